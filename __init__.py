@@ -67,7 +67,10 @@ reload_event = "import_sverchok" in locals()  # reloading does not clear previou
 def profiling_startup(file_name):
     """Start blender with `blender -- --sv-profile` to create two
     files with profiling of Sverchok startup. "imp_stats" file keeps stats of
-    importing modules and "reg_stats" keeps stats of add-on registration."""
+    importing modules and "reg_stats" keeps stats of add-on registration.
+    Time of both stages is printed into console. By default node modules
+    are imported lazily, start Blender with `blender -- --sv-profile --sv-eager-nodes`
+    to compare with the time of importing all node modules."""
     def decorator(func):
         from functools import wraps
 
@@ -75,12 +78,22 @@ def profiling_startup(file_name):
         def wrap():
             import cProfile
             import pstats
+            import time
             profile = cProfile.Profile()
+            start = time.perf_counter()
             profile.enable()
             res = func()
             profile.disable()
+            duration = time.perf_counter() - start
             stats = pstats.Stats(profile)
             stats.dump_stats(file_name)
+
+            lazy_nodes = sys.modules.get("sverchok.core.lazy_nodes")
+            if lazy_nodes is not None and lazy_nodes.pending_modules:
+                mode = f"{len(lazy_nodes.pending_modules)} node modules are deferred"
+            else:
+                mode = "all node modules are imported"
+            print(f"Sverchok {func.__name__}: {duration:.3f} sec (with profiler), {mode}")
             return res
 
         import sys
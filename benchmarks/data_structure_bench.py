@@ -0,0 +1,40 @@
+import numpy as np
+
+from sverchok.data_structure import flatten_data, graft_data, match_long_repeat
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.ragged import SvRaggedArray, match_ragged
+
+
+def nested_vertices(size):
+    """size objects of 1000 vertices each"""
+    return [np.random.rand(1000, 3).tolist() for _ in range(size)]
+
+
+@benchmark(sizes=[1, 10, 100], repeat=3)
+def flatten_vertices(size):
+    verts = nested_vertices(size)
+    return lambda: flatten_data(verts, 1)
+
+
+@benchmark(sizes=[1, 10, 100], repeat=3)
+def graft_numbers(size):
+    numbers = np.random.rand(size, 1000).tolist()
+    return lambda: graft_data(numbers, item_level=0)
+
+
+@benchmark(sizes=[10, 100, 1000], repeat=3)
+def match_level_3_python(size):
+    a, b = nested_vertices(size), nested_vertices(size // 2)
+
+    def match(lsts, level):
+        if level == 1:
+            return match_long_repeat(lsts)
+        return list(map(list, zip(*[match(items, level - 1) for items in zip(*match_long_repeat(lsts))])))
+    return lambda: match([a, b], 3)
+
+
+@benchmark(sizes=[10, 100, 1000], repeat=3)
+def match_level_3_ragged(size):
+    a, b = nested_vertices(size), nested_vertices(size // 2)
+    return lambda: [array.to_nested() for array in
+                    match_ragged([SvRaggedArray.from_nested(a), SvRaggedArray.from_nested(b)], level=3)]
@@ -0,0 +1,21 @@
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.modules.eisenscript import parse, Interpreter
+
+# binary tree of rule calls, 3 * (2 ** (depth + 1) - 1) boxes
+TREE = """
+set maxdepth {depth}
+r
+rule r {{ {{ x 1 s 0.9 rz 20 }} r {{ y 1 s 0.9 rx 20 }} r 3 * {{ z 0.3 }} box }}
+"""
+
+
+@benchmark(sizes=[8, 12], repeat=3)
+def eisenscript_tree(size):
+    program = parse(TREE.format(depth=size))
+    return lambda: Interpreter.interpret(program, max_depth=size)
+
+
+@benchmark(sizes=[8, 12, 15], repeat=3)
+def eisenscript_tree_batched(size):
+    program = parse(TREE.format(depth=size))
+    return lambda: Interpreter.interpret(program, max_depth=size, batched=True)
@@ -0,0 +1,56 @@
+import numpy as np
+
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.field.scalar import SvCoordinateScalarField, SvScalarFieldLambda, SvScalarFieldBinOp, SvMergedScalarField
+from sverchok.utils.field.compiler import compile_field
+from sverchok.utils.manifolds import raycast_iso_surface
+
+
+def rays(size):
+    """size rays from random points directed approximately to the origin"""
+    rng = np.random.default_rng(0)
+    points = rng.normal(scale=3, size=(size, 3))
+    return points, -points + rng.normal(scale=0.5, size=(size, 3))
+
+
+def gyroid(x, y, z, v):
+    return np.sin(x) * np.cos(y) + np.sin(y) * np.cos(z) + np.sin(z) * np.cos(x)
+
+
+@benchmark(sizes=[10000, 100000, 1000000], repeat=3)
+def raycast_sphere_tracing(size):
+    field = SvCoordinateScalarField('SPH_RHO')
+    points, directions = rays(size)
+    return lambda: raycast_iso_surface(field, points, directions, 10.0, 1.0)
+
+
+@benchmark(sizes=[10000, 100000, 1000000], repeat=3)
+def raycast_formula_sections(size):
+    field = SvScalarFieldLambda(gyroid, None, None, function_numpy=gyroid)
+    points, directions = rays(size)
+    return lambda: raycast_iso_surface(field, points, directions, 10.0, 0.5)
+
+
+def composed_field():
+    """gyroid shell cut by sphere, the gyroid field is used twice"""
+    field = SvScalarFieldLambda(gyroid, None, None, function_numpy=gyroid)
+    shell = SvScalarFieldBinOp(field, field, lambda a, b: a * b - 0.1)
+    return SvMergedScalarField('MAX', [shell, SvCoordinateScalarField('SPH_RHO')])
+
+
+@benchmark(sizes=[50, 100, 200], repeat=3)
+def field_box_direct(size):
+    field = composed_field()
+    grid = np.linspace(-3, 3, size)
+
+    def evaluate():
+        xs, ys, zs = np.meshgrid(grid, grid, grid, indexing='ij')
+        return field.evaluate_grid(xs.flatten(), ys.flatten(), zs.flatten())
+    return evaluate
+
+
+@benchmark(sizes=[50, 100, 200], repeat=3)
+def field_box_compiled(size):
+    field = composed_field()
+    grid = np.linspace(-3, 3, size)
+    return lambda: compile_field(field).evaluate_box(grid, grid, grid)
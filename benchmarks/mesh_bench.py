@@ -0,0 +1,91 @@
+import numpy as np
+
+from sverchok.dependencies import mcubes, skimage
+from sverchok.utils.adaptive_polygons import map_to_quads
+from sverchok.utils.benchmarking import benchmark, requires
+from sverchok.utils.catmull_clark import subdivide_arrays
+from sverchok.utils.marching_cubes import isosurface_np
+from sverchok.utils.matrix_array import SvMatrixArray
+from sverchok.utils.mesh_functions import apply_matrices
+from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh
+
+
+def grid_mesh(size):
+    """size x size grid of quads"""
+    xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing='ij')
+    verts = np.stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)), axis=-1).tolist()
+    idx = np.arange((size + 1) ** 2).reshape(size + 1, size + 1)
+    faces = np.stack((idx[:-1, :-1], idx[1:, :-1], idx[1:, 1:], idx[:-1, 1:]), axis=-1).reshape(-1, 4).tolist()
+    return verts, faces
+
+
+def sphere_field(size):
+    """Distance to the center on size x size x size grid"""
+    axis = np.linspace(-1, 1, num=size)
+    xs, ys, zs = np.meshgrid(axis, axis, axis, indexing='ij')
+    return np.sqrt(xs ** 2 + ys ** 2 + zs ** 2)
+
+
+@benchmark(sizes=[10, 100, 300])
+def bmesh_round_trip(size):
+    verts, faces = grid_mesh(size)
+
+    def round_trip():
+        bm = bmesh_from_pydata(verts, [], faces, normal_update=True)
+        pydata_from_bmesh(bm)
+        bm.free()
+    return round_trip
+
+
+@benchmark(sizes=[10, 100, 300], repeat=3)
+def catmull_clark_3_levels(size):
+    verts, faces = grid_mesh(size)
+    faces = np.array(faces)
+    return lambda: subdivide_arrays(verts, faces, levels=3)
+
+
+@benchmark(sizes=[16, 32, 64])
+def marching_cubes_mcubes(size):
+    requires(mcubes)
+    data = sphere_field(size)
+    return lambda: mcubes.marching_cubes(data, 0.8)
+
+
+@benchmark(sizes=[16, 32, 64])
+def marching_cubes_skimage(size):
+    requires(skimage)
+    import skimage.measure
+    data = sphere_field(size)
+    return lambda: skimage.measure.marching_cubes(data, level=0.8)
+
+
+@benchmark(sizes=[8, 16], repeat=3)
+def marching_cubes_python(size):
+    data = sphere_field(size)
+    return lambda: isosurface_np(data, 0.8)
+
+
+@benchmark(sizes=[100, 10000, 100000], repeat=3)
+def adaptive_polygons_quads(size):
+    donor_xy = np.random.uniform(-0.5, 0.5, (100, 2))
+    donor_z = np.random.uniform(0, 1, 100)
+    quads = np.random.rand(size, 4, 3)
+    normals = np.random.rand(size, 4, 3)
+    face_normals = np.random.rand(size, 3)
+    ones = np.ones(size)
+    return lambda: map_to_quads(donor_xy, donor_z, quads, normals, face_normals,
+                                np.ones(size, dtype=bool), ones, ones, np.zeros(size))
+
+
+@benchmark(sizes=[100, 10000, 100000], repeat=3)
+def apply_matrices_packed(size):
+    verts, faces = grid_mesh(1)
+    matrices = SvMatrixArray.from_translations(np.random.rand(size, 3))
+    return lambda: list(apply_matrices([(verts, [], faces)], [matrices]))
+
+
+@benchmark(sizes=[100, 10000], repeat=3)
+def apply_matrices_unpacked(size):
+    verts, faces = grid_mesh(1)
+    matrices = SvMatrixArray.from_translations(np.random.rand(size, 3)).to_matrices()
+    return lambda: list(apply_matrices([(verts, [], faces)], [matrices]))
@@ -0,0 +1,26 @@
+import numpy as np
+
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.noise_engine import noise_vector, MATHUTILS, NUMPY
+
+
+def random_points(size):
+    return np.random.RandomState(0).uniform(-10, 10, (size, 3))
+
+
+@benchmark(sizes=[1000, 100000])
+def noise_vector_mathutils(size):
+    points = random_points(size)
+    return lambda: noise_vector(points, 'PERLIN_ORIGINAL', 1, MATHUTILS)
+
+
+@benchmark(sizes=[1000, 100000, 1000000])
+def noise_vector_numpy_perlin(size):
+    points = random_points(size)
+    return lambda: noise_vector(points, 'PERLIN_ORIGINAL', 1, NUMPY)
+
+
+@benchmark(sizes=[1000, 100000, 1000000])
+def noise_vector_numpy_voronoi(size):
+    points = random_points(size)
+    return lambda: noise_vector(points, 'VORONOI_F1', 1, NUMPY)
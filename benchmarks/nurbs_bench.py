@@ -0,0 +1,90 @@
+import numpy as np
+
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.nurbs_common import SvNurbsMaths
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.surface.nurbs_solver import SvNurbsSurfaceSolver
+from sverchok.utils.curve.batch_intersect import intersect_curves_batch
+
+
+def build_curve(degree=3, n_points=20):
+    rng = np.random.default_rng(0)
+    control_points = np.cumsum(rng.random((n_points, 3)), axis=0)
+    weights = rng.random(n_points) + 0.5
+    knotvector = sv_knotvector.generate(degree, n_points)
+    return SvNurbsMaths.build_curve(SvNurbsMaths.NATIVE, degree, knotvector, control_points, weights)
+
+
+def build_surface(degree=3, n_points=10):
+    rng = np.random.default_rng(0)
+    us, vs = np.meshgrid(np.arange(n_points), np.arange(n_points), indexing='ij')
+    control_points = np.stack((us, vs, rng.random((n_points, n_points))), axis=-1).astype(np.float64)
+    weights = rng.random((n_points, n_points)) + 0.5
+    knotvector = sv_knotvector.generate(degree, n_points)
+    return SvNurbsMaths.build_surface(SvNurbsMaths.NATIVE, degree, degree, knotvector, knotvector,
+                                      control_points, weights)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def nurbs_curve_evaluate(size):
+    curve = build_curve()
+    t_min, t_max = curve.get_u_bounds()
+    ts = np.linspace(t_min, t_max, num=size)
+    return lambda: curve.evaluate_array(ts)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def nurbs_curve_tangent(size):
+    curve = build_curve()
+    t_min, t_max = curve.get_u_bounds()
+    ts = np.linspace(t_min, t_max, num=size)
+    return lambda: curve.tangent_array(ts)
+
+
+@benchmark(sizes=[30, 100, 300])
+def nurbs_surface_evaluate(size):
+    """Evaluation on size x size grid"""
+    surface = build_surface()
+    u_min, u_max = surface.get_u_min(), surface.get_u_max()
+    v_min, v_max = surface.get_v_min(), surface.get_v_max()
+    us, vs = np.meshgrid(np.linspace(u_min, u_max, num=size), np.linspace(v_min, v_max, num=size))
+    us, vs = us.flatten(), vs.flatten()
+    return lambda: surface.evaluate_array(us, vs)
+
+
+@benchmark(sizes=[20, 50, 200])
+def nurbs_surface_interpolate(size):
+    """Interpolation of size x size grid of points, factorization is cached after the first run"""
+    degree = 3
+    ts = np.linspace(0, 1, num=size)
+    knotvector = sv_knotvector.from_tknots(degree, ts)
+    us, vs = np.meshgrid(ts, ts, indexing='ij')
+    goals = list(zip(us.flatten(), vs.flatten(), np.random.default_rng(0).random((size * size, 3))))
+
+    def run():
+        solver = SvNurbsSurfaceSolver.from_parameters(degree, degree, size, size, knotvector, knotvector)
+        solver.add_goals(goals)
+        return solver.solve()
+    return run
+
+
+@benchmark(sizes=[10, 100, 300])
+def nurbs_curves_intersect_batch(size):
+    """Intersection of size curves with other size curves, each pair intersects"""
+    rng = np.random.default_rng(0)
+    degree = 3
+    knotvector = sv_knotvector.generate(degree, 6)
+    ts = np.linspace(0, 10, num=6)
+
+    def build(axis):
+        curves = []
+        for offset in rng.random(size) * 10:
+            control_points = np.zeros((6, 3))
+            control_points[:, axis] = ts
+            control_points[:, 1 - axis] = offset + rng.random(6)
+            curves.append(SvNurbsMaths.build_curve(SvNurbsMaths.NATIVE, degree, knotvector,
+                                                   control_points, np.ones(6)))
+        return curves
+
+    curves1, curves2 = build(0), build(1)
+    return lambda: intersect_curves_batch(curves1, curves2)
@@ -0,0 +1,21 @@
+import numpy as np
+
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.parallel import map_objects
+
+
+def matrices(size):
+    """size objects, each is a matrix 200x200"""
+    return [(np.random.rand(200, 200),) for _ in range(size)]
+
+
+@benchmark(sizes=[10, 100], repeat=3)
+def eigenvalues_sequential(size):
+    objects = matrices(size)
+    return lambda: map_objects(np.linalg.eigvals, objects, workers=1)
+
+
+@benchmark(sizes=[10, 100], repeat=3)
+def eigenvalues_parallel(size):
+    objects = matrices(size)
+    return lambda: map_objects(np.linalg.eigvals, objects)
@@ -0,0 +1,107 @@
+import numpy as np
+from mathutils.geometry import delaunay_2d_cdt
+
+from sverchok.dependencies import scipy
+from sverchok.utils.benchmarking import benchmark, requires
+from sverchok.utils.delaunay3d import simplex_edges, simplex_faces, alpha_shape_faces
+from sverchok.utils.kdtree import SvKdTree, get_kdtree
+from sverchok.utils.voronoi import voronoi_bounded
+from sverchok.utils.voronoi3d import voronoi3d_regions, voronoi_on_mesh_bmesh
+
+
+def random_points(size, dimensions=3):
+    return np.random.default_rng(0).random((size, dimensions))
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def kdtree_blender_query(size):
+    points = random_points(size)
+    tree = SvKdTree.new(SvKdTree.BLENDER, points)
+    needles = random_points(size)[::-1]
+    return lambda: tree.query_array(needles, count=3)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def kdtree_scipy_query(size):
+    requires(scipy)
+    points = random_points(size)
+    tree = SvKdTree.new(SvKdTree.SCIPY, points)
+    needles = random_points(size)[::-1]
+    return lambda: tree.query_array(needles, count=3)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def kdtree_blender_build(size):
+    points = random_points(size)
+    return lambda: SvKdTree.new(SvKdTree.BLENDER, points)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def kdtree_cached_range_query(size):
+    points = random_points(size)
+    needles = random_points(size)[::-1]
+    radius = 2 / size ** (1 / 3)
+    return lambda: get_kdtree(points).query_range_array(needles, radius)
+
+
+@benchmark(sizes=[100, 1000, 5000])
+def voronoi_2d(size):
+    sites = random_points(size).tolist()
+    return lambda: voronoi_bounded(sites, make_faces=True)
+
+
+@benchmark(sizes=[100, 1000, 5000])
+def voronoi_3d(size):
+    requires(scipy)
+    sites = random_points(size)
+    return lambda: voronoi3d_regions(sites, closed_only=True)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def delaunay_2d(size):
+    points = random_points(size, dimensions=2).tolist()
+    # output type 0 is triangulation of the convex hull
+    return lambda: delaunay_2d_cdt(points, [], [], 0, 1e-6)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def delaunay_3d(size):
+    requires(scipy)
+    from scipy.spatial import Delaunay
+    points = random_points(size)
+    return lambda: Delaunay(points)
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def delaunay_3d_edges_faces(size):
+    requires(scipy)
+    from scipy.spatial import Delaunay
+    points = random_points(size)
+    tetras = Delaunay(points).simplices
+    return lambda: (simplex_edges(tetras, size), simplex_faces(tetras, size))
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def alpha_shape_surface(size):
+    requires(scipy)
+    from scipy.spatial import Delaunay
+    points = random_points(size)
+    tetras = Delaunay(points).simplices
+    return lambda: alpha_shape_faces(points, tetras, 2 / size ** (1 / 3))
+
+
+@benchmark(sizes=[10, 100, 1000], repeat=3)
+def voronoi_on_mesh_volume(size):
+    requires(scipy)
+    from scipy.spatial import ConvexHull
+    # convex hull of 2000 points on the unit sphere, cut into size cells
+    points = np.random.default_rng(1).normal(size=(2000, 3))
+    points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+    faces = ConvexHull(points).simplices
+    # outward normals
+    corners = points[faces]
+    inverted = np.einsum('ij,ij->i', np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), corners[:, 0]) < 0
+    faces[inverted] = faces[inverted][:, ::-1]
+    faces = faces.tolist()
+    sites = (random_points(size) - 0.5).tolist()
+    return lambda: voronoi_on_mesh_bmesh(points.tolist(), faces, size, sites, mode='VOLUME')
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+import sverchok
+from sverchok.core.socket_data import sv_deep_copy
+from sverchok.core.update_system import UpdateTree
+from sverchok.utils.benchmarking import benchmark, BenchmarkSkip
+from sverchok.utils.sv_json_import import JSONImporter
+from sverchok.utils.testing import create_node_tree
+
+EXAMPLES_PATH = Path(sverchok.__file__).parent / 'json_examples'
+EXAMPLES = sorted(path.relative_to(EXAMPLES_PATH).with_suffix('').as_posix()
+                  for path in EXAMPLES_PATH.glob('*/*.json'))
+# the biggest trees are the most sensitive to performance of importing
+BIG_EXAMPLES = sorted(EXAMPLES, key=lambda name: (EXAMPLES_PATH / f'{name}.json').stat().st_size)[-3:]
+
+
+def remove_new_trees(old_trees):
+    for tree in list(bpy.data.node_groups):
+        if tree not in old_trees:
+            bpy.data.node_groups.remove(tree)
+
+
+def evaluate_tree(tree):
+    """Evaluate all nodes of the tree synchronously, as timer does it"""
+    UpdateTree.reset_tree(tree)
+    for _ in UpdateTree.main_update(tree, update_interface=False):
+        pass
+
+
+@benchmark(sizes=[1000, 10000, 100000])
+def socket_deep_copy(size):
+    """Typical data of vertices socket - list of objects with vertices"""
+    verts = np.random.default_rng(0).random((size, 3)).tolist()
+    data = [[tuple(v) for v in verts[i::10]] for i in range(10)]
+    return lambda: sv_deep_copy(data)
+
+
+@benchmark(sizes=BIG_EXAMPLES, repeat=3)
+def json_import(example):
+    old_trees = set(bpy.data.node_groups)
+    path = str(EXAMPLES_PATH / f'{example}.json')
+
+    def import_tree():
+        tree = create_node_tree("BenchmarkTree", must_not_exist=False)
+        JSONImporter.init_from_path(path).import_into_tree(tree, print_log=False)
+    try:
+        yield import_tree
+    finally:
+        remove_new_trees(old_trees)
+
+
+@benchmark(sizes=EXAMPLES, repeat=3)
+def tree_evaluation(example):
+    old_trees = set(bpy.data.node_groups)
+    try:
+        tree = create_node_tree("BenchmarkTree", must_not_exist=False)
+        JSONImporter.init_from_path(str(EXAMPLES_PATH / f'{example}.json')).import_into_tree(tree, print_log=False)
+        if any(getattr(node, 'missing_dependency', False) for node in tree.nodes):
+            raise BenchmarkSkip("Some dependencies are not installed")
+        yield lambda: evaluate_tree(tree)
+    finally:
+        remove_new_trees(old_trees)
@@ -0,0 +1,31 @@
+import numpy as np
+
+from sverchok.nodes.vector.math_mk3 import recurse_fx_numpy, batched_fx_numpy
+from sverchok.nodes.vector.lerp import lerp_numpy
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.modules.vector_math_utils import numpy_vector_func_dict
+
+
+def small_objects(size):
+    """size objects of 10 vertices each"""
+    return [np.random.rand(10, 3).tolist() for _ in range(size)]
+
+
+@benchmark(sizes=[100, 1000, 10000], repeat=3)
+def normalize_per_object(size):
+    verts = small_objects(size)
+    func = numpy_vector_func_dict['NORMALIZE'][1]
+    return lambda: recurse_fx_numpy(verts, func, 2, False)
+
+
+@benchmark(sizes=[100, 1000, 10000], repeat=3)
+def normalize_batched(size):
+    verts = small_objects(size)
+    func = numpy_vector_func_dict['NORMALIZE'][1]
+    return lambda: batched_fx_numpy(verts, func, 2, False)
+
+
+@benchmark(sizes=[100, 1000, 10000], repeat=3)
+def lerp(size):
+    verts_a, verts_b = small_objects(size), small_objects(size)
+    return lambda: lerp_numpy(verts_a, verts_b, [[0.5]])
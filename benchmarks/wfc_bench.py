@@ -0,0 +1,24 @@
+import numpy as np
+
+from sverchok.utils.benchmarking import benchmark
+from sverchok.utils.wfc_algorithm import WaveFunctionCollapse, BitsetWaveFunctionCollapse
+
+
+def sample_image():
+    image = np.zeros((8, 8, 4))
+    image[..., 3] = 1
+    image[::2, ::2, 0] = 1
+    image[2:5, 3:6, 1] = 1
+    return image
+
+
+@benchmark(sizes=[16, 32], repeat=3)
+def wfc_sets(size):
+    image = sample_image()
+    return lambda: WaveFunctionCollapse(image).solve((size, size), seed=1, max_number_contradiction_tries=5)
+
+
+@benchmark(sizes=[16, 32, 128], repeat=3)
+def wfc_bitsets(size):
+    image = sample_image()
+    return lambda: BitsetWaveFunctionCollapse(image).solve((size, size), seed=1, max_number_contradiction_tries=5)
@@ -26,6 +26,7 @@ core_modules = [
     "tasks",
     "group_update_system",
     "event_system",
+    "lazy_nodes",
 ]
 
 
@@ -106,6 +107,9 @@ def sv_register_modules(modules):
                 pass
             pass
         
+        from sverchok.core import lazy_nodes
+        result.extend(lazy_nodes.help_mappings())
+
         if result:
             try:
                 if bpy.app.version < (3, 6):
@@ -143,8 +147,15 @@ def sv_unregister_modules(modules):
     pass
 
 
-def import_nodes():
+def import_nodes(lazy=True):
+    """Import node modules. If lazy is True and lazy loading is not switched off,
+    only modules which are not described by the nodes manifest are imported,
+    see core/lazy_nodes.py"""
     from sverchok import nodes
+    from sverchok.core import lazy_nodes
+    if lazy and lazy_nodes.use_lazy_loading():
+        return lazy_nodes.import_nodes(nodes.nodes_dict)
+
     node_modules = []
     base_name = "sverchok.nodes"
     for category, names in nodes.nodes_dict.items():
@@ -161,7 +172,7 @@ def import_modules(modules, base, im_list):
 
 
 def handle_reload_event(imported_modules):
-    node_modules = import_nodes()
+    node_modules = import_nodes(lazy=False)
 
     # reload base modules
     for module in imported_modules:
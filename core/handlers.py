@@ -3,6 +3,7 @@ from bpy.app.handlers import persistent
 
 import sverchok
 from sverchok import old_nodes
+from sverchok.core import lazy_nodes
 from sverchok import data_structure
 import sverchok.core.events as ev
 import sverchok.core.tasks as ts
@@ -11,6 +12,7 @@ from sverchok.core.socket_data import clear_all_socket_cache
 from sverchok.ui import bgl_callback_nodeview, bgl_callback_3dview
 from sverchok.utils.handle_blender_data import BlTrees
 from sverchok.utils.sv_logging import catch_log_error, TextBufferHandler, sv_logger
+from sverchok.utils import objects_data_cache
 import sverchok.settings as settings
 
 _state = {'frame': None}
@@ -115,6 +117,15 @@ def sv_scene_change_handler(scene):
         ng.scene_update()
 
 
+@persistent
+def sv_depsgraph_update_post(scene, depsgraph):
+    """
+    Keeps track of updated data blocks, so the nodes reading objects data
+    can reuse their caches for not changed objects
+    """
+    objects_data_cache.tag_depsgraph_updates(depsgraph)
+
+
 @persistent
 def sv_clean(scene):
     """
@@ -137,6 +148,7 @@ def sv_pre_load(scene):
     4. evaluate trees from main tree handler
     """
     clear_all_socket_cache()
+    objects_data_cache.clear_cache()
     sv_clean(scene)
 
     handle_event(ev.FileEvent())
@@ -160,8 +172,9 @@ def sv_post_load(scene):
     # ensure current nodeview view scale / location parameters reflect users' system settings
     node_tree.SverchCustomTree.update_gl_scale_info(None, "sv_post_load")
 
-    # register and mark old and dependent nodes
+    # register lazy, old and dependent nodes
     with catch_log_error():
+        lazy_nodes.register_used(BlTrees().sv_trees)
         if any(not n.is_registered_node_type() for ng in BlTrees().sv_trees for n in ng.nodes):
             old_nodes.register_all()
         old_nodes.mark_all()
@@ -212,6 +225,7 @@ handler_dict = {
     'load_pre': sv_pre_load,
     'load_post': sv_post_load,
     'depsgraph_update_pre': sv_scene_change_handler,
+    'depsgraph_update_post': sv_depsgraph_update_post,
     'save_pre': save_pre_handler,
 }
 
@@ -0,0 +1,219 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Lazy loading of node modules.
+
+Importing of all node modules takes most of the time of Sverchok initialization.
+With lazy loading only modules which are not described by the nodes manifest
+(see utils/sv_nodes_manifest.py) are imported during initialization. Other
+node modules are imported and registered by request:
+
+- when a node is added via Add menu or search (see `register_lazy`),
+- when a file or JSON with the nodes is loaded (see `register_used`),
+- in background, a few modules per timer tick when Blender is idle.
+
+Until a node is registered, menus use `NodeInfo` stand-in with the data from
+the manifest instead of the node class (see `get_node_class`).
+
+Lazy loading is off in background mode (tests, command line scripts) and when
+Blender is started with `blender -- --sv-eager-nodes`.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import bpy
+
+from sverchok.dependencies import module_available
+from sverchok.utils.docstring import SvDocstring
+from sverchok.utils.sv_logging import sv_logger
+from sverchok.utils.sv_nodes_manifest import read_manifest, file_checksum, nodes_path
+
+BASE_NAME = "sverchok.nodes"
+BACKGROUND_DELAY = 1.0  # seconds after registration before loading nodes in background
+BACKGROUND_STEP = 0.02  # max time of loading per timer tick
+BACKGROUND_INTERVAL = 0.01  # pause between timer ticks to keep UI responsive
+
+pending_modules = dict()  # module address (category.name) -> list of bl_idnames, not imported yet
+lazy_bl_idnames = dict()  # bl_idname -> module address
+node_infos = dict()  # bl_idname -> NodeInfo
+registered_modules = []
+
+
+class NodeInfo:
+    """Stand-in of a node class which is not registered yet,
+    it has attributes which are used for drawing menus"""
+    bl_icon = 'NODE'
+    sv_icon = None
+    sv_category = ''
+
+    def __init__(self, data: dict):
+        self.bl_idname = data['bl_idname']
+        self.bl_label = data['bl_label']
+        if 'bl_icon' in data:
+            self.bl_icon = data['bl_icon']
+        if 'sv_icon' in data:
+            self.sv_icon = data['sv_icon']
+        if 'sv_category' in data:
+            self.sv_category = data['sv_category']
+        self.sv_dependencies = set(data.get('sv_dependencies', []))
+        self.__doc__ = data['doc']
+        self._docstring = None
+
+    @property
+    def docstring(self):
+        if self._docstring is None:
+            self._docstring = SvDocstring(self.__doc__)
+        return self._docstring
+
+    @property
+    def missing_dependency(self):
+        return not all(module_available(dep) for dep in self.sv_dependencies)
+
+    def __repr__(self):
+        return f"<NodeInfo {self.bl_idname}>"
+
+
+def use_lazy_loading():
+    return not bpy.app.background and "--sv-eager-nodes" not in sys.argv
+
+
+def import_nodes(nodes_dict):
+    """Import node modules which are not described by the manifest
+    or were changed after the manifest was generated, other modules
+    are added to pending modules. Returns list of imported modules"""
+    manifest = read_manifest()
+    modules = manifest['modules'] if manifest else dict()
+    root = nodes_path()
+    node_modules = []
+    for category, names in nodes_dict.items():
+        importlib.import_module(f'.{category}', BASE_NAME)
+        for name in names:
+            address = f'{category}.{name}'
+            data = modules.get(address)
+            if data is not None and data['nodes'] is not None \
+                    and data['checksum'] == file_checksum(os.path.join(root, category, f'{name}.py')):
+                pending_modules[address] = [node['bl_idname'] for node in data['nodes']]
+                for node in data['nodes']:
+                    lazy_bl_idnames[node['bl_idname']] = address
+                    node_infos[node['bl_idname']] = NodeInfo(node)
+            else:
+                node_modules.append(importlib.import_module(f'.{address}', BASE_NAME))
+    return node_modules
+
+
+def is_lazy(bl_id: str) -> bool:
+    """Check if the node class can be registered by `register_lazy`"""
+    return bl_id in lazy_bl_idnames and lazy_bl_idnames[bl_id] in pending_modules
+
+
+def get_node_class(bl_id: str):
+    """Returns registered node class, or NodeInfo if the node was not
+    registered yet, or None"""
+    node_cls = bpy.types.Node.bl_rna_get_subclass_py(bl_id)
+    if node_cls is None and is_lazy(bl_id):
+        return node_infos[bl_id]
+    return node_cls
+
+
+def iter_node_infos():
+    """NodeInfo of all nodes which are not registered yet"""
+    for bl_id, address in lazy_bl_idnames.items():
+        if address in pending_modules:
+            yield node_infos[bl_id]
+
+
+def _register_module(address):
+    before = set(sys.modules)
+    module = importlib.import_module(f'.{address}', BASE_NAME)
+    new_modules = [(n, m) for n, m in list(sys.modules.items()) if n not in before and m is not None]
+
+    # the same as during initialization, utils modules are registered before nodes
+    for name, new_module in new_modules:
+        if 'sverchok.utils' in name and hasattr(new_module, 'register'):
+            new_module.register()
+    for name, new_module in new_modules:
+        other_address = name[len(BASE_NAME) + 1:]
+        if name.startswith(BASE_NAME + '.') and other_address in pending_modules and other_address != address:
+            del pending_modules[other_address]
+            new_module.register()
+            registered_modules.append(new_module)
+
+    del pending_modules[address]
+    module.register()
+    registered_modules.append(module)
+
+
+def register_lazy(bl_id: str):
+    """Import module of the node and register its classes"""
+    if bl_id not in lazy_bl_idnames:
+        raise LookupError(f"Cannot find {bl_id} among lazy nodes")
+    address = lazy_bl_idnames[bl_id]
+    if address in pending_modules:
+        _register_module(address)
+
+
+def register_used(trees):
+    """Register all lazy nodes which are used by given trees"""
+    for tree in trees:
+        for node in tree.nodes:
+            if is_lazy(node.bl_idname):
+                try:
+                    register_lazy(node.bl_idname)
+                except Exception as e:
+                    sv_logger.error(e)
+
+
+def _try_register_module(address):
+    try:
+        _register_module(address)
+    except Exception as e:
+        pending_modules.pop(address, None)
+        sv_logger.error(f'Failed to register "{address}" module: {e}')
+
+
+def register_all():
+    """Register all pending node modules"""
+    while pending_modules:
+        _try_register_module(next(iter(pending_modules)))
+
+
+def _register_in_background():
+    start = time.perf_counter()
+    while pending_modules and time.perf_counter() - start < BACKGROUND_STEP:
+        _try_register_module(next(iter(pending_modules)))
+    if pending_modules:
+        return BACKGROUND_INTERVAL
+    sv_logger.debug(f"All lazy node modules are registered ({len(registered_modules)})")
+    return None
+
+
+def help_mappings():
+    """Manual mappings of the nodes which are not registered yet, see core.sv_register_modules"""
+    for bl_id, address in lazy_bl_idnames.items():
+        if address in pending_modules:
+            category, name = address.split('.')
+            yield f'bpy.types.{bl_id}'.lower(), f'{category}/{name}.html'
+
+
+def register():
+    if pending_modules:
+        bpy.app.timers.register(_register_in_background, first_interval=BACKGROUND_DELAY, persistent=True)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(_register_in_background):
+        bpy.app.timers.unregister(_register_in_background)
+    for module in reversed(registered_modules):
+        try:
+            module.unregister()
+        except Exception as e:
+            sv_logger.error(e)
+    registered_modules.clear()
@@ -25,13 +25,17 @@ from sverchok.utils.field.scalar import SvScalarField, SvConstantScalarField
 from sverchok.utils.curve import SvCurve
 from sverchok.utils.surface import SvSurface
 from sverchok.utils.solid_conversion import to_solid_recursive
+from sverchok.utils.matrix_array import (SvMatrixArray, as_matrix_array, unpack_matrices,
+                                         quaternions_to_rotations)
 
-from mathutils import Matrix, Quaternion
+from mathutils import Matrix
 import numpy as np
 from numpy import ndarray
 
 
 def matrices_to_vfield(data):
+    if isinstance(data, SvMatrixArray):
+        data = data.to_matrices()
     if isinstance(data, Matrix):
         data = deepcopy(data)
         return SvMatrixVectorField(data)
@@ -60,26 +64,42 @@ def numbers_to_sfield(data):
         raise TypeError("Unexpected data type from String socket: %s" % type(data))
 
 
-def vectors_to_matrices(source_data):
-    """This means we're going to get a flat list of the incoming
-    locations and convert those into matrices proper."""
-    location_matrices = []
-    collect_matrix = location_matrices.append
+def collect_tuples(source_data, size):
+    """Flat array of all tuples of numbers of given size in nested lists"""
+    chunks = []
+    items = []
 
     def get_all(data):
+        if isinstance(data, ndarray) and data.ndim > 1 and data.shape[-1] == size:
+            if items:
+                chunks.append(np.array(items, dtype=np.float64))
+                items.clear()
+            chunks.append(data.reshape(-1, size))
+            return
         for item in data:
-            if isinstance(item, (tuple, list, ndarray)) and len(item) == 3 and isinstance(item[0], NUMERIC_DATA_TYPES):
-                # generate location matrix from location
-                x, y, z = item
-                collect_matrix(Matrix([(1., .0, .0, x), (.0, 1., .0, y), (.0, .0, 1., z), (.0, .0, .0, 1.)]))
+            if isinstance(item, (tuple, list, ndarray)) and len(item) == size and isinstance(item[0], NUMERIC_DATA_TYPES):
+                items.append(item)
             else:
                 get_all(item)
 
     get_all(source_data)
-    return location_matrices
+    if items:
+        chunks.append(np.array(items, dtype=np.float64))
+    if not chunks:
+        return np.empty((0, size))
+    return np.concatenate(chunks)
+
+
+def vectors_to_matrices(source_data):
+    """This means we're going to get a flat list of the incoming
+    locations and convert those into matrices proper."""
+    return SvMatrixArray.from_translations(collect_tuples(source_data, 3))
 
 
 def matrices_to_vectors(source_data):
+    if isinstance(source_data, SvMatrixArray) or (source_data and isinstance(source_data[0], SvMatrixArray)):
+        return [as_matrix_array(source_data)[:, :3, 3].tolist()]
+
     locations = []
     collect_vector = locations.append
 
@@ -92,22 +112,16 @@ def matrices_to_vectors(source_data):
 
 
 def quaternions_to_matrices(source_data):
-    matrices = []
-    collect_matrix = matrices.append
-
-    def get_all(data):
-        for item in data:
-            if isinstance(item, (tuple, list)) and len(item) == 4 and isinstance(item[0], NUMERIC_DATA_TYPES):
-                mat = Quaternion(item).to_matrix().to_4x4()
-                collect_matrix(mat)
-            else:
-                get_all(item)
-
-    get_all(source_data)
-    return matrices
+    quaternions = collect_tuples(source_data, 4)
+    rotations = quaternions_to_rotations(quaternions)
+    return SvMatrixArray.compose(np.zeros((len(rotations), 3)), rotations, np.ones((len(rotations), 3)))
 
 
 def matrices_to_quaternions(source_data):
+    if isinstance(source_data, SvMatrixArray) or (source_data and isinstance(source_data[0], SvMatrixArray)):
+        quaternions = SvMatrixArray(as_matrix_array(source_data)).to_quaternions()
+        return [[tuple(q) for q in quaternions.tolist()]]
+
     quaternions = []
     collect_quaternion = quaternions.append
 
@@ -167,6 +181,8 @@ class LenientImplicitConversionPolicy:
     """
     @classmethod
     def convert(cls, socket, other, source_data):
+        if other.bl_idname == 'SvMatrixSocket':
+            return unpack_matrices(source_data)
         return source_data
 
 
@@ -203,6 +219,8 @@ class DefaultImplicitConversionPolicy(NoImplicitConversionPolicy):
         # conversion is not needed
         elif to_sock.bl_idname in cls.lenient_socket_types \
                 or cls.is_expected_type_from_string_socket(to_sock, from_sock, source_data):
+            if from_sock.bl_idname == 'SvMatrixSocket':
+                return unpack_matrices(source_data)
             return source_data
 
         # raise exception
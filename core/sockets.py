@@ -20,6 +20,7 @@ import inspect
 import sys
 from typing import Set
 
+import numpy as np
 from mathutils import Matrix, Quaternion
 import bpy
 from bpy.props import StringProperty, BoolProperty, FloatVectorProperty, IntProperty, FloatProperty, EnumProperty, \
@@ -34,12 +35,14 @@ from sverchok.data_structure import (
     enum_item_4,
     get_other_socket, replace_socket,
     SIMPLE_DATA_TYPES,
-    flatten_data, graft_data, map_at_level, wrap_data, unwrap_data)
+    flatten_data, graft_data, map_at_level, wrap_data, unwrap_data, as_ragged_array)
 
 from sverchok.settings import get_param
 
 from sverchok.utils.handle_blender_data import get_func_and_args, BlDomains
 from sverchok.utils.socket_utils import format_bpy_property, setup_new_node_location
+from sverchok.utils.matrix_array import unpack_matrices, copy_packed_matrices
+from sverchok.utils.ragged import SvRaggedArray
 from sverchok.utils.field.scalar import SvScalarField
 from sverchok.utils.field.vector import SvVectorField
 from sverchok.utils.curve import SvCurve
@@ -678,6 +681,24 @@ class SvMatrixSocket(NodeSocket, SvSocketCommon):
     quick_link_to_node = 'SvMatrixInNodeMK4'
     nesting_level: IntProperty(default=1)
 
+    def sv_get(self, default=..., deepcopy=True, packed=False):
+        """
+        :param packed: if True, SvMatrixArray (packed lists of matrices) are returned as is,
+            otherwise they are converted into lists of Matrix objects.
+            Nodes which ask for packed data should be able to process ordinary lists of matrices too.
+        """
+        data = super().sv_get(default=default, deepcopy=deepcopy)
+        if not packed:
+            return unpack_matrices(data)
+        if deepcopy:
+            return copy_packed_matrices(data)
+        return data
+
+    def postprocess_output(self, data):
+        if self.get_mode_flags():
+            data = unpack_matrices(data)
+        return super().postprocess_output(data)
+
     def do_flatten(self, data):
         return flatten_data(data, 1, data_types=(Matrix,))
 
@@ -1003,6 +1024,12 @@ class SvStringsSocket(SocketDomain, NodeSocket, SvSocketCommon):
         return graft_data(data, item_level=0, data_types = STANDARD_TYPES)
 
     def do_graft_2(self, data):
+        ragged = as_ragged_array(data, STANDARD_TYPES)
+        if ragged is not None and ragged.counts(ragged.depth - 1).all():
+            mins = np.repeat(ragged.reduce(np.minimum), ragged.counts(ragged.depth - 1))
+            ragged = SvRaggedArray(ragged.values - mins, ragged.offsets)
+            return ragged.graft(item_level=1).to_nested()
+
         def to_zero_base(lst):
             m = min(lst)
             return [x - m for x in lst]
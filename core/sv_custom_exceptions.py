@@ -78,6 +78,16 @@ class SvUnsupportedOptionException(SvProcessingError):
     options which is not going to work."""
     __description__ = "Unsupported option"
 
+class SvObjectProcessingError(SvProcessingError):
+    """Processing of one of objects passed to the node failed.
+    The index of the object helps the user to find bad data."""
+    __description__ = "Object processing error"
+
+    def __init__(self, index, message):
+        self.index = index
+        self.message = f"Object #{index}: {message}"
+        super().__init__(self.message)
+
 class SvNotFullyConnected(SvProcessingError):
     __description__ = "Not all required inputs are connected"
 
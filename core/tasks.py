@@ -145,6 +145,12 @@ class Tasks:
                     # probably all reports should be cleaned through search
                     sv_logger.debug(f"Unable report a nodes updating progress")
 
+    def report_progress(self, text: str = None):
+        """Can be used by nodes to report progress of long operations in the
+        header of the tree editor. It does nothing outside tree evaluation"""
+        if self._current:
+            self._report_progress(text)
+
     def _report_progress(self, text: str = None):
         """Show text in the tree editor header. If text is none the header
         returns in its initial condition"""
@@ -14,6 +14,7 @@ import sverchok.core.tasks as ts
 from sverchok.core.sv_custom_exceptions import CancelError, SvNoDataError, ImplicitConversionProhibited
 from sverchok.core.socket_conversions import conversions
 from sverchok.utils.profile import profile
+from sverchok.utils import node_instrumentation
 from sverchok.utils.sv_logging import node_error_logger, WarningHandler
 from sverchok.utils.tree_walk import bfs_walk
 
@@ -459,6 +460,8 @@ class UpdateTree(SearchTree):
         # print(f"UPDATE NODES {event.type=}, {event.tree.name=}")
         up_tree = cls.get(tree, refresh_tree=True)
         if update_nodes:
+            if node_instrumentation.is_enabled:
+                node_instrumentation.next_update()
             walker = up_tree._walk()
             # walker = up_tree._debug_color(walker)
             try:
@@ -704,8 +707,11 @@ class AddStatistic:
         self._start = perf_counter()
         self._supress = supress
         self._warnings_handler = None
+        self._record = None
 
     def __enter__(self):
+        if node_instrumentation.is_enabled:
+            self._record = node_instrumentation.start_node(self._node)
         self._warnings_handler = WarningHandler()
         self._node.sv_logger.addHandler(self._warnings_handler)
         logging.getLogger("py.warnings").addHandler(self._warnings_handler)
@@ -727,6 +733,9 @@ class AddStatistic:
             self._node[UPDATE_KEY] = False
             self._node[ERROR_KEY] = get_exception_text(exc_val)
             self._node[ERROR_STACK_KEY] = "".join(traceback.format_exception(exc_val))
+        if self._record is not None:
+            node_instrumentation.finish_node(self._record, self._node, error=exc_type is not None)
+            self._record = None
 
         if self._supress and exc_type is not None:
             if issubclass(exc_type, CancelError):
@@ -738,12 +747,18 @@ def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
                        input_socks: list[NodeSocket]):
     """Reads data from given outputs socket make it conversion if necessary and
     put data into input given socket"""
+    if node_instrumentation.is_enabled:
+        node_instrumentation.inputs_start()
     # this can be a socket method
     for ps, ns in zip(prev_socks, input_socks):
         if ps is None:
             continue
         try:
-            data = ps.sv_get()
+            if ps.bl_idname == 'SvMatrixSocket':
+                # packed matrices are unpacked by the input socket on demand
+                data = ps.sv_get(packed=True)
+            else:
+                data = ps.sv_get()
         except SvNoDataError:
             # let to the node handle No Data error
             ns.sv_forget()
@@ -759,6 +774,9 @@ def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
 
             ns.sv_set(data)
 
+    if node_instrumentation.is_enabled:
+        node_instrumentation.inputs_prepared(input_socks)
+
 
 def update_ui(tree: NodeTree, times: Iterable[float] = None):
     """Updates UI of the given tree
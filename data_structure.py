@@ -37,6 +37,7 @@ from numpy import (
     float64,
     int32, int64)
 from sverchok.utils.sv_logging import sv_logger
+from sverchok.utils.ragged import SvRaggedArray, estimated_size
 import numpy as np
 
 RELOAD_EVENT = False
@@ -650,12 +651,42 @@ def ensure_min_nesting(data, target_level, data_types=SIMPLE_DATA_TYPES, input_n
         result = [result]
     return result
 
+# for smaller data recursion over lists is faster than conversion to columns
+RAGGED_MIN_SIZE = 100
+
+def as_ragged_array(data, data_types=SIMPLE_DATA_TYPES, min_size=RAGGED_MIN_SIZE):
+    """
+    Columnar representation of nested lists of numbers (SvRaggedArray),
+    or None if data contain anything else or are too small to bother.
+    Functions below use it when they have to visit each number of the data;
+    when only upper levels are restructured, recursion over lists is
+    cheaper than conversion.
+    """
+    if any(issubclass(t, (list, tuple, ndarray)) for t in data_types):
+        return None
+    if estimated_size(data) < min_size:
+        return None
+    return SvRaggedArray.from_nested(data)
+
 def flatten_data(data, target_level=1, data_types=SIMPLE_DATA_TYPES):
     """
     Reduce nesting level of `data` to `target_level`, by concatenating nested sub-lists.
     Raises an exception if nesting level is already less than `target_level`.
     Refer to data_structure_tests.py for examples.
     """
+    current_level = get_data_nesting_level(data, data_types)
+    if current_level < target_level:
+        raise TypeError(f"Can't flatten data to level {target_level}: data already have level {current_level}")
+    elif current_level == target_level:
+        return data
+    if target_level == 1:
+        # all numbers are visited, columnar way is faster
+        ragged = as_ragged_array(data, data_types)
+        if ragged is not None and ragged.depth == current_level:
+            return ragged.flatten(target_level).to_nested()
+    return _flatten_data(data, target_level, data_types)
+
+def _flatten_data(data, target_level, data_types):
     current_level = get_data_nesting_level(data, data_types)
     if current_level < target_level:
         raise TypeError(f"Can't flatten data to level {target_level}: data already have level {current_level}")
@@ -664,7 +695,7 @@ def flatten_data(data, target_level=1, data_types=SIMPLE_DATA_TYPES):
     else:
         result = []
         for item in data:
-            result.extend(flatten_data(item, target_level=target_level, data_types=data_types))
+            result.extend(_flatten_data(item, target_level, data_types))
         return result
 
 def graft_data(data, item_level=1, wrap_level=1, data_types=SIMPLE_DATA_TYPES):
@@ -675,6 +706,11 @@ def graft_data(data, item_level=1, wrap_level=1, data_types=SIMPLE_DATA_TYPES):
     (however deep this number is nested) into pair of [].
     Refer to data_structure_tests.py for examples.
     """
+    if item_level == 0:
+        ragged = as_ragged_array(data, data_types)
+        if ragged is not None:
+            return ragged.graft(item_level, wrap_level).to_nested()
+
     def wrap(item):
         for i in range(wrap_level):
             item = [item]
@@ -753,11 +789,18 @@ def map_at_level(function, data, item_level=0, data_types=SIMPLE_DATA_TYPES):
     most nested levels (`item_level` of them) will be eliminated.
     Refer to data_structure_tests.py for examples.
     """
+    if item_level == 0:
+        ragged = as_ragged_array(data, data_types)
+        if ragged is not None:
+            return ragged.map_at_level(function, item_level)
+    return _map_at_level(function, data, item_level, data_types)
+
+def _map_at_level(function, data, item_level, data_types):
     current_level = get_data_nesting_level(data, data_types)
     if current_level == item_level:
         return function(data)
     else:
-        return [map_at_level(function, item, item_level, data_types) for item in data]
+        return [_map_at_level(function, item, item_level, data_types) for item in data]
 
 def transpose_list(lst):
     """
@@ -11,7 +11,9 @@ Sverchok, and declarations of specific dependencies.
 
 In most cases, one imports required dependency modules from this module.
 If the corresponding library is not installed, this will import None value
-instead of actual module, so that one can execute another version of code:
+instead of actual module, so that one can execute another version of code.
+Libraries are imported on first access, so heavy libraries which are not used
+by opened trees do not slow down Sverchok initialization:
 
     from sverchok.dependencies import scipy
 
@@ -23,8 +25,12 @@ instead of actual module, so that one can execute another version of code:
 
 todo: Create dependencies.txt file and import modules from there
 """
-import bpy
+import importlib
+import importlib.util
 import logging
+import sys
+
+import bpy
 
 import sverchok.settings as settings
 
@@ -36,23 +42,59 @@ class SvDependency():
     """
     Definition of external dependency package.
     """
-    def __init__(self, package, url, module=None):
+    def __init__(self, package, url, module=None, module_name=None):
         """
         Args:
             package: name of package
             url: home URL of the package
             module: main package module object
+            module_name: name of main package module, it is imported on first
+                access to `module` attribute
         """
         self.package = package
-        self.module = module
+        self.module_name = module_name
+        self._module = module
+        self._imported = module is not None or module_name is None
         self.url = url
         self.pip_installable = False
 
+    @property
+    def module(self):
+        if not self._imported:
+            self._imported = True
+            try:
+                self._module = importlib.import_module(self.module_name)
+            except ImportError:
+                self._module = None
+        return self._module
+
+    @module.setter
+    def module(self, module):
+        self._module = module
+        self._imported = True
+
+    @property
+    def available(self):
+        """Check whether the package is installed without importing it"""
+        if self._imported:
+            return self._module is not None
+        return module_available(self.module_name)
+
     @property
     def message(self):
         return f"{self.package} package is {'' if self.module else 'not '}available"
 
 
+def module_available(name):
+    """Check whether the module can be imported without importing it"""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 """
 Dictionary with Sverchok dependencies
 """
@@ -108,123 +150,61 @@ else:
     ensurepip = None
     # print("PIP is already installed, no need to call ensurepip")
 
-scipy_d = sv_dependencies["scipy"] = SvDependency("scipy", "https://www.scipy.org/")
+scipy_d = sv_dependencies["scipy"] = SvDependency("scipy", "https://www.scipy.org/", module_name="scipy")
 scipy_d.pip_installable = True
-try:
-    import scipy
-    scipy_d.module = scipy
-except ImportError:
-    scipy = None
 
-geomdl_d = sv_dependencies["geomdl"] = SvDependency("geomdl", "https://github.com/orbingol/NURBS-Python/tree/master/geomdl")
+geomdl_d = sv_dependencies["geomdl"] = SvDependency("geomdl", "https://github.com/orbingol/NURBS-Python/tree/master/geomdl", module_name="geomdl")
 geomdl_d.pip_installable = True
-try:
-    import geomdl
-    geomdl_d.module = geomdl
-except ImportError:
-    geomdl = None
 
-skimage_d = sv_dependencies["skimage"] = SvDependency("scikit-image", "https://scikit-image.org/")
+skimage_d = sv_dependencies["skimage"] = SvDependency("scikit-image", "https://scikit-image.org/", module_name="skimage")
 skimage_d.pip_installable = True
-try:
-    import skimage
-    skimage_d.module = skimage
-except ImportError:
-    skimage = None
 
-mcubes_d = sv_dependencies["mcubes"] = SvDependency("mcubes", "https://github.com/pmneila/PyMCubes")
-try:
-    import mcubes
-    mcubes_d.module = mcubes
-except ImportError:
-    mcubes = None
+mcubes_d = sv_dependencies["mcubes"] = SvDependency("mcubes", "https://github.com/pmneila/PyMCubes", module_name="mcubes")
 
-circlify_d = sv_dependencies["circlify"] = SvDependency("circlify", "https://github.com/elmotec/circlify")
+circlify_d = sv_dependencies["circlify"] = SvDependency("circlify", "https://github.com/elmotec/circlify", module_name="circlify")
 circlify_d.pip_installable = True
-try:
-    import circlify
-    circlify_d.module = circlify
-except ImportError:
-    circlify = None
 
-freecad_d = sv_dependencies["freecad"] = SvDependency("FreeCAD", "https://www.freecadweb.org/")
-try:
-    import FreeCAD
-    freecad_d.module = FreeCAD
-except ImportError:
-    FreeCAD = None
+freecad_d = sv_dependencies["freecad"] = SvDependency("FreeCAD", "https://www.freecadweb.org/", module_name="FreeCAD")
 
-cython_d = sv_dependencies["cython"] = SvDependency("Cython", "https://cython.org/")
+cython_d = sv_dependencies["cython"] = SvDependency("Cython", "https://cython.org/", module_name="Cython")
 cython_d.pip_installable = True
-try:
-    import Cython
-    cython_d.module = Cython
-except ImportError:
-    Cython = None
 
-numba_d = sv_dependencies["numba"] = SvDependency("Numba", "https://numba.pydata.org/")
+numba_d = sv_dependencies["numba"] = SvDependency("Numba", "https://numba.pydata.org/", module_name="numba")
 numba_d.pip_installable = True
-try:
-    import numba
-    numba_d.module = numba
-except ImportError:
-    numba = None
 
-pyOpenSubdiv_d = sv_dependencies["pyOpenSubdiv"] = SvDependency("pyOpenSubdiv","https://github.com/GeneralPancakeMSTR/pyOpenSubdivision")
+pyOpenSubdiv_d = sv_dependencies["pyOpenSubdiv"] = SvDependency("pyOpenSubdiv", "https://github.com/GeneralPancakeMSTR/pyOpenSubdivision", module_name="pyOpenSubdiv")
 pyOpenSubdiv_d.pip_installable = True
-try:
-    import pyOpenSubdiv
-    pyOpenSubdiv_d.module = pyOpenSubdiv
-except ImportError:
-    pyOpenSubdiv = None 
 
-numexpr_d = sv_dependencies["numexpr"] = SvDependency("numexpr","https://github.com/pydata/numexpr")
+numexpr_d = sv_dependencies["numexpr"] = SvDependency("numexpr", "https://github.com/pydata/numexpr", module_name="numexpr")
 numexpr_d.pip_installable = True
-try:
-    import numexpr
-    numexpr_d.module = numexpr
-except ImportError:
-    numexpr = None 
 
-ezdxf_d = sv_dependencies["ezdxf"] = SvDependency("ezdxf","https://github.com/mozman/ezdxf")
+ezdxf_d = sv_dependencies["ezdxf"] = SvDependency("ezdxf", "https://github.com/mozman/ezdxf", module_name="ezdxf")
 ezdxf_d.pip_installable = True
-try:
-    import ezdxf
-    ezdxf_d.module = ezdxf
-except ImportError:
-    ezdxf = None 
 
-pyacvd_d = sv_dependencies["pyacvd"] = SvDependency("pyacvd","https://github.com/pyvista/pyacvd")
+pyacvd_d = sv_dependencies["pyacvd"] = SvDependency("pyacvd", "https://github.com/pyvista/pyacvd", module_name="pyacvd")
 pyacvd_d.pip_installable = True
-try:
-    import pyacvd
-    pyacvd_d.module = pyacvd
-except ImportError:
-    pyacvd = None 
 
-pyQuadriFlow_d = sv_dependencies["pyQuadriFlow"] = SvDependency("pyQuadriFlow","https://github.com/satabol/pyQuadriFlow")
+pyQuadriFlow_d = sv_dependencies["pyQuadriFlow"] = SvDependency("pyQuadriFlow", "https://github.com/satabol/pyQuadriFlow", module_name="pyQuadriFlow")
 pyQuadriFlow_d.pip_installable = True
-try:
-    import pyQuadriFlow
-    pyQuadriFlow_d.module = pyQuadriFlow
-except ImportError:
-    pyQuadriFlow = None 
 
-pySVCGAL_d = sv_dependencies["pySVCGAL"] = SvDependency("pySVCGAL","https://github.com/satabol/pySVCGAL")
+pySVCGAL_d = sv_dependencies["pySVCGAL"] = SvDependency("pySVCGAL", "https://github.com/satabol/pySVCGAL", module_name="pySVCGAL")
 pySVCGAL_d.pip_installable = True
-try:
-    import pySVCGAL
-    pySVCGAL_d.module = pySVCGAL
-except ImportError:
-    pySVCGAL = None 
 
-spyrrow_d = sv_dependencies["spyrrow"] = SvDependency("Spyrrow","https://github.com/PaulDL-RS/spyrrow")
+spyrrow_d = sv_dependencies["spyrrow"] = SvDependency("Spyrrow", "https://github.com/PaulDL-RS/spyrrow", module_name="spyrrow")
 spyrrow_d.pip_installable = True
-try:
-    import spyrrow
-    spyrrow_d.module = spyrrow
-except ImportError:
-    spyrrow = None 
+
+_lazy_modules = {d.module_name: d for d in sv_dependencies.values() if d.module_name is not None}
+
+
+def __getattr__(name):
+    """Import of a dependency on first access: `from sverchok.dependencies import scipy`,
+    None is returned if the library is not installed"""
+    if name in _lazy_modules:
+        module = _lazy_modules[name].module
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 settings.pip = pip
 settings.sv_dependencies = sv_dependencies
@@ -276,7 +256,7 @@ class DI_OT_install_or_update_dependencies_operator(bpy.types.Operator):
     
 def register():
     good_names = [d.package for d in sv_dependencies.values()
-                  if d.module is not None and d.package is not None]
+                  if d.available and d.package is not None]
     if good_names:
         logger.info("Dependencies available: %s.", ", ".join(good_names))
     else:
@@ -26,7 +26,6 @@ a file (or probably even between files =).
 
 
 import logging
-import sys
 import time
 from contextlib import contextmanager
 from itertools import chain, cycle
@@ -43,6 +42,7 @@ from sverchok.core.sv_custom_exceptions import SvNoDataError, DependencyError
 import sverchok.core.events as ev
 from sverchok.core.event_system import handle_event
 from sverchok.data_structure import classproperty, post_load_call
+from sverchok.dependencies import module_available
 from sverchok.utils.sv_node_utils import recursive_framed_location_finder
 from sverchok.utils.docstring import SvDocstring
 from sverchok.utils.sv_logging import catch_log_error, sv_logger
@@ -629,7 +629,7 @@ class NodeDependencies:
         """Returns True if any of dependent libraries are not installed"""
         if cls._missing_dependency is None:
             for dep in cls.sv_dependencies:
-                if dep not in sys.modules:
+                if not module_available(dep):
                     cls._missing_dependency = True
                     break
             else:
@@ -13,6 +13,7 @@ from mathutils import Vector
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, no_space
 from sverchok.utils.geom_2d.merge_mesh import crop_mesh, crop_edges, crop_mesh_delaunay
+from sverchok.utils.geom_2d import array_dcel
 from sverchok.utils.decorators import deprecated
 from sverchok.utils.nodes_mixins.sockets_config import ModifierLiteNode
 
@@ -74,6 +75,15 @@ class SvCropMesh2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
     alg_mode: bpy.props.EnumProperty(
         items=alg_mode_items, name="Name of algorithm", update=update_sockets, default="Sweep_line")
 
+    implementation: bpy.props.EnumProperty(
+        name='Implementation', items=array_dcel.implementation_items, default='Python', update=updateNode,
+        description='Implementation of Sweep line algorithm for faces')
+
+    robust: bpy.props.BoolProperty(
+        name='Robust', default=False, update=updateNode,
+        description='Snap points to grid with step given by accuracy and use exact predicates, '
+                    'so result does not depend on accuracy errors (NumPy implementation only)')
+
     def draw_buttons(self, context, layout):
         layout.prop(self, 'alg_mode', expand=True)
         col = layout.column(align=True)
@@ -85,6 +95,10 @@ class SvCropMesh2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
         col.row().prop(self, 'mode', expand=True)
 
     def draw_buttons_ext(self, context, layout):
+        if self.alg_mode == 'Sweep_line' and self.input_mode == 'faces':
+            layout.prop(self, 'implementation')
+            if self.implementation == 'NumPy':
+                layout.prop(self, 'robust')
         layout.prop(self, 'accuracy')
 
     def sv_init(self, context):
@@ -115,8 +129,12 @@ class SvCropMesh2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
                                                                              in_verts_crop, in_faces_crop):
             if self.input_mode == 'faces':
                 if self.alg_mode == 'Sweep_line':
-                    out.append(crop_mesh(sv_verts, sv_faces_edges, sv_verts_crop, sv_faces_crop,
-                                         self.mode, self.accuracy))
+                    if self.implementation == 'NumPy':
+                        out.append(array_dcel.crop_mesh(sv_verts, sv_faces_edges, sv_verts_crop, sv_faces_crop,
+                                                        self.mode, self.accuracy, self.robust))
+                    else:
+                        out.append(crop_mesh(sv_verts, sv_faces_edges, sv_verts_crop, sv_faces_crop,
+                                             self.mode, self.accuracy))
                 else:
                     out.append(crop_mesh_delaunay(sv_verts, sv_faces_edges, sv_verts_crop, sv_faces_crop,
                                                       self.mode, 1 / 10 ** self.accuracy))
@@ -22,7 +22,7 @@ from mathutils import Vector
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.geom_2d.intersections import intersect_sv_edges
-from sverchok.utils.intersect_edges import intersect_edges_3d_np, intersect_edges_2d, remove_doubles_from_edgenet, intersect_edges_2d_np, intersect_edges_2d_np_big
+from sverchok.utils.intersect_edges import intersect_edges_3d_np, intersect_edges_2d, remove_doubles_from_edgenet, intersect_edges_2d_np, intersect_edges_2d_np_big, intersect_edges_grid
 from sverchok.utils.nodes_mixins.sockets_config import ModifierLiteNode
 
 try:
@@ -45,13 +45,18 @@ class SvIntersectEdgesNodeMK3(
     mode_items_2d = [("Alg_1", "Alg_1", "A brute force algorithm/intersect_line_line", 0),
                      ("Sweep_line", "Sweep line", "This algorithm is based on sweep line", 1),
                      ("Blender", "Blender", "This mode is using internal Blender function", 2),
-                     ("Np", "Np", "A brute force algorithm written in NumPy", 3)]
+                     ("Np", "Np", "A brute force algorithm written in NumPy", 3),
+                     ("Grid", "Grid", "Uniform grid broad phase with vectorized tests, for big edge nets", 4)]
+
+    mode_items_3d = [("Np", "Np", "A brute force algorithm written in NumPy", 0),
+                     ("Grid", "Grid", "Uniform grid broad phase with vectorized tests, for big edge nets", 1)]
 
     mode: bpy.props.EnumProperty(items=modeItems, default="3D", update=updateNode)
     rm_switch: bpy.props.BoolProperty(update=updateNode, description="Merges points that are closer than the defined distance")
     rm_doubles: bpy.props.FloatProperty(min=0.0, default=0.0001, step=0.1, update=updateNode, description="Finds groups of vertices closer than dist and merges them together, using the weld verts bmop")
     epsilon: bpy.props.IntProperty(min=3, default=5, update=updateNode, description="For comparing float figures")
     alg_mode_2d: bpy.props.EnumProperty(items=mode_items_2d, default="Alg_1", update=updateNode)
+    alg_mode_3d: bpy.props.EnumProperty(items=mode_items_3d, default="Np", update=updateNode)
     only_touching: bpy.props.BoolProperty(
         name='Include "On touch"',
         description='consider a valid intersection when one end of the edge lays on another edge. Generates double points so if active "remove doubles" switch is recommended',
@@ -75,9 +80,11 @@ class SvIntersectEdgesNodeMK3(
             row.row(align=True).prop(self, "alg_mode_2d", expand=True)
             if self.alg_mode_2d == 'Blender' and not bl_intersect:
                 row.label(text="For 2.81+ only", icon='ERROR')
-        if self.mode == '3D' or (self.mode == "2D" and self.alg_mode_2d in ['Np']):
+        else:
+            row.row(align=True).prop(self, "alg_mode_3d", expand=True)
+        if self.mode == '3D' or (self.mode == "2D" and self.alg_mode_2d in ['Np', 'Grid']):
             layout.prop(self, 'only_touching')
-        if self.mode == "3D" or self.mode == "2D" and self.alg_mode_2d in ['Alg_1', 'Np']:
+        if self.mode == "3D" or self.mode == "2D" and self.alg_mode_2d in ['Alg_1', 'Np', 'Grid']:
             r = layout.row(align=True)
             r1 = r.split(factor=0.32)
             r1.prop(self, 'rm_switch', text='doubles', toggle=True)
@@ -107,7 +114,9 @@ class SvIntersectEdgesNodeMK3(
             return
         verts_out, edges_out = [], []
         for vs, eds in zip(verts_in, edges_in):
-            if self.mode == "3D":
+            if self.mode == "3D" and self.alg_mode_3d == "Grid":
+                v_out, ed_out = intersect_edges_grid(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching, dimensions=3)
+            elif self.mode == "3D":
                 v_out, ed_out = intersect_edges_3d_np(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
 
             elif self.alg_mode_2d == "Alg_1":
@@ -117,6 +126,8 @@ class SvIntersectEdgesNodeMK3(
                     v_out, ed_out = intersect_edges_2d_np_big(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
                 else:
                     v_out, ed_out = intersect_edges_2d_np(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
+            elif self.alg_mode_2d == "Grid":
+                v_out, ed_out = intersect_edges_grid(vs, eds, 1 / 10 ** self.epsilon, only_touching=self.only_touching)
             elif self.alg_mode_2d == "Sweep_line":
                 v_out, ed_out = intersect_sv_edges(vs, eds, self.epsilon)
             else:
@@ -125,7 +136,7 @@ class SvIntersectEdgesNodeMK3(
                 v_out = [v.to_3d()[:] for v in v_out]
 
             # post processing step to remove doubles
-            if self.rm_switch and (self.mode == "3D" or self.alg_mode_2d in ['Alg_1', 'Np']):
+            if self.rm_switch and (self.mode == "3D" or self.alg_mode_2d in ['Alg_1', 'Np', 'Grid']):
                 v_out, ed_out = remove_doubles_from_edgenet(v_out, ed_out, self.rm_doubles)
 
             verts_out.append(v_out)
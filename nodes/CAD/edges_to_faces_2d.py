@@ -11,6 +11,7 @@ import bpy
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.geom_2d.merge_mesh import edges_to_faces
+from sverchok.utils.geom_2d import array_dcel
 from sverchok.utils.nodes_mixins.sockets_config import ModifierLiteNode
 
 
@@ -33,6 +34,12 @@ class SvEdgesToFaces2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
                                                    "does not intersect with one")
     accuracy: bpy.props.IntProperty(name='Accuracy', update=updateNode, default=5, min=3, max=12,
                                     description='Some errors of the node can be fixed by changing this value')
+    implementation: bpy.props.EnumProperty(name='Implementation', items=array_dcel.implementation_items,
+                                           default='Python', update=updateNode)
+    robust: bpy.props.BoolProperty(name='Robust', default=False, update=updateNode,
+                                   description='Snap points to grid with step given by accuracy and use exact '
+                                               'predicates, so result does not depend on accuracy errors '
+                                               '(NumPy implementation only)')
 
     def draw_buttons(self, context, layout):
         pass
@@ -44,6 +51,9 @@ class SvEdgesToFaces2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
             row.prop(self, 'fill_holes', icon='PROP_CON', toggle=1)
 
     def draw_buttons_ext(self, context, layout):
+        layout.prop(self, 'implementation')
+        if self.implementation == 'NumPy':
+            layout.prop(self, 'robust')
         layout.prop(self, 'accuracy')
 
     def sv_init(self, context):
@@ -57,7 +67,11 @@ class SvEdgesToFaces2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
             return
         out = []
         for vs, es in zip(self.inputs['Verts'].sv_get(), self.inputs['Edges'].sv_get()):
-            out.append(edges_to_faces(vs, es, self.do_intersect, self.fill_holes, self.accuracy))
+            if self.implementation == 'NumPy':
+                out.append(array_dcel.edges_to_faces(vs, es, self.do_intersect, self.fill_holes, self.accuracy,
+                                                     self.robust))
+            else:
+                out.append(edges_to_faces(vs, es, self.do_intersect, self.fill_holes, self.accuracy))
         sv_verts, sv_faces = zip(*out)
         self.outputs['Verts'].sv_set(sv_verts)
         self.outputs['Faces'].sv_set(sv_faces)
@@ -5,12 +5,14 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from functools import partial
 
 import bpy
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.geom_2d.merge_mesh import merge_mesh
+from sverchok.utils.geom_2d import array_dcel
 from sverchok.utils.nodes_mixins.sockets_config import ModifierLiteNode
 
 
@@ -47,11 +49,20 @@ class SvMergeMesh2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
                                                     " of faces from mesh A and Mesh B")
     accuracy: bpy.props.IntProperty(name='Accuracy', update=updateNode, default=5, min=3, max=12,
                                     description='Some errors of the node can be fixed by changing this value')
+    implementation: bpy.props.EnumProperty(name='Implementation', items=array_dcel.implementation_items,
+                                           default='Python', update=updateNode)
+    robust: bpy.props.BoolProperty(name='Robust', default=False, update=updateNode,
+                                   description='Snap points to grid with step given by accuracy and use exact '
+                                               'predicates, so result does not depend on accuracy errors '
+                                               '(NumPy implementation only)')
 
     def draw_buttons_ext(self, context, layout):
         col = layout.column(align=True)
         col.prop(self, 'simple_mask', toggle=True)
         col.prop(self, 'index_mask', toggle=True)
+        col.prop(self, 'implementation')
+        if self.implementation == 'NumPy':
+            col.prop(self, 'robust')
         col.prop(self, 'accuracy')
 
     def sv_init(self, context):
@@ -67,13 +78,17 @@ class SvMergeMesh2D(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node):
     def process(self):
         if not all([sock.is_linked for sock in self.inputs]):
             return
+        if self.implementation == 'NumPy':
+            func = partial(array_dcel.merge_mesh, robust=self.robust)
+        else:
+            func = merge_mesh
         out = []
         for sv_verts_a, sv_faces_a, sv_verts_b, sv_faces_b in zip(self.inputs['Verts A'].sv_get(),
                                                                   self.inputs['Faces A'].sv_get(),
                                                                   self.inputs['Verts B'].sv_get(),
                                                                   self.inputs['Faces B'].sv_get()):
-            out.append(merge_mesh(sv_verts_a, sv_faces_a, sv_verts_b, sv_faces_b, self.simple_mask, self.index_mask,
-                                  self.accuracy))
+            out.append(func(sv_verts_a, sv_faces_a, sv_verts_b, sv_faces_b, self.simple_mask, self.index_mask,
+                            self.accuracy))
         if self.simple_mask and self.index_mask:
             out_verts, out_faces, mask_a, mask_b, face_index_a, face_index_b = zip(*out)
             self.outputs['Mask A'].sv_set(mask_a)
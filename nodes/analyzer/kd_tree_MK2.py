@@ -22,6 +22,7 @@ from bpy.props import FloatProperty, EnumProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_repeat as mlr)
 from sverchok.utils.sv_KDT_utils import kdt_closest_verts_range, kdt_closest_verts_find_n
+from sverchok.utils.kdtree import split_ragged
 
 class SvKDTreeNodeMK2(SverchCustomTreeNode, bpy.types.Node):
     '''
@@ -84,20 +85,27 @@ class SvKDTreeNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         so = self.outputs
         if not (any(s.is_linked for s in so) and si[0].is_linked):
             return
-        V1, V2, N, R = mlr([i.sv_get() for i in si])
-        out = []
+        V1, V2, N, R = mlr([i.sv_get(deepcopy=False) for i in si])
         Co, ind, dist = so
+        co_out, ind_out, dist_out = [], [], []
         find_n = self.mode == "find_n"
         func = self.func_dict[self.mode]
         for v, v2, k in zip(V1, V2, (N if find_n else R)):
-            func(v, v2, k, out)
+            locations, idxs, distances, offsets = func(v, v2, k)
+            # one list of found vertices per searched vertex
+            if Co.is_linked:
+                co_out.extend(split_ragged(locations, offsets))
+            if ind.is_linked:
+                ind_out.extend(split_ragged(idxs, offsets))
+            if dist.is_linked:
+                dist_out.extend(split_ragged(distances, offsets))
 
         if Co.is_linked:
-            Co.sv_set([[i[0][:] for i in i2] for i2 in out])
+            Co.sv_set(co_out)
         if ind.is_linked:
-            ind.sv_set([[i[1] for i in i2] for i2 in out])
+            ind.sv_set(ind_out)
         if dist.is_linked:
-            dist.sv_set([[i[2] for i in i2] for i2 in out])
+            dist.sv_set(dist_out)
 
 
 def register():
@@ -15,6 +15,7 @@ from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_
 from sverchok.utils.curve import SvCurve, UnsupportedCurveTypeException
 from sverchok.utils.curve.nurbs import SvNurbsCurve
 from sverchok.utils.curve.nurbs_algorithms import intersect_nurbs_curves
+from sverchok.utils.curve.batch_intersect import intersect_curves_batch
 from sverchok.utils.curve.freecad import curve_to_freecad
 from sverchok.dependencies import FreeCAD, scipy
 
@@ -31,13 +32,13 @@ class SvIntersectNurbsCurvesNode(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'Intersect NURBS Curves'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_INTERSECT_CURVES'
-    sv_dependencies = {'FreeCAD', 'scipy'}
 
     implementations = []
     if FreeCAD is not None:
         implementations.append(('FREECAD', "FreeCAD", "Implementation from FreeCAD library", 0))
     if scipy is not None:
         implementations.append(('SCIPY', "SciPy", "Sverchok built-in implementation", 1))
+    implementations.append(('BATCH', "Batch", "Sverchok built-in implementation, which intersects all curves at once; fast for many curves", 2))
 
     implementation : EnumProperty(
             name = "Implementation",
@@ -104,6 +105,8 @@ class SvIntersectNurbsCurvesNode(SverchCustomTreeNode, bpy.types.Node):
         if self.implementation == 'SCIPY':
             layout.prop(self, 'precision')
             layout.prop(self, 'method')
+        elif self.implementation == 'BATCH':
+            layout.prop(self, 'precision')
 
     def sv_init(self, context):
         self.inputs.new('SvCurveSocket', "Curve1")
@@ -111,6 +114,7 @@ class SvIntersectNurbsCurvesNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvVerticesSocket', "Intersections")
         self.outputs.new('SvStringsSocket', "T1")
         self.outputs.new('SvStringsSocket', "T2")
+        self.implementation = 'BATCH'
 
     def _filter(self, points):
         if not points:
@@ -150,6 +154,31 @@ class SvIntersectNurbsCurvesNode(SverchCustomTreeNode, bpy.types.Node):
             pts.append((t1, t2, p))
         return self._filter(pts)
 
+    def process_batch(self, curves1, curves2, pairs):
+        curves1 = [self.to_nurbs(curve, "Curve1") for curve in curves1]
+        curves2 = [self.to_nurbs(curve, "Curve2") for curve in curves2]
+        res = intersect_curves_batch(curves1, curves2, pairs = pairs,
+                    numeric_precision = self.precision)
+        results = []
+        for pair in pairs:
+            points = [(r[0], r[1], r[2].tolist()) for r in res.get(pair, [])]
+            results.append(self._filter(points))
+        return results
+
+    def process_pair(self, curve1, curve2):
+        curve1 = self.to_nurbs(curve1, "Curve1")
+        curve2 = self.to_nurbs(curve2, "Curve2")
+        if self.implementation == 'SCIPY':
+            return self.process_native(curve1, curve2)
+        else:
+            return self.process_freecad(curve1, curve2)
+
+    def to_nurbs(self, curve, name):
+        nurbs = SvNurbsCurve.to_nurbs(curve)
+        if nurbs is None:
+            raise UnsupportedCurveTypeException(f"{name} is not a NURBS")
+        return nurbs
+
     def match(self, curves1, curves2):
         if self.matching == 'LONG':
             return zip_long_repeat(list(enumerate(curves1)), list(enumerate(curves2)))
@@ -175,19 +204,13 @@ class SvIntersectNurbsCurvesNode(SverchCustomTreeNode, bpy.types.Node):
             new_points = []
             new_t1 = []
             new_t2 = []
-            for (i, curve1), (j, curve2) in self.match(curve1s, curve2s):
-                curve1 = SvNurbsCurve.to_nurbs(curve1)
-                if curve1 is None:
-                    raise UnsupportedCurveTypeException("Curve1 is not a NURBS")
-                curve2 = SvNurbsCurve.to_nurbs(curve2)
-                if curve2 is None:
-                    raise UnsupportedCurveTypeException("Curve2 is not a NURBS")
-
-                if self.implementation == 'SCIPY':
-                    t1s, t2s, ps = self.process_native(curve1, curve2)
-                else:
-                    t1s, t2s, ps = self.process_freecad(curve1, curve2)
+            pairs = list(self.match(curve1s, curve2s))
+            if self.implementation == 'BATCH':
+                results = self.process_batch(curve1s, curve2s, [(i, j) for (i, _), (j, _) in pairs])
+            else:
+                results = [self.process_pair(curve1, curve2) for (_, curve1), (_, curve2) in pairs]
 
+            for ((i, _), (j, _)), (t1s, t2s, ps) in zip(pairs, results):
                 if self.check_intersection:
                     if not ps:
                         raise Exception(f"Object #{object_idx}: Curve #{i} does not intersect with curve #{j}!")
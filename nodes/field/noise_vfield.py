@@ -5,6 +5,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL
+from sverchok.utils.noise_engine import noise_backends, MATHUTILS
 
 from sverchok.utils.field.vector import SvNoiseVectorField
 
@@ -26,6 +27,13 @@ class SvNoiseVectorFieldNode(SverchCustomTreeNode, bpy.types.Node):
         description="Noise type",
         update=updateNode)
 
+    backend: EnumProperty(
+        name='Backend',
+        items=noise_backends,
+        default=MATHUTILS,
+        description="Implementation of the noise",
+        update=updateNode)
+
     seed: IntProperty(default=0, name='Seed', update=updateNode)
 
     def sv_init(self, context):
@@ -34,6 +42,7 @@ class SvNoiseVectorFieldNode(SverchCustomTreeNode, bpy.types.Node):
 
     def draw_buttons(self, context, layout):
         layout.prop(self, 'noise_type', text="Type")
+        layout.prop(self, 'backend', expand=True)
 
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
@@ -48,7 +57,7 @@ class SvNoiseVectorFieldNode(SverchCustomTreeNode, bpy.types.Node):
 
             if seed == 0:
                 seed = 12345
-            field = SvNoiseVectorField(self.noise_type, seed)
+            field = SvNoiseVectorField(self.noise_type, seed, self.backend)
             fields_out.append(field)
 
         self.outputs['Noise'].sv_set(fields_out)
@@ -7,6 +7,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level
 from sverchok.utils.field.scalar import SvScalarField
+from sverchok.utils.field.compiler import compile_field
 
 
 class SvScalarFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
@@ -60,7 +61,9 @@ class SvScalarFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
                     xs = XYZ[:,0]
                     ys = XYZ[:,1]
                     zs = XYZ[:,2]
-                    new_values = field.evaluate_grid(xs, ys, zs) if self.output_numpy else field.evaluate_grid(xs, ys, zs).tolist()
+                    new_values = compile_field(field).evaluate_grid(xs, ys, zs)
+                    if not self.output_numpy:
+                        new_values = new_values.tolist()
                 values_out.append(new_values)
 
         self.outputs['Value'].sv_set(values_out)
@@ -7,6 +7,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, repeat_last_for_length, ensure_nesting_level
 from sverchok.utils.field.vector import SvVectorField
+from sverchok.utils.field.compiler import compile_field
 
 
 class SvVectorFieldApplyNode(SverchCustomTreeNode, bpy.types.Node):
@@ -84,11 +85,12 @@ class SvVectorFieldApplyNode(SverchCustomTreeNode, bpy.types.Node):
                 else:
                     coeffs = repeat_last_for_length(coeffs, len(vertices))
                     vertices = np.array(vertices)
+                    plan = compile_field(field)
                     for i in range(iterations):
                         xs = vertices[:,0]
                         ys = vertices[:,1]
                         zs = vertices[:,2]
-                        new_xs, new_ys, new_zs = field.evaluate_grid(xs, ys, zs)
+                        new_xs, new_ys, new_zs = plan.evaluate_grid(xs, ys, zs)
                         new_vectors = np.dstack((new_xs[:], new_ys[:], new_zs[:]))
                         new_vectors = np.array(coeffs)[np.newaxis].T * new_vectors[0]
                         vertices = vertices + new_vectors
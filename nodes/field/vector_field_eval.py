@@ -6,6 +6,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty, St
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.utils.field.compiler import compile_field
 
 
 class SvVectorFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
@@ -56,7 +57,7 @@ class SvVectorFieldEvaluateNode(SverchCustomTreeNode, bpy.types.Node):
                 xs = XYZ[:,0]
                 ys = XYZ[:,1]
                 zs = XYZ[:,2]
-                new_xs, new_ys, new_zs = field.evaluate_grid(xs, ys, zs)
+                new_xs, new_ys, new_zs = compile_field(field).evaluate_grid(xs, ys, zs)
                 new_vectors = np.dstack((new_xs[:], new_ys[:], new_zs[:]))
                 new_values = new_vectors if self.output_numpy else new_vectors[0].tolist()
 
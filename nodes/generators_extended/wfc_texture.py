@@ -12,7 +12,7 @@ import bpy
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
-from sverchok.utils.wfc_algorithm import WaveFunctionCollapse
+from sverchok.utils.wfc_algorithm import WaveFunctionCollapse, BitsetWaveFunctionCollapse
 
 
 def load_image(image_name) -> np.ndarray:
@@ -32,8 +32,8 @@ class SvWFCTextureNode(SverchCustomTreeNode, bpy.types.Node):
     bl_icon = 'FORCE_FORCE'
 
     image_name: bpy.props.StringProperty(name="Image", default="", update=updateNode, description="Sample image")
-    height: bpy.props.IntProperty(default=10, min=1, max=100, update=updateNode, description="For output image")
-    width: bpy.props.IntProperty(default=10, min=1, max=100, update=updateNode, description="For output image")
+    height: bpy.props.IntProperty(default=10, min=1, max=1000, update=updateNode, description="For output image")
+    width: bpy.props.IntProperty(default=10, min=1, max=1000, update=updateNode, description="For output image")
     seed: bpy.props.IntProperty(update=updateNode)
     pattern_size: bpy.props.IntProperty(default=3, min=1, max=5, update=updateNode, description="Usually 2 or 3")
     rotate_patterns: bpy.props.BoolProperty(update=updateNode, description="More complex result")
@@ -42,6 +42,13 @@ class SvWFCTextureNode(SverchCustomTreeNode, bpy.types.Node):
     periodic_input: bpy.props.BoolProperty(default=True, update=updateNode, description="Impact on creating patterns")
     tries_number: bpy.props.IntProperty(default=1, min=1, max=10, update=updateNode,
                                         description="If contradiction it will try calculate again")
+    algorithm: bpy.props.EnumProperty(
+        name="Algorithm",
+        items=[('SETS', 'Sets', "Original implementation, possible patterns of each cell are kept in Python sets", 0),
+               ('BITSETS', 'Bitsets', "Possible patterns of all cells are kept in NumPy bitsets, "
+                                      "much faster for big images and many patterns, results differ from Sets", 1)],
+        default='SETS',
+        update=updateNode)
 
     def sv_init(self, context):
         self.inputs.new("SvStringsSocket", "height").prop_name = 'height'
@@ -49,6 +56,7 @@ class SvWFCTextureNode(SverchCustomTreeNode, bpy.types.Node):
         self.inputs.new("SvStringsSocket", "seed").prop_name = 'seed'
         self.inputs.new("SvStringsSocket", "pattern size").prop_name = 'pattern_size'
         self.outputs.new("SvColorSocket", "image")
+        self.algorithm = 'BITSETS'  # default for newly created nodes
 
     def draw_buttons(self, context, layout):
         col = layout.column(align=True)
@@ -60,6 +68,7 @@ class SvWFCTextureNode(SverchCustomTreeNode, bpy.types.Node):
         col.prop(self, 'tiling_output')
 
     def draw_buttons_ext(self, context, layout: 'UILayout'):
+        layout.prop(self, 'algorithm')
         layout.prop(self, 'tries_number')
 
     def process(self):
@@ -67,7 +76,8 @@ class SvWFCTextureNode(SverchCustomTreeNode, bpy.types.Node):
             return
 
         image = load_image(self.image_name)
-        wave = WaveFunctionCollapse(
+        solver_class = BitsetWaveFunctionCollapse if self.algorithm == 'BITSETS' else WaveFunctionCollapse
+        wave = solver_class(
             image,
             patter_size=self.inputs['pattern size'].sv_get()[0][0],
             periodic_input=self.periodic_input,
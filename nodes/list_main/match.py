@@ -21,7 +21,9 @@ from bpy.props import IntProperty, EnumProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (match_short, match_long_cycle, updateNode,
-                                     match_long_repeat, match_cross2)
+                                     match_long_repeat, match_cross2, get_data_nesting_level,
+                                     as_ragged_array)
+from sverchok.utils.ragged import match_ragged
 
 #
 # List Match Node by Linus Yng
@@ -82,6 +84,27 @@ class ListMatchNode(SverchCustomTreeNode, bpy.types.Node):
             return tuple(f2(list(lsts)))
         return None
 
+    def match_numeric(self, lsts):
+        """
+        Faster matching of lists of numbers at the last level of nested data;
+        returns None for other data.
+        """
+        try:
+            if any(get_data_nesting_level(lst) != self.level for lst in lsts):
+                return None
+        except TypeError:
+            return None
+        arrays = []
+        for lst in lsts:
+            array = as_ragged_array(lst)
+            if array is None or array.depth != self.level:
+                return None
+            arrays.append(array)
+        matched = match_ragged(arrays, self.level, self.mode, self.mode_final)
+        if matched is None:
+            return None
+        return [array.to_nested() for array in matched]
+
     def sv_update(self):
         # inputs
         # these functions are in util.py
@@ -115,7 +138,9 @@ class ListMatchNode(SverchCustomTreeNode, bpy.types.Node):
                 if socket.is_linked:
                     lsts.append(socket.sv_get())
 
-            out = self.match(lsts, self.level, func_dict[self.mode], func_dict[self.mode_final])
+            out = self.match_numeric(lsts)
+            if out is None:
+                out = self.match(lsts, self.level, func_dict[self.mode], func_dict[self.mode_final])
 
             # output into linked sockets s
             for i, socket in enumerate(self.outputs):
@@ -16,6 +16,7 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+from itertools import cycle
 from typing import List, Tuple
 
 import numpy as np
@@ -25,8 +26,9 @@ from bpy.props import BoolProperty, EnumProperty
 from mathutils import Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode
-from sverchok.utils.mesh_functions import apply_matrix_to_vertices_py
+from sverchok.data_structure import updateNode, repeat_last
+from sverchok.utils.mesh_functions import apply_matrix_to_vertices_py, transform_copies
+from sverchok.utils.matrix_array import SvMatrixArray, is_packed, unpack_matrices
 from sverchok.utils.vectorize import vectorize, devectorize, SvVerts, SvEdges, SvPolys
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
 
@@ -82,6 +84,38 @@ def apply_matrix(
     return new_vertices, edges, polygons
 
 
+def apply_packed_matrices(vertices, edges, polygons, matrices, implementation='Python'):
+    """Vectorized apply_matrices for packed matrices,
+    matrices are either SvMatrixArray (a matrix per object) or list of SvMatrixArray (matrices per object)"""
+    def output(array):
+        return array.tolist() if implementation == 'Python' else array
+
+    if isinstance(matrices, SvMatrixArray):
+        # copies of one mesh are separate objects
+        mesh_vertices, mesh_edges, mesh_polygons = transform_copies(vertices[0], None, None, matrices)
+        mesh_vertices = mesh_vertices.reshape(len(matrices), -1, 3)
+        return ([output(vs) for vs in mesh_vertices],
+                [edges[0]] * len(matrices) if edges else [],
+                [polygons[0]] * len(matrices) if polygons else [])
+
+    out_vertices, out_edges, out_polygons = [], [], []
+    objects_number = max(len(vertices), len(matrices))
+    for _, vs, es, ps, ms in zip(range(objects_number), repeat_last(vertices),
+                                  repeat_last(edges) if edges else cycle([None]),
+                                  repeat_last(polygons) if polygons else cycle([None]),
+                                  repeat_last(matrices)):
+        if not len(ms) or not len(vs):
+            out_vertices.append(vs)
+            out_edges.append(es)
+            out_polygons.append(ps)
+            continue
+        vs, es, ps = transform_copies(vs, es, ps, ms)
+        out_vertices.append(output(vs))
+        out_edges.append(es)
+        out_polygons.append(ps)
+    return out_vertices, out_edges if edges else [], out_polygons if polygons else []
+
+
 def join_meshes(*, vertices: List[SvVerts], edges: List[SvEdges], polygons: List[SvPolys]):
     joined_vertices = []
     joined_edges = []
@@ -175,10 +209,14 @@ class SvMatrixApplyJoinNode(SverchCustomTreeNode, bpy.types.Node):
         vertices = self.inputs['Vertices'].sv_get(default=[], deepcopy=False)
         edges = self.inputs['Edges'].sv_get(default=[], deepcopy=False)
         faces = self.inputs['Faces'].sv_get(default=[], deepcopy=False)
-        matrices = self.inputs['Matrices'].sv_get(default=[], deepcopy=False)
+        matrices = self.inputs['Matrices'].sv_get(default=[], deepcopy=False, packed=True)
 
+        if matrices and vertices and is_packed(matrices) and (len(vertices) == 1 or not isinstance(matrices, SvMatrixArray)):
+            out_vertices, out_edges, out_polygons = apply_packed_matrices(
+                vertices, edges, faces, matrices, implementation=self.implementation)
         # fixing matrices nesting level if necessary, this is for back capability, can be removed later on
-        if matrices:
+        elif matrices:
+            matrices = unpack_matrices(matrices)
             is_flat_list = not isinstance(matrices[0], (list, tuple))
             if is_flat_list:
                 _apply_matrix = vectorize(apply_matrix, match_mode='REPEAT')
@@ -16,12 +16,16 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import numpy as np
+
 import bpy
 from bpy.props import EnumProperty, FloatProperty, BoolProperty, StringProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, match_long_repeat, make_repeaters
+from sverchok.data_structure import updateNode, match_long_repeat, numpy_full_list
 from sverchok.utils.sv_transform_helper import AngleUnits, SvAngleHelper
-from mathutils import Quaternion, Matrix, Euler
+from sverchok.utils.matrix_array import (SvMatrixArray, quaternions_to_rotations, euler_to_rotations,
+                                         axis_angle_to_quaternions)
+from mathutils import Quaternion
 
 rotation_mode_items = [
     ("QUATERNION", "Quaternion",   "Rotation given as a Quaternion", 0),
@@ -35,74 +39,32 @@ input_sockets = {
     "AXISANGLE":  ["Axis", "Angle"],
 }
 
-mat_t = Matrix().Identity(4)  # pre-allocate once for performance (translation)
-mat_s = Matrix().Identity(4)  # pre-allocate once for performance (scale)
+def match_arrays(params, sizes):
+    """np.arrays of the same length made from the lists of parameters by repeating last values"""
+    mat_num = max(map(len, params))
+    if min(map(len, params)) == 0:
+        mat_num = 0
+    arrays = []
+    for param, size in zip(params, sizes):
+        array = np.asarray(param, dtype=np.float64)
+        if size > 1:
+            array = array.reshape(-1, size)
+        arrays.append(numpy_full_list(array, mat_num) if mat_num else array[:0])
+    return arrays
 
 def quaternion_matrices(params):
-    matrices = []
-    mat_num = max(map(len, params))
-    params2 = make_repeaters(params)
-    for i, location, quaternion, scale in zip(range(mat_num), *params2):
-        # translation
-        mat_t[0][3] = location[0]
-        mat_t[1][3] = location[1]
-        mat_t[2][3] = location[2]
-        # rotation
-        mat_r = quaternion.to_matrix().to_4x4()
-        # scale
-        mat_s[0][0] = scale[0]
-        mat_s[1][1] = scale[1]
-        mat_s[2][2] = scale[2]
-        # composite matrix
-        m = mat_t @ mat_r @ mat_s
-        matrices.append(m)
-    return matrices
+    location, quaternion, scale = match_arrays(params, [3, 4, 3])
+    return SvMatrixArray.compose(location, quaternions_to_rotations(quaternion), scale)
+
 def euler_matrices(params, euler_order, angle_units):
-    mat_num = max(map(len, params))
-    params2 = make_repeaters(params)
-    matrices = []
-    for i, location, angleX, angleY, angleZ, scale in zip(range(mat_num), *params2):
-        # translation
-        mat_t[0][3] = location[0]
-        mat_t[1][3] = location[1]
-        mat_t[2][3] = location[2]
-        # rotation
-        angles = (angleX * angle_units, angleY * angle_units, angleZ * angle_units)
-        euler = Euler(angles, euler_order)
-        # mat_r = euler.to_quaternion().to_matrix().to_4x4()
-        mat_r = euler.to_matrix().to_4x4()
-
-        # scale
-        mat_s[0][0] = scale[0]
-        mat_s[1][1] = scale[1]
-        mat_s[2][2] = scale[2]
-        # composite matrix
-        m = mat_t @ mat_r @ mat_s
-        matrices.append(m)
-    return matrices
+    location, angle_x, angle_y, angle_z, scale = match_arrays(params, [3, 1, 1, 1, 3])
+    angles = np.stack((angle_x, angle_y, angle_z), axis=-1) * angle_units
+    return SvMatrixArray.compose(location, euler_to_rotations(angles, euler_order), scale)
 
 def axis_angle_matrices(params, angle_units):
-    max_len = max(map(len, params))
-
-    params2 = make_repeaters(params)
-    # params2 = match_long_repeat([ll, xl, al, sl])
-    matrices = []
-    for i, location, axis, angle, scale in zip(range(max_len), *params2):
-    # for location, axis, angle, scale in zip(*params2):
-        # translation
-        mat_t[0][3] = location[0]
-        mat_t[1][3] = location[1]
-        mat_t[2][3] = location[2]
-        # rotation
-        mat_r = Quaternion(axis, angle * angle_units).to_matrix().to_4x4()
-        # scale
-        mat_s[0][0] = scale[0]
-        mat_s[1][1] = scale[1]
-        mat_s[2][2] = scale[2]
-        # composite matrix
-        m = mat_t @ mat_r @ mat_s
-        matrices.append(m)
-    return matrices
+    location, axis, angle, scale = match_arrays(params, [3, 3, 1, 3])
+    quaternions = axis_angle_to_quaternions(axis, angle * angle_units)
+    return SvMatrixArray.compose(location, quaternions_to_rotations(quaternions), scale)
 
 class SvMatrixInNodeMK4(SverchCustomTreeNode, bpy.types.Node, SvAngleHelper):
     """
@@ -224,8 +186,9 @@ class SvMatrixInNodeMK4(SverchCustomTreeNode, bpy.types.Node, SvAngleHelper):
 
         inputs = self.inputs
 
+        # matrices of each object are packed into SvMatrixArray
         matrix_list = []
-        add_matrix = matrix_list.extend if self.flat_output else matrix_list.append
+        add_matrix = matrix_list.append
 
         if self.rotation_mode == "QUATERNION":
             input_l = inputs["Location"].sv_get(deepcopy=False)
@@ -258,6 +221,8 @@ class SvMatrixInNodeMK4(SverchCustomTreeNode, bpy.types.Node, SvAngleHelper):
             for p in zip(*params1):
                 add_matrix(axis_angle_matrices(p, angle_units))
 
+        if self.flat_output:
+            matrix_list = SvMatrixArray(np.concatenate([m.data for m in matrix_list])) if matrix_list else []
         self.outputs['Matrices'].sv_set(matrix_list)
 
 
@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from functools import reduce
+import numpy as np
 import bpy
 from bpy.props import BoolProperty, EnumProperty
 
@@ -25,6 +26,7 @@ from mathutils import Matrix
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, list_match_func, numpy_list_match_modes)
 from sverchok.utils.sv_itertools import (recurse_f_level_control)
+from sverchok.utils.matrix_array import SvMatrixArray, unpack_matrices, quaternions_to_rotations
 
 OPERATION_ITEMS = [
     ("MULTIPLY", "Multiply", "Multiply two matrices", 0),
@@ -81,6 +83,15 @@ def recursive_basis_op(mat_list):
     return x_list, y_list, z_list
 
 
+def match_packed(arrays, list_match):
+    """match lengths of arrays of matrices"""
+    lengths = [len(array) for array in arrays]
+    count = min(lengths) if list_match == "SHORT" else max(lengths)
+    indices = np.arange(count)
+    if list_match == "CYCLE":
+        return [array[indices % len(array)] for array in arrays]
+    return [array[np.minimum(indices, len(array) - 1)] for array in arrays]
+
 def general_op(mat_list, operation):
 
     if isinstance(mat_list[0], Matrix):
@@ -242,6 +253,37 @@ class SvMatrixMathNode(SverchCustomTreeNode, bpy.types.Node):
             while len(inputs) > 2 and not inputs[-2].links:
                 inputs.remove(inputs[-1])
 
+    def process_packed(self, data_in):
+        """Vectorized operations for flat lists of matrices packed into SvMatrixArray"""
+        outputs = self.outputs
+        if self.operation == "MULTIPLY":
+            if self.prePost == "POST":  # B op A : reverse input order
+                data_in = data_in[::-1]
+            arrays = match_packed([data.data for data in data_in], self.list_match)
+            outputs['C'].sv_set(SvMatrixArray(reduce(np.matmul, arrays)))
+            return
+
+        mat_list = data_in[0]
+        if self.operation == "INVERT":
+            outputs['C'].sv_set(mat_list.inverted())
+            return
+
+        locations, quaternions, scales = mat_list.decompose()
+        rotations = quaternions_to_rotations(quaternions)
+        if self.operation == "BASIS":
+            outputs['X'].sv_set([rotations[:, :, 0].tolist()])
+            outputs['Y'].sv_set([rotations[:, :, 1].tolist()])
+            outputs['Z'].sv_set([rotations[:, :, 2].tolist()])
+            outputs['C'].sv_set(mat_list)
+        else:  # FILTER
+            if self.filter_t:
+                locations[:] = 0
+            if self.filter_r:
+                rotations[:] = np.identity(3)
+            if self.filter_s:
+                scales[:] = 1
+            outputs['C'].sv_set(SvMatrixArray.compose(locations, rotations, scales))
+
     def process(self):
         outputs = self.outputs
         if not any(s.is_linked for s in outputs):
@@ -249,7 +291,12 @@ class SvMatrixMathNode(SverchCustomTreeNode, bpy.types.Node):
 
         data_in = []  # collect the inputs from the connected sockets
         for s in filter(lambda s: s.is_linked, self.inputs):
-            data_in.append(s.sv_get(default=id_mat))
+            data_in.append(s.sv_get(default=id_mat, packed=True))
+
+        if data_in and all(isinstance(data, SvMatrixArray) and len(data) for data in data_in):
+            self.process_packed(data_in)
+            return
+        data_in = [unpack_matrices(data) for data in data_in]
 
         operation = self.get_operation()
 
@@ -22,7 +22,9 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.sv_transform_helper import AngleUnits, SvAngleHelper
 from sverchok.utils.nodes_mixins.recursive_nodes import SvRecursiveNode
-from mathutils import Matrix
+from sverchok.utils.matrix_array import (SvMatrixArray, is_packed, quaternions_to_rotations,
+                                         rotations_to_euler, quaternions_to_axis_angle)
+from mathutils import Matrix, Quaternion
 
 
 mode_items = [
@@ -113,6 +115,53 @@ class SvMatrixOutNodeMK2(SverchCustomTreeNode, bpy.types.Node, SvAngleHelper, Sv
         elif self.mode == 'QUATERNION':
             layout.prop(self, 'flat_output')
 
+    def process(self):
+        matrix_socket = self.inputs['Matrix']
+        if matrix_socket.is_linked and any(s.is_linked for s in self.outputs):
+            matrices = matrix_socket.sv_get(deepcopy=False, packed=True)
+            if is_packed(matrices):
+                self.process_packed([matrices] if isinstance(matrices, SvMatrixArray) else matrices)
+                return
+        SvRecursiveNode.process(self)
+
+    def process_packed(self, input_M):
+        """The same as process_data but for packed matrices (list of SvMatrixArray)"""
+        outputs = self.outputs
+        result = []
+        for mat_list in input_M:
+            locations, quaternions, scales = mat_list.decompose()
+            quaternion_list = []
+            angles = [[], [], []]
+            axis_list, angle_list = [], []
+            if outputs['Quaternion'].is_linked:
+                quaternion_list = [Quaternion(q) for q in quaternions.tolist()]
+
+            if self.mode == "EULER":
+                # conversion factor from radians to the current angle units
+                au = self.angle_conversion_factor(AngleUnits.RADIANS, self.angle_units)
+                eulers = rotations_to_euler(quaternions_to_rotations(quaternions), self.euler_order) * au
+                for i, name in enumerate("XYZ"):
+                    if outputs["Angle " + name].is_linked:
+                        angles[i] = eulers[:, i].tolist()
+            elif self.mode == "AXISANGLE":
+                axes, rotation_angles = quaternions_to_axis_angle(quaternions)
+                if outputs['Axis'].is_linked:
+                    axis_list = [tuple(axis) for axis in axes.tolist()]
+
+                if outputs['Angle'].is_linked:
+                    # conversion factor from radians to the current angle units
+                    au = self.angle_conversion_factor(AngleUnits.RADIANS, self.angle_units)
+                    angle_list = (rotation_angles * au).tolist()
+
+            result.append([locations.tolist(), scales.tolist(), quaternion_list, *angles, axis_list, angle_list])
+
+        output_data = list(zip(*result))
+        if self.mode == 'QUATERNION' and len(output_data[2]) == 1 and self.flat_output:
+            output_data[2] = output_data[2][0]
+        for socket, data in zip(outputs, output_data):
+            if socket.is_linked:
+                socket.sv_set(data)
+
     def process_data(self, params):
         input_M = params[0]
         outputs = self.outputs
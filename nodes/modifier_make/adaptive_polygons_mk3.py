@@ -18,7 +18,8 @@
 
 from math import sin, cos, pi, sqrt, pow
 from functools import reduce
-from itertools import cycle
+from itertools import cycle, islice
+import numpy as np
 from numpy import (array as np_array,
                    newaxis as np_newaxis,
                    cross as np_cross,
@@ -50,6 +51,8 @@ from sverchok.utils.geom import diameter, LineEquation2D, center
 from sverchok.utils.math import np_normalize_vectors
 from sverchok.utils.mesh_functions import join_meshes, meshes_py, to_elements
 from sverchok.utils.nodes_mixins.sockets_config import ModifierNode
+from sverchok.utils.adaptive_polygons import (flatten_faces, corner_indexes, map_to_quads, map_to_tris,
+                                              auto_z_scales, copy_topology)
 # "coauthor": "Alessandro Zomparelli (sketchesofcode)"
 
 cos_pi_6 = cos(pi/6)
@@ -172,6 +175,40 @@ class OutputData():
         if self.get_face_recpt_idx:
             self.face_idx_add([recpt_face_idx])
 
+    def add_copies(self, verts, donor, recpt_idxs):
+        """Add copies of the donor, one object per copy"""
+        n_copies = len(verts)
+        self.verts_out.extend(verts)
+        if self.get_edges:
+            self.edges_out.extend([donor.edges_i] * n_copies)
+        if self.get_faces:
+            self.faces_out.extend([donor.faces_i] * n_copies)
+        if self.get_face_data:
+            self.face_data_out.extend([donor.face_data_i] * n_copies)
+        if self.get_vert_recpt_idx:
+            self.vert_recpt_idx_out.extend(np.repeat(recpt_idxs[:, np_newaxis], len(donor.verts_v), axis=1).tolist())
+        if self.get_edge_recpt_idx:
+            self.edge_recpt_idx_out.extend(np.repeat(recpt_idxs[:, np_newaxis], len(donor.edges_i), axis=1).tolist())
+        if self.get_face_recpt_idx:
+            self.face_recpt_idx_out.extend(np.repeat(recpt_idxs[:, np_newaxis], len(donor.faces_i), axis=1).tolist())
+
+    def add_joined_copies(self, verts, donor, recpt_idxs):
+        """Add copies of the donor as one object, verts is array of shape (copies, donor verts, 3)"""
+        n_copies, n_verts = verts.shape[:2]
+        self.verts_add(verts.reshape(-1, 3))
+        if self.get_edges:
+            self.edges_add(copy_topology(donor.edges_i, n_copies, n_verts, as_array=True))
+        if self.get_faces:
+            self.faces_add(copy_topology(donor.faces_i, n_copies, n_verts, as_array=True))
+        if self.get_face_data:
+            self.face_data_add(donor.face_data_i * n_copies)
+        if self.get_vert_recpt_idx:
+            self.vert_idx_add(np.repeat(recpt_idxs, n_verts).tolist())
+        if self.get_edge_recpt_idx:
+            self.edge_idx_add(np.repeat(recpt_idxs, len(donor.edges_i)).tolist())
+        if self.get_face_recpt_idx:
+            self.face_idx_add(np.repeat(recpt_idxs, len(donor.faces_i)).tolist())
+
     def extend(self, new):
         self.verts_out.extend(new.verts_out)
         self.edges_out.extend(new.edges_out)
@@ -184,6 +221,8 @@ class OutputData():
     def join(self, rem_doubles, threshold):
 
         self.verts_out, self.edges_out, self.faces_out = join(self.verts_out, self.edges_out, self.faces_out)
+        if isinstance(self.verts_out[0], np.ndarray):
+            self.verts_out = [self.verts_out[0].tolist()]
         self.face_data_out = sum(self.face_data_out, [])
         if self.get_vert_recpt_idx:
             self.vert_recpt_idx_out = sum(self.vert_recpt_idx_out, [])
@@ -1216,6 +1255,173 @@ class SvAdaptivePolygonsNodeMk3(ModifierNode, SverchCustomTreeNode, bpy.types.No
         return self.ngons_as
 
 
+    def get_map_modes(self, mask, faces):
+        """get_map_mode for all faces at once"""
+        if self.mask_mode == 'TRANSFORM':
+            names = np.array([mode[0] for mode in self.transform_modes])
+            return names[np.asarray(mask, dtype=np.int64)]
+        sides = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        modes = np.where(sides == 3, self.tris_as, np.where(sides == 4, self.quads_as, self.ngons_as))
+        return np.where(np.asarray(mask, dtype=bool), modes, self.mask_mode)
+
+    def _prepare_batched_donor(self, verts_donor, edges_donor, faces_donor, face_data_donor, angle):
+        """Donor rotated by angle, with its coordinates prepared for map_to_quads and map_to_tris"""
+        X, Y = self.get_other_axes()
+        Z = self.normal_axis_idx()
+
+        donor = DonorData()
+        self.verts_of_unit_triangle(donor)
+        donor_verts_o = [Vector(vert) for vert in verts_donor]
+        verts_v = self.rotate_z(donor_verts_o, angle)
+        np_verts = np.array(verts_v, dtype=np.float64)
+        donor.verts_v = np_verts
+        donor.edges_i = edges_donor
+        donor.faces_i = faces_donor
+        donor.face_data_i = cycle_for_length(face_data_donor, len(faces_donor))
+        donor.min_x, donor.max_x = np_verts[:, X].min(), np_verts[:, X].max()
+        donor.min_y, donor.max_y = np_verts[:, Y].min(), np_verts[:, Y].max()
+        donor.xy = np_verts[:, [X, Y]]
+        donor.z = np_verts[:, Z]
+        if self.xy_mode == 'BOUNDS':
+            donor.tri_vert_1, donor.tri_vert_2, donor.tri_vert_3 = self.bounding_triangle(verts_v)
+            donor.quad_xy = np.stack((self.map_bounds(donor.min_x, donor.max_x, donor.xy[:, 0]),
+                                      self.map_bounds(donor.min_y, donor.max_y, donor.xy[:, 1])), axis=-1)
+        else:
+            donor.quad_xy = donor.xy
+        donor.src_triangle = np.array([donor.tri_vert_1, donor.tri_vert_2, donor.tri_vert_3])[:, [X, Y]]
+        donor.z_size = diameter(donor_verts_o, Z)
+        return donor
+
+    def _process_batched(self, bm, verts_recpt, faces_recpt, donors, face_donors,
+                         z_coefs, z_offsets, z_rotations, w_coefs, face_rots, normal_mode, map_modes):
+        """
+        The same as _process when faces are mapped as Tris or Quads.
+        Faces are grouped by donor and by Z rotation; the donor of each group
+        is prepared once and all faces of one kind in the group are mapped at once.
+        :param donors: list of (verts, edges, faces, face_data) of donors
+        :param face_donors: index of the donor for each recipient face
+        """
+        output = OutputData(self)
+        output_numpy = self.output_numpy and not self.join
+
+        z_coefs = np.array(z_coefs, dtype=np.float64)
+        z_offsets = np.array(z_offsets, dtype=np.float64)
+        z_rotations = np.array(z_rotations, dtype=np.float64)
+        w_coefs = np.array(w_coefs, dtype=np.float64)
+        face_rots = np.array(face_rots, dtype=np.int64)
+        normal_mode = np.array(normal_mode, dtype=bool)
+
+        recpt_co = np.array([v.co[:] for v in bm.verts])
+        if self.use_shell_factor:
+            recpt_normals = np.array([(v.normal * v.calc_shell_factor())[:] for v in bm.verts])
+        else:
+            recpt_normals = np.array([v.normal[:] for v in bm.verts])
+        face_normals = np.array([f.normal[:] for f in bm.faces])
+        flat_faces = flatten_faces(faces_recpt)
+        smooth_normals = self.normal_interp_mode == 'SMOOTH'
+
+        is_mapped = (map_modes == 'TRI') | (map_modes == 'QUAD')
+        mapped_idxs = np.flatnonzero(is_mapped)
+        # ASIS faces get index of next mapped face, as in _process
+        recpt_idxs = np.cumsum(is_mapped) - is_mapped
+
+        # (donor, face indexes, copies of the donor of shape (faces, donor verts, 3)) per group
+        groups = []
+        group_keys = np.column_stack((face_donors[mapped_idxs], z_rotations[mapped_idxs]))
+        keys, group_of_face = np.unique(group_keys, axis=0, return_inverse=True)
+        group_of_face = group_of_face.ravel()
+        for group_idx, (donor_idx, angle) in enumerate(keys.tolist()):
+            group_faces = mapped_idxs[group_of_face == group_idx]
+            donor = self._prepare_batched_donor(*donors[int(donor_idx)], angle)
+            if self.z_scale == 'CONST':
+                group_z_coefs = np.zeros(len(z_coefs)) if abs(donor.z_size) < 1e-6 else z_coefs / donor.z_size
+            else:
+                group_z_coefs = z_coefs
+            new_verts = np.empty((len(group_faces), len(donor.verts_v), 3))
+            for mode in ('TRI', 'QUAD'):
+                face_idxs = group_faces[map_modes[group_faces] == mode]
+                if not len(face_idxs):
+                    continue
+                vert_idxs = self.tri_vert_idxs if mode == 'TRI' else self.quad_vert_idxs
+                corners = corner_indexes(flat_faces, face_idxs, vert_idxs, face_rots[face_idxs])
+                dst_verts = recpt_co[corners]
+                w_coef, z_coef = w_coefs[face_idxs], group_z_coefs[face_idxs]
+                if mode == 'TRI':
+                    if self.z_scale == 'AUTO':
+                        src_triangle = donor.src_triangle
+                        src_lengths = np_norm(src_triangle - np.roll(src_triangle, -1, axis=0), axis=1)
+                        z_coef = auto_z_scales(dst_verts, src_lengths[np_newaxis, :] / w_coef[:, np_newaxis]) * z_coef
+                    verts = map_to_tris(donor.xy, donor.z, donor.src_triangle,
+                                        dst_verts, recpt_normals[corners], face_normals[face_idxs],
+                                        normal_mode[face_idxs], w_coef, z_coef, z_offsets[face_idxs], smooth_normals)
+                else:
+                    if self.z_scale == 'AUTO':
+                        width, height = donor.max_x - donor.min_x, donor.max_y - donor.min_y
+                        z_coef = auto_z_scales(dst_verts, np.array([height, width, height, width])) * z_coef
+                    verts = map_to_quads(donor.quad_xy, donor.z,
+                                         dst_verts, recpt_normals[corners], face_normals[face_idxs],
+                                         normal_mode[face_idxs], w_coef, z_coef, z_offsets[face_idxs], smooth_normals)
+                new_verts[np.searchsorted(group_faces, face_idxs)] = verts
+            groups.append((donor, group_faces, new_verts))
+
+        kept_modes = map_modes[map_modes != 'SKIP']
+        if not (kept_modes == 'ASIS').any() and (self.join or len(groups) == 1):
+            # with Join enabled, copies are joined group by group
+            for donor, group_faces, new_verts in groups:
+                if self.join:
+                    output.add_joined_copies(new_verts, donor, recpt_idxs[group_faces])
+                else:
+                    output.add_copies(list(new_verts) if output_numpy else new_verts.tolist(),
+                                      donor, recpt_idxs[group_faces])
+            return output
+
+        # copies in order of recipient faces
+        copies = dict()
+        for donor, group_faces, new_verts in groups:
+            new_verts = list(new_verts) if output_numpy else new_verts.tolist()
+            copies.update(zip(group_faces.tolist(), ((donor, verts) for verts in new_verts)))
+        for face_idx in np.flatnonzero(map_modes != 'SKIP').tolist():
+            recpt_face = faces_recpt[face_idx]
+            if map_modes[face_idx] == 'ASIS':
+                verts = [verts_recpt[i] for i in recpt_face]
+                output.add_sigle_face(verts, len(recpt_face), int(recpt_idxs[face_idx]))
+            else:
+                donor, verts = copies[face_idx]
+                output.verts_add(verts)
+                output.set_topology_data(donor, int(recpt_idxs[face_idx]))
+        return output
+
+    def _batched_donors(self, verts_donor, edges_donor, faces_donor, face_data_donor,
+                        single_donor, donor_index, n_faces):
+        """
+        Donors of recipient faces for _process_batched, matched the same way as in _process:
+        list of distinct (verts, edges, faces, face_data) and index of donor for each face.
+        Returns None if some donor has no vertices.
+        """
+        if single_donor:
+            donors = [(verts_donor, edges_donor, faces_donor, face_data_donor)]
+            face_donors = np.zeros(n_faces, dtype=np.int64)
+        else:
+            # donor verts, edges, faces and face data lists are matched with faces independently
+            lists = [verts_donor, edges_donor, faces_donor, face_data_donor]
+            faces_range = np.arange(n_faces)
+            if self.donor_matching_mode == 'INDEX':
+                idxs = np.array(cycle_for_length(donor_index, n_faces), dtype=np.int64)
+                list_idxs = [idxs % len(lst) for lst in lists]
+                if not face_data_donor[0]:
+                    lists[3] = [[]]
+                    list_idxs[3] = np.zeros(n_faces, dtype=np.int64)
+            elif self.donor_matching_mode == 'CYCLE':
+                list_idxs = [faces_range % len(lst) for lst in lists]
+            else:
+                list_idxs = [np.minimum(faces_range, len(lst) - 1) for lst in lists]
+            combinations, face_donors = np.unique(np.column_stack(list_idxs), axis=0, return_inverse=True)
+            face_donors = face_donors.ravel()
+            donors = [tuple(lst[i] for lst, i in zip(lists, combination)) for combination in combinations.tolist()]
+        if not all(len(verts) for verts, _, _, _ in donors):
+            return None
+        return donors, face_donors
+
     def _process(self, verts_recpt, faces_recpt,
                  verts_donor, edges_donor, faces_donor, face_data_donor,
                  frame_widths, z_coefs, z_offsets, z_rotations, w_coefs,
@@ -1236,6 +1442,24 @@ class SvAdaptivePolygonsNodeMk3(ModifierNode, SverchCustomTreeNode, bpy.types.No
             face_layer = bm.faces.layers.int.get("initial_index")
             for face in bm.faces:
                 face.normal = custom_normals[face[face_layer]]
+
+        n_faces = len(faces_recpt)
+        frame_widths, z_coefs, z_offsets, z_rotations, w_coefs, face_rots, normal_mode = [
+            list(islice(param, n_faces))
+            for param in (frame_widths, z_coefs, z_offsets, z_rotations, w_coefs, face_rots, normal_mode)]
+        if self.implementation != 'Mathutils' and len(bm.faces) == n_faces:
+            map_modes = self.get_map_modes(mask, faces_recpt)
+            if set(map_modes.tolist()) <= {'SKIP', 'ASIS', 'TRI', 'QUAD'}:
+                batched = self._batched_donors(verts_donor, edges_donor, faces_donor, face_data_donor,
+                                               single_donor, donor_index, n_faces)
+                if batched is not None:
+                    donors, face_donors = batched
+                    output = self._process_batched(bm, verts_recpt, faces_recpt, donors, face_donors,
+                                                   z_coefs, z_offsets, z_rotations,
+                                                   w_coefs, face_rots, normal_mode, map_modes)
+                    bm.free()
+                    return output
+
         if single_donor:
             # Original (unrotated) donor vertices
             donor_verts_o = [Vector(vert) for vert in verts_donor]
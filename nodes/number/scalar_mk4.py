@@ -27,6 +27,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, list_match_func, numpy_list_match_modes, numpy_list_match_func, no_space
 from sverchok.utils.math import gcd
 from sverchok.utils.sv_itertools import (recurse_fx, recurse_fxy, recurse_f_level_control)
+from sverchok.utils.ragged import concatenate_objects, match_objects, split_objects, fill_objects
 import numpy as np
 # pylint: disable=C0326
 
@@ -137,6 +138,36 @@ def math_numpy(params, constant, matching_f):
 
     return result
 
+def collect_objects(params, objects, matching_f):
+    params = matching_f(params)
+    start = len(objects)
+    objects.extend(zip(*params))
+    return list(range(start, len(objects)))
+
+def math_numpy_batched(params, constant, matching_f, desired_levels):
+    '''
+    Same as math_numpy applied by recurse_f_level_control, but all objects
+    are concatenated and func is called once. Returns None if objects
+    can't be concatenated.
+    '''
+    func, matching_mode, out_numpy = constant
+    objects = []
+    structure = recurse_f_level_control(params, objects, collect_objects, matching_f, desired_levels)
+    if not objects:
+        return None
+    joined = [concatenate_objects(props) for props in zip(*objects)]
+    if any(j is None for j in joined):
+        return None
+
+    if len(joined) == 1:
+        array, offsets = joined[0]
+        res = func(array)
+    else:
+        offsets, indices = match_objects([prop_offsets for _, prop_offsets in joined], matching_mode)
+        res = func([array[idxs] for (array, _), idxs in zip(joined, indices)])
+
+    return fill_objects(structure, split_objects(res, offsets, out_numpy))
+
 class SvScalarMathNodeMK4(SverchCustomTreeNode, bpy.types.Node):
     """Scalar: Add, Subtruct, Sine, Cosine, Log, Power and other.
     constants: pi, e, phi, tau
@@ -269,16 +300,22 @@ class SvScalarMathNodeMK4(SverchCustomTreeNode, bpy.types.Node):
                 result = recurse_fxy(params[0], params[1], current_func)
             elif self.current_op  == 'SINCOS':
                 ops = [np.sin, self.list_match, self.output_numpy]
-                result = recurse_f_level_control(params, ops, math_numpy, matching_f, desired_levels)
+                result = self.math(params, ops, matching_f, desired_levels)
                 ops2 = [np.cos, self.list_match, self.output_numpy]
-                result2 = recurse_f_level_control(params, ops2, math_numpy, matching_f, desired_levels)
+                result2 = self.math(params, ops2, matching_f, desired_levels)
                 self.outputs[1].sv_set(result2)
             else:
                 ops = [current_func, self.list_match, self.output_numpy]
-                result = recurse_f_level_control(params, ops, math_numpy, matching_f, desired_levels)
+                result = self.math(params, ops, matching_f, desired_levels)
 
             self.outputs[0].sv_set(result)
 
+    def math(self, params, ops, matching_f, desired_levels):
+        result = math_numpy_batched(params, ops, matching_f, desired_levels)
+        if result is None:
+            result = recurse_f_level_control(params, ops, math_numpy, matching_f, desired_levels)
+        return result
+
     def ensure_enums_have_no_space(self, enums=None):
         """
         enums: a list of property names to check. like  self.current_op
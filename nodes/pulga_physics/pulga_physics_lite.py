@@ -22,7 +22,8 @@ import bpy
 from bpy.props import IntProperty, StringProperty, BoolProperty, FloatProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, node_id, match_long_repeat
-from sverchok.utils.pulga_physics_core import pulga_system_init
+from sverchok.utils.pulga_physics_core import pulga_system_object
+from sverchok.utils.parallel import map_objects
 
 FILE_NAME = 'pulga_Memory '
 
@@ -526,19 +527,22 @@ class SvPulgaPhysicsNode(SverchCustomTreeNode, bpy.types.Node):
             params = self.get_data()
             gates_dict = self.fill_gates_dict()
             data, past, from_file = self.get_global_cache()
-            temp_id = 0
-            for par in zip(*params):
+            objects = []
+            for temp_id, par in enumerate(zip(*params)):
                 cache = self.get_local_cache(past, data, from_file, temp_id)
                 par_dict = {}
                 for idx, p in enumerate(self.sorted_props):
                     par_dict[p[0]] = par[idx]
-                cache_new = pulga_system_init(par_dict, par, gates_dict, out_lists, cache)
+                objects.append((par_dict, par, gates_dict, cache))
+
+            # systems are independent, they are simulated in parallel processes
+            for temp_id, (object_lists, cache_new) in enumerate(map_objects(pulga_system_object, objects)):
+                for out_list, object_list in zip(out_lists, object_lists):
+                    out_list.extend(object_list)
 
                 if self.accumulative:
                     self.accumulativity_set_data(cache_new, temp_id)
 
-                temp_id += 1
-
         if so['Vertices'].is_linked:
             so['Vertices'].sv_set(verts_out)
         if so['Rads'].is_linked:
@@ -12,14 +12,16 @@ import json
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.utils.sv_operator_mixins import SvGenericNodeLocator
-from sverchok.data_structure import updateNode
+from sverchok.data_structure import updateNode, node_id
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh
 from sverchok.utils.sv_mesh_utils import mesh_join
 from sverchok.utils.nodes_mixins.show_3d_properties import Show3DProperties
 from sverchok.ui.sv_icons import custom_icon
 from sverchok.utils.blender_mesh import (
     read_verts, read_edges, read_verts_normal,
-    read_face_normal, read_face_center, read_face_area, read_materials_idx)
+    read_face_normal, read_face_center, read_face_area, read_materials_idx,
+    polygons_from_csr, mesh_array_readers)
+from sverchok.utils.objects_data_cache import ObjectsDataReader, clear_cache
 import numpy as np
 from sverchok.ui.sv_object_names_utils import SvNodeInDataMK5, SV_PT_ViewportDisplayPropertiesDialogMK5, SV_PT_ViewportDisplayCustomPropertiesDialogMK5, ReadingObjectDataError, get_objects_from_item
 
@@ -28,6 +30,9 @@ numpy_socket_names = ['vertices', 'edges', 'vertex_normals', 'material_idx', 'po
 def get_vertgroups(mesh):
     return [k for k,v in enumerate(mesh.vertices) if v.groups.values()]
 
+def read_vertgroups(mesh):
+    return dict(vert_groups=get_vertgroups(mesh))
+
 def find_layer_collection(layer_coll, target_coll):
     if layer_coll.collection == target_coll:
         return layer_coll
@@ -110,6 +115,11 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
         description='Output numpy arrays if possible',
         default=False, update=updateNode) # type: ignore
     
+    use_cache: bpy.props.BoolProperty(
+        name='Cache',
+        description='Keep data of objects between updates until the objects are changed',
+        default=True, update=updateNode) # type: ignore
+
     mesh_join : bpy.props.BoolProperty(
         name = "Mesh Join",
         description = "If checked, join mesh elements into one object",
@@ -317,6 +327,7 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
         pass
 
     def sv_draw_buttons_ext(self, context, layout):
+        layout.prop(self, 'use_cache')
         r = layout.column(align=True)
         row = r.row(align=True)
         row.label(text="Output Numpy:")
@@ -351,6 +362,9 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
             row.label(text=self.label if self.label else self.name)
             self.draw_animatable_buttons(row, icon_only=True)
 
+    def sv_free(self):
+        clear_cache(node_id(self))
+
     def get_materials_from_bmesh(self, bm):
         return [face.material_index for face in bm.faces[:]]
 
@@ -377,6 +391,18 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
 
         out_np = self.out_np if not self.output_np_all else [True for i in range(7)]
 
+        # names of arrays which should be read from meshes in object mode
+        requested_arrays = {name for name in mesh_array_readers if name in self.outputs and self.outputs[name].is_linked}
+        if o_vertices or o_edges or o_polygons or self.vergroups or (o_vertex_normals and self.apply_matrix):
+            requested_arrays.add('vertices')
+        if o_material_idx or o_material_names or o_material_custom_properties:
+            requested_arrays.add('material_idx')
+        reader = ObjectsDataReader(node_id(self), self.use_cache)
+
+        def as_output(array, output_numpy):
+            # mesh join works with lists
+            return array if output_numpy and not self.mesh_join else array.tolist()
+
         # Список для загрузки custom properties по object, data и materials
         custom_properties_data = dict()
         for elem in self.custom_properties_sockets:
@@ -636,36 +662,13 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
                         # https://developer.blender.org/T99661
                         if obj.type == 'CURVE' and obj.mode == 'EDIT' and bpy.app.version[:2] == (3, 2):
                             raise ReadingObjectDataError("Does not support curves in edit mode in Blender 3.2")
-                        elif self.modifiers:
-                            if obj.type in ['META']:
-                                if sv_depsgraph is None:
-                                    sv_depsgraph = bpy.context.evaluated_depsgraph_get()
-                                obj_data = sv_depsgraph.objects[obj.name].to_mesh(preserve_all_data_layers=True, depsgraph=sv_depsgraph)
-                            elif obj.type in ['POINTCLOUD']:
-                                # PointCound могут быть получены только через depsgraph (что с модификатором, что без модификатора)
-                                if sv_depsgraph is None:
-                                    sv_depsgraph = bpy.context.evaluated_depsgraph_get()
-                                obj_eval = sv_depsgraph.objects[obj.name].evaluated_get(sv_depsgraph)
-                                obj_data = obj_eval.data
-                            else:
-                                obj_data = sv_depsgraph.objects[obj.name].to_mesh(preserve_all_data_layers=True, depsgraph=sv_depsgraph)
-                        else:
-                            if obj.type in ['META']:
-                                if sv_depsgraph is None:
-                                    sv_depsgraph = bpy.context.evaluated_depsgraph_get()
-                                obj_data = sv_depsgraph.objects[obj.name].to_mesh(preserve_all_data_layers=True, depsgraph=sv_depsgraph)
-                            elif obj.type in ['POINTCLOUD']:
-                                # PointCound могут быть получены только через depsgraph (что с модификатором, что без модификатора)
-                                if sv_depsgraph is None:
-                                    sv_depsgraph = bpy.context.evaluated_depsgraph_get()
-                                obj_eval = sv_depsgraph.objects[obj.name].evaluated_get(sv_depsgraph)
-                                obj_data = obj_eval.data
-                            else:
-                                obj_data = obj.to_mesh()
-                        
-                        T, R, S = mtrx.decompose()
-
-                        if obj.type in ['POINTCLOUD']:
+                        elif obj.type in ['POINTCLOUD']:
+                            # PointCound могут быть получены только через depsgraph (что с модификатором, что без модификатора)
+                            if sv_depsgraph is None:
+                                sv_depsgraph = bpy.context.evaluated_depsgraph_get()
+                            obj_eval = sv_depsgraph.objects[obj.name].evaluated_get(sv_depsgraph)
+                            obj_data = obj_eval.data
+                            T, R, S = mtrx.decompose()
                             if o_vertices or o_edges or o_polygons or self.vergroups:
                                 # any of verts, edges, faces or vergroups are connected to verts
                                 verts            = [ ((mtrx @ v.co)[:] if self.apply_matrix else v.co)[:] for v in obj_data.points]  # v.co is a Vector()
@@ -765,147 +768,100 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
                                 polygon_normals  = []
 
                         else:
+                            # all requested data is read by foreach_get and is cached until the object is changed
+                            mesh_arrays = reader.read(obj, requested_arrays, sv_depsgraph if self.modifiers else None,
+                                                      extra=read_vertgroups if self.vergroups else None)
+                            np_mtrx = np.array(mtrx)
+                            np_rot = np.array(mtrx.decompose()[1].to_matrix())
+
                             if o_vertices or o_edges or o_polygons or self.vergroups:
                                 # any of verts, edges, faces or vergroups are connected to verts
-                                verts            = [ ((mtrx @ v.co)[:] if self.apply_matrix else v.co)[:] for v in obj_data.vertices]  # v.co is a Vector()
+                                verts_np = mesh_arrays['vertices']
+                                if self.apply_matrix:
+                                    verts_np = verts_np @ np_mtrx[:3, :3].T + np_mtrx[:3, 3]
+                                verts            = as_output(verts_np, out_np[0])
                                 if o_edges:
-                                    edgs         = [[ e.vertices[0], e.vertices[1] ] for e in obj_data.edges]
+                                    edgs         = as_output(mesh_arrays['edges'], out_np[1])
                                 if o_polygons:
-                                    pols         = [list(p.vertices) for p in obj_data.polygons]
+                                    pols         = polygons_from_csr(*mesh_arrays['polygons'])
 
                             if o_vertices_select:
-                                vertices_select1 = [v.select for v in obj_data.vertices]
-
+                                vertices_select1 = mesh_arrays['vertices_select'].tolist()
                             if o_vertices_crease:
-                                if hasattr(obj_data, 'vertex_creases') and (obj_data.vertex_creases is not None) and hasattr(obj_data.vertex_creases, '__len__') and len(obj_data.vertex_creases)>0:
-                                    # it is very hard to identify creases in object mode in blender before 4.0
-                                    creases = obj_data.vertex_creases[0]
-                                    vertices_crease1 = [creases.data[i].value for i, v in enumerate(obj_data.vertices)]
-                                elif 'crease_vert' in obj_data.attributes:
-                                    # get creases of vertices in Blender 4.x
-                                    vertices_crease1 = [e.value for e in obj_data.attributes['crease_vert'].data]
-                                else:
-                                    # if no data then all creases are 0.0
-                                    vertices_crease1 = [0.0 for i in range( len(obj_data.vertices) )]
-                                pass
-
+                                vertices_crease1 = mesh_arrays['vertices_crease'].tolist()
                             if o_vertices_bevel_weight:
-                                if 'bevel_weight_vert' in obj_data.attributes:
-                                    # after Blender 4.0
-                                    vertices_bevel_weight1 = [e.value for e in obj_data.attributes['bevel_weight_vert'].data]
-                                elif len(obj_data.vertices)>0 and hasattr(obj_data.vertices[0], 'bevel_weight'):
-                                    # before Blender 4.0
-                                    vertices_bevel_weight1 = [v.bevel_weight for v in obj_data.vertices]
-                                else:
-                                    # vertices has no data in e (not initalized)
-                                    vertices_bevel_weight1 = [0.0 for i in range( len(obj_data.vertices) )]
-                                pass
-
+                                vertices_bevel_weight1 = mesh_arrays['vertices_bevel_weight'].tolist()
                             if o_edges_select:
-                                edges_select1 = [e.select for e in obj_data.edges]
+                                edges_select1 = mesh_arrays['edges_select'].tolist()
                             if o_edges_seams:
-                                edges_seams1 = [e.use_seam for e in obj_data.edges]
+                                edges_seams1 = mesh_arrays['edges_seams'].tolist()
                             if o_edges_sharps:
-                                edges_sharps1 = [e.use_edge_sharp for e in obj_data.edges]
-
+                                edges_sharps1 = mesh_arrays['edges_sharps'].tolist()
                             if o_edges_crease:
-                                if 'crease_edge' in obj_data.attributes:
-                                    # after blender 4.0
-                                    edges_crease1 = [e.value for e in obj_data.attributes['crease_edge'].data]
-                                elif len(obj_data.edges)>0 and hasattr(obj_data.edges[0], 'crease'):
-                                    # before Blender 4.0
-                                    edges_crease1 = [e.crease for e in obj_data.edges]
-                                else:
-                                    # edges has no data in e (not initalized)
-                                    edges_crease1 = [0.0 for e in obj_data.edges]
-                                pass
-                            
+                                edges_crease1 = mesh_arrays['edges_crease'].tolist()
                             if o_edges_bevel_weight:
-                                if 'bevel_weight_edge' in obj_data.attributes:
-                                    # after Blender 4.0
-                                    edges_bevel_weight1 = [e.value for e in obj_data.attributes['bevel_weight_edge'].data]
-                                elif len(obj_data.edges)>0 and hasattr(obj_data.edges[0], 'bevel_weight'):
-                                    # before Blender 4.0
-                                    edges_bevel_weight1 = [e.bevel_weight for e in obj_data.edges]
-                                else:
-                                    # edges has no data for bevel (not initalized)
-                                    edges_bevel_weight1 = [0.0 for e in obj_data.edges]
-                                pass
-                                    
+                                edges_bevel_weight1 = mesh_arrays['edges_bevel_weight'].tolist()
                             if o_polygon_selects:
-                                polygon_selects1 = [p.select for p in obj_data.polygons]
+                                polygon_selects1 = mesh_arrays['polygon_selects'].tolist()
                             if o_polygon_smooth:
-                                polygon_smooth1 = [p.use_smooth for p in obj_data.polygons]
+                                polygon_smooth1 = mesh_arrays['polygon_smooth'].tolist()
                             if self.vergroups:
-                                vert_groups      = get_vertgroups(obj_data)
+                                vert_groups      = mesh_arrays['vert_groups']
                             if o_vertex_normals:
-                                vertex_normals   = [ ((   R @ v.co) if self.apply_matrix else v.normal)[:] for v in obj_data.vertices ] # v.normal is a Vector(). Update. Blender 3.6.3 crash in no wrap Vector(v.normal). I think this is after line "obj.to_mesh_clear()"
+                                if self.apply_matrix:
+                                    vertex_normals = mesh_arrays['vertices'] @ np_rot.T
+                                else:
+                                    vertex_normals = mesh_arrays['vertex_normals']
+                                vertex_normals   = as_output(vertex_normals, out_np[2])
                             if o_material_idx or o_material_names or o_material_custom_properties:
-                                if hasattr(obj_data, 'polygons')==True:
-                                    if hasattr(obj, 'material_slots'):
-                                        if len(obj.material_slots)>0:
-                                            material_indexes = read_materials_idx(obj_data, out_np[3])
-                                            material_socket_ids = set(material_indexes)
-                                            # save all sockets materials in materials sockets of object (materials name if it is not null and info about faces)
-                                            materials_info = dict()
-                                            # В случае, когда попадаются дубликаты материалов в слотах, то комбинировать такие слоты по одному материалу. Считать одинаковые материалы по первому слоту, в котором этот материал появился
-                                            materials_name_id = dict()
-                                            for id in range(len(obj.material_slots)):
-                                                is_faces = (id in material_socket_ids),
-                                                material_name = (None if obj.material_slots[id].material is None else obj.material_slots[id].material.name)
-                                                if material_name in materials_name_id:
-                                                    _id = materials_name_id[material_name]
-                                                    # Не все слоты могут быть назначены faces. Если оказывается, что один из слотов с тем же материалом назначен faces, а другие нет,
-                                                    # то это надо учесть и сделать признак, что этот материал всё-таки назначен faces:
-                                                    materials_info[_id]['is_faces'] = materials_info[_id]['is_faces'] or is_faces
-                                                    for I, index in enumerate(material_indexes):
-                                                        if index==id:
-                                                            material_indexes[I] = _id
-                                                    pass
-                                                else:
-                                                    #_id = id
-                                                    _id = len(materials_name_id)
-                                                    materials_name_id[material_name] = _id
-                                                    materials_info[_id] = dict(material_name = material_name,
-                                                                            is_faces = (id in material_socket_ids),
-                                                                            custom_properties = dict()
-                                                                            )
-                                                    for I, index in enumerate(material_indexes):
-                                                        if index==id:
-                                                            material_indexes[I] = _id
-                                                    # Прочитать custom property для динамических сокетов
-                                                    for elem in self.custom_properties_sockets:
-                                                        if elem.socket_type=='MATERIAL':
-                                                            mi = obj.material_slots[id].material
-                                                            materials_info[_id]['custom_properties'][elem.custom_property_name] = get_prop_value(mi, elem)
-                                                            pass
-                                                        pass
-                                                    pass
-                                                pass
-                                            pass
+                                material_idx_np = mesh_arrays['material_idx']
+                                if len(obj.material_slots)>0:
+                                    material_socket_ids = set(np.unique(material_idx_np).tolist())
+                                    # save all sockets materials in materials sockets of object (materials name if it is not null and info about faces)
+                                    materials_info = dict()
+                                    # В случае, когда попадаются дубликаты материалов в слотах, то комбинировать такие слоты по одному материалу. Считать одинаковые материалы по первому слоту, в котором этот материал появился
+                                    materials_name_id = dict()
+                                    # indexes of slots which does not exist are kept as is
+                                    slot_map = np.arange(max(len(obj.material_slots), material_idx_np.max(initial=-1) + 1))
+                                    for id in range(len(obj.material_slots)):
+                                        is_faces = (id in material_socket_ids),
+                                        material_name = (None if obj.material_slots[id].material is None else obj.material_slots[id].material.name)
+                                        if material_name in materials_name_id:
+                                            _id = materials_name_id[material_name]
+                                            # Не все слоты могут быть назначены faces. Если оказывается, что один из слотов с тем же материалом назначен faces, а другие нет,
+                                            # то это надо учесть и сделать признак, что этот материал всё-таки назначен faces:
+                                            materials_info[_id]['is_faces'] = materials_info[_id]['is_faces'] or is_faces
                                         else:
-                                            # Пустой material_slots
-                                            material_indexes = [0]*len(obj_data.polygons)
-                                            materials_info = dict( [(0,dict(material_name=None, is_faces=True, custom_properties = dict()))] )
-                                    else:
-                                        # Странная ситуация - полигоны есть, а materials slots - нет.
-                                        # Вроде как такого не должно быть, но предположим, что обработать надо так
-                                        # же как и пустой material_slots
-                                        material_indexes = [0]*len(obj_data.polygons)
-                                        materials_info = dict( [(0,dict(material_name=None, is_faces=True, custom_properties = dict()))] )
-                                        pass
+                                            _id = len(materials_name_id)
+                                            materials_name_id[material_name] = _id
+                                            materials_info[_id] = dict(material_name = material_name,
+                                                                    is_faces = (id in material_socket_ids),
+                                                                    custom_properties = dict()
+                                                                    )
+                                            # Прочитать custom property для динамических сокетов
+                                            for elem in self.custom_properties_sockets:
+                                                if elem.socket_type=='MATERIAL':
+                                                    mi = obj.material_slots[id].material
+                                                    materials_info[_id]['custom_properties'][elem.custom_property_name] = get_prop_value(mi, elem)
+                                        slot_map[id] = _id
+                                    material_indexes = as_output(slot_map[material_idx_np], out_np[3])
                                 else:
-                                    # У POINT_CLOUDS, например, has no polygons
-                                    material_indexes = []
-                                    materials_info = dict()
-                                    pass
+                                    # Пустой material_slots
+                                    material_indexes = [0]*mesh_arrays['n_polygons']
+                                    materials_info = dict( [(0,dict(material_name=None, is_faces=True, custom_properties = dict()))] )
 
                             if o_polygon_areas:
-                                polygons_areas   = [ polygon.area for polygon in obj_data.polygons]
+                                polygons_areas   = as_output(mesh_arrays['polygon_areas'], out_np[4])
                             if o_polygon_centers:
-                                polygon_centers  = [ ((mtrx @ polygon.center) if self.apply_matrix else polygon.center)[:] for polygon in obj_data.polygons]
+                                polygon_centers  = mesh_arrays['polygon_centers']
+                                if self.apply_matrix:
+                                    polygon_centers = polygon_centers @ np_mtrx[:3, :3].T + np_mtrx[:3, 3]
+                                polygon_centers  = as_output(polygon_centers, out_np[5])
                             if o_polygon_normals:
-                                polygon_normals  = [ ((   R @ polygon.normal) if self.apply_matrix else polygon.normal)[:] for polygon in obj_data.polygons]
+                                polygon_normals  = mesh_arrays['polygon_normals']
+                                if self.apply_matrix:
+                                    polygon_normals = polygon_normals @ np_rot.T
+                                polygon_normals  = as_output(polygon_normals, out_np[6])
 
                     if o_matrices:
                         l_matrices.append(mtrx)
@@ -963,7 +919,7 @@ class SvGetObjectsDataMK5(Show3DProperties, SvNodeInDataMK5, bpy.types.Node):
             
             pass
 
-            
+        reader.finish()
 
         if self.mesh_join:
             offset = 0
@@ -6,8 +6,6 @@
 # License-Filename: LICENSE
 
 import numpy as np
-from collections import defaultdict
-from itertools import combinations
 
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
@@ -16,6 +14,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level, get_data_nesting_level
 from sverchok.utils.geom import PlaneEquation, bounding_box_aligned
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
+from sverchok.utils.delaunay3d import filter_simplices, simplex_edges, simplex_faces, SIMPLEX_EDGES, SIMPLEX_FACES
 from sverchok.dependencies import scipy
 from mathutils import Vector, Matrix
 
@@ -278,25 +277,6 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvStringsSocket', "Edges")
         self.outputs.new('SvStringsSocket', "Faces")
 
-    def make_edges(self, idxs):
-        return [(i, j) for i in idxs for j in idxs if i < j]
-
-    def make_faces(self, idxs):
-        return [(i, j, k) for i in idxs for j in idxs for k in idxs if i < j and j < k]
-
-    def get_verts(self, verts, idxs):
-        return [verts[i] for i in idxs]
-
-    def is_too_long(self, verts, idxs, threshold):
-        if threshold == 0:
-            return False
-        verts = [np.array(verts[i]) for i in idxs]
-        for v1, v2 in combinations(verts, 2):
-            d = np.linalg.norm(v1 - v2)
-            if d > threshold:
-                return True
-        return False
-
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -313,12 +293,6 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
 
         nested_output = input_level > 3
 
-        edges_new_2 = [ (0, 1) ]
-        edges_new_3 = self.make_edges([0, 1, 2])     # [ (0, 1), (1, 2), (2, 0), ]
-        edges_new_4 = self.make_edges([0, 1, 2, 3])  # [ (0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3) ]
-        faces_new_2 = []
-        faces_new_3 = self.make_faces([0, 1, 2])     # [ (0, 1, 2) ]
-        faces_new_4 = self.make_faces([0, 1, 2, 3])  # [ (0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3) ]
         verts_out = []
         edges_out = []
         faces_out = []
@@ -329,128 +303,30 @@ class SvDelaunay3dMk2Node(SverchCustomTreeNode, bpy.types.Node):
             for vertices, volume_threshold, edge_threshold in zip_long_repeat(*params):
                 vertices = np.array(vertices, dtype=np.float64)
                 simplices = get_delaunay_simplices(vertices, self.volume_threshold)
+                # all simplices have the same number of vertices (depends on dimension of the shape)
+                simplices = np.array(simplices, dtype=np.int64)
+                if simplices.ndim != 2:
+                    simplices = simplices.reshape(-1, 1)
+                simplex_length = simplices.shape[1]
+                if simplex_length > 4:
+                    # unknown simplex. Incredible.
+                    simplices = simplices[:0]
+                simplices = filter_simplices(vertices, simplices, self.volume_threshold, edge_threshold)
                 if self.join:
-
-                    verts_new = vertices
-                    edges_new = set()
-                    faces_new = set()
-
-                    for simplex in simplices:
-                        simplex_length = len(simplex)
-                        
-                        # unknown simplex. skip. Incredible. get_sites_delaunay_params work with size==5 so need test.
-                        if simplex_length>4:
-                            continue
-
-                        if self.is_too_long(vertices, simplex, edge_threshold):
-                             continue
-
-                        if simplex_length==1:
-                            continue
-
-                        # if simplex.size>=2 (2,3,4) then create edges
-                        if simplex_length==2:
-                            if is_length_0(vertices, simplex, self.volume_threshold):
-                                continue
-                            edges_new.update( [ ( simplex[0], simplex[1] ) ] )
-                            continue
-
-                        # if simplex.size>=3 (3,4) then create faces
-                        if simplex_length>=3:
-                            if simplex_length==3:
-                                if is_area_0(vertices, simplex, self.volume_threshold):
-                                    continue
-                                edges_simplex = [ (simplex[0], simplex[1]),
-                                                  (simplex[1], simplex[2]),
-                                                  (simplex[2], simplex[0]), ]
-                                faces_simplex = [ (simplex[0], simplex[1], simplex[2]) ]
-                            else:
-                                if is_volume_0(vertices, simplex, self.volume_threshold):
-                                    continue
-                                edges_simplex = [ (simplex[0], simplex[1]),
-                                                  (simplex[0], simplex[2]),
-                                                  (simplex[0], simplex[3]),
-                                                  (simplex[1], simplex[2]),
-                                                  (simplex[1], simplex[3]),
-                                                  (simplex[2], simplex[3]) ]
-                                faces_simplex = [ (simplex[0], simplex[1], simplex[2]),
-                                                  (simplex[0], simplex[1], simplex[3]),
-                                                  (simplex[0], simplex[2], simplex[3]),
-                                                  (simplex[1], simplex[2], simplex[3]) ]
-                            edges_new.update( edges_simplex )
-                            faces_new.update( faces_simplex )
-
-                    verts_item.append(verts_new)
-                    edges_item.append(list(edges_new))
-                    faces_item.append(list(faces_new))
+                    verts_item.append(vertices)
+                    edges_item.append(simplex_edges(simplices, len(vertices)).tolist())
+                    if simplex_length == 3:
+                        faces_item.append(simplices.tolist())
+                    else:
+                        faces_item.append(simplex_faces(simplices, len(vertices)).tolist())
                 else:
-                    verts_new = []
-                    edges_new = []
-                    faces_new = []
-                    for simplex in simplices:
-                        simplex_length = len(simplex)
-
-                        # unknown simplex. skip. Incredible. get_sites_delaunay_params work with size==5 so need test.
-                        if simplex_length>4:
-                            continue
-
-                        if self.is_too_long(vertices, simplex, edge_threshold):
-                             continue
-
-                        if simplex_length==1:
-                            edges_new.append( [] )
-                            faces_new.append( [] )
-
-                            # if some geometry is visible then geometry need verts:
-                            verts_simplex = self.get_verts(vertices, simplex)
-                            verts_new.append(verts_simplex)                        
-                            continue
-
-                        if simplex_length==2:
-                            if is_length_0(vertices, simplex, self.volume_threshold):
-                                continue
-                            edges_new.append( edges_new_2 )
-                            faces_new.append( faces_new_2 )
-
-                            # if some geometry is visible then geometry need verts:
-                            verts_simplex = self.get_verts(vertices, simplex)
-                            verts_new.append(verts_simplex)                        
-                            continue
-
-                        # if simplex.size>=2 (2,3,4) then create edges
-                        if simplex_length==2:
-                            if is_length_0(vertices, simplex, self.volume_threshold):
-                                continue
-                            edges_new.append( edges_new_2 )
-                            faces_new.append( faces_new_2 )
-
-                            # if some geometry is visible then geometry need verts:
-                            verts_simplex = self.get_verts(vertices, simplex)
-                            verts_new.append(verts_simplex)                        
-                            continue
-
-                        # if simplex.size>=3 (3,4) then create faces
-                        if simplex_length>=3:
-                            if simplex_length==3:
-                                if is_area_0(vertices, simplex, self.volume_threshold):
-                                    continue
-                                edges_simplex = edges_new_3
-                                faces_simplex = faces_new_3
-                            else:
-                                if is_volume_0(vertices, simplex, self.volume_threshold):
-                                    continue
-                                edges_simplex = edges_new_4
-                                faces_simplex = faces_new_4
-                            edges_new.append( edges_simplex )
-                            faces_new.append( faces_simplex )
-
-                            # if some geometry is visible then geometry need verts:
-                            verts_simplex = self.get_verts(vertices, simplex)
-                            verts_new.append(verts_simplex)                        
-
-                    verts_item.extend(verts_new)
-                    edges_item.extend(edges_new)
-                    faces_item.extend(faces_new)
+                    n = len(simplices)
+                    edges_simplex = SIMPLEX_EDGES.get(simplex_length, [])
+                    faces_simplex = SIMPLEX_FACES.get(simplex_length, [])
+                    # if some geometry is visible then geometry need verts:
+                    verts_item.extend(vertices[simplices].tolist())
+                    edges_item.extend([edges_simplex] * n)
+                    faces_item.extend([faces_simplex] * n)
 
                 if nested_output:
                     verts_out.append(verts_item)
@@ -7,7 +7,7 @@ from bpy.props import FloatProperty, IntProperty, BoolProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level
 from sverchok.utils.field.scalar import SvScalarField
-from sverchok.utils.manifolds import intersect_line_iso_surface, FAIL, RETURN_NONE, SKIP
+from sverchok.utils.manifolds import intersect_line_iso_surface, raycast_iso_surface, FAIL, RETURN_NONE, SKIP
 
 class SvExImplSurfaceRaycastNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -54,6 +54,24 @@ class SvExImplSurfaceRaycastNode(SverchCustomTreeNode, bpy.types.Node):
             default = FAIL,
             update = updateNode)
 
+    methods = [
+            ('SECTIONS', "Per ray", "Search for intersections of each ray separately", 0),
+            ('BATCH', "Batched", "Search for intersections of all rays at once; rays are sphere traced if Lipschitz constant of the field is known", 1)
+        ]
+
+    method : EnumProperty(
+            name = "Method",
+            items = methods,
+            default = 'SECTIONS',
+            update = updateNode)
+
+    lipschitz : FloatProperty(
+            name = "Lipschitz constant",
+            description = "Upper bound of the field gradient length, used for sphere tracing in Batched mode; 0 means it is taken from the field if known",
+            default = 0.0,
+            min = 0.0,
+            update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvScalarFieldSocket', "Field")
         p = self.inputs.new('SvVerticesSocket', "Vertices")
@@ -68,12 +86,50 @@ class SvExImplSurfaceRaycastNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvStringsSocket', 'Distance')
 
     def draw_buttons(self, context, layout):
+        layout.prop(self, 'method', text='')
         layout.prop(self, 'first_only')
         layout.prop(self, 'sections')
 
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
         layout.prop(self, 'on_fail')
+        if self.method == 'BATCH':
+            layout.prop(self, 'lipschitz')
+
+    def raycast_batch(self, fields, verts, directions, iso_values, max_distances):
+        """Intersections for all rays of one object, (ts, pts) or None for each ray"""
+        verts = np.asarray(verts, dtype=np.float64)
+        directions = np.asarray(directions, dtype=np.float64)
+        iso_values = np.asarray(iso_values, dtype=np.float64)
+        max_distances = np.asarray(max_distances, dtype=np.float64)
+        n = max(len(fields), len(verts), len(directions), len(iso_values), len(max_distances))
+        # shorter inputs are matched by repeating their last items
+        index = np.arange(n)
+        fields = [fields[i] for i in np.minimum(index, len(fields) - 1)]
+        verts = verts[np.minimum(index, len(verts) - 1)]
+        directions = directions[np.minimum(index, len(directions) - 1)]
+        iso_values = iso_values[np.minimum(index, len(iso_values) - 1)]
+        max_distances = max_distances[np.minimum(index, len(max_distances) - 1)]
+
+        # rays are processed together for each field
+        field_rays = dict()
+        for i, field in enumerate(fields):
+            field_rays.setdefault(id(field), (field, []))[1].append(i)
+
+        results = [None] * n
+        for field, rays in field_rays.values():
+            offsets, ts, pts = raycast_iso_surface(field, verts[rays], directions[rays],
+                                                   max_distances[rays], iso_values[rays],
+                                                   sections = self.sections,
+                                                   first_only = self.first_only,
+                                                   lipschitz = self.lipschitz or None)
+            ts, pts = ts.tolist(), pts.tolist()
+            for i, start, end in zip(rays, offsets[:-1], offsets[1:]):
+                if end > start:
+                    results[i] = ts[start:end], [tuple(p) for p in pts[start:end]]
+                elif self.on_fail == FAIL:
+                    raise Exception(f"Ray {verts[i]} + {directions[i]} does not intersect iso surface with iso_value={iso_values[i]}")
+        return results
 
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
@@ -101,12 +157,16 @@ class SvExImplSurfaceRaycastNode(SverchCustomTreeNode, bpy.types.Node):
         for fields, verts_i, directions, iso_value_i, max_distance_i in zip_long_repeat(field_s, verts_s, direction_s, iso_value_s, max_distance_s):
             new_verts = []
             new_t = []
-            for field, vert, direction, iso_value, max_distance in zip_long_repeat(fields, verts_i, directions, iso_value_i, max_distance_i):
-                res = intersect_line_iso_surface(field, vert, direction,
+            if self.method == 'BATCH':
+                results = self.raycast_batch(fields, verts_i, directions, iso_value_i, max_distance_i)
+            else:
+                results = [intersect_line_iso_surface(field, vert, direction,
                                                      max_distance, iso_value,
                                                      sections = self.sections,
                                                      first_only = self.first_only,
                                                      on_fail = on_fail)
+                           for field, vert, direction, iso_value, max_distance in zip_long_repeat(fields, verts_i, directions, iso_value_i, max_distance_i)]
+            for res in results:
                 if res is None:
                     if self.on_fail == SKIP:
                         continue
@@ -8,6 +8,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.core.sockets import setup_new_node_location
 from sverchok.data_structure import updateNode, match_long_repeat
 from sverchok.utils.marching_cubes import isosurface_np
+from sverchok.utils.field.compiler import compile_field
 from sverchok.dependencies import mcubes, skimage
 from sverchok.utils.nodes_mixins.draft_mode import DraftMode
 
@@ -229,8 +230,8 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
                 x_range = np.linspace(b1[0], b2[0], num=samples_x)
                 y_range = np.linspace(b1[1], b2[1], num=samples_y)
                 z_range = np.linspace(b1[2], b2[2], num=samples_z)
-                xs, ys, zs = np.meshgrid(x_range, y_range, z_range, indexing='ij')
-                func_values = field.evaluate_grid(xs.flatten(), ys.flatten(), zs.flatten())
+                # grid coordinates are made by chunks, not for the whole grid at once
+                func_values = compile_field(field).evaluate_box(x_range, y_range, z_range)
                 func_values = func_values.reshape((samples_x, samples_y, samples_z))
 
             if self.implementation == 'mcubes':
@@ -15,12 +15,15 @@ import csv
 import collections
 import json
 import ast
+import os
 
 import bpy
 from bpy.props import BoolProperty, EnumProperty, StringProperty, IntProperty, PointerProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import node_id, multi_socket, updateNode
+from sverchok.core.tasks import tasks
+from sverchok.utils.sv_text_stream import read_csv_array, read_json_file, parse_columns, csv_dialect_delimiters
 
 from sverchok.utils.sv_text_io_common import (
     FAIL_COLOR, READY_COLOR, TEXT_IO_CALLBACK,
@@ -104,7 +107,10 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
     file_pointer: bpy.props.PointerProperty(type=bpy.types.Text, poll=lambda s, o: True, update=pointer_update)
 
     # external file
-    file: StringProperty(subtype='FILE_PATH')
+    file: StringProperty(subtype='FILE_PATH', name="File", description="File to read directly from disk")
+    file_mode: BoolProperty(
+        name='From file', default=False,
+        description="Read data directly from a file on disk into NumPy arrays, in chunks (CSV and JSON)")
 
     # csv standard dialect as defined in http://docs.python.org/3.3/library/csv.html
     # below are csv settings, user defined are set to 10 to allow more settings be added before
@@ -147,6 +153,17 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
     csv_skip_header_lines: IntProperty(default=0, name='skip n lines', description='some csv need n skips', min=0)
     csv_extended_mode: BoolProperty(name='extended mode')
 
+    # file mode csv options
+    csv_columns: StringProperty(
+        default='', name="Columns",
+        description='Indices of columns to read, for example "0,2,4-6". Empty means all columns')
+    csv_memmap: BoolProperty(
+        default=False, name="Memory map",
+        description="Keep parsed data in a temporary file mapped into memory, it's reused until the file changes")
+    csv_chunk_size: IntProperty(
+        default=100000, min=1000, name="Chunk size",
+        description="Number of lines parsed at once when reading from file")
+
     # Sverchok list options
     # choose which socket to interpret data as
     socket_type: EnumProperty(items=socket_types, default='s')
@@ -167,6 +184,8 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
             layout.prop(self, 'csv_skip_header_lines', text='Skip n header lines')
             layout.label(text="extra mode")
             layout.prop(self, "csv_extended_mode", toggle=True)
+            if self.file_mode:
+                layout.prop(self, 'csv_chunk_size')
 
     def draw_buttons(self, context, layout):
 
@@ -182,9 +201,13 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
             col.operator(TEXT_IO_CALLBACK, text='R E S E T').fn_name = 'reset'
 
         else:
+            col.prop(self, 'file_mode', toggle=True)
             row = col.row(align=True)
-            row.prop_search(self, 'file_pointer', bpy.data, 'texts', text="Read")
-            row.operator("node.sv_textin_file_importer", text='', icon='EMPTY_SINGLE_ARROW')
+            if self.file_mode:
+                row.prop(self, 'file', text="")
+            else:
+                row.prop_search(self, 'file_pointer', bpy.data, 'texts', text="Read")
+                row.operator("node.sv_textin_file_importer", text='', icon='EMPTY_SINGLE_ARROW')
 
             row = col.row(align=True)
             row.prop(self, 'textmode', expand=True)
@@ -209,6 +232,10 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
                     if self.csv_decimalmark == 'CUSTOM':
                         col.prop(self, 'csv_custom_decimalmark')
 
+                if self.file_mode:
+                    col.prop(self, 'csv_columns')
+                    col.prop(self, 'csv_memmap', toggle=True)
+
             if self.textmode == 'SV':
                 col.label(text="Select data type")
                 row = col.row(align=True)
@@ -328,6 +355,10 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         if n_id in self.csv_data:
             del self.csv_data[n_id]
 
+        if self.file_mode:
+            self.load_csv_file_data()
+            return
+
         f = io.StringIO(bpy.data.texts[self.text].as_string())
 
         # setup CSV options
@@ -406,6 +437,61 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
             self.csv_data[n_id] = csv_data
 
 
+    def load_csv_file_data(self):
+        """Read CSV file directly into NumPy array, outputs get column views of the array"""
+        n_id = node_id(self)
+        path = bpy.path.abspath(self.file)
+        if not os.path.isfile(path):
+            self.error("File %s is not found", path)
+            self.color = FAIL_COLOR
+            return
+
+        if self.csv_dialect == 'user':
+            delimiter = self.csv_custom_delimiter if self.csv_delimiter == 'CUSTOM' else self.csv_delimiter
+        else:
+            delimiter = csv_dialect_delimiters[self.csv_dialect]
+            self.csv_decimalmark = ',' if self.csv_dialect == 'semicolon' else '.'
+
+        if self.csv_decimalmark == 'LOCALE':
+            decimalmark = locale.localeconv()['decimal_point']
+        elif self.csv_decimalmark == 'CUSTOM':
+            decimalmark = self.csv_custom_decimalmark or '.'
+        else:
+            decimalmark = self.csv_decimalmark
+
+        file_name = bpy.path.basename(path)
+
+        def report(done, total):
+            tasks.report_progress(f'Reading "{file_name}": {done}/{total} rows')
+
+        try:
+            names, array = read_csv_array(
+                path, delimiter=delimiter, decimalmark=decimalmark,
+                skip_lines=self.csv_skip_header_lines, header=self.csv_header,
+                columns=parse_columns(self.csv_columns), memmap=self.csv_memmap,
+                chunk_size=self.csv_chunk_size, progress=report)
+        except ValueError as err:
+            self.error("Failed to read %s: %s", path, err)
+            self.color = FAIL_COLOR
+            return
+        finally:
+            tasks.report_progress()
+
+        if not len(array):
+            return
+
+        csv_data = collections.OrderedDict()
+        for j, name in enumerate(names):
+            tmp = name
+            c = 1
+            while tmp in csv_data:
+                tmp = name + str(c)
+                c += 1
+            csv_data[tmp] = array[:, j]
+
+        self.current_text = file_name
+        self.csv_data[n_id] = csv_data
+
     #
     # Sverchok list data
     #
@@ -515,9 +601,12 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         if n_id in self.json_data:
             del self.json_data[n_id]
 
-        f = io.StringIO(bpy.data.texts[self.text].as_string())
         try:
-            json_data = json.load(f)
+            if self.file_mode:
+                json_data = read_json_file(bpy.path.abspath(self.file))
+            else:
+                f = io.StringIO(bpy.data.texts[self.text].as_string())
+                json_data = json.load(f)
         except:
             print("Failed to load JSON data")
 
@@ -525,7 +614,7 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
             self.color = FAIL_COLOR
             return
 
-        self.current_text = self.text
+        self.current_text = bpy.path.basename(self.file) if self.file_mode else self.text
         self.json_data[n_id] = json_data
 
     def update_json(self):
@@ -599,7 +688,7 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         self.outputs[0].sv_set(self.list_data[n_id])
 
     def save_to_json(self, node_data: dict):
-        if not self.text:
+        if self.file_mode or not self.text:
             return  # empty node, nothing to do
         texts = bpy.data.texts
 
@@ -619,6 +708,11 @@ class SvTextInNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         as it's a beta service, old IO json may not be compatible - in this interest
         of neat code we assume it finds everything.
         '''
+        if self.file_mode:
+            # the data is not stored in the tree, it's read from the file again
+            self.load()
+            return
+
         if import_version < 1.0:
             params = node_data.get('params')
 
@@ -28,9 +28,10 @@ from sverchok.utils.sv_text_io_common import (
     name_dict,
     text_modes
 )
+from sverchok.utils.sv_text_stream import write_csv_arrays, write_json_arrays, csv_dialect_delimiters
 
 
-def get_csv_data(node):
+def get_csv_columns(node):
     data_out = []
     for socket in node.inputs:
         if socket.is_linked:
@@ -39,6 +40,11 @@ def get_csv_data(node):
             # flatten list
             if tmp:
                 data_out.extend(list(itertools.chain.from_iterable([tmp])))
+    return data_out
+
+
+def get_csv_data(node):
+    data_out = get_csv_columns(node)
 
     csv_str = io.StringIO()
     writer = csv.writer(csv_str, dialect=node.csv_dialect)
@@ -48,7 +54,7 @@ def get_csv_data(node):
     return csv_str.getvalue()
 
 
-def get_json_data(node):
+def get_json_dict(node):
     data_out = {}
 
     socket_order = []
@@ -68,6 +74,11 @@ def get_json_data(node):
                 socket_order.append(name)
 
     data_out['socket_order'] = socket_order
+    return data_out
+
+
+def get_json_data(node):
+    data_out = get_json_dict(node)
 
     if node.json_mode == 'pretty':
         out = json.dumps(data_out, indent=4)
@@ -158,6 +169,10 @@ class SvTextOutNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         # need to do other stuff?
 
     text: StringProperty(name='text')
+    file: StringProperty(subtype='FILE_PATH', name="File", description="File to write directly on disk")
+    file_mode: BoolProperty(
+        name='To file', default=False,
+        description="Stream data directly into a file on disk, without building the whole text in memory")
     file_pointer: bpy.props.PointerProperty(type=bpy.types.Text, poll=lambda s, o: True, update=pointer_update)
 
     text_mode: EnumProperty(items=text_modes, default='CSV', update=change_mode, name="Text format")
@@ -179,9 +194,13 @@ class SvTextOutNodeMK2(SverchCustomTreeNode, bpy.types.Node):
 
         col = layout.column(align=True)
         col.prop(self, 'autodump', toggle=True)
+        col.prop(self, 'file_mode', toggle=True)
         row = col.row(align=True)
-        row.prop_search(self, 'file_pointer', bpy.data, 'texts', text="Write")
-        row.operator("text.new", icon="ZOOM_IN", text='')
+        if self.file_mode:
+            row.prop(self, 'file', text="")
+        else:
+            row.prop_search(self, 'file_pointer', bpy.data, 'texts', text="Write")
+            row.operator("text.new", icon="ZOOM_IN", text='')
 
         row = col.row(align=True)
         row.prop(self, 'text_mode', expand=True)
@@ -218,6 +237,9 @@ class SvTextOutNodeMK2(SverchCustomTreeNode, bpy.types.Node):
 
     # build a string with data from sockets
     def dump(self):
+        if self.file_mode:
+            return self.dump_to_file()
+
         out = self.get_data()
         if len(out) == 0:
             return False
@@ -232,6 +254,31 @@ class SvTextOutNodeMK2(SverchCustomTreeNode, bpy.types.Node):
 
         return True
 
+    def dump_to_file(self):
+        """CSV and JSON data is written in chunks directly from arrays"""
+        if not self.file:
+            return False
+        path = bpy.path.abspath(self.file)
+        # data is checked before opening the file, so that it is not truncated in vain
+        if self.text_mode == 'CSV':
+            columns = get_csv_columns(self)
+            if not columns:
+                return False
+        elif self.text_mode != 'JSON':
+            out = self.get_data()
+            if len(out) == 0:
+                return False
+        with open(path, 'a' if self.append else 'w', newline='') as f:
+            if self.text_mode == 'CSV':
+                write_csv_arrays(f, columns, delimiter=csv_dialect_delimiters[self.csv_dialect])
+            elif self.text_mode == 'JSON':
+                indent = 4 if self.json_mode == 'pretty' else None
+                write_json_arrays(f, get_json_dict(self), indent=indent)
+            else:
+                f.write(out)
+        self.color = READY_COLOR
+        return True
+
     def get_data(self):
         out = ""
         if self.text_mode == 'CSV':
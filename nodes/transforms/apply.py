@@ -22,6 +22,7 @@ from bpy.props import BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, repeat_last
 from sverchok.utils.mesh_functions import meshes_np, meshes_py, apply_matrix, apply_matrices, to_elements, repeat_meshes
+from sverchok.utils.matrix_array import SvMatrixArray
 
 
 class MatrixApplyNode(SverchCustomTreeNode, bpy.types.Node):
@@ -54,14 +55,14 @@ class MatrixApplyNode(SverchCustomTreeNode, bpy.types.Node):
             return
 
         vertices = self.inputs['Vectors'].sv_get(deepcopy=False)
-        matrices = self.inputs['Matrixes'].sv_get(deepcopy=False, default=[])
+        matrices = self.inputs['Matrixes'].sv_get(deepcopy=False, default=[], packed=True)
 
         is_py_input = isinstance(vertices[0], (list, tuple))
         meshes = (meshes_py if is_py_input or not self.output_numpy else meshes_np)(vertices)
         object_number = max([len(vertices), len(matrices)]) if vertices else 0
         meshes = repeat_meshes(meshes, object_number)
         if matrices:
-            is_flat = not isinstance(matrices[0], (list, tuple))
+            is_flat = not isinstance(matrices[0], (list, tuple, SvMatrixArray))
             meshes = (apply_matrix if is_flat else apply_matrices)(meshes, repeat_last(matrices))
         out_vertices, *_ = to_elements(meshes)
 
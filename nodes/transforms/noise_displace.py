@@ -26,6 +26,7 @@ from mathutils import noise, Vector, Matrix
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, list_match_func, numpy_list_match_modes, iter_list_match_func, numpy_full_list_func)
 from sverchok.utils.sv_noise_utils import noise_options, noise_numpy_types
+from sverchok.utils.noise_engine import noise_vector, noise_backends, MATHUTILS, NUMPY
 from sverchok.utils.sv_itertools import recurse_f_level_control
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
@@ -128,6 +129,29 @@ def v_normal_numpy(verts, pols, noise_type, n_props, result, output_numpy):
         result.append((np_verts + normals * n_v[:, np.newaxis] * scale).tolist())
     bm.free()
 
+def v_noise_fast(verts, _, noise_type, n_props, result, output_numpy):
+    scale, seed, matrix, _, _ = n_props
+    np_verts = np.array(verts)
+    n_v = noise_vector(matrix_apply_np(np_verts, matrix), noise_type, int(seed) or 1385, NUMPY)
+    if output_numpy:
+        result.append(np_verts + n_v * scale)
+    else:
+        result.append((np_verts + n_v * scale).tolist())
+
+def v_normal_fast(verts, pols, noise_type, n_props, result, output_numpy):
+    bm = bmesh_from_pydata(verts, [], pols, normal_update=True)
+    normals = np.array([v.normal for v in bm.verts])
+    scale, seed, matrix, _, _ = n_props
+    np_verts = np.array(verts)
+    n_v = noise_vector(matrix_apply_np(np_verts, matrix), noise_type, int(seed) or 1385, NUMPY)
+    n_v[:, 2] -= 1  # the same as deepnoise
+    n_v = np.linalg.norm(n_v, axis=1) * 0.5
+    if output_numpy:
+        result.append(np_verts + normals * n_v[:, np.newaxis] * scale)
+    else:
+        result.append((np_verts + normals * n_v[:, np.newaxis] * scale).tolist())
+    bm.free()
+
 def noise_displace(params, constant, matching_f):
     result = []
     noise_function, noise_type, _, _, match_mode, output_numpy = constant
@@ -177,6 +201,7 @@ for idx, new_type in enumerate(noise_numpy_types.keys()):
 
 noise_func = {'NORMAL': v_normal, 'VECTOR': v_noise}
 noise_func_numpy = {'NORMAL': v_normal_numpy, 'VECTOR': v_noise_numpy}
+noise_func_fast = {'NORMAL': v_normal_fast, 'VECTOR': v_noise_fast}
 
 class SvNoiseDisplaceNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -206,6 +231,13 @@ class SvNoiseDisplaceNode(SverchCustomTreeNode, bpy.types.Node):
         description="Noise type",
         update=updateNode)
 
+    backend: EnumProperty(
+        name='Backend',
+        items=noise_backends,
+        default=MATHUTILS,
+        description="Implementation of the noise, Fast backend takes only first seed and matrix of each object",
+        update=updateNode)
+
     seed: IntProperty(default=0, name='Seed', update=updateNode)
 
     scale_out_v: FloatVectorProperty(
@@ -250,6 +282,8 @@ class SvNoiseDisplaceNode(SverchCustomTreeNode, bpy.types.Node):
             row = layout.row(align=True)
             row.prop(self, 'smooth', toggle=True)
             row.prop(self, 'interpolate', toggle=True)
+        else:
+            layout.prop(self, 'backend', expand=True)
 
     def draw_buttons_ext(self, context, layout):
         '''draw buttons on the N-panel'''
@@ -261,6 +295,8 @@ class SvNoiseDisplaceNode(SverchCustomTreeNode, bpy.types.Node):
         if self.noise_type in noise_numpy_types.keys():
             layout.prop(self, 'smooth', toggle=True)
             layout.prop(self, 'interpolate', toggle=True)
+        else:
+            layout.prop_menu_enum(self, "backend")
         layout.prop_menu_enum(self, "list_match", text="List Match")
         layout.prop(self, "output_numpy", toggle=True)
 
@@ -281,6 +317,9 @@ class SvNoiseDisplaceNode(SverchCustomTreeNode, bpy.types.Node):
         if self.noise_type in noise_numpy_types.keys():
             main_func = noise_displace_numpy
             noise_function = noise_func_numpy[self.out_mode]
+        elif self.backend == NUMPY:
+            main_func = noise_displace_numpy
+            noise_function = noise_func_fast[self.out_mode]
         else:
             main_func = noise_displace
             noise_function = noise_func[self.out_mode]
@@ -16,12 +16,15 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import numpy as np
+
 import bpy
-from bpy.props import FloatProperty
+from bpy.props import FloatProperty, BoolProperty
 from mathutils import Vector
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import (fullList, updateNode)
+from sverchok.data_structure import (match_long_repeat, repeat_last_for_length, updateNode)
+from sverchok.utils.ragged import concatenate_objects, concatenated_ranges, counts_to_offsets, group_items
 
 
 def interp_v3_v3v3(a, b, t=0.5):
@@ -32,6 +35,45 @@ def interp_v3_v3v3(a, b, t=0.5):
         return (s * a[0] + t * b[0], s * a[1] + t * b[1], s * a[2] + t * b[2])
 
 
+def lerp_numpy(verts_a, verts_b, factors, evaluate=False, out_numpy=False):
+    """
+    Vectorized version of the node's main loop: all objects are concatenated
+    and interpolated at once. Shorter lists of objects, of vertices and of
+    factors are extended by repeating their last element.
+    Returns None if inputs can't be concatenated (empty or of mixed types).
+    """
+    joined = [concatenate_objects(verts_a, (3,)), concatenate_objects(verts_b, (3,)), concatenate_objects(factors)]
+    if any(j is None for j in joined):
+        return None
+    (a, offsets_a), (b, offsets_b), (t, offsets_t) = joined
+
+    objects = np.arange(max(len(verts_a), len(verts_b)))
+    idx_a, idx_b, idx_t = [np.minimum(objects, len(offsets) - 2) for offsets in (offsets_a, offsets_b, offsets_t)]
+    count_a, count_b, count_t = [np.diff(offsets)[idx] for offsets, idx in
+                                 [(offsets_a, idx_a), (offsets_b, idx_b), (offsets_t, idx_t)]]
+    count = np.maximum(count_a, count_b)
+    # in Evaluate mode each pair of vertices gives a point per factor
+    out_count = count * count_t if evaluate else count
+
+    # object and position in object of each output point
+    obj = np.repeat(objects, out_count)
+    local = concatenated_ranges(np.zeros(len(objects), dtype=np.int64), out_count)
+    if evaluate:
+        vert, fac = np.divmod(local, count_t[obj])
+    else:
+        vert, fac = local, np.minimum(local, count_t[obj] - 1)
+
+    a = a[offsets_a[idx_a][obj] + np.minimum(vert, count_a[obj] - 1)]
+    b = b[offsets_b[idx_b][obj] + np.minimum(vert, count_b[obj] - 1)]
+    t = t[offsets_t[idx_t][obj] + fac][:, np.newaxis]
+    points = (1.0 - t) * a + t * b
+
+    offsets = counts_to_offsets(out_count)
+    if out_numpy:
+        return np.split(points, offsets[1:-1])
+    return group_items(list(map(tuple, points.tolist())), offsets)
+
+
 class SvVectorLerp(SverchCustomTreeNode, bpy.types.Node):
     '''Linear Interpolation between two vectors (+extrapolate).[def]
     In: Vert_1, Vert_2, Factor (List)
@@ -53,6 +95,11 @@ class SvVectorLerp(SverchCustomTreeNode, bpy.types.Node):
         default="Lerp", update=updateNode
     )
 
+    output_numpy: BoolProperty(
+        name='Output NumPy',
+        description='Output NumPy arrays',
+        default=False, update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvStringsSocket', "Factor").prop_name = 'factor_'
         self.inputs.new('SvVerticesSocket', "Vertices A")
@@ -62,28 +109,41 @@ class SvVectorLerp(SverchCustomTreeNode, bpy.types.Node):
     def draw_buttons(self, context, layout):
         layout.prop(self, 'process_mode', text='Evaluate', expand=True)
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, 'output_numpy', toggle=False)
+
+    def rclick_menu(self, context, layout):
+        layout.prop_menu_enum(self, 'process_mode', text='Mode')
+        layout.prop(self, 'output_numpy', toggle=True)
+
     def process(self):
         if not self.outputs['EvPoint'].is_linked:
             return
-        VerticesA = self.inputs[1].sv_get()
-        VerticesB = self.inputs[2].sv_get()
-        factor = self.inputs['Factor'].sv_get()
 
-        # match inputs using fullList, longest list matching on A and B
+        points = lerp_numpy(self.inputs[1].sv_get(deepcopy=False), self.inputs[2].sv_get(deepcopy=False),
+                            self.inputs['Factor'].sv_get(deepcopy=False),
+                            self.process_mode == 'Evaluate', self.output_numpy)
+        if points is not None:
+            self.outputs['EvPoint'].sv_set(points)
+            return
+
+        VerticesA = self.inputs[1].sv_get(deepcopy=False)
+        VerticesB = self.inputs[2].sv_get(deepcopy=False)
+        factor = self.inputs['Factor'].sv_get(deepcopy=False)
+
+        # match inputs by longest list matching on A and B, into new lists;
         # extend factor list if necessary, it should not control length of output
 
-        max_obj = max(len(VerticesA), len(VerticesB))
-        fullList(VerticesA, max_obj)
-        fullList(VerticesB, max_obj)
-        if len(factor) < max_obj:
-            fullList(factor, max_obj)
+        VerticesA, VerticesB = match_long_repeat([VerticesA, VerticesB])
+        max_obj = len(VerticesA)
+        factor = repeat_last_for_length(list(factor), max_obj)
 
         points = []
         for i in range(max_obj):
 
-            max_l = max(len(VerticesA[i]), len(VerticesB[i]))
-            fullList(VerticesA[i], max_l)
-            fullList(VerticesB[i], max_l)
+            verts_a, verts_b = match_long_repeat([VerticesA[i], VerticesB[i]])
+            max_l = len(verts_a)
 
             temp_points = []
             temp_append = temp_points.append
@@ -92,19 +152,21 @@ class SvVectorLerp(SverchCustomTreeNode, bpy.types.Node):
             if self.process_mode == 'Evaluate':
                 # this matches the old Evaluate Line's code
                 for j in range(max_l):
-                    a = VerticesA[i][j]
-                    b = VerticesB[i][j]
+                    a = verts_a[j]
+                    b = verts_b[j]
                     temp_extend([interp_v3_v3v3(a, b, f) for f in factor[i]])
 
             else:
                 # This is Vector Lerp
-                fullList(factor[i], max_l)   # extend factor list to match vert pair.
+                factors = repeat_last_for_length(list(factor[i]), max_l)   # extend factor list to match vert pair.
                 for j in range(max_l):
-                    a = VerticesA[i][j]
-                    b = VerticesB[i][j]
-                    lerp_factor = factor[i][j]
+                    a = verts_a[j]
+                    b = verts_b[j]
+                    lerp_factor = factors[j]
                     temp_append(interp_v3_v3v3(a, b, lerp_factor))
 
+            if self.output_numpy:
+                temp_points = np.array(temp_points, dtype=np.float64).reshape(-1, 3)
             points.append(temp_points)
 
         self.outputs['EvPoint'].sv_set(points)
@@ -28,6 +28,7 @@ from sverchok.data_structure import (
 from sverchok.ui.sv_icons import custom_icon
 import numpy as np
 from sverchok.utils.modules.vector_math_utils import numpy_vector_func_dict, mathutils_vector_func_dict, vector_math_ops
+from sverchok.utils.ragged import concatenate_objects, match_objects, split_objects, fill_objects
 
 
 socket_type = {'s': 'SvStringsSocket', 'v': 'SvVerticesSocket'}
@@ -64,6 +65,50 @@ def recurse_fxy_numpy(l1, l2, func, level, min_l2_level, out_numpy):
             res_append(recurse_fxy_numpy(u, v, func, level-1, min_l2_level, out_numpy))
         return res
 
+# batched versions of the above: objects of the last level are collected
+# by the same recursion, concatenated and processed by one call of func;
+# they return None if objects can't be concatenated
+
+def collect_fx(l, level, objects):
+    if level == 1:
+        objects.append(l)
+        return len(objects) - 1
+    return [collect_fx(i, level-1, objects) for i in l]
+
+def collect_fxy(l1, l2, level, min_l2_level, pairs):
+    if level == 1:
+        pairs.append((l1, l2))
+        return len(pairs) - 1
+    if levels_of_list_or_np([l1]) < 4:
+        l1 = [l1]
+    if levels_of_list_or_np([l2]) < min_l2_level+1:
+        l2 = [l2]
+    fl = l2[-1] if len(l1) > len(l2) else l1[-1]
+    return [collect_fxy(u, v, level-1, min_l2_level, pairs) for u, v in zip_longest(l1, l2, fillvalue=fl)]
+
+def batched_fx_numpy(l, func, level, out_numpy):
+    objects = []
+    structure = collect_fx(l, level, objects)
+    joined = concatenate_objects(objects, (3,))
+    if joined is None:
+        return None
+    array, offsets = joined
+    return fill_objects(structure, split_objects(func(array), offsets, out_numpy))
+
+def batched_fxy_numpy(l1, l2, func, level, min_l2_level, out_numpy):
+    pairs = []
+    structure = collect_fxy(l1, l2, level, min_l2_level, pairs)
+    if not pairs:
+        return None
+    objects1, objects2 = zip(*pairs)
+    joined1 = concatenate_objects(objects1, (3,))
+    joined2 = concatenate_objects(objects2, (3,) if min_l2_level == 3 else ())
+    if joined1 is None or joined2 is None:
+        return None
+    offsets, (idxs1, idxs2) = match_objects([joined1[1], joined2[1]], 'REPEAT')
+    result = func(joined1[0][idxs1], joined2[0][idxs2])
+    return fill_objects(structure, split_objects(result, offsets, out_numpy))
+
 def recurse_fx(l, func, level):
     if not level:
         return func(l)
@@ -221,9 +266,13 @@ class SvVectorMathNodeMK3(SverchCustomTreeNode, bpy.types.Node):
             params = [input_one, input_two, func, level, min_l2_level]
             recurse_func = self.implementation_func_dict[self.implementation][2]
 
+        result = None
         if self.implementation == 'NumPy':
             params.append(self.output_numpy)
-        result = recurse_func(*params)
+            batched_func = batched_fx_numpy if num_inputs == 1 else batched_fxy_numpy
+            result = batched_func(*params)
+        if result is None:
+            result = recurse_func(*params)
         outputs[0].sv_set(result)
 
     def ensure_enums_have_no_space(self, enums=None):
@@ -20,12 +20,13 @@
 
 import bpy
 from bpy.props import EnumProperty, IntProperty, BoolProperty
-from mathutils import noise, Matrix, Vector
+from mathutils import Matrix, Vector
 from itertools import cycle
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat
 from sverchok.utils.sv_noise_utils import noise_options, PERLIN_ORIGINAL, noise_numpy_types
+from sverchok.utils.noise_engine import noise_vector, noise_backends, MATHUTILS
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
 import numpy as np
 
@@ -45,14 +46,11 @@ def numpy_noise(vecs, out, out_mode, seed, noise_function, smooth, output_numpy)
         else:
             out.append(noise_function(np.array(vecs), seed, smooth).tolist())
 
-def mathulis_noise(vecs, out, out_mode, noise_type, noise_function, output_numpy):
+def mathulis_noise(vecs, out, out_mode, noise_type, seed, backend, output_numpy):
+    vecs = noise_vector(vecs, noise_type, seed, backend)
     if out_mode == 'VECTOR':
-        if output_numpy:
-            out.append(np.array([noise_function(v, noise_basis=noise_type)[:] for v in vecs]))
-        else:
-            out.append([noise_function(v, noise_basis=noise_type)[:] for v in vecs])
+        out.append(vecs if output_numpy else vecs.tolist())
     else:
-        vecs = np.array([noise_function(v, noise_basis=noise_type)[:] for v in vecs])
         vecs -= [0, 0, 1]
         noise_output = np.linalg.norm(vecs, axis=1)*0.5
         out.append(noise_output if output_numpy else noise_output.tolist())
@@ -123,6 +121,13 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
         description="Noise type",
         update=updateNode)
 
+    backend: EnumProperty(
+        name='Backend',
+        items=noise_backends,
+        default=MATHUTILS,
+        description="Implementation of the noise",
+        update=updateNode)
+
     seed: IntProperty(default=0, name='Seed', update=updateNode)
 
     smooth: BoolProperty(
@@ -154,7 +159,8 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
             row = layout.row(align=True)
             row.prop(self, 'smooth', toggle=True)
             row.prop(self, 'interpolate', toggle=True)
-
+        else:
+            layout.prop(self, 'backend', expand=True)
 
     def draw_buttons_ext(self, ctx, layout):
         self.draw_buttons(ctx, layout)
@@ -166,6 +172,8 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
         if self.noise_type in noise_numpy_types.keys():
             layout.prop(self, 'smooth', toggle=True)
             layout.prop(self, 'interpolate', toggle=True)
+        else:
+            layout.prop_menu_enum(self, "backend")
         layout.prop(self, "output_numpy", toggle=True)
 
     def process(self):
@@ -200,15 +208,14 @@ class SvNoiseNodeMK3(SverchCustomTreeNode, bpy.types.Node):
 
         else:
 
-            noise_function = noise.noise_vector
+            backend = self.backend
 
             for i in range(max_len):
                 seed = seeds[min(i, len(seeds)-1)]
                 obj_id = min(i, len(verts)-1)
                 # 0 unsets the seed and generates unreproducible output based on system time
                 seed_val = int(round(seed)) or 140230
-                noise.seed_set(seed_val)
-                mathulis_noise(verts[obj_id], out, out_mode, noise_type, noise_function, output_numpy)
+                mathulis_noise(verts[obj_id], out, out_mode, noise_type, seed_val, backend, output_numpy)
 
         outputs[0].sv_set(out)
 
@@ -17,6 +17,8 @@ from sverchok.data_structure import updateNode, replace_socket
 from sverchok.utils.nodes_mixins.generating_objects import SvMeshData, SvViewerNode
 from sverchok.ui.sv_icons import custom_icon
 from sverchok.utils.handle_blender_data import correct_collection_length
+from sverchok.utils.matrix_array import is_packed, as_matrix_array
+from sverchok.utils.mesh_functions import transform_copies
 
 def auto_release(parent, childs_name):
     for obj in bpy.data.objects[parent].children:
@@ -28,6 +30,15 @@ def generate_mesh_data(transforms, child, mode, ignore_location):
     A = Vector((-1, -1/3, 0))
     B = Vector((1, -1/3, 0))
     C = Vector((0, 2/3, 0))
+    if mode == "FACES" and is_packed(transforms):
+        # a triangle per matrix, all at once
+        matrices = as_matrix_array(transforms)
+        if ignore_location:
+            matrices = np.array(Matrix.Translation(-child.matrix_world.to_translation())) @ matrices
+        verts, _, _ = transform_copies([A, B, C], None, None, matrices)
+        faces = np.arange(3*len(matrices)).reshape(-1, 3).tolist()
+        return verts.astype(np.float32), faces
+
     if ignore_location:
         if mode == "FACES":
             mtrx = Matrix.Translation(child.matrix_world.to_translation()).inverted()
@@ -183,7 +194,10 @@ class SvDupliInstancesMK5(SverchCustomTreeNode, bpy.types.Node, SvViewerNode):
         if not self.is_active or not self.inputs[1].is_linked:
             return
         child_objects = self.inputs['child'].sv_get(deepcopy=False)
-        transforms = self.inputs['matr/vert'].sv_get(deepcopy=False)
+        if self.inputs['matr/vert'].bl_idname == 'SvMatrixSocket':
+            transforms = self.inputs['matr/vert'].sv_get(deepcopy=False, packed=True)
+        else:
+            transforms = self.inputs['matr/vert'].sv_get(deepcopy=False)
         if not child_objects:
             return
         child = child_objects[0]
@@ -0,0 +1,13 @@
+#!/bin/bash
+
+# If your blender is not available as just "blender" command, then you need
+# to specify path to blender when running this script, e.g.
+#
+# $ BLENDER=~/soft/blender-3.6/blender ./run_benchmarks.sh --baseline benchmarks/baseline.json
+#
+
+set -e
+
+BLENDER=${BLENDER:-blender}
+
+$BLENDER -b --addons sverchok --python utils/benchmarking.py --python-exit-code 1 -- $@
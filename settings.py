@@ -336,6 +336,12 @@ class SverchokPreferences(AddonPreferences):
         default="POST",
         update=set_frame_change)
 
+    parallel_workers: IntProperty(
+        name="Worker processes",
+        description="Number of processes used by nodes which process objects in parallel; "
+                    "0 - number of CPUs, 1 - do not use parallel processes",
+        default=0, min=0)
+
     #  Menu settings
 
     show_icons: BoolProperty(
@@ -514,6 +520,7 @@ class SverchokPreferences(AddonPreferences):
         box = col1.box()
         box.label(text="Other")
         box.prop(self, "frame_change_mode", expand=False)
+        box.prop(self, "parallel_workers")
 
         col2 = col_split.split().column()
 
@@ -0,0 +1,143 @@
+from itertools import repeat
+from unittest.mock import patch
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, EmptyTreeTestCase, create_node
+from sverchok.utils.adaptive_polygons import (flatten_faces, corner_indexes, quad_weights, triangle_weights,
+                                              map_to_quads, map_to_tris, auto_z_scales, copy_topology)
+
+
+class AdaptivePolygonsTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        # unit square and a square of size 2 lifted up to z=1
+        self.quads = np.array([[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+                               [[0, 0, 1], [2, 0, 1], [2, 2, 1], [0, 2, 1]]], dtype=np.float64)
+        self.normals = np.broadcast_to(np.array([0.0, 0.0, 1.0]), self.quads.shape)
+        self.face_normals = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+        self.ones = np.ones(2)
+
+    def test_corner_indexes(self):
+        flat_faces = flatten_faces([[0, 1, 2], [3, 4, 5, 6], [7, 8, 9, 10, 11]])
+        corners = corner_indexes(flat_faces, np.array([0, 1, 2]), [0, 1, 2, -1], np.array([0, 1, 2]))
+        expected = np.array([[0, 1, 2, 2], [4, 5, 6, 3], [9, 11, 7, 8]])
+        self.assert_numpy_arrays_equal(corners, expected)
+
+    def test_weights(self):
+        weights = quad_weights(np.array([-0.5, 0.0]), np.array([-0.5, 0.0]))
+        self.assert_numpy_arrays_equal(weights, np.array([[1, 0, 0, 0], [0.25, 0.25, 0.25, 0.25]]), precision=8)
+        triangle = np.array([[0, 0], [1, 0], [0, 1]], dtype=np.float64)
+        weights = triangle_weights(np.array([[0, 0], [0.25, 0.5]]), triangle)
+        self.assert_numpy_arrays_equal(weights, np.array([[1, 0, 0], [0.25, 0.25, 0.5]]), precision=8)
+
+    def test_map_to_quads(self):
+        donor_xy = np.array([[-0.5, -0.5], [0.0, 0.0], [0.5, 0.25]])
+        donor_z = np.array([0.0, 1.0, 0.5])
+        result = map_to_quads(donor_xy, donor_z, self.quads, self.normals, self.face_normals,
+                              np.array([True, False]), self.ones, self.ones, np.zeros(2))
+        expected = np.array([[[0, 0, 0], [0.5, 0.5, 1], [1, 0.75, 0.5]],
+                             [[0, 0, 1], [1, 1, 2], [2, 1.5, 1.5]]])
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_map_to_quads_coefficients(self):
+        donor_xy = np.array([[0.5, 0.5], [0.0, 0.0]])
+        donor_z = np.array([1.0, 0.0])
+        result = map_to_quads(donor_xy, donor_z, self.quads, self.normals, self.face_normals,
+                              np.array([True, True]), np.array([0.5, 1.0]), np.array([2.0, 1.0]),
+                              np.array([0.0, -1.0]))
+        expected = np.array([[[0.75, 0.75, 2], [0.5, 0.5, 0]],
+                             [[2, 2, 1], [1, 1, 0]]])
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_map_to_tris(self):
+        tris = self.quads[:, :3]
+        triangle = np.array([[0, 0], [1, 0], [1, 1]], dtype=np.float64)
+        donor_xy = np.array([[0.0, 0.0], [1.0, 0.5]])
+        donor_z = np.array([0.0, 1.0])
+        result = map_to_tris(donor_xy, donor_z, triangle, tris, self.normals[:, :3], self.face_normals,
+                             np.array([False, True]), np.array([1.0, 2.0]), self.ones, np.zeros(2))
+        # the source triangle of the second face is scaled by 1/2 around the origin
+        expected = np.array([[[0, 0, 0], [1, 0.5, 1]],
+                             [[0, 0, 1], [4, 2, 2]]])
+        self.assert_numpy_arrays_equal(result, expected, precision=8)
+
+    def test_auto_z_scales(self):
+        scales = auto_z_scales(self.quads, np.ones(4))
+        self.assert_numpy_arrays_equal(scales, np.array([1.0, 2.0]), precision=8)
+        degenerated = np.zeros((1, 3, 3))
+        self.assert_numpy_arrays_equal(auto_z_scales(degenerated, np.ones(3)), np.array([1.0]), precision=8)
+
+    def test_copy_topology(self):
+        self.assertEqual(copy_topology([[0, 1], [1, 2]], 2, 3), [[0, 1], [1, 2], [3, 4], [4, 5]])
+        self.assertEqual(copy_topology([[0, 1, 2], [1, 2, 3, 4]], 2, 5),
+                         [[0, 1, 2], [1, 2, 3, 4], [5, 6, 7], [6, 7, 8, 9]])
+        self.assertEqual(copy_topology([], 3, 5), [])
+
+
+class AdaptivePolygonsBatchedTest(EmptyTreeTestCase):
+    # donor: a small pyramid
+    donor_verts = [(-0.5, -0.5, 0), (0.5, -0.5, 0), (0.5, 0.5, 0), (-0.5, 0.5, 0), (0.1, 0.2, 0.7)]
+    donor_faces = [[0, 1, 2, 3], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]
+
+    @staticmethod
+    def recipients():
+        rng = np.random.RandomState(0)
+        grid = [(x + rng.uniform(-0.2, 0.2), y + rng.uniform(-0.2, 0.2), rng.uniform(0, 0.5))
+                for y in range(3) for x in range(4)]
+        quads = [[y * 4 + x, y * 4 + x + 1, y * 4 + x + 5, y * 4 + x + 4] for y in range(2) for x in range(3)]
+        # quads, triangles and a hexagon made of two cells
+        mixed = quads[:2] + [[2, 3, 7], [2, 7, 6], [4, 5, 9, 8], [5, 6, 7, 11, 10, 9]]
+        return [(grid, quads), (grid, mixed)]
+
+    def process(self, node, verts, faces, donors=None, rotations=None, donor_index=(0,)):
+        if donors is None:
+            donors, single_donor = (self.donor_verts, [], self.donor_faces, []), True
+        else:
+            donors, single_donor = ([donor[0] for donor in donors], [[]], [donor[1] for donor in donors], [[]]), False
+        rotations = repeat(0.3) if rotations is None else iter(rotations)
+        output = node._process(verts, faces, *donors,
+                               repeat(0.5), repeat(1.0), repeat(0.1), rotations, repeat(0.8),
+                               repeat(1), [1] * len(faces), single_donor, list(donor_index),
+                               repeat(1), [])
+        return output.verts_out
+
+    def assert_batched_parity(self, node, *args, **kwargs):
+        node.implementation = 'Mathutils'
+        expected = self.process(node, *args, **kwargs)
+        node.implementation = 'NumPy'
+        with patch.object(type(node), '_process_batched', autospec=True,
+                          side_effect=type(node)._process_batched) as batched:
+            result = self.process(node, *args, **kwargs)
+        self.assertTrue(batched.called)
+        self.assertEqual(len(result), len(expected))
+        for copy, expected_copy in zip(result, expected):
+            # mathutils calculates in single precision
+            np.testing.assert_allclose(np.array(copy), np.array(expected_copy), atol=1e-5)
+
+    def test_batched_parity(self):
+        node = create_node('SvAdaptivePolygonsNodeMk3')
+        node.ngons_as = 'ASIS'
+        for verts, faces in self.recipients():
+            for xy_mode in ['BOUNDS', 'PLAIN']:
+                for z_scale in ['PROP', 'CONST', 'AUTO']:
+                    with self.subTest(sides=sorted(set(map(len, faces))), xy_mode=xy_mode, z_scale=z_scale):
+                        node.xy_mode, node.z_scale = xy_mode, z_scale
+                        self.assert_batched_parity(node, verts, faces)
+
+    def test_batched_donor_per_face(self):
+        node = create_node('SvAdaptivePolygonsNodeMk3')
+        node.ngons_as = 'ASIS'
+        node.matching_mode = 'PERFACE'
+        # the pyramid, a flat quad and a scaled pyramid with apex moved
+        donors = [(self.donor_verts, self.donor_faces),
+                  ([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [[0, 1, 2, 3]]),
+                  ([(2 * x, 2 * y, 3 * z) for x, y, z in self.donor_verts[:4]] + [(-0.3, 0.4, 1.5)], self.donor_faces)]
+        for verts, faces in self.recipients():
+            rotations = [0.0, 0.5, 0.0, 1.0, 0.5, 0.0, 0.0][:len(faces)]
+            for donor_matching_mode in ['REPEAT', 'CYCLE', 'INDEX']:
+                for z_scale in ['PROP', 'CONST', 'AUTO']:
+                    with self.subTest(sides=sorted(set(map(len, faces))), donor_matching=donor_matching_mode,
+                                      z_scale=z_scale):
+                        node.donor_matching_mode, node.z_scale = donor_matching_mode, z_scale
+                        self.assert_batched_parity(node, verts, faces, donors, rotations, donor_index=[2, 0, 1, 1])
@@ -0,0 +1,68 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.nurbs_common import SvNurbsMaths
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.curve.batch_intersect import SvAabbTree, intersect_curves_batch
+
+
+def build_curve(control_points, degree=2, weights=None):
+    control_points = np.asarray(control_points, dtype=np.float64)
+    n = len(control_points)
+    if weights is None:
+        weights = np.ones(n)
+    knotvector = sv_knotvector.generate(degree, n)
+    return SvNurbsMaths.build_curve(SvNurbsMaths.NATIVE, degree, knotvector, control_points, weights)
+
+
+class AabbTreeTests(SverchokTestCase):
+    def test_query_tree(self):
+        rng = np.random.default_rng(0)
+        min1 = rng.random((50, 3))
+        max1 = min1 + 0.1 * rng.random((50, 3))
+        min2 = rng.random((30, 3))
+        max2 = min2 + 0.1 * rng.random((30, 3))
+        idxs1, idxs2 = SvAabbTree(min1, max1).query_tree(SvAabbTree(min2, max2))
+        found = set(zip(idxs1.tolist(), idxs2.tolist()))
+        expected = set()
+        for i in range(50):
+            for j in range(30):
+                if np.all(min1[i] <= max2[j]) and np.all(min2[j] <= max1[i]):
+                    expected.add((i, j))
+        self.assertEqual(found, expected)
+
+
+class BatchIntersectTests(SverchokTestCase):
+    def test_lines_grid(self):
+        horizontal = [build_curve([[0, y, 0], [5, y, 0]], degree=1) for y in range(4)]
+        vertical = [build_curve([[x, 0, 0], [x, 3, 0], [x, 6, 0]], degree=1) for x in (0.5, 2.5)]
+        result = intersect_curves_batch(horizontal, vertical)
+        self.assertEqual(len(result), 8)
+        for (i, j), intersections in result.items():
+            self.assertEqual(len(intersections), 1)
+            t1, t2, point = intersections[0]
+            expected = [(0.5, 2.5)[j], i, 0]
+            self.assert_numpy_arrays_equal(point, np.array(expected), precision=3)
+
+    def test_several_intersections(self):
+        # parabola-like curve crosses the line twice, as well as its rational version
+        line = build_curve([[-2, 0.5, 0], [2, 0.5, 0]], degree=1)
+        arc = build_curve([[-1, 0, 0], [0, 2, 0], [1, 0, 0]], degree=2)
+        rational = build_curve([[-1, 0, 0], [0, 2, 0], [1, 0, 0]], degree=2, weights=[1, 3, 1])
+        result = intersect_curves_batch([arc, rational], [line])
+        for i, curve in enumerate([arc, rational]):
+            intersections = result[(i, 0)]
+            self.assertEqual(len(intersections), 2)
+            for t1, t2, point in intersections:
+                self.assert_numpy_arrays_equal(curve.evaluate(t1), point, precision=3)
+                self.assert_numpy_arrays_equal(line.evaluate(t2), point, precision=3)
+                self.assertAlmostEqual(point[1], 0.5, places=3)
+
+    def test_pairs_and_self(self):
+        curves = [build_curve([[0, y, 0], [1, y + 1, 0]], degree=1) for y in (0, 0.5)]
+        curves.append(build_curve([[0, 1, 0], [1, 0, 0]], degree=1))
+        result = intersect_curves_batch(curves)
+        self.assertEqual(set(result.keys()), {(0, 2), (1, 2)})
+        result = intersect_curves_batch(curves, curves, pairs=[(2, 0)])
+        self.assertEqual(set(result.keys()), {(2, 0)})
+        self.assert_numpy_arrays_equal(result[(2, 0)][0][2], np.array([0.5, 0.5, 0]), precision=3)
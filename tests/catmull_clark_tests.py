@@ -0,0 +1,47 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.catmull_clark import SvCatmullClarkTopology, subdivide_arrays
+
+
+class CatmullClarkTests(SverchokTestCase):
+    cube_verts = [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+    cube_faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+
+    def test_cube(self):
+        verts, edges, faces = subdivide_arrays(self.cube_verts, self.cube_faces)
+        self.assertEqual(verts.shape, (8 + 6 + 12, 3))
+        self.assertEqual(faces.shape, (24, 4))
+        self.assertEqual(len(edges), 48)
+        self.assert_numpy_arrays_equal(verts[0], np.array([2, 2, 2]) / 9, precision=8)
+        # middle of face 0 (x = 0)
+        self.assert_numpy_arrays_equal(verts[8], np.array([0, 0.5, 0.5]), precision=8)
+        edge_points = {tuple(np.round(v, 8)) for v in verts[14:]}
+        self.assertIn((0.5, 0.125, 0.125), edge_points)
+
+    def test_boundary(self):
+        # single quad: corners have 1 face, edges are split in the middle
+        verts, edges, faces = subdivide_arrays([(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)], [[0, 1, 2, 3]])
+        self.assert_numpy_arrays_equal(verts[0], np.array([0.25, 0.25, 0]), precision=8)
+        self.assert_numpy_arrays_equal(verts[4], np.array([1, 1, 0]), precision=8)
+        self.assertEqual({tuple(v) for v in verts[5:].tolist()}, {(1, 0, 0), (2, 1, 0), (1, 2, 0), (0, 1, 0)})
+
+    def test_topology_reuse(self):
+        faces = self.cube_faces[:5] + [[1, 5, 7], [1, 7, 3]]
+        topology = SvCatmullClarkTopology.from_faces(8, faces)
+        for level in range(2):
+            subdivided = topology.subdivided()
+            expected = SvCatmullClarkTopology.from_faces(subdivided.n_verts, subdivided.face_verts.reshape(-1, 4))
+            self.assertEqual({tuple(e) for e in np.sort(subdivided.edges, axis=1).tolist()},
+                             {tuple(e) for e in expected.edges.tolist()})
+            self.assert_numpy_arrays_equal(np.sort(subdivided.edges[subdivided.loop_edges], axis=1),
+                                           expected.edges[expected.loop_edges])
+            topology = subdivided
+
+    def test_levels(self):
+        verts, edges, faces = subdivide_arrays(self.cube_verts, self.cube_faces, levels=3)
+        self.assertEqual(len(faces), 6 * 4 ** 3)
+        self.assertEqual(len(verts) - len(edges) + len(faces), 2)
+        # subdivided cube is symmetric and lies inside of the original one
+        self.assert_numpy_arrays_equal(verts.mean(axis=0), np.array([0.5, 0.5, 0.5]), precision=8)
+        self.assertTrue((verts > 0).all() and (verts < 1).all())
@@ -0,0 +1,51 @@
+import numpy as np
+
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.delaunay3d import (
+    simplex_measures, filter_simplices, unique_rows, simplex_edges, simplex_faces,
+    boundary_faces, circumradii_squared, alpha_shape_faces)
+
+
+class Delaunay3dTests(SverchokTestCase):
+    # two tetrahedrons with common face (1, 2, 3)
+    vertices = np.array([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1), (2, 2, 2)], dtype=np.float64)
+    tetras = np.array([[0, 1, 2, 3], [3, 2, 1, 4]])
+
+    def test_measures(self):
+        self.assert_numpy_arrays_equal(simplex_measures(self.vertices, self.tetras[:1]), np.array([1 / 6]), precision=8)
+        self.assert_numpy_arrays_equal(simplex_measures(self.vertices, np.array([[0, 1, 2]])), np.array([0.5]), precision=8)
+        self.assert_numpy_arrays_equal(simplex_measures(self.vertices, np.array([[0, 4]])), np.array([12 ** 0.5]), precision=8)
+
+    def test_filter(self):
+        flat = np.array([[0, 1, 2, 2]])
+        simplices = np.concatenate((self.tetras, flat))
+        self.assertEqual(filter_simplices(self.vertices, simplices, 1e-4).tolist(), self.tetras.tolist())
+        self.assertEqual(filter_simplices(self.vertices, simplices, 0, 1.5).tolist(), [[0, 1, 2, 3], [0, 1, 2, 2]])
+
+    def test_unique(self):
+        rows, counts = unique_rows(np.array([[2, 1], [0, 3], [1, 2]]), 4, return_counts=True)
+        self.assertEqual(rows.tolist(), [[0, 3], [1, 2]])
+        self.assertEqual(counts.tolist(), [1, 2])
+        self.assertEqual(len(simplex_edges(self.tetras, 5)), 9)
+        self.assertEqual(len(simplex_faces(self.tetras, 5)), 7)
+
+    def test_boundary(self):
+        faces = boundary_faces(self.tetras, 5).tolist()
+        self.assertEqual(len(faces), 6)
+        self.assertNotIn([1, 2, 3], faces)
+
+    def test_circumradius(self):
+        r2 = circumradii_squared(self.vertices, self.tetras[:1])
+        self.assert_numpy_arrays_equal(r2, np.array([0.75]), precision=8)
+
+    @requires(scipy)
+    def test_alpha_shape(self):
+        from scipy.spatial import Delaunay, ConvexHull
+        points = np.random.RandomState(1).rand(100, 3)
+        tetras = Delaunay(points).simplices
+        # with big alpha, alpha shape is the convex hull
+        faces = alpha_shape_faces(points, tetras, 100, 0)
+        hull = np.sort(ConvexHull(points).simplices, axis=1)
+        self.assertEqual(sorted(map(tuple, faces.tolist())), sorted(map(tuple, hull.tolist())))
+        self.assertEqual(len(alpha_shape_faces(points, tetras, 0.01, 0)), 0)
@@ -0,0 +1,103 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""
+Tests for the batched EisenScript interpreter: it should give the same
+matrices in the same order as the stack-based interpreter.
+"""
+
+import unittest
+
+import numpy as np
+
+from sverchok.utils.modules.eisenscript.parser import parse
+from sverchok.utils.modules.eisenscript.interpreter import (
+    Interpreter,
+    BatchInterpreter,
+)
+
+
+class BatchInterpreterTests(unittest.TestCase):
+    """Compare results of batched and stack-based interpretation."""
+
+    def assert_same_result(self, src, **kwargs):
+        expected = Interpreter.interpret(parse(src), **kwargs)
+        result = Interpreter.interpret(parse(src), batched=True, **kwargs)
+        self.assertEqual(list(result.matrices), list(expected.matrices))
+        for name, matrices in expected.matrices.items():
+            matrices = np.array(matrices, dtype=np.float64).reshape(-1, 4, 4)
+            self.assertIsInstance(result.matrices[name], np.ndarray)
+            self.assertEqual(result.matrices[name].shape, matrices.shape)
+            np.testing.assert_allclose(result.matrices[name], matrices, atol=1e-5)
+        return result
+
+    def test_repetitions(self):
+        self.assert_same_result("10 * { x 1 } 3 * { ry 30 y 1 } box  5 * { z 1 } sphere")
+
+    def test_recursion(self):
+        src = """
+        set maxdepth 6
+        r
+        rule r { { x 1 s 0.8 rz 10 } r { y 1 s 0.7 } r 2 * { z 1 } box }
+        """
+        result = self.assert_same_result(src)
+        self.assertEqual(len(result.matrices["box"]), 2 * (2 ** 6 - 1))
+
+    def test_origin_as_center(self):
+        src = "set maxdepth 4\nr\nrule r { { s 0.5 rx 30 x 1 } r { fy y 1 } r box }"
+        self.assert_same_result(src, origin_as_center=False)
+
+    def test_size_bounds(self):
+        self.assert_same_result("set minsize 0.5\nset maxdepth 20\nr\n"
+                                "rule r { { x 1 s 0.8 } r { y 1 s 0.7 rz 10 } r box }")
+        self.assert_same_result("set maxsize 3\nset maxdepth 6\nr\n"
+                                "rule r { { s 1.3 x 1 } r 2 * { y 1 } 3 * { z 1 } box }")
+
+    def test_retirement(self):
+        self.assert_same_result("set maxdepth 10\nr\nrule r maxdepth 3 > leaf { { x 1 } r box }\n"
+                                "rule leaf { 2 * { y 1 } sphere }")
+        self.assert_same_result("set maxdepth 10\nstart2\nrule start2 { 1 * { x 1 } md 2 > leaf child }\n"
+                                "rule child { { x 1 } child box }\nrule leaf { sphere }")
+
+    def test_parameters(self):
+        self.assert_same_result("set maxdepth 8\nrule r(n) { { x n } box { y 1 } r(n * 0.5) }\nr(4)\n"
+                                "2 * { z 2 } r(1)")
+
+    def test_stack_depth_guard(self):
+        """Calls beyond max depth in the stack are dropped in the same way."""
+        result = self.assert_same_result("set maxdepth 3\n10 * { x 1 } r\nrule r { box }")
+        self.assertEqual(len(result.matrices["box"]), 4)
+
+    def test_max_objects(self):
+        src = "set maxobjects 7\nset maxdepth 5\nr\nrule r { { x 1 } r { y 1 } r box }"
+        result = self.assert_same_result(src)
+        self.assertEqual(len(result.matrices["box"]), 7)
+
+    def test_fallback(self):
+        """Programs which depend on the order of evaluation are interpreted in the usual way."""
+        weighted = parse("child\nrule child w 10 { box }\nrule child w 1 { sphere }")
+        self.assertFalse(BatchInterpreter.supports(weighted, None))
+        self.assert_same_result("set seed 3\n10 * { x 1 } child\nrule child w 10 { box }\nrule child w 1 { sphere }")
+        mixed = parse("10 * { x 1 } box\n10 * { y 1 } sphere")
+        self.assertTrue(BatchInterpreter.supports(mixed, None))
+        self.assertFalse(BatchInterpreter.supports(mixed, 5))
+        self.assert_same_result("set maxobjects 5\n10 * { x 1 } box\n10 * { y 1 } sphere")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.field.scalar import (
+        SvCoordinateScalarField, SvScalarFieldLambda, SvScalarFieldBinOp,
+        SvScalarFieldVectorizedFunction, SvMergedScalarField, SvVectorScalarFieldComposition)
+from sverchok.utils.field.vector import SvAbsoluteVectorField
+from sverchok.utils.field.vector_operations import SvComposedVectorField, SvVectorFieldMultipliedByScalar
+from sverchok.utils.field.compiler import compile_field
+
+
+class FieldCompilerTests(SverchokTestCase):
+    def setUp(self):
+        self.calls = 0
+
+        def wave(xs, ys, zs, vs):
+            self.calls += 1
+            return np.sin(xs) * np.cos(ys) + zs
+
+        self.wave = SvScalarFieldLambda(wave, None, None, function_numpy=wave)
+        x = SvCoordinateScalarField('X')
+        product = SvScalarFieldBinOp(self.wave, x, np.multiply)
+        merged = SvMergedScalarField('MAX', [SvScalarFieldVectorizedFunction(product, np.tanh), self.wave])
+        self.vector_field = SvVectorFieldMultipliedByScalar(
+                SvAbsoluteVectorField(SvComposedVectorField('XYZ', merged, self.wave, x)), self.wave)
+        self.scalar_field = SvVectorScalarFieldComposition(self.vector_field, merged)
+        self.xs, self.ys, self.zs = np.random.default_rng(0).normal(size=(3, 1000))
+
+    def test_scalar(self):
+        expected = self.scalar_field.evaluate_grid(self.xs, self.ys, self.zs)
+        plan = compile_field(self.scalar_field)
+        self.assert_numpy_arrays_equal(plan.evaluate_grid(self.xs, self.ys, self.zs), expected, precision=10)
+        self.assert_numpy_arrays_equal(plan.evaluate_grid(self.xs, self.ys, self.zs, chunk_size=300), expected, precision=10)
+
+    def test_vector(self):
+        expected = self.vector_field.evaluate_grid(self.xs, self.ys, self.zs)
+        result = compile_field(self.vector_field).evaluate_grid(self.xs, self.ys, self.zs, chunk_size=300)
+        for component, expected_component in zip(result, expected):
+            self.assert_numpy_arrays_equal(component, expected_component, precision=10)
+
+    def test_common_subexpressions(self):
+        self.scalar_field.evaluate_grid(self.xs, self.ys, self.zs)
+        self.assertGreater(self.calls, 2)
+        self.calls = 0
+        compile_field(self.scalar_field).evaluate_grid(self.xs, self.ys, self.zs)
+        # once at source points and once at points mapped by the vector field
+        self.assertEqual(self.calls, 2)
+
+    def test_box(self):
+        x_range, y_range, z_range = np.linspace(0, 1, 7), np.linspace(-1, 1, 5), np.linspace(2, 3, 4)
+        xs, ys, zs = np.meshgrid(x_range, y_range, z_range, indexing='ij')
+        expected = self.scalar_field.evaluate_grid(xs.flatten(), ys.flatten(), zs.flatten())
+        result = compile_field(self.scalar_field).evaluate_box(x_range, y_range, z_range, chunk_size=50)
+        self.assert_numpy_arrays_equal(result, expected, precision=10)
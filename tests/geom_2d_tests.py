@@ -3,6 +3,7 @@ from sverchok.utils.geom_2d.make_monotone import monotone_sv_face_with_holes
 from sverchok.utils.geom_2d.intersections import intersect_sv_edges
 from sverchok.utils.geom_2d.merge_mesh import edges_to_faces, merge_mesh_light, crop_mesh, crop_edges, merge_mesh
 from sverchok.utils.geom_2d.dissolve_mesh import dissolve_faces
+from sverchok.utils.geom_2d import array_dcel
 
 
 class MakeMonotoneTest(SverchokTestCase):
@@ -293,3 +294,92 @@ class DissolveFaces2DTest(SverchokTestCase):
         self.assert_sverchok_data_equal(expected_faces, result_faces)
         self.assert_sverchok_data_equal(expected_face_mask, result_face_mask)
         self.assert_sverchok_data_equal(expected_index_mask, result_index_mask)
+
+
+def face_areas(sv_points, sv_faces, *masks):
+    # order independent representation of a mesh for comparing results of different implementations
+    out = []
+    for i, face in enumerate(sv_faces):
+        co = [sv_points[j] for j in face]
+        area = sum(v1[0] * v2[1] - v2[0] * v1[1] for v1, v2 in zip(co, co[1:] + co[:1])) / 2
+        out.append((round(area, 5),) + tuple(mask[i] for mask in masks))
+    return sorted(out)
+
+
+class ArrayDCELTest(SverchokTestCase):
+
+    def test_edges_to_faces_holes_in_holes(self):
+        sv_points = [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0], [2, 2, 0], [8, 2, 0], [8, 8, 0], [2, 8, 0],
+                     [4, 4, 0], [6, 4, 0], [6, 6, 0], [4, 6, 0]]
+        sv_edges = [[0, 1], [1, 2], [2, 3], [3, 0], [4, 5], [5, 6], [6, 7], [7, 4], [8, 9], [9, 10], [10, 11], [11, 8]]
+
+        result_with_holes = array_dcel.edges_to_faces(sv_points, sv_edges, True, True, 5)
+        result_without_holes = array_dcel.edges_to_faces(sv_points, sv_edges, True, False, 5)
+        expected_with_holes = edges_to_faces(sv_points, sv_edges, True, True, 5)
+        expected_without_holes = edges_to_faces(sv_points, sv_edges, True, False, 5)
+
+        self.assertEqual(face_areas(*expected_with_holes), face_areas(*result_with_holes))
+        self.assertEqual(face_areas(*expected_without_holes), face_areas(*result_without_holes))
+        self.assertAlmostEqual(100 - 36 + 4, sum(a for a, in face_areas(*result_without_holes)))
+
+    def test_edges_to_faces_overlapping_edges(self):
+        # two squares with common part of a side and crossing diagonal
+        sv_points = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [1, 0, 0], [3, 0, 0], [3, -1, 0], [1, -1, 0]]
+        sv_edges = [[0, 1], [1, 2], [2, 3], [3, 0], [4, 5], [5, 6], [6, 7], [7, 4], [0, 2]]
+
+        result_points, result_faces = array_dcel.edges_to_faces(sv_points, sv_edges, True, True, 5)
+
+        self.assertEqual([(2.0,), (2.0,), (2.0,)], face_areas(result_points, result_faces))
+        self.assertEqual([3, 4, 5], sorted(len(face) for face in result_faces))
+
+    def test_crop_mesh(self):
+        sv_points = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [4, 0, 0], [4, 2, 0]]
+        sv_faces = [[0, 1, 2, 3], [1, 4, 5, 2]]
+        sv_points_crop = [[1, 1, 0], [3, 1, 0], [3, 3, 0], [1, 3, 0]]
+        sv_faces_crop = [[0, 1, 2, 3]]
+
+        for mode in ['inner', 'outer']:
+            with self.subTest(mode=mode):
+                result = array_dcel.crop_mesh(sv_points, sv_faces, sv_points_crop, sv_faces_crop, mode, 5)
+                expected = crop_mesh(sv_points, sv_faces, sv_points_crop, sv_faces_crop, mode, 5)
+                self.assertEqual(face_areas(*expected), face_areas(*result))
+
+    def test_merge_mesh(self):
+        sv_points_a = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0]]
+        sv_faces_a = [[0, 1, 2, 3]]
+        sv_points_b = [[1, 1, 0], [3, 1, 0], [3, 3, 0], [1, 3, 0], [1.5, 1.5, 0], [2.5, 1.5, 0], [2.5, 2.5, 0]]
+        sv_faces_b = [[0, 1, 2, 3], [4, 5, 6]]
+
+        result_points, result_faces, mask_a, mask_b, index_a, index_b = \
+            array_dcel.merge_mesh(sv_points_a, sv_faces_a, sv_points_b, sv_faces_b, True, True, 5)
+        expected_points, expected_faces, expected_mask_a, expected_mask_b, expected_index_a, _ = \
+            merge_mesh(sv_points_a, sv_faces_a, sv_points_b, sv_faces_b, True, True, 5)
+
+        self.assertEqual(face_areas(expected_points, expected_faces, expected_mask_a, expected_mask_b, expected_index_a),
+                         face_areas(result_points, result_faces, mask_a, mask_b, index_a))
+        self.assertEqual(sorted(index_b), [-1, 0, 0, 0, 0])
+
+    def test_crop_mesh_robust(self):
+        sv_points = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [4, 0, 0], [4, 2, 0]]
+        sv_faces = [[0, 1, 2, 3], [1, 4, 5, 2]]
+        sv_points_crop = [[1, 1, 0], [3, 1, 0], [3, 3, 0], [1, 3, 0]]
+        sv_faces_crop = [[0, 1, 2, 3]]
+
+        for mode in ['inner', 'outer']:
+            with self.subTest(mode=mode):
+                result = array_dcel.crop_mesh(sv_points, sv_faces, sv_points_crop, sv_faces_crop, mode, 5, True)
+                expected = crop_mesh(sv_points, sv_faces, sv_points_crop, sv_faces_crop, mode, 5)
+                self.assertEqual(face_areas(*expected), face_areas(*result))
+
+    def test_merge_mesh_light_robust_almost_equal_squares(self):
+        # the second square differs from the first one less than accuracy
+        sv_points = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0],
+                     [1e-7, 1e-7, 0], [2 + 1e-7, -1e-7, 0], [2, 2 + 1e-7, 0], [-1e-7, 2, 0]]
+        sv_faces = [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+        result_points, result_faces, index_mask, overlap_number = \
+            array_dcel.merge_mesh_light(sv_points, sv_faces, True, True, 5, robust=True)
+
+        self.assertEqual(sorted(map(tuple, result_points)), [(0, 0, 0), (0, 2, 0), (2, 0, 0), (2, 2, 0)])
+        self.assertEqual(len(result_faces), 1)
+        self.assertEqual(overlap_number, [1])
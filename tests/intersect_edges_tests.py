@@ -1,4 +1,5 @@
 from sverchok.utils.testing import *
+from sverchok.utils.intersect_edges import intersect_edges_grid
 
 
 class IntersectEdgesTest2(ReferenceTreeTestCase):
@@ -19,3 +20,28 @@ class IntersectEdgesTest2(ReferenceTreeTestCase):
         # self.assert_sverchok_data_equals_file(result_verts, "intersecting_planes_result_verts.txt", precision=8)
         # #self.store_reference_sverchok_data("intersecting_planes_result_faces.txt", result_edges)
         # self.assert_sverchok_data_equals_file(result_edges, "intersecting_planes_result_faces.txt", precision=8)
+
+
+class IntersectEdgesGridTest(SverchokTestCase):
+    def test_crossing_in_one_point(self):
+        verts = [(0, 0, 0), (2, 0, 0), (1, -1, 0), (1, 1, 0), (0, -1, 0), (2, 1, 0)]
+        edges = [(0, 1), (2, 3), (4, 5)]
+        verts_out, edges_out = intersect_edges_grid(verts, edges, 1e-5)
+        self.assert_sverchok_data_equal(verts_out, [list(v) for v in verts] + [[1.0, 0.0, 0.0]], precision=6)
+        self.assertEqual(len(edges_out), 6)
+        self.assertTrue(all(6 in edge for edge in edges_out))
+
+    def test_touching_end(self):
+        verts = [(0, 0, 0), (2, 0, 0), (1, 0, 0), (1, 1, 0)]
+        edges = [(0, 1), (2, 3)]
+        verts_out, edges_out = intersect_edges_grid(verts, edges, 1e-5)
+        self.assertEqual(len(verts_out), 4)
+        self.assertEqual(sorted(map(sorted, edges_out)), [[0, 2], [1, 2], [2, 3]])
+
+    def test_3d_skew_edges(self):
+        verts = [(0, 0, 0), (2, 0, 0), (1, -1, 1), (1, 1, 2), (1, -1, -1), (1, 1, 1)]
+        edges = [(0, 1), (2, 3), (4, 5)]
+        verts_out, edges_out = intersect_edges_grid(verts, edges, 1e-5, dimensions=3)
+        # only the third edge crosses the first one
+        self.assertEqual(len(verts_out), 7)
+        self.assertEqual(len(edges_out), 5)
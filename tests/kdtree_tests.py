@@ -0,0 +1,59 @@
+import numpy as np
+
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.kdtree import SvKdTree, SvBruteforceKdTree, get_kdtree, clear_cache, split_ragged
+from sverchok.utils.sv_KDT_utils import kdt_closest_verts_find_n, kdt_closest_verts_range, kdt_closest_edges
+
+
+class KdTreeTests(SverchokTestCase):
+    def setUp(self):
+        clear_cache()
+        self.points = np.random.RandomState(1).rand(100, 3)
+        self.needles = np.random.RandomState(2).rand(10, 3)
+
+    def expected_range(self, radius):
+        distances = np.linalg.norm(self.points[np.newaxis] - self.needles[:, np.newaxis], axis=2)
+        result = []
+        for needle_distances in distances:
+            idxs = np.flatnonzero(needle_distances <= radius)
+            result.append(idxs[np.argsort(needle_distances[idxs])].tolist())
+        return result
+
+    def test_range_bruteforce(self):
+        tree = SvBruteforceKdTree(self.points)
+        idxs, distances, offsets = tree.query_range_array(self.needles, 0.3)
+        self.assertEqual(split_ragged(idxs, offsets), self.expected_range(0.3))
+
+    @requires(scipy)
+    def test_range_scipy(self):
+        tree = SvKdTree.new(SvKdTree.SCIPY, self.points)
+        idxs, distances, offsets = tree.query_range_array(self.needles, 0.3)
+        self.assertEqual(split_ragged(idxs, offsets), self.expected_range(0.3))
+        expected = np.linalg.norm(self.points[idxs] - np.repeat(self.needles, np.diff(offsets), axis=0), axis=1)
+        self.assert_numpy_arrays_equal(distances, expected, precision=8)
+
+    def test_cache(self):
+        tree = get_kdtree(self.points)
+        self.assertIs(get_kdtree(self.points.tolist()), tree)
+        points = self.points.copy()
+        points[0] += 1
+        self.assertIsNot(get_kdtree(points), tree)
+
+    def test_find_n(self):
+        nums = [1, 3, 0, 200]
+        locations, idxs, distances, offsets = kdt_closest_verts_find_n(self.points, self.needles[:4], nums)
+        self.assertEqual(np.diff(offsets).tolist(), [1, 3, 0, 100])
+        expected = self.expected_range(2)
+        for i, found in enumerate(split_ragged(idxs, offsets)):
+            self.assertEqual(found, expected[i][:nums[i]])
+        self.assert_numpy_arrays_equal(locations, self.points[idxs])
+
+    def test_range(self):
+        locations, idxs, distances, offsets = kdt_closest_verts_range(self.points, self.needles, [0.2])
+        self.assertEqual(split_ragged(idxs, offsets), self.expected_range(0.2))
+
+    def test_edges(self):
+        verts = [(0, 0, 0), (1, 0, 0), (2.5, 0, 0), (3, 0, 0)]
+        edges = kdt_closest_edges(verts, (0.1, 1.2, 4, 0))
+        self.assertEqual(sorted(edges), [(0, 1), (2, 3)])
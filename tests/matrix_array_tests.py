@@ -0,0 +1,89 @@
+import numpy as np
+from math import pi
+
+from mathutils import Matrix, Quaternion, Euler
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.matrix_array import (
+    SvMatrixArray, unpack_matrices, is_packed, quaternions_to_rotations, rotations_to_quaternions,
+    euler_to_rotations, rotations_to_euler, axis_angle_to_quaternions, quaternions_to_axis_angle)
+from sverchok.core.socket_conversions import vectors_to_matrices, matrices_to_vectors, matrices_to_quaternions
+
+
+def random_matrices(count, seed=1):
+    rng = np.random.RandomState(seed)
+    rotations = quaternions_to_rotations(rotations_to_quaternions(quaternions_to_rotations(rng.randn(count, 4))))
+    # scales are kept away from zero, so that the matrices are well conditioned
+    return SvMatrixArray.compose(rng.randn(count, 3), rotations, rng.uniform(0.5, 2, (count, 3)))
+
+
+class MatrixArrayTests(SverchokTestCase):
+    def test_list_interface(self):
+        matrices = random_matrices(5)
+        unpacked = unpack_matrices([matrices, matrices[1:3]])
+        self.assertEqual(len(unpacked[0]), 5)
+        self.assertEqual(len(unpacked[1]), 2)
+        self.assertTrue(all(isinstance(m, Matrix) for m in unpacked[0]))
+        self.assertEqual(unpacked[1][0], matrices[1])
+        self.assertEqual(list(matrices)[4], matrices[4])
+        self.assertTrue(is_packed(matrices))
+        self.assertFalse(is_packed(unpacked))
+        self.assert_numpy_arrays_equal(SvMatrixArray.from_matrices(unpacked[0]).data, matrices.data, precision=5)
+
+    def test_decompose(self):
+        special = [Matrix.Rotation(pi, 4, 'X'), Matrix.Diagonal((-1, 1, 1, 1)), Matrix.Diagonal((-1, -1, 2, 1))]
+        matrices = SvMatrixArray(np.concatenate([random_matrices(20).data, np.array(special)]))
+        locations, quaternions, scales = matrices.decompose()
+        for matrix, location, quaternion, scale in zip(matrices, locations, quaternions, scales):
+            expected_location, expected_quaternion, expected_scale = matrix.decompose()
+            self.assert_numpy_arrays_equal(location, np.array(expected_location), precision=5)
+            self.assert_numpy_arrays_equal(scale, np.array(expected_scale), precision=5)
+            self.assert_numpy_arrays_equal(quaternions_to_rotations(quaternion)[0],
+                                           np.array(expected_quaternion.to_matrix()), precision=5)
+        composed = SvMatrixArray.compose(locations, quaternions_to_rotations(quaternions), scales)
+        self.assert_numpy_arrays_equal(composed.data, matrices.data, precision=8)
+
+    def test_multiply_invert(self):
+        a, b = random_matrices(4, seed=2), random_matrices(4, seed=3)
+        product = a @ b
+        inverted = a.inverted()
+        for i in range(4):
+            # mathutils calculates in single precision
+            np.testing.assert_allclose(product.data[i], np.array(a[i] @ b[i]), rtol=1e-5, atol=1e-6)
+            np.testing.assert_allclose(inverted.data[i], np.array(a[i].inverted()), rtol=1e-5, atol=1e-6)
+
+    def test_rotations(self):
+        rng = np.random.RandomState(4)
+        quaternions = rng.randn(10, 4)
+        for quaternion, rotation in zip(quaternions, quaternions_to_rotations(quaternions)):
+            self.assert_numpy_arrays_equal(rotation, np.array(Quaternion(quaternion).to_matrix()), precision=5)
+
+        axes, angles = rng.randn(10, 3), rng.randn(10)
+        for axis, angle, quaternion in zip(axes, angles, axis_angle_to_quaternions(axes, angles)):
+            self.assert_numpy_arrays_equal(quaternion, np.array(Quaternion(axis, angle)), precision=5)
+        quaternions = axis_angle_to_quaternions(axes, angles)
+        result_axes, result_angles = quaternions_to_axis_angle(quaternions)
+        for quaternion, angle in zip(quaternions, result_angles):
+            self.assertAlmostEqual(angle, Quaternion(quaternion).angle, places=5)
+        self.assert_numpy_arrays_equal(axis_angle_to_quaternions(result_axes, result_angles), quaternions, precision=8)
+
+        for order in ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX']:
+            with self.subTest(order=order):
+                angles = rng.randn(10, 3)
+                rotations = euler_to_rotations(angles, order)
+                for angle, rotation in zip(angles, rotations):
+                    self.assert_numpy_arrays_equal(rotation, np.array(Euler(angle, order).to_matrix()), precision=5)
+                for euler, rotation in zip(rotations_to_euler(rotations, order), rotations):
+                    expected = Matrix(rotation.tolist()).to_euler(order)
+                    self.assert_numpy_arrays_equal(euler, np.array(expected), precision=4)
+
+    def test_conversions(self):
+        vertices = [[(1, 2, 3), (4, 5, 6)], np.array([[7, 8, 9]])]
+        matrices = vectors_to_matrices(vertices)
+        self.assertTrue(isinstance(matrices, SvMatrixArray))
+        self.assertEqual(matrices[2], Matrix.Translation((7, 8, 9)))
+        self.assert_sverchok_data_equal(matrices_to_vectors(matrices), [[[1, 2, 3], [4, 5, 6], [7, 8, 9]]])
+
+        matrices = random_matrices(3)
+        expected = matrices_to_quaternions(matrices.to_matrices())
+        np.testing.assert_allclose(np.array(matrices_to_quaternions(matrices)), np.array(expected), rtol=1e-5, atol=1e-6)
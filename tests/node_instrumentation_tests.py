@@ -0,0 +1,90 @@
+import csv
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from sverchok.core.update_system import UpdateTree
+from sverchok.utils import node_instrumentation as ni
+from sverchok.utils.testing import EmptyTreeTestCase, SverchokTestCase, create_node
+
+
+class DataVolumeTest(SverchokTestCase):
+    def test_lists(self):
+        self.assertEqual(ni.data_volume([[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]]), (2, 3))
+
+    def test_numbers(self):
+        self.assertEqual(ni.data_volume([[1, 2, 3], 4]), (2, 4))
+
+    def test_array(self):
+        self.assertEqual(ni.data_volume(np.zeros((2, 10, 3))), (2, 20))
+
+
+class NodeInstrumentationTest(EmptyTreeTestCase):
+    def setUp(self):
+        super().setUp()
+        box = create_node('SvBoxNodeMk2')
+        move = create_node('SvMoveNodeMk3')
+        self.tree.links.new(box.outputs['Vers'], move.inputs['Vertices'])
+        self.box, self.move = box, move
+        ni.reset()
+        ni.enable(memory=True)
+
+    def tearDown(self):
+        ni.disable()
+        ni.reset()
+        super().tearDown()
+
+    def update_tree(self):
+        UpdateTree.reset_tree(self.tree)
+        for _ in UpdateTree.main_update(self.tree, update_interface=False):
+            pass
+
+    def test_records(self):
+        self.update_tree()
+        self.update_tree()
+        records = {r.node: r for r in ni.records}
+        self.assertEqual(len(ni.records), 4)
+        move = records[self.move.name]
+        self.assertEqual(move.input_objects, 1)
+        self.assertEqual(move.output_items, move.input_items)
+        self.assertGreater(move.output_items, 0)
+        self.assertGreaterEqual(move.deep_copies, 0)
+        self.assertLessEqual(move.prepare_time + move.process_time, move.total_time + 1e-9)
+        self.assertFalse(move.error)
+
+    def test_top_nodes(self):
+        self.update_tree()
+        self.update_tree()
+        top = ni.top_nodes(self.tree.name, count=1)
+        self.assertEqual(len(top), 1)
+        self.assertEqual(top[0].calls, 2)
+        by_calls = ni.top_nodes(self.tree.name, key='calls')
+        self.assertEqual({s.node for s in by_calls}, {self.box.name, self.move.name})
+
+    def test_ring_buffer(self):
+        ni.enable(ring_size=3)
+        try:
+            self.update_tree()
+            self.update_tree()
+            self.assertEqual(len(ni.records), 3)
+        finally:
+            ni.enable(ring_size=ni.RING_SIZE)
+
+    def test_export(self):
+        self.update_tree()
+        with tempfile.TemporaryDirectory() as directory:
+            trace_path = os.path.join(directory, 'trace.json')
+            ni.export(trace_path)
+            with open(trace_path) as file:
+                trace = json.load(file)
+            names = {e['name'] for e in trace['traceEvents'] if e['ph'] == 'X'}
+            self.assertTrue({self.box.name, self.move.name, 'process'} <= names)
+
+            csv_path = os.path.join(directory, 'trace.csv')
+            ni.export(csv_path)
+            with open(csv_path, newline='') as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(set(rows[0]), set(ni.CSV_FIELDS))
@@ -2,6 +2,7 @@ import bpy
 
 from sverchok.utils.testing import SverchokTestCase
 from sverchok.utils.modules_inspection import iter_classes_from_module
+from sverchok.utils.sv_nodes_manifest import generate_manifest, read_manifest
 import sverchok
 
 
@@ -52,3 +53,22 @@ class NodesAPITest(SverchokTestCase):
                         msg=f"Make sure that the {node_class=} store its items"
                             f" in memory and add its bl_idname to the exception list"
                             f" or add 'keep_enum_reference' decorator to the enum function")
+
+    def test_nodes_manifest(self):
+        """The manifest should be regenerated after changing nodes, otherwise
+        changed modules can't be loaded lazily: python utils/sv_nodes_manifest.py"""
+        manifest = read_manifest()
+        self.assertIsNotNone(manifest, "Nodes manifest is not found")
+        for address, data in generate_manifest()['modules'].items():
+            with self.subTest(module=address):
+                self.assertEqual(data, manifest['modules'].get(address))
+
+    def test_nodes_manifest_labels(self):
+        """Data of the manifest should be the same as attributes of node classes"""
+        for address, data in read_manifest()['modules'].items():
+            for node in data['nodes'] or []:
+                node_class = bpy.types.Node.bl_rna_get_subclass_py(node['bl_idname'])
+                if node_class is None:
+                    continue  # it is checked by test_register_node
+                with self.subTest(node=node['bl_idname']):
+                    self.assertEqual(node['bl_label'], node_class.bl_label)
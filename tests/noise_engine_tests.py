@@ -0,0 +1,62 @@
+import numpy as np
+from mathutils import noise
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.sv_noise_utils import noise_options
+from sverchok.utils.noise_engine import (
+    noise_scalar, noise_vector, fractal_noise, evaluate_chunked, MATHUTILS, NUMPY)
+
+
+class NoiseEngineTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.points = np.random.RandomState(1).uniform(-10, 10, (500, 3))
+
+    def test_mathutils_parity(self):
+        for noise_type, _ in noise_options:
+            with self.subTest(noise_type=noise_type):
+                noise.seed_set(7)
+                expected = np.array([noise.noise_vector(v, noise_basis=noise_type)[:] for v in self.points.tolist()])
+                result = noise_vector(self.points, noise_type, 7, MATHUTILS)
+                self.assert_numpy_arrays_equal(result, expected, precision=12)
+
+    def test_numpy_shape_and_range(self):
+        for noise_type, _ in noise_options:
+            with self.subTest(noise_type=noise_type):
+                vectors = noise_vector(self.points, noise_type, 3, NUMPY)
+                self.assertEqual(vectors.shape, (500, 3))
+                self.assertTrue(np.all(np.isfinite(vectors)))
+                self.assertTrue(np.all(vectors >= -1.0))
+                self.assertTrue(np.all(vectors <= 3.0))
+
+    def test_numpy_seed(self):
+        first = noise_scalar(self.points, 'PERLIN_ORIGINAL', 1, NUMPY)
+        self.assert_numpy_arrays_equal(noise_scalar(self.points, 'PERLIN_ORIGINAL', 1, NUMPY), first)
+        self.assertFalse(np.allclose(noise_scalar(self.points, 'PERLIN_ORIGINAL', 2, NUMPY), first))
+
+    def test_numpy_continuity(self):
+        # values on both sides of a cell border are the same
+        points = np.array([[2 - 1e-9, 0.3, 0.7], [2 + 1e-9, 0.3, 0.7]])
+        for noise_type in ['BLENDER', 'PERLIN_NEW', 'VORONOI_F1', 'VORONOI_F2']:
+            with self.subTest(noise_type=noise_type):
+                values = noise_scalar(points, noise_type, 0, NUMPY)
+                self.assertAlmostEqual(values[0], values[1], places=6)
+
+    def test_voronoi_order(self):
+        distances = [noise_scalar(self.points, f'VORONOI_F{i}', 5, NUMPY) for i in range(1, 5)]
+        for near, far in zip(distances, distances[1:]):
+            self.assertTrue(np.all(near <= far))
+
+    def test_chunks(self):
+        expected = noise_vector(self.points, 'VORONOI_F1', 5, NUMPY)
+        result = evaluate_chunked(lambda chunk: noise_vector(chunk, 'VORONOI_F1', 5, NUMPY), self.points, chunk_size=64)
+        self.assert_numpy_arrays_equal(result, expected)
+
+    def test_fractal(self):
+        single = fractal_noise(self.points, 'PERLIN_NEW', 4, octaves=1, backend=NUMPY)
+        self.assert_numpy_arrays_equal(single, noise_scalar(self.points, 'PERLIN_NEW', 4, NUMPY))
+        for backend in [MATHUTILS, NUMPY]:
+            with self.subTest(backend=backend):
+                values = fractal_noise(self.points, 'PERLIN_NEW', 4, octaves=4, backend=backend)
+                self.assertEqual(values.shape, (500,))
+                self.assertTrue(np.all(np.abs(values) < 2.0))
@@ -8,6 +8,8 @@ from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.nurbs import SvNurbsBasisFunctions, SvNurbsCurve
 from sverchok.utils.curve.nurbs_solver import *
 from sverchok.utils.curve.nurbs_solver_applications import interpolate_nurbs_curve_with_tangents
+from sverchok.utils.surface.nurbs_solver import SvNurbsSurfaceSolver
+from sverchok.utils.nurbs_factorization import SvLinearFactorization
 
 class NurbsSolverTests(SverchokTestCase):
     def test_interpolate_with_tangents(self):
@@ -33,4 +35,60 @@ class NurbsSolverTests(SverchokTestCase):
         alphas = goal.calc_alphas(solver, ts)
         print("A", alphas)
 
+    def test_factorization_reuse(self):
+        degree = 3
+        ts = np.linspace(0, 1, 100)
+        knotvector = sv_knotvector.from_tknots(degree, ts)
+        rng = np.random.default_rng(0)
+        factorizations = []
+        for points in rng.random((2, len(ts), 3)):
+            solver = SvNurbsCurveSolver(degree = degree)
+            solver.add_goal(SvNurbsCurvePoints(ts, points))
+            solver.set_curve_params(len(ts), knotvector)
+            problem_type, residue, curve = solver.solve_ex()
+            self.assertEqual(problem_type, SvNurbsCurveSolver.PROBLEM_WELLDETERMINED)
+            self.assert_numpy_arrays_equal(curve.evaluate_array(ts), points, precision=8)
+            factorizations.append(solver.factorization)
+        self.assertIs(factorizations[0], factorizations[1])
+
+    def test_sparse_least_squares(self):
+        rng = np.random.default_rng(1)
+        matrix = rng.random((200, 70))
+        matrix[matrix < 0.8] = 0
+        matrix[np.arange(70), np.arange(70)] = 1
+        b = rng.random((200, 3))
+        x, residue = SvLinearFactorization(matrix).solve(b)
+        expected, residues, _, _ = np.linalg.lstsq(matrix, b, rcond=None)
+        self.assert_numpy_arrays_equal(x, expected, precision=8)
+        self.assertAlmostEqual(residue, residues.sum(), places=8)
+
+class NurbsSurfaceSolverTests(SverchokTestCase):
+    def test_interpolate_grid(self):
+        degree = 3
+        n = 12
+        ts = np.linspace(0, 1, n)
+        knotvector = sv_knotvector.from_tknots(degree, ts)
+        us, vs = np.meshgrid(ts, ts, indexing='ij')
+        us, vs = us.flatten(), vs.flatten()
+        points = np.random.default_rng(2).random((n*n, 3))
+        solver = SvNurbsSurfaceSolver.from_parameters(degree, degree, n, n, knotvector, knotvector)
+        solver.add_goals(zip(us, vs, points))
+        problem_type, residue, surface = solver.solve_ex()
+        self.assertEqual(problem_type, SvNurbsSurfaceSolver.PROBLEM_WELLDETERMINED)
+        self.assert_numpy_arrays_equal(surface.evaluate_array(us, vs), points, precision=8)
 
+    def test_overdetermined(self):
+        degree = 2
+        n = 5
+        knotvector = sv_knotvector.generate(degree, n)
+        ts = np.linspace(0, 1, 9)
+        us, vs = np.meshgrid(ts, ts, indexing='ij')
+        us, vs = us.flatten(), vs.flatten()
+        # points on a plane can be approximated exactly
+        points = np.stack((us, vs, 0.5*us - vs), axis=-1)
+        solver = SvNurbsSurfaceSolver.from_parameters(degree, degree, n, n, knotvector, knotvector)
+        solver.add_goals(zip(us, vs, points))
+        problem_type, residue, surface = solver.solve_ex()
+        self.assertEqual(problem_type, SvNurbsSurfaceSolver.PROBLEM_OVERDETERMINED)
+        self.assertAlmostEqual(residue, 0.0, places=10)
+        self.assert_numpy_arrays_equal(surface.evaluate_array(us, vs), points, precision=8)
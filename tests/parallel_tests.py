@@ -0,0 +1,42 @@
+import numpy as np
+
+from sverchok.core.sv_custom_exceptions import SvObjectProcessingError
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.parallel import map_objects, share_arrays, attach_arrays, release_memories, SHARED_MIN_SIZE
+
+
+class ParallelTests(SverchokTestCase):
+    def test_shared_arrays(self):
+        big = np.arange(SHARED_MIN_SIZE, dtype=np.float64).reshape(-1, 4)
+        small = np.arange(3)
+        memories = dict()
+        shared = share_arrays([(big, 'a'), (small, {'b': big})], memories)
+        for _, _, memory in memories.values():
+            self.addCleanup(memory.unlink)
+            self.addCleanup(memory.close)
+        # the same array is shared once
+        self.assertEqual(len(memories), 1)
+        self.assertIs(shared[1][0], small)
+        attached = dict()
+        data = attach_arrays(shared, attached)
+        self.assert_numpy_arrays_equal(data[0][0], big)
+        self.assert_numpy_arrays_equal(data[1][1]['b'], big)
+        self.assertEqual(data[0][1], 'a')
+        del data
+        release_memories(attached)
+
+    def test_map_objects(self):
+        arrays = [np.full((SHARED_MIN_SIZE, 3), i, dtype=np.float64) for i in range(5)] + [[1, 2, 3]]
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                results = map_objects(np.sum, [(array,) for array in arrays], workers=workers)
+                self.assertEqual(results, [SHARED_MIN_SIZE * 3 * i for i in range(5)] + [6])
+
+    def test_errors(self):
+        matrices = [np.eye(3), np.eye(3), np.zeros((3, 3)), np.eye(3)]
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                with self.assertRaises(SvObjectProcessingError) as context:
+                    map_objects(np.linalg.inv, [(matrix,) for matrix in matrices], workers=workers)
+                self.assertEqual(context.exception.index, 2)
+                self.assertIn("Singular matrix", str(context.exception))
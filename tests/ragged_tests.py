@@ -0,0 +1,117 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.ragged import (SvRaggedArray, match_ragged, concatenate_objects, match_objects,
+                                   split_objects, fill_objects)
+from sverchok.data_structure import (flatten_data, graft_data, map_at_level, as_ragged_array,
+                                     match_long_repeat, match_long_cycle, match_short, match_cross2)
+
+
+class RaggedArrayTests(SverchokTestCase):
+    data = [[[1, 2], [3]], [[4, 5, 6], []]]
+
+    def test_layout(self):
+        array = SvRaggedArray.from_nested(self.data)
+        self.assertEqual(array.depth, 3)
+        self.assertEqual([offsets.tolist() for offsets in array.offsets], [[0, 2], [0, 2, 4], [0, 2, 3, 6, 6]])
+        self.assertEqual(array.values.tolist(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(array.to_nested(), self.data)
+
+    def test_types(self):
+        data = [(1, 2.5), (3, 4)]
+        array = SvRaggedArray.from_nested(data)
+        self.assertEqual(array.values.dtype, object)
+        self.assertEqual(array.to_nested(), data)
+        self.assertIsInstance(array.to_nested()[1][0], int)
+        self.assertEqual(SvRaggedArray.from_nested([[0.5], [1.5]]).values.dtype, np.float64)
+
+    def test_not_supported(self):
+        self.assertIsNone(SvRaggedArray.from_nested(17))
+        self.assertIsNone(SvRaggedArray.from_nested([[1], 2]))
+        self.assertIsNone(SvRaggedArray.from_nested([['a'], ['b']]))
+        self.assertIsNone(SvRaggedArray.from_nested([[1], (2,)]))
+        # nesting level of [] is ambiguous here
+        self.assertIsNone(SvRaggedArray.from_nested([[], [[1]]]))
+
+    def test_flatten(self):
+        array = SvRaggedArray.from_nested(self.data)
+        self.assertEqual(array.flatten(1).to_nested(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(array.flatten(2).to_nested(), [[1, 2], [3], [4, 5, 6], []])
+        with self.assertRaises(TypeError):
+            array.flatten(4)
+
+    def test_graft(self):
+        array = SvRaggedArray.from_nested([[1, 2], [3]])
+        self.assertEqual(array.graft(0).to_nested(), [[[1], [2]], [[3]]])
+        self.assertEqual(array.graft(1, wrap_level=2).to_nested(), [[[[1, 2]]], [[[3]]]])
+        self.assertEqual(array.wrap(2).unwrap(2).to_nested(), [[1, 2], [3]])
+        self.assertEqual(SvRaggedArray.from_nested([[5]]).unwrap(2).to_nested(), 5)
+        with self.assertRaises(Exception):
+            array.unwrap()
+
+    def test_keep_tuples(self):
+        verts = [[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]]
+        array = SvRaggedArray.from_nested(verts)
+        self.assertEqual(array.flatten(2).to_nested(), [(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+        self.assertEqual(array.graft(1).to_nested(), [[[(0, 0, 0)], [(1, 0, 0)]], [[(0, 1, 0)]]])
+
+    def test_take(self):
+        array = SvRaggedArray.from_nested(self.data)
+        self.assertEqual(array.take([1, 0, 1]).to_nested(), [self.data[1], self.data[0], self.data[1]])
+
+    def test_map_reduce(self):
+        array = SvRaggedArray.from_nested([[1, 2, 3], [4, 5]])
+        self.assertEqual(array.map_at_level(sum, item_level=1), [6, 9])
+        self.assertEqual(array.map_at_level(lambda x: -x), [[-1, -2, -3], [-4, -5]])
+        self.assertEqual(array.reduce(np.minimum).tolist(), [1, 4])
+
+    def test_match(self):
+        lists = [[1, 2, 3, 4, 5], [10, 11]]
+        for mode, function in [('REPEAT', match_long_repeat), ('CYCLE', match_long_cycle),
+                               ('SHORT', match_short), ('XREF', match_cross2)]:
+            with self.subTest(mode=mode):
+                arrays = match_ragged([SvRaggedArray.from_nested(lst) for lst in lists], mode=mode)
+                self.assertEqual([array.to_nested() for array in arrays], function(lists))
+
+    def test_match_level(self):
+        a = [[1, 2], [3]]
+        b = [[10, 11, 12]]
+        arrays = match_ragged([SvRaggedArray.from_nested(a), SvRaggedArray.from_nested(b)], level=2)
+        self.assertEqual([array.to_nested() for array in arrays], [[[1, 2, 2], [3, 3, 3]], [[10, 11, 12], [10, 11, 12]]])
+        self.assertIsNone(match_ragged([SvRaggedArray.from_nested(a), SvRaggedArray.from_nested([[]])], level=2))
+
+    def test_data_structure(self):
+        data = [[[float(i + j), float(i - j)] for j in range(20)] for i in range(10)]
+        self.assertIsNotNone(as_ragged_array(data))
+        self.assertEqual(flatten_data(data), sum(sum(data, []), []))
+        self.assertEqual(graft_data(data, item_level=0)[3][4], [[7.0], [-1.0]])
+        self.assertEqual(map_at_level(abs, data)[3][4], [7.0, 1.0])
+
+
+class BatchObjectsTests(SverchokTestCase):
+    def test_concatenate(self):
+        array, offsets = concatenate_objects([[(0, 0, 1), (0, 1, 0)], [(1, 0, 0)]], item_shape=(3,))
+        self.assertEqual(array.shape, (3, 3))
+        self.assertEqual(offsets.tolist(), [0, 2, 3])
+        array, offsets = concatenate_objects([np.array([1.0, 2.0]), np.array([3.0])])
+        self.assertEqual(array.tolist(), [1.0, 2.0, 3.0])
+
+    def test_concatenate_not_supported(self):
+        self.assertIsNone(concatenate_objects([[1.0], []]))
+        # processing of ints and floats together could change types of results
+        self.assertIsNone(concatenate_objects([[1], [2.5]]))
+        self.assertIsNone(concatenate_objects([[1, 2.5]]))
+        self.assertIsNone(concatenate_objects([[(0, 0, 1)]]))
+        self.assertIsNone(concatenate_objects([['a']]))
+
+    def test_match_split(self):
+        _, offsets_a = concatenate_objects([[1, 2, 3], [4]])
+        _, offsets_b = concatenate_objects([[10], [20, 30]])
+        offsets, (idx_a, idx_b) = match_objects([offsets_a, offsets_b], 'REPEAT')
+        self.assertEqual(offsets.tolist(), [0, 3, 5])
+        self.assertEqual(idx_a.tolist(), [0, 1, 2, 3, 3])
+        self.assertEqual(idx_b.tolist(), [0, 0, 0, 1, 2])
+        array = np.arange(5)
+        self.assertEqual(split_objects(array, offsets), [[0, 1, 2], [3, 4]])
+        self.assertEqual([a.tolist() for a in split_objects(array, offsets, out_numpy=True)], [[0, 1, 2], [3, 4]])
+        self.assertEqual(fill_objects([[1], [0, [1]]], ['a', 'b']), [['b'], ['a', ['b']]])
@@ -0,0 +1,40 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.field.scalar import SvCoordinateScalarField, SvScalarFieldLambda, SvMergedScalarField
+from sverchok.utils.manifolds import raycast_iso_surface
+
+
+class RaycastIsoSurfaceTests(SverchokTestCase):
+    points = np.array([(3, 0, 0), (0, 0, 5), (0, 3, 0)], dtype=np.float64)
+    directions = np.array([(-1, 0, 0), (0, 0, -2), (1, 0, 0)], dtype=np.float64)
+
+    def check(self, field, first_only, lipschitz=None):
+        offsets, ts, points = raycast_iso_surface(field, self.points, self.directions, 10.0, 1.0,
+                                                  first_only=first_only, lipschitz=lipschitz)
+        if first_only:
+            self.assertEqual(offsets.tolist(), [0, 1, 2, 2])
+            self.assert_numpy_arrays_equal(ts, np.array([2, 4]), precision=5)
+            self.assert_numpy_arrays_equal(points, np.array([(1, 0, 0), (0, 0, 1)]), precision=5)
+        else:
+            self.assertEqual(offsets.tolist(), [0, 2, 4, 4])
+            self.assert_numpy_arrays_equal(ts, np.array([2, 4, 4, 6]), precision=5)
+
+    def test_sphere_tracing(self):
+        sphere = SvCoordinateScalarField('SPH_RHO')
+        self.assertEqual(sphere.get_lipschitz_constant(), 1.0)
+        self.check(sphere, first_only=True)
+
+    def test_sections(self):
+        function = lambda x, y, z, v: np.sqrt(x*x + y*y + z*z)
+        sphere = SvScalarFieldLambda(function, None, None, function_numpy=function)
+        self.assertIsNone(sphere.get_lipschitz_constant())
+        self.check(sphere, first_only=True)
+        self.check(sphere, first_only=False)
+        self.check(sphere, first_only=True, lipschitz=1.0)
+
+    def test_merged_lipschitz(self):
+        field = SvMergedScalarField('SUM', [SvCoordinateScalarField('X'), SvCoordinateScalarField('Y')])
+        self.assertEqual(field.get_lipschitz_constant(), 2.0)
+        field = SvMergedScalarField('MIN', [SvCoordinateScalarField('X'), SvCoordinateScalarField('PHI')])
+        self.assertIsNone(field.get_lipschitz_constant())
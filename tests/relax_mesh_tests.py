@@ -0,0 +1,110 @@
+import numpy as np
+from mathutils import Vector
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
+from sverchok.utils.geom import linear_approximation
+from sverchok.utils.relax_mesh import lloyd_relax, edges_relax, faces_relax, NONE, NORMAL, LINEAR, BVH
+
+
+def make_grid(size):
+    """Regular planar grid of size x size quads"""
+    verts = [(x, y, 0.0) for x in range(size + 1) for y in range(size + 1)]
+    faces = []
+    for x in range(size):
+        for y in range(size):
+            i = x * (size + 1) + y
+            faces.append([i, i + size + 1, i + size + 2, i + 1])
+    return verts, faces
+
+
+def make_irregular_mesh(size, seed=0):
+    """Grid of quads and triangles with randomly moved vertices on a bumpy surface"""
+    rng = np.random.RandomState(seed)
+    verts, quads = make_grid(size)
+    verts = np.array(verts) + rng.uniform(-0.25, 0.25, (len(verts), 3))
+    verts[:, 2] += np.sin(verts[:, 0]) * np.cos(verts[:, 1])
+    faces = []
+    for i, (a, b, c, d) in enumerate(quads):
+        if i % 3 == 0:
+            faces += [[a, b, c], [a, c, d]]
+        else:
+            faces.append([a, b, c, d])
+    return verts.tolist(), faces
+
+
+def per_vertex_lloyd_relax(vertices, faces, iterations, method):
+    """Lloyd relaxation with bmesh, vertex by vertex, as it was done before it was vectorized"""
+    bm = bmesh_from_pydata(vertices, [], faces, normal_update=True)
+    for i in range(iterations):
+        face_centers = [face.calc_center_median() for face in bm.faces]
+        new_verts = []
+        for bm_vert in bm.verts:
+            co = bm_vert.co
+            if bm_vert.is_boundary:
+                new_verts.append(Vector(co))
+                continue
+            centers = [face_centers[face.index] for face in bm_vert.link_faces]
+            median = sum(centers, Vector()) / len(centers)
+            if method == NORMAL:
+                dv = median - co
+                new_verts.append(co + dv - dv.project(bm_vert.normal))
+            else:
+                approx = linear_approximation(np.array(centers))
+                plane = approx.most_similar_plane()
+                new_verts.append(Vector(approx.center) + plane.normal.normalized() * plane.distance_to_point(co))
+        for bm_vert, co in zip(bm.verts, new_verts):
+            bm_vert.co = co
+        bm.normal_update()
+    result = [tuple(v.co) for v in bm.verts]
+    bm.free()
+    return result
+
+
+class RelaxMeshTest(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.verts, self.faces = make_grid(4)
+        # move one inner vertex from its place
+        self.moved = 2 * 5 + 2
+        self.verts[self.moved] = (2.3, 1.8, 0.0)
+
+    def test_lloyd_regular_grid(self):
+        verts, faces = make_grid(4)
+        for method in [NONE, NORMAL, LINEAR, BVH]:
+            with self.subTest(method=method):
+                result = lloyd_relax(verts, faces, 3, method=method)
+                self.assert_numpy_arrays_equal(np.array(result), np.array(verts), precision=6)
+
+    def test_lloyd_relaxes(self):
+        result = np.array(lloyd_relax(self.verts, self.faces, 20, method=NONE))
+        self.assert_numpy_arrays_equal(result[self.moved], np.array([2.0, 2.0, 0.0]), precision=3)
+        # boundary vertices are kept
+        self.assert_numpy_arrays_equal(result[0], np.array(self.verts[0]), precision=6)
+
+    def test_lloyd_per_vertex_parity(self):
+        verts, faces = make_irregular_mesh(5)
+        for method in [NORMAL, LINEAR]:
+            with self.subTest(method=method):
+                expected = per_vertex_lloyd_relax(verts, faces, 3, method)
+                result = lloyd_relax(verts, faces, 3, method=method)
+                # bmesh keeps coordinates in single precision
+                np.testing.assert_allclose(np.array(result), np.array(expected), atol=1e-5)
+
+    def test_lloyd_mask_and_axes(self):
+        mask = [True] * len(self.verts)
+        mask[self.moved] = False
+        result = lloyd_relax(self.verts, self.faces, 5, mask=mask, method=NONE)
+        self.assert_numpy_arrays_equal(np.array(result[self.moved]), np.array(self.verts[self.moved]), precision=6)
+
+        result = lloyd_relax(self.verts, self.faces, 20, method=NONE, use_axes={0})
+        self.assertAlmostEqual(result[self.moved][0], 2.0, places=3)
+        self.assertAlmostEqual(result[self.moved][1], 1.8, places=6)
+
+    def test_edges_and_faces_relax(self):
+        verts, faces = make_grid(4)
+        for relax in [edges_relax, faces_relax]:
+            for method in [NONE, NORMAL, BVH]:
+                with self.subTest(relax=relax.__name__, method=method):
+                    result = relax(verts, [], faces, 3, 0.5, method=method)
+                    self.assert_numpy_arrays_equal(np.array(result), np.array(verts), precision=6)
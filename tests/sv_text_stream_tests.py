@@ -0,0 +1,37 @@
+import os
+import glob
+import tempfile
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.sv_text_stream import read_csv_array
+
+
+class ReadCsvMemmapTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.cached = set(glob.glob(os.path.join(tempfile.gettempdir(), 'sverchok_csv_*')))
+
+    def tearDown(self):
+        for path in set(glob.glob(os.path.join(tempfile.gettempdir(), 'sverchok_csv_*'))) - self.cached:
+            os.remove(path)
+        self.directory.cleanup()
+        super().tearDown()
+
+    def write(self, text):
+        path = os.path.join(self.directory.name, 'data.csv')
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_options_change(self):
+        path = self.write("".join(f"{i},{i * 2}\n" for i in range(4)))
+        self.assertEqual(read_csv_array(path, memmap=True)[1].shape, (4, 2))
+        self.assertEqual(read_csv_array(path, memmap=True, skip_lines=2)[1].shape, (2, 2))
+        self.assertEqual(read_csv_array(path, memmap=True, header=True)[1].shape, (3, 2))
+
+    def test_failed_read(self):
+        path = self.write("".join(f"{i}.5,{i}\n" for i in range(10)) + "abc,1\n")
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                read_csv_array(path, memmap=True, chunk_size=3)
@@ -0,0 +1,99 @@
+import numpy as np
+
+from sverchok.dependencies import scipy
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.utils.ragged import counts_to_offsets
+from sverchok.utils.voronoi_cells import (
+    simplex_ridges, neighbour_planes, prune_planes, cell_faces, clip_cell)
+
+
+def mesh_volume(verts, faces):
+    verts = np.array(verts)
+    volume = 0
+    for face in faces:
+        corners = verts[face]
+        volume += np.einsum('ij,ij->', corners[0][np.newaxis], np.cross(corners[1:-1], corners[2:])) / 6
+    return volume
+
+
+def is_closed(faces):
+    edges = [(face[i - 1], face[i]) for face in faces for i in range(len(face))]
+    return len(set(edges)) == len(edges) and set(edges) == set((v2, v1) for v1, v2 in edges)
+
+
+class VoronoiCellsTests(SverchokTestCase):
+    cube_verts = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64)
+    cube_faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+    cube_offsets = counts_to_offsets([4] * 6)
+    cube_indices = np.array(cube_faces).ravel()
+
+    def cells(self, sites, spacing=0.0):
+        sites = np.array(sites, dtype=np.float64)
+        ridges = np.array([(i, j) for i in range(len(sites)) for j in range(i + 1, len(sites))])
+        plane_sites, neighbours, planes = neighbour_planes(sites, ridges, np.full(len(sites), spacing))
+        offsets, planes, empty = prune_planes(plane_sites, neighbours, planes, len(sites),
+                                              self.cube_verts, np.zeros(3), 3 ** 0.5)
+        return [None if empty[i] else clip_cell(self.cube_verts, self.cube_offsets, self.cube_indices, None,
+                                                planes[offsets[i]:offsets[i + 1]])
+                for i in range(len(sites))]
+
+    def test_ridges(self):
+        simplices = np.array([[0, 1, 2, 3], [3, 2, 1, 4]])
+        self.assertEqual(len(simplex_ridges(simplices, 5)), 9)
+        self.assertEqual(simplex_ridges(simplices, 4).tolist(), [[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]])
+
+    def test_cube_cells(self):
+        cells = self.cells([(-0.5, -0.5, 0), (0.5, -0.5, 0), (0, 0.5, 0.5)])
+        self.assertAlmostEqual(sum(mesh_volume(verts, faces) for verts, _, faces in cells), 8)
+        for verts, edges, faces in cells:
+            self.assertTrue(is_closed(faces))
+            self.assertEqual(len(edges), len(verts) + len(faces) - 2)
+
+    def test_spacing(self):
+        cells = self.cells([(-0.5, 0, 0), (0.5, 0, 0)], spacing=0.2)
+        for verts, _, faces in cells:
+            self.assertAlmostEqual(mesh_volume(verts, faces), 3.6)
+
+    def test_empty(self):
+        cells = self.cells([(0, 0, 0), (5, 0, 0), (0, 10, 0)])
+        self.assertAlmostEqual(mesh_volume(cells[0][0], cells[0][2]), 8)
+        self.assertIsNone(cells[1])
+        self.assertIsNone(cells[2])
+
+    def test_section_with_hole(self):
+        # frame around z axis: the section by plane z = 0 is not a simple polygon
+        n = 8
+        outer = [(2 * np.cos(a), 2 * np.sin(a)) for a in np.linspace(0, 2 * np.pi, n, endpoint=False)]
+        inner = [(x / 2, y / 2) for x, y in outer]
+        verts = np.array([(x, y, z) for x, y in outer + inner for z in (-1, 1)], dtype=np.float64)
+        faces = []
+        for i in range(n):
+            j = (i + 1) % n
+            o1, o2, i1, i2 = 2 * i, 2 * j, 2 * (n + i), 2 * (n + j)
+            faces += [[o1, o2, o2 + 1, o1 + 1], [i2, i1, i1 + 1, i2 + 1], [o1 + 1, o2 + 1, i2 + 1, i1 + 1], [o2, o1, i1, i2]]
+        offsets = counts_to_offsets([4] * len(faces))
+        planes = np.array([[0, 0, 1, 0]], dtype=np.float64)
+        self.assertIs(clip_cell(verts, offsets, np.array(faces).ravel(), None, planes), False)
+        verts_out, _, faces_out = clip_cell(verts, offsets, np.array(faces).ravel(), None, planes, fill=False)
+        self.assertAlmostEqual(min(v[2] for v in verts_out), 0)
+        self.assertEqual(len(faces_out), 3 * n)
+
+    def test_non_convex_face(self):
+        # U-shaped face, the plane y = 1.5 cuts off both of its legs
+        verts = np.array([(0, 0, 0), (3, 0, 0), (3, 2, 0), (2, 2, 0), (2, 1, 0), (1, 1, 0), (1, 2, 0), (0, 2, 0)],
+                         dtype=np.float64)
+        planes = np.array([[0, 1, 0, 1.5]], dtype=np.float64)
+        self.assertIs(clip_cell(verts, np.array([0, 8]), np.arange(8), None, planes, fill=False), False)
+        planes = np.array([[0, -1, 0, -0.5]], dtype=np.float64)
+        verts_out, _, faces_out = clip_cell(verts, np.array([0, 8]), np.arange(8), None, planes, fill=False)
+        self.assertEqual(len(faces_out), 1)
+        self.assertEqual(len(faces_out[0]), 4)
+
+    @requires(scipy)
+    def test_cell_faces(self):
+        from scipy.spatial import cKDTree
+        # only the top face is near the second site
+        sites = np.array([(0, 0, -0.9), (0, 0, 5)])
+        offsets, faces = cell_faces(cKDTree(sites), self.cube_verts, self.cube_offsets, self.cube_indices, 2)
+        self.assertEqual(offsets.tolist(), [0, 6, 7])
+        self.assertEqual(faces[6:].tolist(), [5])
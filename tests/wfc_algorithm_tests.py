@@ -0,0 +1,68 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.wfc_algorithm import (
+    WaveFunctionCollapse, BitsetWaveFunctionCollapse, to_bitsets, from_bitsets, popcount)
+
+
+def sample_image():
+    image = np.zeros((8, 8, 4))
+    image[..., 3] = 1
+    image[::2, ::2, 0] = 1
+    image[2:5, 3:6, 1] = 1
+    return image
+
+
+class BitsetWaveFunctionCollapseTest(SverchokTestCase):
+    def test_bitsets(self):
+        bools = np.random.RandomState(1).rand(5, 70) > 0.5
+        bitsets = to_bitsets(bools)
+        self.assertEqual(bitsets.shape, (5, 2))
+        self.assertTrue(np.array_equal(from_bitsets(bitsets, 70), bools))
+        self.assertTrue(np.array_equal(popcount(bitsets), bools.sum(axis=1)))
+
+    def test_same_patterns(self):
+        rng = np.random.RandomState(2)
+        palette = rng.rand(3, 4)
+        for pattern_size in [1, 2, 3]:
+            for periodic_input in [True, False]:
+                for rotate_patterns in [True, False]:
+                    with self.subTest(size=pattern_size, periodic=periodic_input, rotate=rotate_patterns):
+                        image = palette[rng.randint(0, 3, (6, 7))]
+                        params = dict(patter_size=pattern_size, periodic_input=periodic_input,
+                                      rotate_patterns=rotate_patterns)
+                        expected = WaveFunctionCollapse(image, **params)
+                        result = BitsetWaveFunctionCollapse(image, **params)
+                        self.assertEqual(result.patterns, expected.patterns)
+                        self.assertEqual(result.pattern_frequencies, expected.pattern_frequencies)
+                        self.assertEqual(result.patterns_transforms, expected.patterns_transforms)
+
+    def test_same_adjacencies(self):
+        image = sample_image()
+        expected = WaveFunctionCollapse(image)
+        expected.calculate_adjacencies()
+        result = BitsetWaveFunctionCollapse(image)
+        result.calculate_adjacency_masks()
+        n_patterns = result.number_of_unique_patterns
+        masks = from_bitsets(result.adjacency_masks, n_patterns)
+        for pattern in range(n_patterns):
+            for direction in range(4):
+                allowed = set(np.flatnonzero(masks[pattern, direction]).tolist())
+                self.assertEqual(allowed, expected.allowed_pattern_adjacencies[pattern][direction])
+
+    def test_solve(self):
+        for tiling_output in [False, True]:
+            with self.subTest(tiling=tiling_output):
+                wave = BitsetWaveFunctionCollapse(sample_image())
+                output = wave.solve((30, 20), seed=3, tiling_output=tiling_output, max_number_contradiction_tries=5)
+                self.assertEqual(np.array(output).shape, (20, 30, 4))
+
+                n_patterns = wave.number_of_unique_patterns
+                self.assertTrue(np.all(popcount(wave.domains) == 1))
+                patterns = from_bitsets(wave.domains, n_patterns).argmax(axis=1)
+                masks = from_bitsets(wave.adjacency_masks, n_patterns)
+                for direction in range(4):
+                    neighbours = wave.neighbours[:, direction]
+                    has_neighbour = neighbours >= 0
+                    allowed = masks[patterns[has_neighbour], direction, patterns[neighbours[has_neighbour]]]
+                    self.assertTrue(allowed.all())
@@ -19,6 +19,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 from typing import Iterator, Union, TypeVar, Optional
 import shutil
@@ -27,6 +28,7 @@ import bl_operators
 import bpy
 from bpy.props import StringProperty
 
+from sverchok.core import lazy_nodes
 from sverchok.ui.sv_icons import node_icon, icon, get_icon_switch
 from sverchok.ui import presets
 from sverchok.ui.presets import apply_default_preset
@@ -167,7 +169,7 @@ class AddNode(MenuItem):
         """This and other properties of the class can't be accessed during
         module initialization and registration"""
         if self._label is None:
-            node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+            node_cls = lazy_nodes.get_node_class(self.bl_idname)
             if self.bl_idname == 'NodeReroute':
                 self._label = "Reroute"
             # todo check labels of dependent classes after their refactoring
@@ -180,7 +182,7 @@ class AddNode(MenuItem):
     @property
     def icon_prop(self):
         if self._icon_prop is None:
-            node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+            node_cls = lazy_nodes.get_node_class(self.bl_idname)
             if node_cls is None:
                 self._icon_prop = {'icon': 'ERROR'}
             elif self.bl_idname == 'NodeReroute':
@@ -194,7 +196,7 @@ class AddNode(MenuItem):
         return self._icon_prop
 
     def draw(self, layout):
-        node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+        node_cls = lazy_nodes.get_node_class(self.bl_idname)
         icon_prop = self.icon_prop if get_icon_switch() else {}
 
         if node_cls is None:
@@ -215,7 +217,7 @@ class AddNode(MenuItem):
 
     def draw_icon(self, layout):
         """Only icon will be drawn"""
-        node_cls = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+        node_cls = lazy_nodes.get_node_class(self.bl_idname)
         icon_prop = self.icon_prop or {'icon': 'OUTLINER_OB_EMPTY'}
 
         if node_cls is None:
@@ -243,7 +245,7 @@ class AddNode(MenuItem):
         if all(w in label for w in words):
             return True
 
-        node_class = bpy.types.Node.bl_rna_get_subclass_py(self.bl_idname)
+        node_class = lazy_nodes.get_node_class(self.bl_idname)
         if not node_class or not hasattr(node_class, 'docstring'):
             return False
         shorthand = node_class.docstring.get_shorthand()
@@ -535,7 +537,7 @@ class AddNodeOp(bl_operators.node.NodeAddOperator):
         node_type = properties["type"]
         extra = properties.get("extra_description", "")
         tooltip = extra + ("\n" if extra else "")
-        node_cls = bpy.types.Node.bl_rna_get_subclass_py(node_type)
+        node_cls = lazy_nodes.get_node_class(node_type)
         if node_cls is None:
             return f'"{node_type}" node is not found'
         tooltip += node_cls.docstring.get_tooltip()
@@ -556,6 +558,8 @@ class SvNodeAddOperator(AddNodeOp, bpy.types.Operator):
         if bpy.app.version >= (3, 6):
             self.deselect_nodes(context)
 
+        if lazy_nodes.is_lazy(self.type):
+            lazy_nodes.register_lazy(self.type)
         node = self.create_node(context, self.type)
         apply_default_preset(node)
         return {'FINISHED'}
@@ -609,7 +613,8 @@ class NodeCategoryMenu(SverchokContext, bpy.types.Menu):
             import sverchok
             cats = defaultdict(list)
             # todo replace with `bpy.types.Node.bl_rna_get_subclass_py` after dummy nodes refactoring
-            for cls in iter_classes_from_module(sverchok.nodes, [bpy.types.Node]):
+            for cls in chain(iter_classes_from_module(sverchok.nodes, [bpy.types.Node]),
+                             lazy_nodes.iter_node_infos()):
                 #print("F", cls)
                 if name := getattr(cls, 'sv_category', None):
                     cats[name].append(AddNode(cls.bl_idname))
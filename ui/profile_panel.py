@@ -10,6 +10,7 @@ from bpy.props import EnumProperty, BoolProperty
 
 from sverchok.utils.sv_logging import sv_logger
 import sverchok.utils.profile as prof
+import sverchok.utils.node_instrumentation as ni
 
 
 class SvProfilingToggle(bpy.types.Operator):
@@ -85,7 +86,92 @@ class SvProfileReset(bpy.types.Operator):
         return {'FINISHED'}
 
 
-classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset]
+class SvInstrumentationToggle(bpy.types.Operator):
+    """Toggle recording of per node statistics (time, data volume, deep copies, memory) on/off"""
+    bl_idname = "node.sverchok_instrumentation_toggle"
+    bl_label = "Toggle nodes instrumentation"
+    bl_options = {'INTERNAL'}
+
+    memory: BoolProperty(name="Trace memory",
+                         description="Record memory allocated by nodes, it slows down nodes significantly",
+                         default=False)
+
+    def execute(self, context):
+        if ni.is_enabled:
+            ni.disable()
+        else:
+            ni.enable(memory=self.memory)
+        sv_logger.info("Nodes instrumentation is set to %s", ni.is_enabled)
+        return {'FINISHED'}
+
+
+class SvInstrumentationTopNodes(bpy.types.Operator):
+    """Print nodes of the tree which took most time to log"""
+    bl_idname = "node.sverchok_instrumentation_top_nodes"
+    bl_label = "Dump hot nodes to log"
+    bl_options = {'INTERNAL'}
+
+    sort_keys = [
+        ("total_time", "Total time", "Time of reading inputs and processing", 0),
+        ("process_time", "Process time", "Time of process method", 1),
+        ("prepare_time", "Prepare time", "Time of reading and converting input data", 2),
+        ("deep_copy_time", "Deep copy time", "Time of copying input data", 3),
+        ("memory_peak", "Memory peak", "Max memory allocated during processing", 4),
+        ("calls", "Calls count", "How many times the node was updated", 5),
+    ]
+
+    key: EnumProperty(name="Sort by", items=sort_keys, default="total_time")
+    count: bpy.props.IntProperty(name="Count", default=20, min=1)
+
+    def execute(self, context):
+        tree = context.space_data.edit_tree
+        lines = [f"{'Node':<30} {'Calls':>6} {'Total, ms':>10} {'Prepare':>10} {'Process':>10} "
+                 f"{'Copy':>10} {'Out items':>10} {'Memory, KB':>10}"]
+        for stat in ni.top_nodes(tree.name if tree else None, self.count, self.key):
+            lines.append(f"{stat.node:<30} {stat.calls:>6} {stat.total_time * 1000:>10.2f} "
+                         f"{stat.prepare_time * 1000:>10.2f} {stat.process_time * 1000:>10.2f} "
+                         f"{stat.deep_copy_time * 1000:>10.2f} {stat.output_items:>10} "
+                         f"{stat.memory_peak / 1024:>10.1f}")
+        sv_logger.info("Hot nodes:\n%s", "\n".join(lines))
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        wm = context.window_manager
+        return wm.invoke_props_dialog(self)
+
+
+class SvInstrumentationExport(bpy.types.Operator):
+    """Save nodes statistics into Chrome trace JSON file (or CSV file if the extension is .csv)"""
+    bl_idname = "node.sverchok_instrumentation_export"
+    bl_label = "Export nodes statistics"
+    bl_options = {'INTERNAL'}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filename_ext = ".json"
+
+    def execute(self, context):
+        ni.export(self.filepath)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self.filepath = "sverchok_trace.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class SvInstrumentationReset(bpy.types.Operator):
+    """Remove gathered nodes statistics"""
+    bl_idname = "node.sverchok_instrumentation_reset"
+    bl_label = "Reset nodes statistics"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        ni.reset()
+        return {'FINISHED'}
+
+
+classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset,
+           SvInstrumentationToggle, SvInstrumentationTopNodes, SvInstrumentationExport, SvInstrumentationReset]
 
 
 def register():
@@ -94,5 +180,6 @@ def register():
 
 
 def unregister():
+    ni.disable()
     for class_name in reversed(classes):
         bpy.utils.unregister_class(class_name)
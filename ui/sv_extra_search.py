@@ -24,6 +24,7 @@ import bpy
 from bpy.props import StringProperty
 
 import sverchok
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_logging import sv_logger
 from sverchok.utils.docstring import SvDocstring
 from sverchok.utils.sv_default_macros import macros, DefaultMacros
@@ -60,7 +61,7 @@ def ensure_valid_show_string(nodetype):
 
     try:
         loop_reverse[nodetype.bl_label] = nodetype.bl_idname
-        description = SvDocstring(nodetype.bl_rna.description).get_shorthand()
+        description = nodetype.docstring.get_shorthand()
         return nodetype.bl_label + ensure_short_description(description)
     except Exception as err:
         sv_logger.error(f'Nodetype "{nodetype}": ensure_valid_show_string() threw an exception:\n {err}')
@@ -109,7 +110,7 @@ def gather_items(context):
             if item.bl_idname == 'NodeReroute':
                 continue
 
-            nodetype = bpy.types.Node.bl_rna_get_subclass_py(item.bl_idname)
+            nodetype = lazy_nodes.get_node_class(item.bl_idname)
             if not nodetype:
                 continue
 
@@ -213,6 +214,8 @@ class SvMacroInterpreter(bpy.types.Operator):
         for n in tree.nodes:
             n.select = False
 
+        if lazy_nodes.is_lazy(node_type):
+            lazy_nodes.register_lazy(node_type)
         node = tree.nodes.new(type=node_type)
 
         if self.settings:
@@ -19,7 +19,7 @@
 import bpy
 
 import sverchok
-from sverchok.utils import profile
+from sverchok.utils import profile, node_instrumentation
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.utils.context_managers import sv_preferences
 from sverchok.utils.handle_blender_data import BlTrees
@@ -145,6 +145,22 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        col.separator()
+        col.label(text="Nodes instrumentation:")
+        if node_instrumentation.is_enabled:
+            col.operator("node.sverchok_instrumentation_toggle", text="Stop recording", icon="CANCEL")
+        else:
+            row = col.row(align=True)
+            op = row.operator("node.sverchok_instrumentation_toggle", text="Start recording", icon="REC")
+            op.memory = False
+            op = row.operator("node.sverchok_instrumentation_toggle", text="", icon="MEMORY")
+            op.memory = True
+        col_nodes = col.column()
+        col_nodes.active = bool(node_instrumentation.records)
+        col_nodes.operator("node.sverchok_instrumentation_top_nodes", text="Dump hot nodes", icon="TEXT")
+        col_nodes.operator("node.sverchok_instrumentation_export", text="Export trace", icon="FILE_TICK")
+        col_nodes.operator("node.sverchok_instrumentation_reset", text="Reset records", icon="X")
+
 
 class SV_PT_SverchokUtilsPanel(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_SverchokUtilsPanel"
@@ -0,0 +1,184 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Batched mapping of a donor mesh onto many recipient faces, it is used by
+Adaptive Polygons node when all faces get the same donor.
+
+Instead of transforming the donor face by face, all recipient faces of one
+kind (tris or quads) are processed at once: donor vertices are expressed
+as weights of corners of the unit triangle / square once, and each copy of
+the donor is a product of these weights with corners of a recipient face.
+Topology of copies is the donor topology shifted by index offsets.
+"""
+
+from itertools import chain, islice
+
+import numpy as np
+
+# max number of donor vertices which are mapped at once, limits memory of intermediate arrays
+CHUNK_SIZE = 2 ** 20
+
+
+def flatten_faces(faces):
+    """Returns flat array of indexes, start position and number of sides of each face"""
+    lengths = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=int(lengths.sum()))
+    starts = np.cumsum(lengths) - lengths
+    return flat, starts, lengths
+
+
+def corner_indexes(flat_faces, face_idxs, corners, face_rots):
+    """
+    Indexes of vertices of given faces which are used as corners of the unit triangle or square
+    :param flat_faces: result of `flatten_faces`
+    :param corners: positions of vertices in a face, negative positions count from the end
+    :param face_rots: corners are shifted in the same way as `rotate_list` does it
+    :return: array of shape (number of faces, number of corners)
+    """
+    flat, starts, lengths = flat_faces
+    corners = np.asarray(corners)
+    n_corners = len(corners)
+    shift = (np.arange(n_corners)[np.newaxis, :] + np.asarray(face_rots, dtype=np.int64)[:, np.newaxis]) % n_corners
+    local = corners[shift]
+    lengths = lengths[face_idxs][:, np.newaxis]
+    local = np.where(local < 0, local + lengths, local)
+    return flat[starts[face_idxs][:, np.newaxis] + local]
+
+
+def quad_weights(xs, ys):
+    """Bilinear weights of four corners of [-1/2; 1/2] x [-1/2; 1/2] square"""
+    return np.stack(((0.5 - xs) * (0.5 - ys),
+                     (0.5 + xs) * (0.5 - ys),
+                     (0.5 + xs) * (0.5 + ys),
+                     (0.5 - xs) * (0.5 + ys)), axis=-1)
+
+
+def triangle_weights(xy, triangle):
+    """Barycentric coordinates of 2D points in the triangle"""
+    matrix = np.linalg.inv(np.array([triangle[0] - triangle[2], triangle[1] - triangle[2]]).T)
+    l12 = (xy - triangle[2]) @ matrix.T
+    return np.concatenate((l12, 1 - l12.sum(axis=-1, keepdims=True)), axis=-1)
+
+
+def _normalize(vecs):
+    norms = np.linalg.norm(vecs, axis=-1, keepdims=True)
+    return np.divide(vecs, norms, out=vecs, where=norms > 0)
+
+
+def _interpolate(weight_terms, w_coefs, corners):
+    """
+    Sum over corners of weights * corner values for each face,
+    weights of a face are sum(w_coef ** i * weight_terms[i]).
+    :return: (n_faces, n_verts, 3) array
+    """
+    if np.all(w_coefs == w_coefs[0]):
+        weight_terms = [sum(term * w_coefs[0] ** i for i, term in enumerate(weight_terms))]
+    result = None
+    for i, term in enumerate(weight_terms):
+        # (faces, corners, 3) x (verts, corners) -> (faces, 3, verts), it's one matrix product
+        part = np.tensordot(corners, term, axes=([1], [1])).transpose(0, 2, 1)
+        if len(weight_terms) > 1:
+            part *= (w_coefs ** i)[:, np.newaxis, np.newaxis]
+        result = part if result is None else result + part
+    return result
+
+
+def _map_chunked(weight_terms, donor_z, dst_verts, dst_normals, face_normals, normal_modes,
+                 w_coefs, z_coefs, z_offsets, smooth_normals):
+    n_faces, n_verts = len(dst_verts), len(donor_z)
+    result = np.empty((n_faces, n_verts, 3))
+    step = max(1, CHUNK_SIZE // max(n_verts, 1))
+    for start in range(0, n_faces, step):
+        chunk = slice(start, start + step)
+        loc = _interpolate(weight_terms, w_coefs[chunk], dst_verts[chunk])
+        modes = normal_modes[chunk]
+        if modes.any():
+            normals = _interpolate(weight_terms, w_coefs[chunk], dst_normals[chunk])
+            if smooth_normals:
+                _normalize(normals)
+            if not modes.all():
+                normals[~modes] = face_normals[chunk][~modes][:, np.newaxis, :]
+        else:
+            normals = face_normals[chunk][:, np.newaxis, :]
+        heights = donor_z[np.newaxis, :] * z_coefs[chunk, np.newaxis] + z_offsets[chunk, np.newaxis]
+        loc += normals * heights[:, :, np.newaxis]
+        result[chunk] = loc
+    return result
+
+
+def map_to_quads(donor_xy, donor_z, dst_verts, dst_normals, face_normals, normal_modes,
+                 w_coefs, z_coefs, z_offsets, smooth_normals=False):
+    """
+    Map donor vertices from [-1/2; 1/2] square (scaled by w_coef) to recipient quads
+    :param donor_xy: (n_verts, 2) coordinates of donor vertices in the plane of the square
+    :param donor_z: (n_verts,) coordinates of donor vertices along the normal
+    :param dst_verts: (n_faces, 4, 3) corners of recipient faces
+    :param dst_normals: (n_faces, 4, 3) normals in the corners
+    :param face_normals: (n_faces, 3) used for faces where normal_modes is False
+    :param w_coefs, z_coefs, z_offsets: per face arrays
+    :param smooth_normals: use normals of unit length instead of linear interpolation
+    :return: (n_faces, n_verts, 3) array
+    """
+    xs, ys = donor_xy[:, 0], donor_xy[:, 1]
+    # bilinear weights are a polynomial of w_coef
+    weight_terms = [np.full((len(xs), 4), 0.25),
+                    0.5 * np.stack((-xs - ys, xs - ys, xs + ys, ys - xs), axis=-1),
+                    (xs * ys)[:, np.newaxis] * np.array([1, -1, 1, -1])]
+    return _map_chunked(weight_terms, donor_z, dst_verts, dst_normals, face_normals, normal_modes,
+                        w_coefs, z_coefs, z_offsets, smooth_normals)
+
+
+def map_to_tris(donor_xy, donor_z, src_triangle, dst_verts, dst_normals, face_normals, normal_modes,
+                w_coefs, z_coefs, z_offsets, smooth_normals=False):
+    """
+    Map donor vertices from the source triangle (scaled by 1 / w_coef) to recipient triangles
+    :param src_triangle: (3, 2) coordinates of the source triangle in the plane of donor_xy
+    Other parameters are the same as in `map_to_quads`
+    """
+    # barycentric coordinates are affine, so scaling of the triangle is linear in w_coef
+    src_triangle = np.asarray(src_triangle, dtype=np.float64)
+    origin = triangle_weights(np.zeros((1, 2)), src_triangle)
+    weight_terms = [np.repeat(origin, len(donor_xy), axis=0),
+                    triangle_weights(donor_xy, src_triangle) - origin]
+    return _map_chunked(weight_terms, donor_z, dst_verts, dst_normals, face_normals, normal_modes,
+                        w_coefs, z_coefs, z_offsets, smooth_normals)
+
+
+def auto_z_scales(dst_verts, src_lengths):
+    """
+    Geometric mean of ratios of lengths of sides of recipient faces to lengths of sides
+    of the source polygon, sides shorter than 1e-6 are skipped
+    :param dst_verts: (n_faces, n_sides, 3)
+    :param src_lengths: (n_sides,) or (n_faces, n_sides)
+    """
+    dst_lengths = np.linalg.norm(dst_verts - np.roll(dst_verts, -1, axis=1), axis=2)
+    src_lengths = np.broadcast_to(src_lengths, dst_lengths.shape)
+    good = (np.abs(src_lengths) > 1e-6) & (np.abs(dst_lengths) > 1e-6)
+    logs = np.log(np.where(good, dst_lengths, 1.0) / np.where(good, src_lengths, 1.0))
+    count = good.sum(axis=1)
+    return np.exp(logs.sum(axis=1) / np.maximum(count, 1))
+
+
+def copy_topology(elements, n_copies, n_verts, as_array=False):
+    """
+    Topology of joined copies of a mesh
+    :param elements: edges or faces of the mesh
+    :param n_verts: number of vertices of the mesh
+    :param as_array: return array if all elements have the same size, list otherwise
+    """
+    offsets = np.arange(n_copies, dtype=np.int64) * n_verts
+    if not elements or not len(elements[0]):
+        return []
+    sizes = set(map(len, elements))
+    if len(sizes) == 1:
+        elements = np.asarray(elements, dtype=np.int64)
+        copies = (elements[np.newaxis] + offsets[:, np.newaxis, np.newaxis]).reshape(-1, elements.shape[1])
+        return copies if as_array else copies.tolist()
+    flat, _, lengths = flatten_faces(elements)
+    copies = iter((flat[np.newaxis] + offsets[:, np.newaxis]).ravel().tolist())
+    return [list(islice(copies, n)) for n in np.tile(lengths, n_copies).tolist()]
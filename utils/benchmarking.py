@@ -0,0 +1,296 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Performance benchmarks of Sverchok kernels.
+
+Benchmarks are looked up in benchmarks/ directory, in files matching
+`*_bench.py` pattern. A benchmark is a function decorated with `benchmark`,
+it is called once per input size, prepares input data and returns a callable
+which is timed. If the preparation needs cleaning up, the function can be
+a generator which yields the callable, code after `yield` is executed after
+timing:
+
+    @benchmark(sizes=[1000, 10000])
+    def kdtree_query(size):
+        points = np.random.rand(size, 3)
+        tree = SvKdTree.new(SvKdTree.BLENDER, points)
+        return lambda: tree.query_array(points)
+
+The runner writes results into a JSON file and can compare them with a
+baseline file (results of previous run on the same machine). A benchmark
+is reported as a regression if its minimal time grows more than tolerance
+allows. Usually it is run via run_benchmarks.sh:
+
+    $ ./run_benchmarks.sh --baseline benchmarks/baseline.json
+"""
+
+import gc
+import importlib.util
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import unittest
+from fnmatch import fnmatch
+from os.path import dirname, join
+
+import sverchok
+from sverchok.utils.sv_logging import sv_logger
+
+RESULTS_VERSION = 1
+DEFAULT_TOLERANCE = 0.2
+# differences smaller than this are considered as noise
+MIN_TIME_DIFFERENCE = 1e-4
+
+
+class BenchmarkSkip(Exception):
+    """Can be raised by a benchmark to skip it, e.g. when a dependency is missing"""
+
+
+class BenchmarkInfo:
+    def __init__(self, func, sizes, repeat, number):
+        self.func = func
+        self.name = func.__name__
+        self.sizes = sizes
+        self.repeat = repeat
+        self.number = number
+
+    def key(self, size):
+        return self.name if size is None else f"{self.name}[{size}]"
+
+
+def benchmark(sizes=None, repeat=5, number=1):
+    """
+    Marks function as a benchmark
+    :param sizes: list of input sizes, the function is called with each of them,
+        if None the function is called without arguments
+    :param repeat: how many times timing is repeated
+    :param number: how many times the callable is called per one timing
+    """
+    def decorator(func):
+        func.sv_benchmark = BenchmarkInfo(func, sizes, repeat, number)
+        return func
+    return decorator
+
+
+def requires(module):
+    """Raises BenchmarkSkip if the module (see sverchok.dependencies) is not available"""
+    if module is None:
+        raise BenchmarkSkip("This benchmark requires a module which is not currently available")
+
+
+def get_benchmarks_path():
+    """
+    Return path to all benchmarks (benchmarks/ directory).
+    """
+    return join(dirname(sverchok.__file__), "benchmarks")
+
+
+def collect_benchmarks(pattern=None, name_filter=None):
+    """
+    Yield BenchmarkInfo of all benchmarks in files matching the pattern
+    :param name_filter: fnmatch pattern of benchmark names
+    """
+    pattern = pattern or "*_bench.py"
+    path = get_benchmarks_path()
+    for file_name in sorted(os.listdir(path)):
+        if not fnmatch(file_name, pattern):
+            continue
+        module_name = f"sverchok_benchmarks.{file_name[:-3]}"
+        spec = importlib.util.spec_from_file_location(module_name, join(path, file_name))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for _, func in inspect.getmembers(module, inspect.isfunction):
+            info = getattr(func, 'sv_benchmark', None)
+            if info is None or func.__module__ != module_name:
+                continue
+            if name_filter is None or fnmatch(info.name, name_filter):
+                yield info
+
+
+def time_callable(func, repeat, number):
+    """Timings in seconds of one call of func, in the same way timeit does it"""
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+
+def run_benchmark(info, size):
+    """Returns dictionary with timings of the benchmark for given size"""
+    setup = info.func() if info.sizes is None else info.func(size)
+    if inspect.isgenerator(setup):
+        generator, func = setup, next(setup)
+    else:
+        generator, func = None, setup
+    try:
+        func()  # warming up, caches and lazy imports should not affect results
+        timings = time_callable(func, info.repeat, info.number)
+    except Exception:
+        if generator is not None:
+            generator.close()
+        raise
+    if generator is not None:
+        next(generator, None)  # cleaning up
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+        'repeat': info.repeat,
+        'number': info.number,
+    }
+
+
+def environment_info():
+    info = {
+        'sverchok': '.'.join(map(str, sverchok.bl_info['version'])),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    try:
+        import bpy
+        info['blender'] = bpy.app.version_string
+    except ImportError:
+        pass
+    return info
+
+
+def run_all_benchmarks(pattern=None, name_filter=None):
+    """Run all benchmarks and return results which can be saved into JSON file"""
+    results = dict()
+    skipped = dict()
+    for info in collect_benchmarks(pattern, name_filter):
+        for size in (info.sizes or [None]):
+            key = info.key(size)
+            try:
+                results[key] = run_benchmark(info, size)
+            except (BenchmarkSkip, unittest.SkipTest) as e:
+                skipped[key] = str(e)
+                sv_logger.info("%s: skipped (%s)", key, e)
+            except Exception as e:
+                skipped[key] = f"{type(e).__name__}: {e}"
+                sv_logger.exception("%s: failed", key)
+            else:
+                sv_logger.info("%s: %.6f sec", key, results[key]['min'])
+    return {
+        'version': RESULTS_VERSION,
+        'environment': environment_info(),
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def save_results(results, file_path):
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def load_results(file_path):
+    with open(file_path, encoding='utf-8') as file:
+        results = json.load(file)
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f"Unsupported version of benchmark results in {file_path}")
+    return results
+
+
+def compare_results(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare minimal times of benchmarks which exist in both results
+    :param tolerance: allowed relative slowdown, 0.2 means 20%
+    :return: list of (key, baseline time, new time, ratio) sorted by key,
+        and set of keys of regressions
+    """
+    comparison = []
+    regressions = set()
+    old_results = baseline['results']
+    for key, new in sorted(results['results'].items()):
+        if key not in old_results:
+            continue
+        old_time, new_time = old_results[key]['min'], new['min']
+        ratio = new_time / old_time if old_time > 0 else float('inf')
+        comparison.append((key, old_time, new_time, ratio))
+        if new_time > old_time * (1 + tolerance) and new_time - old_time > MIN_TIME_DIFFERENCE:
+            regressions.add(key)
+    return comparison, regressions
+
+
+def format_report(results, comparison=None, regressions=None):
+    lines = []
+    if comparison is None:
+        for key, data in sorted(results['results'].items()):
+            lines.append(f"{key:<50} {data['min']:>12.6f}")
+    else:
+        lines.append(f"{'Benchmark':<50} {'Baseline':>12} {'Current':>12} {'Ratio':>7}")
+        for key, old_time, new_time, ratio in comparison:
+            mark = "  REGRESSION" if key in regressions else ""
+            lines.append(f"{key:<50} {old_time:>12.6f} {new_time:>12.6f} {ratio:>7.2f}{mark}")
+    for key, reason in sorted(results['skipped'].items()):
+        lines.append(f"{key:<50} skipped: {reason}")
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    try:
+        argv = sys.argv
+        if "--" in argv:
+            argv = argv[argv.index("--")+1:]
+        else:
+            argv = argv[1:]
+
+        parser = argparse.ArgumentParser(prog="benchmarking.py", description="Run Sverchok benchmarks")
+        parser.add_argument('pattern', metavar='*.PY', nargs='?', default='*_bench.py',
+                            help="Benchmark files pattern")
+        parser.add_argument('-k', '--filter', metavar='NAME', default=None, help="Benchmark names pattern")
+        parser.add_argument('-o', '--output', metavar='FILE.json', default='sverchok_benchmarks.json',
+                            help="Path to output results file")
+        parser.add_argument('-b', '--baseline', metavar='FILE.json', default=None,
+                            help="Results of previous run to compare with")
+        parser.add_argument('-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                            help="Allowed relative slowdown comparing with baseline (default: %(default)s)")
+        parser.add_argument('--save-baseline', action='store_true',
+                            help="Write results into the baseline file instead of comparing")
+
+        args = parser.parse_args(argv)
+        pattern = os.path.basename(args.pattern)
+        if not pattern.endswith('.py'):
+            pattern += '.py'
+
+        results = run_all_benchmarks(pattern, args.filter)
+        save_results(results, args.output)
+
+        if args.baseline and args.save_baseline:
+            save_results(results, args.baseline)
+            print(format_report(results))
+        elif args.baseline and os.path.exists(args.baseline):
+            comparison, regressions = compare_results(results, load_results(args.baseline), args.tolerance)
+            print(format_report(results, comparison, regressions))
+            if regressions:
+                # We have to raise an exception for Blender to exit with specified exit code.
+                raise Exception(f"Performance regressions found: {', '.join(sorted(regressions))}")
+        else:
+            print(format_report(results))
+        sys.exit(0)
+    except Exception as e:
+        sv_logger.exception(e)
+        sys.exit(1)
@@ -66,3 +66,95 @@ def read_materials_idx(blender_mesh, output_numpy=False):
     if output_numpy:
         return material_index
     return material_index.tolist()
+
+def read_polygons_csr(blender_mesh):
+    """
+    Read polygons as CSR arrays: (indices, starts, totals), where indices
+    are vertex indices of all loops, and polygon #i is
+    indices[starts[i] : starts[i] + totals[i]].
+    """
+    n_polygons = len(blender_mesh.polygons)
+    indices = np.empty(len(blender_mesh.loops), dtype=np.int32)
+    blender_mesh.loops.foreach_get("vertex_index", indices)
+    starts = np.empty(n_polygons, dtype=np.int32)
+    blender_mesh.polygons.foreach_get("loop_start", starts)
+    totals = np.empty(n_polygons, dtype=np.int32)
+    blender_mesh.polygons.foreach_get("loop_total", totals)
+    return indices, starts, totals
+
+def polygons_from_csr(indices, starts, totals):
+    """Convert CSR polygons into list of lists of vertex indices"""
+    if len(starts) == 0:
+        return []
+    if starts[0] != 0 or np.any(starts[1:] != starts[:-1] + totals[:-1]):
+        # loops are not stored in polygons order
+        order = np.repeat(starts - np.cumsum(totals) + totals, totals) + np.arange(totals.sum())
+        indices = indices[order]
+        starts = np.cumsum(totals) - totals
+    indices = indices.tolist()
+    return [indices[s: s + t] for s, t in zip(starts.tolist(), totals.tolist())]
+
+def _foreach_get(collection, attr, dtype, width=1):
+    values = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, values)
+    if width > 1:
+        return values.reshape((-1, width))
+    return values
+
+def _read_attribute(blender_mesh, name, size, dtype=np.float32):
+    """Read float / bool attribute of mesh, zeros if the attribute does not exist"""
+    attributes = getattr(blender_mesh, 'attributes', None)
+    if attributes is not None and name in attributes:
+        return _foreach_get(attributes[name].data, "value", dtype)
+    return np.zeros(size, dtype=dtype)
+
+def _read_vertex_crease(blender_mesh):
+    n = len(blender_mesh.vertices)
+    creases = getattr(blender_mesh, 'vertex_creases', None)
+    if creases is not None and hasattr(creases, '__len__') and len(creases) > 0:
+        # before Blender 4.0
+        return _foreach_get(creases[0].data, "value", np.float32)
+    return _read_attribute(blender_mesh, 'crease_vert', n)
+
+def _read_element_layer(blender_mesh, elements, attribute_name, old_property_name):
+    """Attribute layers of Blender 4.x or element properties of older versions"""
+    if attribute_name in blender_mesh.attributes:
+        return _foreach_get(blender_mesh.attributes[attribute_name].data, "value", np.float32)
+    if len(elements) > 0 and hasattr(elements[0], old_property_name):
+        return _foreach_get(elements, old_property_name, np.float32)
+    return np.zeros(len(elements), dtype=np.float32)
+
+mesh_array_readers = {
+    'vertices': lambda me: _foreach_get(me.vertices, "co", np.float64, 3),
+    'edges': lambda me: _foreach_get(me.edges, "vertices", np.int32, 2),
+    'polygons': read_polygons_csr,
+    'vertices_select': lambda me: _foreach_get(me.vertices, "select", bool),
+    'vertices_crease': _read_vertex_crease,
+    'vertices_bevel_weight': lambda me: _read_element_layer(me, me.vertices, 'bevel_weight_vert', 'bevel_weight'),
+    'edges_select': lambda me: _foreach_get(me.edges, "select", bool),
+    'edges_crease': lambda me: _read_element_layer(me, me.edges, 'crease_edge', 'crease'),
+    'edges_seams': lambda me: _foreach_get(me.edges, "use_seam", bool),
+    'edges_sharps': lambda me: _foreach_get(me.edges, "use_edge_sharp", bool),
+    'edges_bevel_weight': lambda me: _read_element_layer(me, me.edges, 'bevel_weight_edge', 'bevel_weight'),
+    'polygon_selects': lambda me: _foreach_get(me.polygons, "select", bool),
+    'polygon_smooth': lambda me: _foreach_get(me.polygons, "use_smooth", bool),
+    'vertex_normals': lambda me: _foreach_get(me.vertices, "normal", np.float64, 3),
+    'material_idx': lambda me: _foreach_get(me.polygons, "material_index", np.int64),
+    'polygon_areas': lambda me: _foreach_get(me.polygons, "area", np.float64),
+    'polygon_centers': lambda me: _foreach_get(me.polygons, "center", np.float64, 3),
+    'polygon_normals': lambda me: _foreach_get(me.polygons, "normal", np.float64, 3),
+}
+
+def read_mesh_arrays(blender_mesh, names):
+    """
+    Read all requested attributes of a mesh with foreach_get into NumPy arrays.
+    :param names: iterable of keys of `mesh_array_readers`
+    :return: dictionary {name: array}; polygons are returned in CSR form, see
+        `read_polygons_csr`. Also the dictionary always contains number of
+        vertices, edges and polygons under 'n_vertices', 'n_edges', 'n_polygons' keys.
+    """
+    result = {name: mesh_array_readers[name](blender_mesh) for name in names}
+    result['n_vertices'] = len(blender_mesh.vertices)
+    result['n_edges'] = len(blender_mesh.edges)
+    result['n_polygons'] = len(blender_mesh.polygons)
+    return result
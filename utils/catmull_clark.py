@@ -8,13 +8,20 @@
 """
 Implementation of Catmull-Clark subdivision algorithm in pure Python, with use
 of NumPy and Blender's bmesh library.
+
+SvCatmullClarkTopology and subdivide_arrays implement the same algorithm on
+arrays only: faces are stored in CSR form (flat array of face vertices and
+offsets of faces in it), all points are calculated by np.bincount sums over
+face corners and edges. After first subdivision all faces are quads, and the
+topology of next level is derived from the topology of the previous one
+directly, without searching for edges again.
 """
 
 import numpy as np
 
 import bmesh
 
-from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh
+from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
 
 def calc_new_verts(bm):
     """
@@ -117,8 +124,191 @@ def subdivide(bm, iterations=1):
     Returns:
         new bmesh object.
     """
-    for i in range(iterations):
-        bm = subdivide_once(bm)
-    bm.normal_update()
-    return bm
+    if iterations < 1:
+        bm.normal_update()
+        return bm
+    verts, _, faces = pydata_from_bmesh(bm)
+    verts, edges, faces = subdivide_arrays(verts, faces, iterations)
+    return bmesh_from_pydata(verts.tolist(), edges.tolist(), faces.tolist(), normal_update=True)
+
+def sum_by_index(index, values, size):
+    """Sums of rows of values (shape (n, 3)) with the same index"""
+    return np.stack([np.bincount(index, weights=values[:, i], minlength=size) for i in range(values.shape[1])], axis=-1)
+
+class SvCatmullClarkTopology:
+    """
+    Topology of a mesh which is required for one step of Catmull-Clark subdivision.
+    It does not depend on vertex coordinates, so it can be reused for meshes
+    with the same faces (for example, for an animated control cage).
+
+    Attributes:
+        n_verts: number of vertices.
+        face_verts: np.array of vertex indices of all faces, one by one.
+        face_offsets: np.array of shape (n_faces + 1,), vertices of i-th face
+            are face_verts[face_offsets[i]:face_offsets[i+1]].
+        edges: np.array of shape (n_edges, 2).
+        loop_edges: for each face corner, index of edge from this corner to the next one.
+    """
+    def __init__(self, n_verts, face_verts, face_offsets, edges, loop_edges):
+        self.n_verts = n_verts
+        self.face_verts = face_verts
+        self.face_offsets = face_offsets
+        self.edges = edges
+        self.loop_edges = loop_edges
+
+        self.n_faces = len(face_offsets) - 1
+        face_sizes = np.diff(face_offsets)
+        self.loop_faces = np.repeat(np.arange(self.n_faces), face_sizes)
+        self.face_sizes = face_sizes
+        # number of faces linked to each edge and to each vertex
+        self.edge_face_count = np.bincount(loop_edges, minlength=len(edges))
+        self.vert_face_count = np.bincount(face_verts, minlength=n_verts)
+        self.vert_edge_count = np.bincount(edges.ravel(), minlength=n_verts)
+
+    @classmethod
+    def from_faces(cls, n_verts, faces):
+        """
+        Args:
+            n_verts: number of vertices.
+            faces: list of lists of vertex indices, or np.array of shape (n_faces, k).
+        """
+        if isinstance(faces, np.ndarray) and faces.ndim == 2:
+            face_verts = faces.ravel().astype(np.int64)
+            face_offsets = np.arange(len(faces) + 1) * faces.shape[1]
+        else:
+            face_sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+            face_offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+            np.cumsum(face_sizes, out=face_offsets[1:])
+            face_verts = np.fromiter((i for face in faces for i in face), dtype=np.int64, count=face_offsets[-1])
+
+        next_verts = face_verts[cls._next_loops(face_offsets)]
+        keys = np.minimum(face_verts, next_verts) * n_verts + np.maximum(face_verts, next_verts)
+        keys, loop_edges = np.unique(keys, return_inverse=True)
+        edges = np.stack((keys // n_verts, keys % n_verts), axis=-1)
+        return cls(n_verts, face_verts, face_offsets, edges, loop_edges.ravel())
+
+    @staticmethod
+    def _next_loops(face_offsets):
+        face_sizes = np.diff(face_offsets)
+        starts = np.repeat(face_offsets[:-1], face_sizes)
+        sizes = np.repeat(face_sizes, face_sizes)
+        return starts + (np.arange(face_offsets[-1]) - starts + 1) % sizes
+
+    @staticmethod
+    def _prev_loops(face_offsets):
+        face_sizes = np.diff(face_offsets)
+        starts = np.repeat(face_offsets[:-1], face_sizes)
+        sizes = np.repeat(face_sizes, face_sizes)
+        return starts + (np.arange(face_offsets[-1]) - starts - 1) % sizes
+
+    def new_verts(self, verts):
+        """
+        Calculate coordinates of new vertices.
+
+        Args:
+            verts: np.array of shape (n_verts, 3).
+
+        Returns:
+            np.array of new vertices: first ones replace vertices of original
+            mesh, then ones in the middles of faces, then ones in the middles
+            of edges.
+        """
+        verts = np.asarray(verts, dtype=np.float64)
+        face_points = sum_by_index(self.loop_faces, verts[self.face_verts], self.n_faces)
+        face_points /= self.face_sizes[:, np.newaxis]
+
+        # edges with two linked faces get the average of the faces and edge ends,
+        # other edges (boundary ones) are split in the middle
+        edge_centers = verts[self.edges].mean(axis=1)
+        edge_face_sums = sum_by_index(self.loop_edges, face_points[self.loop_faces], len(self.edges))
+        is_inner = (self.edge_face_count == 2)[:, np.newaxis]
+        edge_points = np.where(is_inner, (edge_face_sums + 2 * edge_centers) / 4, edge_centers)
+
+        n = self.vert_face_count[:, np.newaxis].astype(np.float64)
+        m = self.vert_edge_count[:, np.newaxis].astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            F = sum_by_index(self.face_verts, face_points[self.loop_faces], self.n_verts) / n
+            R = sum_by_index(self.edges.ravel(), np.repeat(edge_centers, 2, axis=0), self.n_verts) / m
+            P = verts
+            vert_points = np.where(n >= 3, (F + 2*R + (n-3)*P) / n,
+                            np.where(n == 1, (R + P) / 2, P))
+
+        return np.concatenate((vert_points, face_points, edge_points))
+
+    def new_faces(self):
+        """
+        Faces of subdivided mesh: one quad for each corner of each face.
+
+        Returns:
+            np.array of shape (n_loops, 4).
+        """
+        edge_base = self.n_verts + self.n_faces
+        prev_edges = self.loop_edges[self._prev_loops(self.face_offsets)]
+        return np.stack((self.face_verts,
+                         edge_base + self.loop_edges,
+                         self.n_verts + self.loop_faces,
+                         edge_base + prev_edges), axis=-1)
+
+    def new_edges(self):
+        """
+        Edges of subdivided mesh: each edge is split into two, and middles of
+        edges are connected with middles of faces.
+
+        Returns:
+            np.array of shape (2 * n_edges + n_loops, 2).
+        """
+        n_edges = len(self.edges)
+        edge_verts = self.n_verts + self.n_faces + np.arange(n_edges)
+        halves = np.stack((self.edges, np.stack((edge_verts, edge_verts), axis=-1)), axis=-1).reshape(-1, 2)
+        inner = np.stack((self.n_verts + self.loop_faces, self.n_verts + self.n_faces + self.loop_edges), axis=-1)
+        return np.concatenate((halves, inner))
+
+    def subdivided(self):
+        """
+        Topology of subdivided mesh.
+
+        Returns:
+            SvCatmullClarkTopology.
+        """
+        n_edges = len(self.edges)
+        n_loops = len(self.face_verts)
+        faces = self.new_faces()
+        prev_loops = self._prev_loops(self.face_offsets)
+        # new_edges() puts halves of edge i at 2*i (the one at edges[i, 0]) and 2*i+1,
+        # and edge from middle of face to middle of corner's edge at 2*n_edges + corner
+        def half(edge_idxs):
+            return 2 * edge_idxs + (self.edges[edge_idxs, 0] != self.face_verts)
+        loop_edges = np.stack((half(self.loop_edges),
+                               2 * n_edges + np.arange(n_loops),
+                               2 * n_edges + prev_loops,
+                               half(self.loop_edges[prev_loops])), axis=-1)
+        return SvCatmullClarkTopology(self.n_verts + self.n_faces + n_edges,
+                                      faces.ravel(), np.arange(n_loops + 1) * 4,
+                                      self.new_edges(), loop_edges.ravel())
+
+def subdivide_arrays(verts, faces, levels=1, topology=None):
+    """
+    Subdivide mesh by use of Catmull-Clark algorithm, one or several times.
+    Unlike subdivide(), works with arrays only.
+
+    Args:
+        verts: np.array of shape (n_verts, 3) or list of vertices.
+        faces: list of faces or np.array of shape (n_faces, k).
+        levels: number of times the subdivision is to be applied.
+        topology: SvCatmullClarkTopology of input mesh, if it is known already.
+
+    Returns:
+        np.arrays of vertices, edges and faces (quads, shape (n, 4));
+        if levels is 0, faces are returned as they were passed.
+    """
+    verts = np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+    if topology is None:
+        topology = SvCatmullClarkTopology.from_faces(len(verts), faces)
+    if levels < 1:
+        return verts, topology.edges, faces
+    for level in range(levels):
+        verts = topology.new_verts(verts)
+        if level < levels - 1:
+            topology = topology.subdivided()
+    return verts, topology.new_edges(), topology.new_faces()
 
@@ -0,0 +1,408 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Batched intersection of many NURBS curves.
+
+`intersect_nurbs_curves` subdivides each pair of curves recursively, which is
+slow when thousands of curves are intersected with each other. Here all pairs
+are processed together:
+
+1. Every curve is decomposed into Bezier segments once. Homogeneous control
+   points of all segments are elevated to the same degree, so they are one
+   (n_segments, degree+1, 4) array.
+2. Broad phase: an AABB tree is built over bounding boxes of segments (a NURBS
+   segment lies in the convex hull of its control points), candidate pairs of
+   segments are found by one breadth-first traversal of two trees.
+3. Narrow phase: all candidate pairs are subdivided by de Casteljau algorithm
+   at once, pairs of pieces with not intersecting bounding boxes are dropped.
+   When pieces are small enough, intersection points are refined by
+   Gauss-Newton iterations for all remaining pairs together.
+
+    intersections = intersect_curves_batch(curves1, curves2, pairs=[(0, 1), (2, 3)])
+    for t1, t2, point in intersections[(0, 1)]:
+        ...
+"""
+
+import numpy as np
+
+from sverchok.utils.math import binomial_array
+from sverchok.utils.nurbs_common import elevate_bezier_degree
+from sverchok.utils.curve.nurbs_algorithms import cut_closed_segments
+
+# max number of segments in a leaf of AABB tree
+LEAF_SIZE = 4
+# max number of candidate pairs of segments which are subdivided at once,
+# limits memory of intermediate arrays
+CHUNK_SIZE = 2 ** 16
+# max depth of subdivision of candidate pairs of segments
+MAX_SUBDIVISIONS = 24
+NEWTON_ITERATIONS = 16
+# pieces of curves which deviate from their chords by less than FLATNESS * chord length
+# intersect at most once, and they are refined numerically without further subdivision
+FLATNESS = 0.05
+
+
+class SvCurveSegments:
+    """
+    Bezier segments of a list of NURBS curves.
+
+    Attributes:
+        * control_points: homogeneous control points, (n_segments, degree+1, 4)
+        * curve_idxs: index of the curve of each segment
+        * t_min, t_max: parameter ranges of segments in their curves
+    """
+    def __init__(self, curves, degree=None, tolerance=1e-6):
+        segments = []
+        curve_idxs = []
+        for curve_idx, curve in enumerate(curves):
+            curve_segments = curve.to_bezier_segments(to_bezier_class=False)
+            curve_segments = cut_closed_segments(curve_segments, tolerance=tolerance)
+            segments.extend(curve_segments)
+            curve_idxs.extend([curve_idx] * len(curve_segments))
+        if degree is None:
+            degree = max((segment.get_degree() for segment in segments), default=1)
+        self.degree = degree
+        self.curve_idxs = np.array(curve_idxs, dtype=np.int64)
+        self.control_points = np.zeros((len(segments), degree + 1, 4))
+        self.t_min = np.zeros(len(segments))
+        self.t_max = np.zeros(len(segments))
+        for i, segment in enumerate(segments):
+            cpts = segment.get_homogenous_control_points()
+            segment_degree = segment.get_degree()
+            if len(cpts) != segment_degree + 1:
+                raise Exception(f"Segment #{i} is not a Bezier curve: degree {segment_degree}, {len(cpts)} control points")
+            if segment_degree < degree:
+                cpts = elevate_bezier_degree(segment_degree, cpts, delta=degree - segment_degree)
+            self.control_points[i] = cpts
+            self.t_min[i], self.t_max[i] = segment.get_u_bounds()
+
+    def __len__(self):
+        return len(self.curve_idxs)
+
+    def get_bounds(self):
+        return _bounds(self.control_points)
+
+
+def _euclidean(control_points):
+    return control_points[:, :, :3] / control_points[:, :, 3:]
+
+
+def _bounds(control_points):
+    """Bounding boxes of Bezier curves by their homogeneous control points, (n, 3) arrays"""
+    points = _euclidean(control_points)
+    # reduction along short axis of control points is slower than a loop over them
+    box_min = points[:, 0].copy()
+    box_max = points[:, 0].copy()
+    for i in range(1, points.shape[1]):
+        np.minimum(box_min, points[:, i], out=box_min)
+        np.maximum(box_max, points[:, i], out=box_max)
+    return box_min, box_max
+
+
+def _is_flat(control_points, tolerance=FLATNESS):
+    """
+    Check if Bezier curves are almost straight: distances of control points
+    to the chord are less than tolerance * chord length.
+    """
+    points = _euclidean(control_points)
+    chord = points[:, -1] - points[:, 0]
+    length = np.linalg.norm(chord, axis=1)
+    direction = chord / np.where(length > 0, length, 1.0)[:, np.newaxis]
+    result = length > 0
+    for i in range(1, points.shape[1] - 1):
+        offset = points[:, i] - points[:, 0]
+        projection = (offset * direction).sum(axis=1)
+        distance_sq = (offset * offset).sum(axis=1) - projection * projection
+        result &= (distance_sq <= (tolerance * length) ** 2) & (projection >= 0) & (projection <= length)
+    return result
+
+
+def _boxes_intersect(min1, max1, min2, max2, tolerance):
+    return np.all((min1 <= max2 + tolerance) & (min2 <= max1 + tolerance), axis=1)
+
+
+class SvAabbTree:
+    """
+    Tree of axis-aligned bounding boxes. Nodes are stored in arrays:
+    boxes of nodes, indexes of children (-1 for leaves), and ranges
+    [start, end) in `order` - permutation of boxes - for leaves.
+    """
+    def __init__(self, box_min, box_max, leaf_size=LEAF_SIZE):
+        self.box_min = box_min
+        self.box_max = box_max
+        self.order = np.arange(len(box_min))
+        node_min = []
+        node_max = []
+        children = []
+        ranges = []
+        centers = (box_min + box_max) * 0.5
+
+        def build(start, end):
+            node = len(node_min)
+            idxs = self.order[start:end]
+            node_min.append(box_min[idxs].min(axis=0))
+            node_max.append(box_max[idxs].max(axis=0))
+            children.append([-1, -1])
+            ranges.append((start, end))
+            if end - start > leaf_size:
+                # split by median of centers along the longest side
+                axis = np.argmax(node_max[node] - node_min[node])
+                mid = (end - start) // 2
+                self.order[start:end] = idxs[np.argpartition(centers[idxs, axis], mid)]
+                children[node] = [build(start, start + mid), build(start + mid, end)]
+            return node
+
+        if len(box_min):
+            build(0, len(box_min))
+        self.node_min = np.array(node_min).reshape(-1, 3)
+        self.node_max = np.array(node_max).reshape(-1, 3)
+        self.children = np.array(children, dtype=np.int64).reshape(-1, 2)
+        self.ranges = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+
+    def is_empty(self):
+        return len(self.node_min) == 0
+
+    def query_tree(self, other, tolerance=0.0):
+        """
+        Find all pairs of intersecting boxes of two trees.
+
+        Returns:
+            two arrays of indexes of boxes in self and in other.
+        """
+        if self.is_empty() or other.is_empty():
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        nodes1 = np.zeros(1, dtype=np.int64)
+        nodes2 = np.zeros(1, dtype=np.int64)
+        leaves1 = []
+        leaves2 = []
+        while len(nodes1):
+            good = _boxes_intersect(self.node_min[nodes1], self.node_max[nodes1],
+                                    other.node_min[nodes2], other.node_max[nodes2], tolerance)
+            nodes1, nodes2 = nodes1[good], nodes2[good]
+            is_leaf1 = self.children[nodes1, 0] < 0
+            is_leaf2 = other.children[nodes2, 0] < 0
+            both_leaves = is_leaf1 & is_leaf2
+            leaves1.append(nodes1[both_leaves])
+            leaves2.append(nodes2[both_leaves])
+            # descend into the bigger node of each pair
+            size1 = (self.node_max[nodes1] - self.node_min[nodes1]).max(axis=1)
+            size2 = (other.node_max[nodes2] - other.node_min[nodes2]).max(axis=1)
+            split1 = ~is_leaf1 & (is_leaf2 | (size1 >= size2))
+            split2 = ~both_leaves & ~split1
+            nodes1 = np.concatenate((self.children[nodes1[split1]].ravel(), np.repeat(nodes1[split2], 2)))
+            nodes2 = np.concatenate((np.repeat(nodes2[split1], 2), other.children[nodes2[split2]].ravel()))
+        leaves1 = np.concatenate(leaves1)
+        leaves2 = np.concatenate(leaves2)
+
+        # all pairs of boxes of intersecting leaves
+        start1, end1 = self.ranges[leaves1].T
+        start2, end2 = other.ranges[leaves2].T
+        count1, count2 = end1 - start1, end2 - start2
+        counts = count1 * count2
+        pair_idxs = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        idxs1 = self.order[start1[pair_idxs] + local // count2[pair_idxs]]
+        idxs2 = other.order[start2[pair_idxs] + local % count2[pair_idxs]]
+        good = _boxes_intersect(self.box_min[idxs1], self.box_max[idxs1],
+                                other.box_min[idxs2], other.box_max[idxs2], tolerance)
+        return idxs1[good], idxs2[good]
+
+
+def _split_half(control_points):
+    """Split Bezier curves at t = 0.5 by de Casteljau algorithm"""
+    degree = control_points.shape[1] - 1
+    left = np.empty_like(control_points)
+    right = np.empty_like(control_points)
+    points = control_points
+    left[:, 0] = points[:, 0]
+    right[:, degree] = points[:, degree]
+    for i in range(1, degree + 1):
+        points = 0.5 * (points[:, :-1] + points[:, 1:])
+        left[:, i] = points[:, 0]
+        right[:, degree - i] = points[:, -1]
+    return left, right
+
+
+def _evaluate(control_points, ts):
+    """Points and derivatives of rational Bezier curves at parameters ts (one per curve)"""
+    degree = control_points.shape[1] - 1
+    ts = ts[:, np.newaxis]
+    ks = np.arange(degree + 1)[np.newaxis, :]
+    binomials = binomial_array(degree + 1)
+    basis = binomials[degree, ks] * ts ** ks * (1 - ts) ** (degree - ks)
+    points = np.einsum('ij,ijk->ik', basis, control_points)
+    if degree > 0:
+        ks = ks[:, :-1]
+        basis = binomials[degree - 1, ks] * ts ** ks * (1 - ts) ** (degree - 1 - ks)
+        derivatives = degree * np.einsum('ij,ijk->ik', basis, np.diff(control_points, axis=1))
+    else:
+        derivatives = np.zeros_like(points)
+    weights = points[:, 3:]
+    euclidean = points[:, :3] / weights
+    euclidean_derivatives = (derivatives[:, :3] - euclidean * derivatives[:, 3:]) / weights
+    return euclidean, euclidean_derivatives
+
+
+def _refine(cpts1, cpts2, bounds1, bounds2):
+    """
+    Gauss-Newton iterations for the minimum of |C1(s1) - C2(s2)|^2,
+    each s is kept in its bounds (array of shape (n, 2)).
+    """
+    s1 = bounds1.mean(axis=1)
+    s2 = bounds2.mean(axis=1)
+    for _ in range(NEWTON_ITERATIONS):
+        pt1, d1 = _evaluate(cpts1, s1)
+        pt2, d2 = _evaluate(cpts2, s2)
+        r = pt1 - pt2
+        # normal equations with jacobian (d1, -d2), slightly damped
+        a = (d1 * d1).sum(axis=1)
+        b = -(d1 * d2).sum(axis=1)
+        c = (d2 * d2).sum(axis=1)
+        g1 = -(d1 * r).sum(axis=1)
+        g2 = (d2 * r).sum(axis=1)
+        damping = 1e-12 * (a + c) + 1e-300
+        a += damping
+        c += damping
+        det = a * c - b * b
+        det = np.where(np.abs(det) < 1e-300, 1e-300, det)
+        s1 = np.clip(s1 + (c * g1 - b * g2) / det, bounds1[:, 0], bounds1[:, 1])
+        s2 = np.clip(s2 + (a * g2 - b * g1) / det, bounds2[:, 0], bounds2[:, 1])
+    pt1, _ = _evaluate(cpts1, s1)
+    pt2, _ = _evaluate(cpts2, s2)
+    return s1, s2, pt1, pt2
+
+
+def _intersect_candidates(segments1, segments2, idxs1, idxs2, numeric_method_threshold, precision):
+    """
+    Subdivide candidate pairs of segments and refine intersections.
+
+    Returns:
+        indexes of segments, parameters of intersections in [0, 1] ranges
+        of segments and intersection points.
+    """
+    cpts1 = segments1.control_points[idxs1]
+    cpts2 = segments2.control_points[idxs2]
+    pairs = np.arange(len(idxs1))
+    # ranges of pieces of segments in their [0, 1] parametrization
+    ranges1 = np.tile([0.0, 1.0], (len(pairs), 1))
+    ranges2 = np.tile([0.0, 1.0], (len(pairs), 1))
+    found_pairs = []
+    found_ranges1 = []
+    found_ranges2 = []
+    for i in range(MAX_SUBDIVISIONS + 1):
+        if not len(pairs):
+            break
+        min1, max1 = _bounds(cpts1)
+        min2, max2 = _bounds(cpts2)
+        good = _boxes_intersect(min1, max1, min2, max2, precision)
+        small = (np.linalg.norm(max1 - min1, axis=1) < numeric_method_threshold) \
+                & (np.linalg.norm(max2 - min2, axis=1) < numeric_method_threshold)
+        done = good & (small | (i == MAX_SUBDIVISIONS))
+        check_flat = good & ~done
+        done[check_flat] = _is_flat(cpts1[check_flat]) & _is_flat(cpts2[check_flat])
+        found_pairs.append(pairs[done])
+        found_ranges1.append(ranges1[done])
+        found_ranges2.append(ranges2[done])
+
+        split = good & ~done
+        pairs, cpts1, cpts2 = pairs[split], cpts1[split], cpts2[split]
+        ranges1, ranges2 = ranges1[split], ranges2[split]
+        left1, right1 = _split_half(cpts1)
+        left2, right2 = _split_half(cpts2)
+        mid1 = ranges1.mean(axis=1)
+        mid2 = ranges2.mean(axis=1)
+        halves1 = (np.stack((ranges1[:, 0], mid1), axis=1), np.stack((mid1, ranges1[:, 1]), axis=1))
+        halves2 = (np.stack((ranges2[:, 0], mid2), axis=1), np.stack((mid2, ranges2[:, 1]), axis=1))
+        cpts1 = np.concatenate((left1, left1, right1, right1))
+        cpts2 = np.concatenate((left2, right2, left2, right2))
+        ranges1 = np.concatenate((halves1[0], halves1[0], halves1[1], halves1[1]))
+        ranges2 = np.concatenate((halves2[0], halves2[1], halves2[0], halves2[1]))
+        pairs = np.tile(pairs, 4)
+
+    pairs = np.concatenate(found_pairs)
+    ranges1 = np.concatenate(found_ranges1)
+    ranges2 = np.concatenate(found_ranges2)
+    idxs1, idxs2 = idxs1[pairs], idxs2[pairs]
+    s1, s2, pt1, pt2 = _refine(segments1.control_points[idxs1], segments2.control_points[idxs2],
+                               ranges1, ranges2)
+    good = np.linalg.norm(pt1 - pt2, axis=1) < precision
+    return idxs1[good], idxs2[good], s1[good], s2[good], 0.5 * (pt1[good] + pt2[good])
+
+
+def intersect_curves_batch(curves1, curves2=None, pairs=None,
+                           numeric_method_threshold=0.02, numeric_precision=0.001):
+    """
+    Find intersections of many NURBS curves at once.
+
+    Args:
+        * curves1: list of SvNurbsCurve
+        * curves2: list of SvNurbsCurve. If None, curves1 are intersected with
+            each other (each pair of different curves once).
+        * pairs: list of pairs (i, j) of indexes of curves in curves1 and curves2
+            which should be intersected. If None, all pairs are intersected.
+        * numeric_method_threshold: size of bounding boxes of curve pieces
+            at which numeric refinement is used instead of subdivision.
+        * numeric_precision: max distance between curves at intersection point.
+
+    Returns:
+        dictionary: (i, j) -> list of (t1, t2, point) tuples, sorted by t1.
+        There are keys only for pairs of curves which do intersect.
+    """
+    self_intersect = curves2 is None
+    segments1 = SvCurveSegments(curves1, tolerance=numeric_precision)
+    if self_intersect:
+        segments2 = segments1
+    else:
+        segments2 = SvCurveSegments(curves2, tolerance=numeric_precision)
+        degree = max(segments1.degree, segments2.degree)
+        if segments1.degree < degree:
+            segments1 = SvCurveSegments(curves1, degree=degree, tolerance=numeric_precision)
+        if segments2.degree < degree:
+            segments2 = SvCurveSegments(curves2, degree=degree, tolerance=numeric_precision)
+
+    tree1 = SvAabbTree(*segments1.get_bounds())
+    tree2 = tree1 if self_intersect else SvAabbTree(*segments2.get_bounds())
+    idxs1, idxs2 = tree1.query_tree(tree2, tolerance=numeric_precision)
+
+    curve_idxs1 = segments1.curve_idxs[idxs1]
+    curve_idxs2 = segments2.curve_idxs[idxs2]
+    if self_intersect:
+        good = curve_idxs1 < curve_idxs2
+    else:
+        good = np.ones(len(idxs1), dtype=bool)
+    if pairs is not None:
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        n_curves2 = len(curves1) if self_intersect else len(curves2)
+        good &= np.isin(curve_idxs1 * n_curves2 + curve_idxs2, pairs[:, 0] * n_curves2 + pairs[:, 1])
+    idxs1, idxs2 = idxs1[good], idxs2[good]
+
+    result = dict()
+    if not len(idxs1):
+        return result
+    chunks = [_intersect_candidates(segments1, segments2, idxs1[start: start + CHUNK_SIZE],
+                                    idxs2[start: start + CHUNK_SIZE],
+                                    numeric_method_threshold, numeric_precision)
+              for start in range(0, len(idxs1), CHUNK_SIZE)]
+    idxs1, idxs2, s1, s2, points = [np.concatenate(arrays) for arrays in zip(*chunks)]
+    t1s = segments1.t_min[idxs1] + s1 * (segments1.t_max[idxs1] - segments1.t_min[idxs1])
+    t2s = segments2.t_min[idxs2] + s2 * (segments2.t_max[idxs2] - segments2.t_min[idxs2])
+    curve_idxs1 = segments1.curve_idxs[idxs1]
+    curve_idxs2 = segments2.curve_idxs[idxs2]
+
+    # several pieces can converge to the same point; sort by curve pair and t1,
+    # and skip points which are too close to the previous point of the same pair
+    order = np.lexsort((t1s, curve_idxs2, curve_idxs1))
+    curve_idxs1, curve_idxs2 = curve_idxs1[order], curve_idxs2[order]
+    t1s, t2s, points = t1s[order], t2s[order], points[order]
+    same_pair = (curve_idxs1[1:] == curve_idxs1[:-1]) & (curve_idxs2[1:] == curve_idxs2[:-1])
+    close = np.linalg.norm(points[1:] - points[:-1], axis=1) < numeric_precision
+    keep = np.concatenate(([True], ~(same_pair & close)))
+    for i, j, t1, t2, point in zip(curve_idxs1[keep].tolist(), curve_idxs2[keep].tolist(),
+                                   t1s[keep].tolist(), t2s[keep].tolist(), points[keep]):
+        result.setdefault((i, j), []).append((t1, t2, point))
+    return result
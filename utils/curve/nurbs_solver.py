@@ -44,6 +44,7 @@ from sverchok.utils.sv_logging import get_logger
 from sverchok.utils.curve.core import SvCurve
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.nurbs_common import SvNurbsBasisFunctions, SvNurbsMaths, from_homogenous, to_homogenous
+from sverchok.utils.nurbs_factorization import get_factorization, array_key
 
 class SvNurbsCurveGoal(object):
     """
@@ -54,10 +55,41 @@ class SvNurbsCurveGoal(object):
 
     def add(self, other):
         raise NotImplementedError("Not implemented")
-        
+
     def get_equations(self, solver):
+        """
+        Matrix A and column B of equations A @ X = B, where X are coordinates
+        of all control points. By default they are built from scalar equations.
+        """
+        matrix = self.get_scalar_matrix(solver)
+        if matrix is None:
+            raise NotImplementedError("Not implemented")
+        A = np.kron(matrix, np.eye(solver.ndim))
+        B = self.get_scalar_rhs(solver).reshape((-1, 1))
+        return A, B
+
+    def get_scalar_matrix(self, solver):
+        """
+        Matrix M of equations M @ X = B, which are the same for all coordinates
+        of control points, X has shape (n_cpts, ndim). Returns None if the goal
+        can't be expressed by such equations.
+        """
+        return None
+
+    def get_scalar_rhs(self, solver):
+        """
+        Right-hand side B of equations M @ X = B, np.array of shape (n_equations, ndim).
+        """
         raise NotImplementedError("Not implemented")
 
+    def get_matrix_key(self, solver):
+        """
+        Hashable value which defines the scalar matrix of the goal (but not its
+        right-hand side), so that factorization of the matrix could be reused.
+        None means that the matrix can't be cached.
+        """
+        return None
+
     def get_n_defined_control_points(self):
         raise NotImplementedError("Not implemented")
 
@@ -136,46 +168,21 @@ class SvNurbsCurvePoints(SvNurbsCurveGoal):
     def get_n_defined_control_points(self):
         return len(self.us)
 
-    def get_equations(self, solver):
-        ndim = solver.ndim
-        us = self.us
-        vectors = self.vectors
-
-        n_points = len(vectors)
-        n_equations = ndim * n_points
-        n_unknowns = ndim * solver.n_cpts
-
-        alphas = self.calc_alphas(solver, us)
-
-        weights = self.get_weights()
-
-        A = np.zeros((n_equations, n_unknowns))
-        B = np.zeros((n_equations, 1))
-        #print(f"A: {A.shape}, W {weights.shape}, n_points {n_points}")
+    def get_matrix_key(self, solver):
+        return (type(self), array_key(self.us), array_key(self.get_weights()))
 
-        for pt_idx in range(n_points):
-            for cpt_idx in range(solver.n_cpts):
-                alpha = alphas[cpt_idx][pt_idx]
-                for dim_idx in range(ndim):
-                    A[ndim*pt_idx + dim_idx, ndim*cpt_idx + dim_idx] = weights[pt_idx] * alpha
+    def get_scalar_matrix(self, solver):
+        alphas = self.calc_alphas(solver, self.us)
+        return self.get_weights()[:, np.newaxis] * alphas.T
 
+    def get_scalar_rhs(self, solver):
+        vectors = np.asarray(self.vectors, dtype=np.float64)
         if solver.src_curve is None:
             if self.relative:
                 raise InvalidStateError("Can not solve relative constraint without original curve")
-            else:
-                src_points = None
-        else:
-            if self.relative:
-                src_points = None
-            else:
-                src_points = self.get_src_points(solver)
-
-        for pt_idx, point in enumerate(vectors):
-            if src_points is not None:
-                point = point - src_points[pt_idx]
-            B[pt_idx*ndim:pt_idx*ndim+ndim,0] = weights[pt_idx] * point[np.newaxis]
-
-        return A, B
+        elif not self.relative:
+            vectors = vectors - self.get_src_points(solver)
+        return self.get_weights()[:, np.newaxis] * vectors
 
 class SvNurbsCurveTangents(SvNurbsCurvePoints):
     """
@@ -298,6 +305,9 @@ class SvNurbsCurveDerivatives(SvNurbsCurvePoints):
         betas = np.array(betas) # (n_cpts, n_points)
         return betas
     
+    def get_matrix_key(self, solver):
+        return super().get_matrix_key(solver) + (self.order,)
+
     def get_src_points(self, solver):
         tangents = solver.src_curve.tangent_array(self.us)
         if solver.ndim == 4 and tangents.shape[-1] == 3:
@@ -376,40 +386,21 @@ class SvNurbsCurveSelfIntersections(SvNurbsCurveGoal):
     def get_n_defined_control_points(self):
         return len(self.us1)
 
-    def get_equations(self, solver):
-        ndim = solver.ndim
-        us1 = self.us1
-        us2 = self.us2
-        p = solver.degree
-
-        n_points = len(us1)
-        n_equations = ndim * n_points
-        n_unknowns = ndim * solver.n_cpts
+    def get_matrix_key(self, solver):
+        return (type(self), array_key(self.us1), array_key(self.us2), self.relative_u, array_key(self.get_weights()))
 
+    def get_scalar_matrix(self, solver):
         alphas, betas = self.calc_alphas(solver)
+        return self.get_weights()[:, np.newaxis] * (alphas - betas).T
 
-        weights = self.get_weights()
-
-        A = np.zeros((n_equations, n_unknowns))
-        B = np.zeros((n_equations, 1))
-
-        for pt_idx in range(n_points):
-            for cpt_idx in range(solver.n_cpts):
-                alpha = alphas[cpt_idx][pt_idx]
-                beta = betas[cpt_idx][pt_idx]
-                for dim_idx in range(ndim):
-                    A[ndim*pt_idx + dim_idx, ndim*cpt_idx + dim_idx] = weights[pt_idx] * (alpha - beta)
-
-        if self.relative:
-            if solver.src_curve is None:
-                raise InvalidStateError("Can not solve relative constraint without original curve")
-            else:
-                points1, points2 = self.calc_vectors(solver)
-                for pt_idx, (pt1, pt2) in enumerate(zip(points1, points2)):
-                    for dim_idx in range(ndim):
-                        B[pt_idx*ndim:pt_idx*ndim+ndim,0] = weights[pt_idx] * (pt2 - pt1)[np.newaxis]
-
-        return A, B
+    def get_scalar_rhs(self, solver):
+        n_points = len(self.us1)
+        if not self.relative:
+            return np.zeros((n_points, solver.ndim))
+        if solver.src_curve is None:
+            raise InvalidStateError("Can not solve relative constraint without original curve")
+        points1, points2 = self.calc_vectors(solver)
+        return self.get_weights()[:, np.newaxis] * (points2 - points1)
 
 class SvNurbsCurveCotangents(SvNurbsCurveSelfIntersections):
     """
@@ -456,49 +447,25 @@ class SvNurbsCurveCotangents(SvNurbsCurveSelfIntersections):
         betas = np.array(betas) # (n_cpts, n_points)
         return alphas, betas
     
-    def get_equations(self, solver):
-        ndim = solver.ndim
-        us1 = self.us1
-        us2 = self.us2
-        p = solver.degree
-
-        n_points = len(us1)
-        n_equations = ndim * n_points
-        n_unknowns = ndim * solver.n_cpts
+    def get_matrix_key(self, solver):
+        return (type(self), array_key(self.us1), array_key(self.us2), self.relative_u)
 
+    def get_scalar_matrix(self, solver):
         alphas, betas = self.calc_alphas(solver)
+        return (alphas - betas).T
 
-        weights = self.get_weights()
-
-        A = np.zeros((n_equations, n_unknowns))
-        B = np.zeros((n_equations, 1))
-
-        weight = 1
-
-        for pt_idx in range(n_points):
-            for cpt_idx in range(solver.n_cpts):
-                alpha = alphas[cpt_idx][pt_idx]
-                beta = betas[cpt_idx][pt_idx]
-                for dim_idx in range(ndim):
-                    A[ndim*pt_idx + dim_idx, ndim*cpt_idx + dim_idx] = weight * (alpha - beta)
-
-        if self.relative:
-            if solver.src_curve is None:
-                raise InvalidStateError("Can not solve relative constraint without original curve")
-            else:
-                points1, points2 = self.calc_vectors(solver)
-                for pt_idx, (pt1, pt2) in enumerate(zip(points1, points2)):
-                    for dim_idx in range(ndim):
-                        B[pt_idx*ndim:pt_idx*ndim+ndim,0] = weight * (pt2 - pt1)[np.newaxis]
-
-        print("A", A)
-        print("B", B)
-        return A, B
+    def get_scalar_rhs(self, solver):
+        n_points = len(self.us1)
+        if not self.relative:
+            return np.zeros((n_points, solver.ndim))
+        if solver.src_curve is None:
+            raise InvalidStateError("Can not solve relative constraint without original curve")
+        points1, points2 = self.calc_vectors(solver)
+        return points2 - points1
 
     def calc_vectors(self, solver):
         points1 = solver.src_curve.tangent_array(self.us1)
         points2 = solver.src_curve.tangent_array(self.us2)
-        print(f"Tg1: {points1}, Tg2: {points2}")
         return points1, points2
 
 class SvNurbsCurveControlPoints(SvNurbsCurveGoal):
@@ -545,39 +512,23 @@ class SvNurbsCurveControlPoints(SvNurbsCurveGoal):
     def get_n_defined_control_points(self):
         return len(self.cpt_idxs)
 
-    def get_equations(self, solver):
-        ndim = solver.ndim
-
-        n_points = len(self.cpt_vectors)
-        n_equations = ndim * n_points
-        n_unknowns = ndim * solver.n_cpts
+    def get_matrix_key(self, solver):
+        return (type(self), np.asarray(self.cpt_idxs).tobytes(), array_key(self.get_weights()))
 
+    def get_scalar_matrix(self, solver):
         weights = self.get_weights()
+        matrix = np.zeros((len(self.cpt_vectors), solver.n_cpts))
+        matrix[np.arange(len(self.cpt_idxs)), self.cpt_idxs] = weights
+        return matrix
 
-        A = np.zeros((n_equations, n_unknowns))
-        B = np.zeros((n_equations, 1))
-
-        for pt_idx, cpt_idx in enumerate(self.cpt_idxs):
-            for dim_idx in range(ndim):
-                A[dim_idx, ndim*cpt_idx + dim_idx] = weights[pt_idx]
-
+    def get_scalar_rhs(self, solver):
+        vectors = np.asarray(self.cpt_vectors, dtype=np.float64)
         if solver.src_curve is None:
             if self.relative:
                 raise InvalidStateError("Can not solve relative constraint without original curve")
-            else:
-                src_points = None
-        else:
-            if self.relative:
-                src_points = None
-            else:
-                src_points = solver.src_curve.get_control_points()
-
-        for pt_idx, (cpt_idx, point) in enumerate(zip(self.cpt_idxs, self.cpt_vectors)):
-            if src_points is not None:
-                point = point - src_points[cpt_idx]
-            B[pt_idx*ndim:pt_idx*ndim+ndim,0] = weights[pt_idx] * point[np.newaxis]
-
-        return A, B
+        elif not self.relative:
+            vectors = vectors - solver.src_curve.get_control_points()[self.cpt_idxs]
+        return self.get_weights()[:, np.newaxis] * vectors
 
 class SvNurbsCurveSolver(SvCurve):
     """
@@ -615,6 +566,7 @@ class SvNurbsCurveSolver(SvCurve):
         self.knotvector = None
         self.goals = []
         self.A = self.B = None
+        self.factorization = None
         self._inited = False
 
     @staticmethod
@@ -731,31 +683,61 @@ class SvNurbsCurveSolver(SvCurve):
             raise InvalidStateError("Number of control points is not specified; specify it in the constructor, in set_curve_params() call, or call guess_curve_params()")
         if self.knotvector is None:
             raise InvalidStateError("Knotvector is not specified; specify it in the constructor, in set_curve_params() call, or call guess_curve_params()")
-        ndim = self.ndim
         n = self.n_cpts
-        p = self.degree
         if self.curve_weights is None:
             self.curve_weights = np.ones((n,))
         self.basis = SvNurbsBasisFunctions(self.knotvector)
 
         self._sort_goals()
-        As = []
-        Bs = []
-        for goal in self.goals:
-            Ai, Bi = goal.get_equations(self)
-            As.append(Ai)
-            Bs.append(Bi)
-        self.A = np.concatenate(As)
-        self.B = np.concatenate(Bs)
+        self.A = self.B = None
+        self.factorization = None
+        # Equations of most goals are the same for all coordinates, so the system
+        # of scalar equations is solved; its factorization is reused if possible.
+        keys = [goal.get_matrix_key(self) for goal in self.goals]
+        if None not in keys:
+            key = ('curve', self.degree, n, array_key(self.knotvector), array_key(self.curve_weights), tuple(keys))
+            self.factorization = get_factorization(key, self._calc_scalar_matrix)
+        else:
+            matrix = self._calc_scalar_matrix()
+            if matrix is not None:
+                self.factorization = get_factorization(None, lambda: matrix)
+
+        if self.factorization is not None:
+            self.scalar_B = np.concatenate([goal.get_scalar_rhs(self) for goal in self.goals])
+        else:
+            As = []
+            Bs = []
+            for goal in self.goals:
+                Ai, Bi = goal.get_equations(self)
+                As.append(Ai)
+                Bs.append(Bi)
+            self.A = np.concatenate(As)
+            self.B = np.concatenate(Bs)
         self._inited = True
 
+    def _calc_scalar_matrix(self):
+        matrices = [goal.get_scalar_matrix(self) for goal in self.goals]
+        if any(matrix is None for matrix in matrices):
+            return None
+        return np.concatenate(matrices)
+
     def get_matrices(self):
         self._init()
+        if self.A is None:
+            self.A = np.kron(self.factorization.dense_matrix(), np.eye(self.ndim))
+            self.B = self.scalar_B.reshape((-1, 1))
         return self.A, self.B
 
+    def _get_system_shape(self):
+        # number of equations and number of unknowns
+        if self.factorization is not None:
+            n_equations, n_unknowns = self.factorization.shape
+            return self.ndim * n_equations, self.ndim * n_unknowns
+        return self.A.shape
+
     def get_problem_type(self):
         self._init()
-        n_equations, n_unknowns = self.A.shape
+        n_equations, n_unknowns = self._get_system_shape()
         if n_equations == n_unknowns:
             return SvNurbsCurveSolver.PROBLEM_WELLDETERMINED
         elif n_equations < n_unknowns:
@@ -786,34 +768,38 @@ class SvNurbsCurveSolver(SvCurve):
         residue = 0.0
         ndim = self.ndim
         n = self.n_cpts
-        n_equations, n_unknowns = self.A.shape
-        if n_equations == n_unknowns:
-            #logger.debug(f"Solving well-determined system: #equations = {n_equations}, #unknonwns = {n_unknowns}")
-            problem_type = SvNurbsCurveSolver.PROBLEM_WELLDETERMINED
-            if problem_type not in problem_types:
+        n_equations, n_unknowns = self._get_system_shape()
+        problem_type = self.get_problem_type()
+        if problem_type not in problem_types:
+            if problem_type == SvNurbsCurveSolver.PROBLEM_WELLDETERMINED:
                 raise AlgorithmError("The problem is well-determined")
+            elif problem_type == SvNurbsCurveSolver.PROBLEM_UNDERDETERMINED:
+                raise AlgorithmError("The problem is underdetermined")
+            else:
+                raise AlgorithmError("The system is overdetermined")
+
+        if self.factorization is not None:
             try:
-                A1 = np.linalg.inv(self.A)
-                X = (A1 @ self.B).T
+                d_cpts, residue = self.factorization.solve(self.scalar_B)
             except np.linalg.LinAlgError as e:
-                logger.error(f"Matrix: {self.A}")
+                logger.error(f"Matrix: {self.factorization.matrix}")
                 raise AlgorithmError(f"Can not solve: #equations = {n_equations}, #unknowns = {n_unknowns}: {e}") from e
-        elif n_equations < n_unknowns:
-            #logger.debug(f"Solving underdetermined system: #equations = {n_equations}, #unknonwns = {n_unknowns}")
-            problem_type = SvNurbsCurveSolver.PROBLEM_UNDERDETERMINED
-            if problem_type not in problem_types:
-                raise AlgorithmError("The problem is underdetermined")
-            A1 = np.linalg.pinv(self.A)
-            X = (A1 @ self.B).T
-        else: # n_equations > n_unknowns
-            #logger.debug(f"Solving overdetermined system: #equations = {n_equations}, #unknonwns = {n_unknowns}")
-            problem_type = SvNurbsCurveSolver.PROBLEM_OVERDETERMINED
-            if problem_type not in problem_types:
-                raise AlgorithmError("The system is overdetermined")
-            X, residues, rank, singval = np.linalg.lstsq(self.A, self.B)
-            residue = residues.sum()
-            
-        d_cpts = X.reshape((n, ndim))
+        else:
+            if problem_type == SvNurbsCurveSolver.PROBLEM_WELLDETERMINED:
+                try:
+                    A1 = np.linalg.inv(self.A)
+                    X = (A1 @ self.B).T
+                except np.linalg.LinAlgError as e:
+                    logger.error(f"Matrix: {self.A}")
+                    raise AlgorithmError(f"Can not solve: #equations = {n_equations}, #unknowns = {n_unknowns}: {e}") from e
+            elif problem_type == SvNurbsCurveSolver.PROBLEM_UNDERDETERMINED:
+                A1 = np.linalg.pinv(self.A)
+                X = (A1 @ self.B).T
+            else:
+                X, residues, rank, singval = np.linalg.lstsq(self.A, self.B)
+                residue = residues.sum()
+            d_cpts = X.reshape((n, ndim))
+
         if ndim == 4:
             #print("D cpts 4", d_cpts)
             if self.src_curve is None:
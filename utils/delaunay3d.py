@@ -0,0 +1,158 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Batched post-processing of Delaunay triangulations.
+
+All functions work with simplices of one size at once, given as np.array
+of shape (n_simplices, k) of vertex indices: k = 4 for tetrahedrons,
+3 for triangles, 2 for segments. Unique edges and faces are found by
+hashing sorted vertex indices of each element into one integer key.
+"""
+
+import numpy as np
+
+# edges and faces of a simplex, as indices of its vertices
+SIMPLEX_EDGES = {
+    1: [],
+    2: [(0, 1)],
+    3: [(0, 1), (1, 2), (2, 0)],
+    4: [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+}
+
+SIMPLEX_FACES = {
+    1: [],
+    2: [],
+    3: [(0, 1, 2)],
+    4: [(0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3)]
+}
+
+
+def simplex_measures(vertices, simplices):
+    """
+    Lengths of segments, areas of triangles or volumes of tetrahedrons.
+    :param vertices: np.array of shape (n_verts, 3)
+    :param simplices: np.array of shape (n, k)
+    :return: np.array of shape (n,); zeros for simplices of one vertex
+    """
+    k = simplices.shape[1]
+    corners = vertices[simplices]
+    vectors = corners[:, 1:] - corners[:, :1]
+    if k == 4:
+        return np.abs(np.einsum('ij,ij->i', np.cross(vectors[:, 0], vectors[:, 1]), vectors[:, 2])) / 6
+    elif k == 3:
+        return np.linalg.norm(np.cross(vectors[:, 0], vectors[:, 1]), axis=1) / 2
+    elif k == 2:
+        return np.linalg.norm(vectors[:, 0], axis=1)
+    else:
+        return np.zeros(len(simplices))
+
+
+def max_edge_lengths(vertices, simplices):
+    """Length of the longest edge of each simplex"""
+    idxs = np.array(SIMPLEX_EDGES[simplices.shape[1]]).reshape(-1, 2)
+    if len(idxs) == 0:
+        return np.zeros(len(simplices))
+    corners = vertices[simplices]
+    lengths = np.linalg.norm(corners[:, idxs[:, 0]] - corners[:, idxs[:, 1]], axis=2)
+    return lengths.max(axis=1)
+
+
+def filter_simplices(vertices, simplices, size_threshold=0, edge_threshold=0):
+    """
+    Remove degenerated and too big simplices.
+    :param size_threshold: simplices with smaller volume (area, length) are
+        removed; 0 means do not check
+    :param edge_threshold: simplices with longer edges are removed; 0 means do not check
+    :return: np.array of remaining simplices
+    """
+    simplices = np.asarray(simplices, dtype=np.int64)
+    good = np.ones(len(simplices), dtype=bool)
+    if edge_threshold != 0:
+        good &= max_edge_lengths(vertices, simplices) <= edge_threshold
+    if size_threshold != 0 and simplices.shape[1] > 1:
+        good &= simplex_measures(vertices, simplices) >= size_threshold
+    return simplices[good]
+
+
+def unique_rows(rows, n_verts, return_counts=False):
+    """
+    Unique rows of vertex indices, not taking into account the order of indices in a row.
+    :param rows: np.array of shape (n, k)
+    :param n_verts: number of vertices (max index + 1)
+    :return: np.array of unique rows with sorted indices (and counts of rows, if requested)
+    """
+    rows = np.sort(rows, axis=1)
+    k = rows.shape[1]
+    if len(rows) == 0 or float(n_verts) ** k >= 2 ** 63:
+        return np.unique(rows, axis=0, return_counts=return_counts)
+    keys = np.zeros(len(rows), dtype=np.int64)
+    for column in rows.T:
+        keys = keys * n_verts + column
+    _, index, counts = np.unique(keys, return_index=True, return_counts=True)
+    if return_counts:
+        return rows[index], counts
+    return rows[index]
+
+
+def simplex_edges(simplices, n_verts):
+    """Unique edges of all simplices, np.array of shape (n, 2)"""
+    idxs = SIMPLEX_EDGES[simplices.shape[1]]
+    if not idxs:
+        return np.zeros((0, 2), dtype=np.int64)
+    return unique_rows(simplices[:, idxs].reshape(-1, 2), n_verts)
+
+
+def simplex_faces(simplices, n_verts):
+    """Unique triangles of all simplices, np.array of shape (n, 3)"""
+    idxs = SIMPLEX_FACES[simplices.shape[1]]
+    if not idxs:
+        return np.zeros((0, 3), dtype=np.int64)
+    return unique_rows(simplices[:, idxs].reshape(-1, 3), n_verts)
+
+
+def boundary_faces(tetras, n_verts):
+    """Triangles which belong to only one of tetrahedrons, np.array of shape (n, 3)"""
+    faces, counts = unique_rows(tetras[:, SIMPLEX_FACES[4]].reshape(-1, 3), n_verts, return_counts=True)
+    return faces[counts == 1]
+
+
+def circumradii_squared(vertices, tetras):
+    """Squared radiuses of spheres circumscribed around tetrahedrons"""
+    corners = vertices[tetras]
+    u, v, w = (corners[:, 1:] - corners[:, :1]).transpose(1, 0, 2)
+    vw, wu, uv = np.cross(v, w), np.cross(w, u), np.cross(u, v)
+    # offset of circumcenter from the first vertex
+    numerator = (u*u).sum(axis=1)[:, None] * vw + (v*v).sum(axis=1)[:, None] * wu + (w*w).sum(axis=1)[:, None] * uv
+    denominator = 2 * np.einsum('ij,ij->i', u, vw)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (numerator**2).sum(axis=1) / denominator**2
+
+
+def flatness(vertices, tetras):
+    """
+    Volumes of tetrahedrons built on unit vectors along edges from the first vertex;
+    unlike the volume, this does not depend on the size of tetrahedron.
+    """
+    corners = vertices[tetras]
+    vectors = corners[:, 1:] - corners[:, :1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vectors /= np.linalg.norm(vectors, axis=2, keepdims=True)
+    return np.abs(np.einsum('ij,ij->i', np.cross(vectors[:, 0], vectors[:, 1]), vectors[:, 2])) / 6
+
+
+def alpha_shape_faces(vertices, tetras, alpha, volume_threshold=0):
+    """
+    Surface of alpha shape: boundary triangles of tetrahedrons with
+    circumsphere radius smaller than alpha, excluding flat tetrahedrons.
+    :param volume_threshold: threshold of flatness() of tetrahedrons;
+        tetrahedrons with coincident vertices are always excluded
+    :return: np.array of shape (n, 3)
+    """
+    good = circumradii_squared(vertices, tetras) < alpha**2
+    good &= flatness(vertices, tetras) >= volume_threshold
+    return boundary_faces(tetras[good], len(vertices))
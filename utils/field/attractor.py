@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
-from math import copysign, pi
+from math import copysign, pi, sqrt
 import numpy as np
 
 from mathutils import Vector
@@ -414,6 +414,18 @@ class SvScalarFieldPointDistance(SvScalarField):
         else:
             return norm
 
+    def get_lipschitz_constant(self):
+        if self.falloff is not None:
+            return None
+        if self.metric in {'EUCLIDEAN', 'CHEBYSHEV'}:
+            return 1.0
+        elif self.metric == 'MANHATTAN':
+            return sqrt(3)
+        elif self.metric == 'CUSTOM' and self.power >= 1:
+            # |v|_p <= 3^(1/p - 1/2) |v|_2 for p < 2
+            return 3 ** max(1.0 / self.power - 0.5, 0.0)
+        return None
+
 class SvKdtScalarField(SvScalarField):
     __description__ = "KDT"
 
@@ -475,6 +487,11 @@ class SvLineAttractorScalarField(SvScalarField):
         else:
             return norms
 
+    def get_lipschitz_constant(self):
+        if self.falloff is None:
+            return 1.0
+        return None
+
 class SvPlaneAttractorScalarField(SvScalarField):
     __description__ = "Plane Attractor"
 
@@ -507,6 +524,11 @@ class SvPlaneAttractorScalarField(SvScalarField):
         else:
             return norms
 
+    def get_lipschitz_constant(self):
+        if self.falloff is None:
+            return 1.0
+        return None
+
 class SvCircleAttractorScalarField(SvScalarField):
     __description__ = "Circle Attractor"
 
@@ -532,6 +554,11 @@ class SvCircleAttractorScalarField(SvScalarField):
         else:
             return distances
 
+    def get_lipschitz_constant(self):
+        if self.falloff is None:
+            return 1.0
+        return None
+
 class SvBvhAttractorScalarField(SvScalarField):
     __description__ = "BVH Attractor (faces)"
 
@@ -671,3 +698,7 @@ class SvEdgeAttractorScalarField(SvScalarField):
         else:
             return distances
 
+    def get_lipschitz_constant(self):
+        if self.falloff is None:
+            return 1.0
+        return None
@@ -0,0 +1,280 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Fused evaluation of composed fields.
+
+Fields made by field math nodes are trees of field objects, and evaluate_grid
+of each of them evaluates its subfields for all points, so a deep composition
+keeps many intermediate arrays of the size of the whole grid. compile_field
+flattens such tree into a plan: a list of steps, each step calculates one
+intermediate value from values of previous steps. The same field evaluated at
+the same points (for example, one field used by two branches) is calculated
+once. The plan evaluates points by chunks of CHUNK_SIZE, and intermediate
+values are released after their last use, so memory used besides the result
+does not depend on the number of points.
+
+    from sverchok.utils.field.compiler import compile_field
+    values = compile_field(field).evaluate_grid(xs, ys, zs)
+
+Fields of types which are not known to the compiler are evaluated by their
+own evaluate_grid, by chunks as well.
+"""
+
+import numpy as np
+
+from sverchok.utils.field.scalar import (
+            SvScalarFieldBinOp, SvScalarFieldVectorizedFunction, SvNegatedScalarField,
+            SvAbsScalarField, SvMergedScalarField, SvScalarFieldLambda,
+            SvVectorScalarFieldComposition, SvVectorFieldNorm, SvVectorFieldsScalarProduct,
+            SvVectorFieldDecomposed)
+from sverchok.utils.field.vector import SvAbsoluteVectorField, SvRelativeVectorField, SvVectorFieldLambda
+from sverchok.utils.field.vector_operations import (
+            SvVectorFieldBinOp, SvVectorFieldComposition, SvVectorFieldMultipliedByScalar,
+            SvVectorFieldsLerp, SvVectorFieldCrossProduct, SvComposedVectorField)
+
+# number of points evaluated at once; float64 arrays of this size fit in L2 cache
+CHUNK_SIZE = 2 ** 16
+
+# slot of point coordinates in values of steps
+COORDS = 0
+
+
+class SvFieldPlan(object):
+    """
+    Evaluation plan of a scalar or vector field. Scalar values are arrays,
+    vector values are tuples of 3 arrays, as returned by evaluate_grid of fields.
+    """
+    def __init__(self, field):
+        # (function, slots of arguments); result of step i is in slot i + 1
+        self.steps = []
+        self._slots = dict()
+        # compiled fields are kept so that their ids stay unique
+        self._fields = []
+        self.output = self.add_field(field, COORDS)
+        self._releases = self._calc_releases()
+
+    def add_step(self, function, inputs):
+        self.steps.append((function, tuple(inputs)))
+        return len(self.steps)
+
+    def add_field(self, field, coords):
+        """Add steps evaluating the field at points from the coords slot, return slot of the result"""
+        key = (id(field), coords)
+        if key not in self._slots:
+            self._fields.append(field)
+            compiler = FIELD_COMPILERS.get(type(field))
+            slot = None if compiler is None else compiler(self, field, coords)
+            if slot is None:
+                slot = self.add_step(_unpacked_coords(field.evaluate_grid), [coords])
+            self._slots[key] = slot
+        return self._slots[key]
+
+    def _calc_releases(self):
+        last_use = dict()
+        for i, (_, inputs) in enumerate(self.steps):
+            for slot in inputs:
+                last_use[slot] = i
+        releases = [[] for _ in self.steps]
+        for slot, i in last_use.items():
+            if slot != self.output:
+                releases[i].append(slot)
+        return releases
+
+    def evaluate_chunk(self, xs, ys, zs):
+        values = [None] * (len(self.steps) + 1)
+        values[COORDS] = (xs, ys, zs)
+        for i, ((function, inputs), releases) in enumerate(zip(self.steps, self._releases)):
+            values[i + 1] = function(*[values[slot] for slot in inputs])
+            for slot in releases:
+                values[slot] = None
+        return values[self.output]
+
+    def evaluate_grid(self, xs, ys, zs, chunk_size=CHUNK_SIZE):
+        xs, ys, zs = np.asarray(xs), np.asarray(ys), np.asarray(zs)
+        n = len(xs)
+        if n <= chunk_size:
+            return self.evaluate_chunk(xs, ys, zs)
+        result = None
+        for start in range(0, n, chunk_size):
+            end = min(start + chunk_size, n)
+            value = self.evaluate_chunk(xs[start:end], ys[start:end], zs[start:end])
+            result = _store_chunk(result, value, n, start, end)
+        return result
+
+    def evaluate_box(self, x_range, y_range, z_range, chunk_size=CHUNK_SIZE):
+        """
+        Evaluate at nodes of the grid made by np.meshgrid(x_range, y_range, z_range, indexing='ij'),
+        flattened; coordinates of the grid are made by chunks too.
+        """
+        x_range, y_range, z_range = np.asarray(x_range), np.asarray(y_range), np.asarray(z_range)
+        n_y, n_z = len(y_range), len(z_range)
+        n = len(x_range) * n_y * n_z
+        result = None
+        for start in range(0, max(n, 1), chunk_size):
+            end = min(start + chunk_size, n)
+            indices = np.arange(start, end)
+            i, jk = np.divmod(indices, n_y * n_z)
+            j, k = np.divmod(jk, n_z)
+            value = self.evaluate_chunk(x_range[i], y_range[j], z_range[k])
+            if n <= chunk_size:
+                return value
+            result = _store_chunk(result, value, n, start, end)
+        return result
+
+
+def _unpacked_coords(function):
+    return lambda coords: function(*coords)
+
+
+def _store_chunk(result, value, n, start, end):
+    if isinstance(value, (tuple, list)) or (isinstance(value, np.ndarray) and value.ndim == 2):
+        if result is None:
+            result = tuple(np.empty(n, dtype=np.asarray(component).dtype) for component in value)
+        for array, component in zip(result, value):
+            array[start:end] = component
+    else:
+        if result is None:
+            result = np.empty(n, dtype=np.asarray(value).dtype)
+        result[start:end] = value
+    return result
+
+
+def compile_field(field):
+    """Make SvFieldPlan of scalar or vector field"""
+    return SvFieldPlan(field)
+
+
+def evaluate_field_grid(field, xs, ys, zs):
+    """The same as field.evaluate_grid(xs, ys, zs), evaluated by compiled plan"""
+    return compile_field(field).evaluate_grid(xs, ys, zs)
+
+
+####################
+#                  #
+#  Field compilers #
+#                  #
+####################
+
+# Each compiler adds steps for a field of some type to the plan and returns
+# the slot of the result; or returns None if the field is to be evaluated
+# by its own evaluate_grid. Compilers are selected by exact type of the field,
+# so that subclasses which override evaluate_grid are not affected.
+
+def _scalar_binop(plan, field, coords):
+    return plan.add_step(field.function, [plan.add_field(field.field1, coords), plan.add_field(field.field2, coords)])
+
+def _scalar_function(plan, field, coords):
+    return plan.add_step(field.function, [plan.add_field(field.field, coords)])
+
+def _negated(plan, field, coords):
+    return plan.add_step(np.negative, [plan.add_field(field.field, coords)])
+
+def _abs(plan, field, coords):
+    return plan.add_step(np.abs, [plan.add_field(field.field, coords)])
+
+def _merged(plan, field, coords):
+    if field.mode == 'MIN':
+        function = lambda *values: np.min(values, axis=0)
+    elif field.mode == 'MAX':
+        function = lambda *values: np.max(values, axis=0)
+    elif field.mode == 'SUM':
+        function = lambda *values: np.sum(values, axis=0)
+    elif field.mode == 'AVG':
+        function = lambda *values: np.mean(values, axis=0)
+    else:
+        return None
+    return plan.add_step(function, [plan.add_field(subfield, coords) for subfield in field.fields])
+
+def _scalar_lambda(plan, field, coords):
+    if field.in_field is None or field.function_numpy is None:
+        return None
+    function = field.function_numpy
+    return plan.add_step(lambda xyz, vs: function(xyz[0], xyz[1], xyz[2], vs),
+                         [coords, plan.add_field(field.in_field, coords)])
+
+def _scalar_composition(plan, field, coords):
+    return plan.add_field(field.sfield, plan.add_field(field.vfield, coords))
+
+def _vector_norm(plan, field, coords):
+    return plan.add_step(lambda v: np.sqrt(v[0]*v[0] + v[1]*v[1] + v[2]*v[2]), [plan.add_field(field.field, coords)])
+
+def _scalar_product(plan, field, coords):
+    return plan.add_step(lambda v1, v2: v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2],
+                         [plan.add_field(field.field1, coords), plan.add_field(field.field2, coords)])
+
+def _decomposed(plan, field, coords):
+    if field.coords != 'XYZ':
+        return None
+    axis = field.axis
+    return plan.add_step(lambda v: v[axis], [plan.add_field(field.vfield, coords)])
+
+def _absolute(plan, field, coords):
+    return plan.add_step(lambda v, xyz: (v[0] + xyz[0], v[1] + xyz[1], v[2] + xyz[2]),
+                         [plan.add_field(field.field, coords), coords])
+
+def _relative(plan, field, coords):
+    return plan.add_step(lambda v, xyz: (v[0] - xyz[0], v[1] - xyz[1], v[2] - xyz[2]),
+                         [plan.add_field(field.field, coords), coords])
+
+def _vector_lambda(plan, field, coords):
+    if field.in_field is None or field.function_numpy is None:
+        return None
+    function = field.function_numpy
+    return plan.add_step(lambda xyz, v: function(xyz[0], xyz[1], xyz[2], np.stack(v)),
+                         [coords, plan.add_field(field.in_field, coords)])
+
+def _vector_binop(plan, field, coords):
+    function = field.function
+    def binop(v1, v2):
+        r = function(np.array(v1), np.array(v2))
+        return r[0], r[1], r[2]
+    return plan.add_step(binop, [plan.add_field(field.field1, coords), plan.add_field(field.field2, coords)])
+
+def _vector_composition(plan, field, coords):
+    return plan.add_field(field.field2, plan.add_field(field.field1, coords))
+
+def _multiplied_by_scalar(plan, field, coords):
+    return plan.add_step(lambda v, s: (s * v[0], s * v[1], s * v[2]),
+                         [plan.add_field(field.vector_field, coords), plan.add_field(field.scalar_field, coords)])
+
+def _lerp(plan, field, coords):
+    return plan.add_step(lambda v1, v2, s: tuple((1 - s) * c1 + s * c2 for c1, c2 in zip(v1, v2)),
+                         [plan.add_field(field.vfield1, coords), plan.add_field(field.vfield2, coords),
+                          plan.add_field(field.scalar_field, coords)])
+
+def _cross_product(plan, field, coords):
+    return plan.add_step(lambda v1, v2: (v1[1]*v2[2] - v1[2]*v2[1], v1[2]*v2[0] - v1[0]*v2[2], v1[0]*v2[1] - v1[1]*v2[0]),
+                         [plan.add_field(field.field1, coords), plan.add_field(field.field2, coords)])
+
+def _composed_vector(plan, field, coords):
+    if field.coords != 'XYZ':
+        return None
+    return plan.add_step(lambda v1, v2, v3: (v1, v2, v3),
+                         [plan.add_field(subfield, coords) for subfield in (field.sfield1, field.sfield2, field.sfield3)])
+
+FIELD_COMPILERS = {
+        SvScalarFieldBinOp: _scalar_binop,
+        SvScalarFieldVectorizedFunction: _scalar_function,
+        SvNegatedScalarField: _negated,
+        SvAbsScalarField: _abs,
+        SvMergedScalarField: _merged,
+        SvScalarFieldLambda: _scalar_lambda,
+        SvVectorScalarFieldComposition: _scalar_composition,
+        SvVectorFieldNorm: _vector_norm,
+        SvVectorFieldsScalarProduct: _scalar_product,
+        SvVectorFieldDecomposed: _decomposed,
+        SvAbsoluteVectorField: _absolute,
+        SvRelativeVectorField: _relative,
+        SvVectorFieldLambda: _vector_lambda,
+        SvVectorFieldBinOp: _vector_binop,
+        SvVectorFieldComposition: _vector_composition,
+        SvVectorFieldMultipliedByScalar: _multiplied_by_scalar,
+        SvVectorFieldsLerp: _lerp,
+        SvVectorFieldCrossProduct: _cross_product,
+        SvComposedVectorField: _composed_vector,
+    }
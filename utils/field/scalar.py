@@ -32,6 +32,13 @@ class SvScalarField(object):
     def evaluate_grid(self, xs, ys, zs):
         raise Exception("not implemented")
 
+    def get_lipschitz_constant(self):
+        """
+        Upper bound of the norm of the field gradient, or None if it is not known.
+        It allows sphere tracing of the field iso surfaces.
+        """
+        return None
+
     def gradient(self, point, step=0.001):
         x, y, z = point
         v_dx_plus = self.evaluate(x+step,y,z)
@@ -73,6 +80,9 @@ class SvConstantScalarField(SvScalarField):
         result = np.full_like(xs, self.value, dtype=np.float64)
         return result
 
+    def get_lipschitz_constant(self):
+        return 0.0
+
 class SvVectorFieldDecomposed(SvScalarField):
     def __init__(self, vfield, coords, axis):
         self.vfield = vfield
@@ -200,6 +210,11 @@ class SvCoordinateScalarField(SvScalarField):
         else:
             raise Exception("Unknown variable: " + self.coordinate)
 
+    def get_lipschitz_constant(self):
+        if self.coordinate in {'X', 'Y', 'Z', 'CYL_RHO', 'SPH_RHO'}:
+            return 1.0
+        return None
+
 class SvNegatedScalarField(SvScalarField):
     def __init__(self, field):
         self.field = field
@@ -212,6 +227,9 @@ class SvNegatedScalarField(SvScalarField):
     def evaluate_grid(self, xs, ys, zs):
         return (- self.field.evaluate_grid(xs, ys, zs))
 
+    def get_lipschitz_constant(self):
+        return self.field.get_lipschitz_constant()
+
 class SvAbsScalarField(SvScalarField):
     def __init__(self, field):
         self.field = field
@@ -224,6 +242,9 @@ class SvAbsScalarField(SvScalarField):
     def evaluate_grid(self, xs, ys, zs):
         return np.abs(self.field.evaluate_grid(xs, ys, zs))
 
+    def get_lipschitz_constant(self):
+        return self.field.get_lipschitz_constant()
+
 class SvVectorFieldsScalarProduct(SvScalarField):
     def __init__(self, field1, field2):
         self.field1 = field1
@@ -300,6 +321,19 @@ class SvMergedScalarField(SvScalarField):
             raise Exception("unsupported operation")
         return value
 
+    def get_lipschitz_constant(self):
+        constants = [field.get_lipschitz_constant() for field in self.fields]
+        if None in constants:
+            return None
+        if self.mode in {'MIN', 'MAX'}:
+            return max(constants)
+        elif self.mode == 'SUM':
+            return sum(constants)
+        elif self.mode == 'AVG':
+            return sum(constants) / len(constants)
+        else:
+            return None
+
 class SvVectorScalarFieldComposition(SvScalarField):
     __description__ = "Composition"
 
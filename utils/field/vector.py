@@ -10,7 +10,6 @@ import numpy as np
 
 from mathutils import Vector
 from mathutils import bvhtree
-from mathutils import noise
 from sverchok.utils.curve import SvCurveLengthSolver, SvNormalTrack, MathutilsRotationCalculator
 from sverchok.utils.geom import LineEquation, CircleEquation3D, rotate_around_vector_matrix
 from sverchok.utils.math import (
@@ -19,6 +18,7 @@ from sverchok.utils.math import (
             from_spherical_np, to_spherical_np,
             np_dot, np_multiply_matrices_vectors)
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.noise_engine import noise_vector, MATHUTILS
 from sverchok.utils.field.voronoi import SvVoronoiFieldData
 
 ##################
@@ -145,23 +145,20 @@ class SvVectorFieldLambda(SvVectorField):
         return np.array(self.function(x, y, z, V))
 
 class SvNoiseVectorField(SvVectorField):
-    def __init__(self, noise_type, seed):
+    def __init__(self, noise_type, seed, backend=MATHUTILS):
         self.noise_type = noise_type
         self.seed = seed
+        self.backend = backend
         self.__description__ = "{} noise".format(noise_type)
 
     def evaluate(self, x, y, z):
-        noise.seed_set(self.seed)
-        v = noise.noise_vector((x, y, z), noise_basis=self.noise_type)
-        return np.array(v)
+        return noise_vector([(x, y, z)], self.noise_type, self.seed, self.backend)[0]
 
     def evaluate_grid(self, xs, ys, zs):
-        noise.seed_set(self.seed)
-        def mk_noise(v):
-            r = noise.noise_vector(v, noise_basis=self.noise_type)
-            return r[0], r[1], r[2]
-        vectors = np.stack((xs,ys,zs)).T
-        return np.vectorize(mk_noise, signature="(3)->(),(),()")(vectors)
+        xs = np.asarray(xs)
+        vectors = np.stack((xs, ys, zs), axis=-1)
+        R = noise_vector(vectors.reshape(-1, 3), self.noise_type, self.seed, self.backend).T
+        return R[0].reshape(xs.shape), R[1].reshape(xs.shape), R[2].reshape(xs.shape)
 
 class SvRotationVectorField(SvVectorField):
 
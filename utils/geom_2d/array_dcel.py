@@ -0,0 +1,734 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Struct of arrays implementation of half edge data structure for 2D planar meshes.
+
+Unlike dcel.py, which keeps every point, half edge and face as separate Python object,
+here the whole mesh is stored in several NumPy arrays. Building of the structure
+(sorting of half edges around vertices, extraction of face loops, searching of holes)
+is vectorized, Python loops are left only for splitting of faces with holes into
+monotone pieces. Functions at the end of the module are drop-in replacements
+of the functions of merge_mesh.py with the same arguments and output.
+
+In robust mode points are snapped to integer grid with step equal to accuracy
+and all topological decisions are made by exact predicates (see snap_rounding.py),
+so the result does not depend on choosing of accuracy value.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+from sverchok.utils.intersect_edges import intersect_edges_grid_np
+from .make_monotone import monotone_sv_face_with_holes
+from .snap_rounding import (unique_rows, snap_to_grid, from_grid, snap_round_graph, orientation,
+                            exact_angular_order)
+
+
+CHUNK_SIZE = 250000
+
+# for nodes which can use either this module or merge_mesh.py
+implementation_items = [
+    ('Python', 'Python', 'Object based half edge mesh (merge_mesh.py)', 0),
+    ('NumPy', 'NumPy', 'Array based half edge mesh, much faster and uses less memory on big meshes', 1)]
+
+
+def get_accuracy(accuracy):
+    # The same convention as in DCELMesh.set_accuracy
+    if isinstance(accuracy, int):
+        accuracy = 1 / 10 ** accuracy
+    if not (1e-1 > accuracy > 1e-15):
+        raise ValueError("Accuracy should between 1^-1 and 1^-15, {} value was given".format(accuracy))
+    return accuracy
+
+
+class ArrayDCEL:
+    """
+    Half edge mesh of planar straight line graph.
+    Half edges 2 * i and 2 * i + 1 belong to edge i and are twins of each other.
+
+    origin - index of the vertex the half edge starts from
+    next, prev - indexes of next and previous half edges of the same loop
+    loop - index of the loop the half edge belongs to
+    loop_order - indexes of half edges ordered loop by loop, along each loop
+    loop_starts, loop_sizes - position of each loop in loop_order
+    loop_area - signed area of each loop, loops with positive area are boundaries of faces (CCW),
+        others are outer boundaries of connected components of the graph
+    int_co - integer coordinates of vertices on the grid in robust mode, otherwise None
+    grid_step - length of step of the grid
+    """
+    def __init__(self, co, edges, int_co=None, grid_step=1.0):
+        """
+        :param co: array of vertices, shape (n, 2) or (n, 3), only X and Y are used
+        :param edges: array of edges without duplicates and without zero length edges, shape (m, 2)
+        :param int_co: integer coordinates of vertices, shape (n, 2), if given,
+            orientation of half edges and of loops is calculated exactly
+        :param grid_step: length of the grid step, for calculating areas of loops in robust mode
+        """
+        self.co = np.asarray(co, dtype=np.float64)
+        self.int_co = int_co
+        self.grid_step = grid_step
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.origin = self.edges.ravel()
+        self.twin = np.arange(len(self.origin)) ^ 1
+        self.next = None
+        self.prev = None
+        self.loop = None
+        self.loop_order = None
+        self.loop_starts = None
+        self.loop_sizes = None
+        self.loop_area = None
+        self._component = None
+        self.link()
+
+    @property
+    def dest(self):
+        return self.origin[self.twin]
+
+    @property
+    def n_loops(self):
+        return len(self.loop_sizes)
+
+    def link(self):
+        """Calculate next/prev links and loops of half edges"""
+        xy = self.co[:, :2]
+        n_hedges = len(self.origin)
+        direction = xy[self.dest] - xy[self.origin]
+        angle = np.arctan2(direction[:, 1], direction[:, 0])
+        # half edges around each vertex in counterclockwise order
+        order = np.lexsort((angle, self.origin))
+        if self.int_co is not None:
+            int_directions = self.int_co[self.dest] - self.int_co[self.origin]
+            order = exact_angular_order(order, self.origin, angle, int_directions)
+        position = np.empty(n_hedges, dtype=np.int64)
+        position[order] = np.arange(n_hedges)
+        sorted_origin = self.origin[order]
+        group_start = np.searchsorted(sorted_origin, sorted_origin, side='left')
+        group_end = np.searchsorted(sorted_origin, sorted_origin, side='right')
+
+        # next half edge is previous (clockwise) to the twin around the destination vertex
+        twin_pos = position[self.twin]
+        prev_pos = twin_pos - 1
+        wrap = prev_pos < group_start[twin_pos]
+        prev_pos[wrap] = group_end[twin_pos[wrap]] - 1
+        self.next = order[prev_pos]
+        self.prev = np.empty(n_hedges, dtype=np.int64)
+        self.prev[self.next] = np.arange(n_hedges)
+        self._find_loops()
+        self._component = None
+
+    def _find_loops(self):
+        n_hedges = len(self.next)
+        if not n_hedges:
+            self.loop = self.loop_order = self.loop_starts = self.loop_sizes = np.empty(0, dtype=np.int64)
+            self.loop_area = np.empty(0)
+            return
+        # minimal half edge index of each loop by pointer jumping
+        label = np.arange(n_hedges)
+        jump = self.next
+        step = 1
+        while step < n_hedges:
+            label = np.minimum(label, label[jump])
+            jump = jump[jump]
+            step *= 2
+        first_hedges, self.loop = np.unique(label, return_inverse=True)
+        self.loop = self.loop.ravel()
+
+        # distance to the end of each loop, where loops are broken before the first half edge
+        succ = self.next.copy()
+        last = self.prev[first_hedges]
+        succ[last] = last
+        rank = np.ones(n_hedges, dtype=np.int64)
+        rank[last] = 0
+        while True:
+            succ_succ = succ[succ]
+            if np.array_equal(succ_succ, succ):
+                break
+            rank += rank[succ]
+            succ = succ_succ
+        self.loop_order = np.lexsort((-rank, self.loop))
+        self.loop_sizes = np.bincount(self.loop, minlength=len(first_hedges))
+        self.loop_starts = np.cumsum(self.loop_sizes) - self.loop_sizes
+
+        if self.int_co is None:
+            xy = self.co[:, :2]
+            start, end = xy[self.origin], xy[self.dest]
+            cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+            self.loop_area = np.bincount(self.loop, weights=cross, minlength=len(first_hedges)) / 2
+        else:
+            # integer sum is exact, even if it overflows in the middle, because the final area fits into int64
+            start, end = self.int_co[self.origin], self.int_co[self.dest]
+            cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+            doubled_area = np.zeros(len(first_hedges), dtype=np.int64)
+            np.add.at(doubled_area, self.loop, cross)
+            self.loop_area = doubled_area / 2 * self.grid_step ** 2
+
+    def loop_vertices(self, loop_indexes):
+        """Indexes of vertices of given loops as flat array and sizes of the loops"""
+        sizes = self.loop_sizes[loop_indexes]
+        positions = np.repeat(self.loop_starts[loop_indexes], sizes) + _local_indexes(sizes)
+        return self.origin[self.loop_order[positions]], sizes
+
+    @property
+    def component(self):
+        """Index of connected component per half edge"""
+        if self._component is None:
+            self._component = connected_components(len(self.co), self.edges)[self.origin]
+        return self._component
+
+    def remove_edges(self, mask):
+        """Remove edges by mask and recalculate links"""
+        self.edges = self.edges[~mask]
+        self.origin = self.edges.ravel()
+        self.twin = np.arange(len(self.origin)) ^ 1
+        self.link()
+
+    def remove_dangling_edges(self):
+        """
+        Remove edges which have the same loop on both sides, such edges
+        do not bound any face (loose edges, bridges between a hole and its face)
+        """
+        while len(self.origin):
+            same = self.loop[0::2] == self.loop[1::2]
+            if not np.any(same):
+                break
+            self.remove_edges(same)
+
+    def loop_parents(self):
+        """
+        Find region containing every outer boundary of connected component.
+        :return: array with index of loop per loop, for loops with positive area the value is the loop itself,
+            for other loops it is index of the face containing the loop, -1 means unbounded face
+        """
+        parents = np.arange(self.n_loops)
+        outer = np.flatnonzero(self.loop_area <= 0)
+        if not len(outer):
+            return parents
+
+        # top most vertex of every outer boundary, upward ray is cast from it
+        exact = self.int_co is not None
+        xy = self.int_co if exact else self.co[:, :2]
+        hedges = np.flatnonzero(np.isin(self.loop, outer))
+        point_xy = xy[self.origin[hedges]]
+        order = np.lexsort((point_xy[:, 0], point_xy[:, 1], self.loop[hedges]))
+        hedges = hedges[order]
+        is_last = np.append(self.loop[hedges][1:] != self.loop[hedges][:-1], True)
+        top_hedges = hedges[is_last]
+        top_loops = self.loop[top_hedges]
+        ray_origin = xy[self.origin[top_hedges]]
+        ray_component = self.component[top_hedges]
+
+        # first edge of another component above the vertex
+        edge_start, edge_end = xy[self.edges[:, 0]], xy[self.edges[:, 1]]
+        edge_min, edge_max = np.minimum(edge_start, edge_end), np.maximum(edge_start, edge_end)
+        ray_min = ray_origin
+        ray_max = np.column_stack((ray_origin[:, 0], np.full(len(ray_origin), edge_max[:, 1].max())))
+        best_dist = np.full(len(top_hedges), np.inf)
+        best_edge = np.full(len(top_hedges), -1, dtype=np.int64)
+        boxes = [np.asarray(b, dtype=np.float64) for b in (edge_min, edge_max, ray_min, ray_max)]
+        for edge_idx, ray_idx in grid_box_pairs(*boxes):
+            p0, p1 = edge_start[edge_idx], edge_end[edge_idx]
+            x, y = ray_origin[ray_idx, 0], ray_origin[ray_idx, 1]
+            # half open interval, so a ray passing through a vertex crosses only one of its edges
+            good = (edge_min[edge_idx, 0] <= x) & (x < edge_max[edge_idx, 0])
+            good &= self.component[2 * edge_idx] != ray_component[ray_idx]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                y_hit = p0[:, 1] + (p1[:, 1] - p0[:, 1]) * (x - p0[:, 0]) / (p1[:, 0] - p0[:, 0])
+            if exact:
+                # the point is below the edge directed to +X
+                left = np.where((p0[:, 0] < p1[:, 0])[:, np.newaxis], p0, p1)
+                right = np.where((p0[:, 0] < p1[:, 0])[:, np.newaxis], p1, p0)
+                good &= orientation(left, right, ray_origin[ray_idx]) < 0
+            else:
+                good &= y_hit > y
+            dist = np.where(good, y_hit - y, np.inf)
+            order = np.lexsort((dist, ray_idx))
+            ray_idx, edge_idx, dist = ray_idx[order], edge_idx[order], dist[order]
+            is_first = np.insert(ray_idx[1:] != ray_idx[:-1], 0, True)
+            ray_idx, edge_idx, dist = ray_idx[is_first], edge_idx[is_first], dist[is_first]
+            better = dist < best_dist[ray_idx]
+            best_dist[ray_idx[better]] = dist[better]
+            best_edge[ray_idx[better]] = edge_idx[better]
+
+        # the region below an edge is on the left side of its half edge directed to -X
+        hit = best_edge >= 0
+        hit_edges = best_edge[hit]
+        goes_left = edge_end[hit_edges, 0] < edge_start[hit_edges, 0]
+        below_hedges = np.where(goes_left, 2 * hit_edges, 2 * hit_edges + 1)
+        parents[top_loops] = -1
+        parents[top_loops[hit]] = self.loop[below_hedges]
+
+        # the region can be outside of another component, then its parent should be taken
+        while True:
+            has_parent = parents >= 0
+            step = np.where(has_parent, parents, -1)
+            step[has_parent] = parents[parents[has_parent]]
+            step[self.loop_area > 0] = np.flatnonzero(self.loop_area > 0)
+            if np.array_equal(step, parents):
+                break
+            parents = step
+        return parents
+
+    def face_holes(self, parents=None):
+        """
+        :return: dictionary {face loop: list of loops of holes}
+        """
+        if parents is None:
+            parents = self.loop_parents()
+        holes = np.flatnonzero((self.loop_area <= 0) & (parents >= 0))
+        result = dict()
+        for hole, face in zip(holes.tolist(), parents[holes].tolist()):
+            result.setdefault(face, []).append(hole)
+        return result
+
+    def nesting_depth(self, parents=None):
+        """
+        Nesting depth per loop. Faces of components which are not inside any face have depth 0,
+        faces of components inside faces with depth 0 have depth 1 and so on.
+        """
+        if parents is None:
+            parents = self.loop_parents()
+        n_components = self.component.max() + 1 if len(self.component) else 0
+        loop_component = np.zeros(self.n_loops, dtype=np.int64)
+        loop_component[self.loop] = self.component
+        component_parent = np.full(n_components, -1, dtype=np.int64)
+        outer = np.flatnonzero(self.loop_area <= 0)
+        has_parent = parents[outer] >= 0
+        component_parent[loop_component[outer[has_parent]]] = loop_component[parents[outer[has_parent]]]
+
+        # list ranking along chains of parent components
+        depth = (component_parent >= 0).astype(np.int64)
+        succ = np.where(component_parent >= 0, component_parent, np.arange(n_components))
+        while True:
+            succ_succ = succ[succ]
+            if np.array_equal(succ_succ, succ):
+                break
+            depth += depth[succ]
+            succ = succ_succ
+        return depth[loop_component]
+
+    def interior_points(self, loops, accuracy):
+        """
+        Points lying inside of given face loops close to the middle of longest edge of each loop
+        """
+        xy = self.co[:, :2]
+        direction = xy[self.dest] - xy[self.origin]
+        length = np.linalg.norm(direction, axis=1)
+        order = np.lexsort((length, self.loop))
+        last = self.loop_starts + self.loop_sizes - 1
+        longest = order[last[loops]]
+        length = length[longest]
+        normal = np.column_stack((-direction[longest, 1], direction[longest, 0])) / length[:, np.newaxis]
+        offset = np.minimum(accuracy, 0.5 * self.loop_area[loops] / length)
+        middle = (xy[self.origin[longest]] + xy[self.dest[longest]]) / 2
+        return middle + normal * offset[:, np.newaxis]
+
+
+def _local_indexes(sizes):
+    """[0, 1, .., size0 - 1, 0, 1, .., size1 - 1, ...]"""
+    return np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+
+def connected_components(n_verts, edges):
+    """Label of connected component per vertex, labels are in range(number of components)"""
+    label = np.arange(n_verts)
+    while len(edges):
+        # hooking of trees to trees with lower labels and pointer jumping to the roots
+        a, b = label[edges[:, 0]], label[edges[:, 1]]
+        if np.array_equal(a, b):
+            break
+        low = np.minimum(a, b)
+        np.minimum.at(label, a, low)
+        np.minimum.at(label, b, low)
+        while True:
+            root = label[label]
+            if np.array_equal(root, label):
+                break
+            label = root
+    return np.unique(label, return_inverse=True)[1].ravel()
+
+
+def grid_box_pairs(a_min, a_max, b_min, b_max, chunk_size=CHUNK_SIZE):
+    """
+    Uniform grid search of overlapping 2D boxes from two sets.
+    Yields chunks (a indexes, b indexes), every pair is yielded only once.
+    Size of grid cells is taken from boxes of the first set.
+    """
+    n_a = len(a_min)
+    if not n_a or not len(b_min):
+        return
+    box_min = np.concatenate((a_min, b_min))
+    box_max = np.concatenate((a_max, b_max))
+    origin = box_min.min(axis=0)
+    extent = box_max.max(axis=0) - origin
+    cell_size = max((a_max - a_min).max(axis=1).mean(), extent.max() / np.sqrt(n_a))
+    if cell_size <= 0:
+        cell_size = 1.0
+    n_cells = np.floor(extent / cell_size).astype(np.int64) + 1
+    cell_min = np.floor((box_min - origin) / cell_size).astype(np.int64)
+    cell_max = np.floor((box_max - origin) / cell_size).astype(np.int64)
+    spans = cell_max - cell_min + 1
+    per_box = spans[:, 0] * spans[:, 1]
+
+    box_ids = np.repeat(np.arange(len(box_min)), per_box)
+    local = _local_indexes(per_box)
+    cell_x = cell_min[box_ids, 0] + local % spans[box_ids, 0]
+    cell_y = cell_min[box_ids, 1] + local // spans[box_ids, 0]
+    cell_ids = cell_x * n_cells[1] + cell_y
+    del local, cell_x, cell_y
+    is_b = box_ids >= n_a
+    order = np.lexsort((is_b, cell_ids))
+    cell_ids, box_ids, is_b = cell_ids[order], box_ids[order], is_b[order]
+    del order
+
+    cells, group_starts, group_sizes = np.unique(cell_ids, return_index=True, return_counts=True)
+    b_sizes = np.add.reduceat(is_b.astype(np.int64), group_starts) if len(cells) else group_sizes
+    a_sizes = group_sizes - b_sizes
+    pair_counts = a_sizes * b_sizes
+    keep = pair_counts > 0
+    cells, group_starts, a_sizes, b_sizes, pair_counts = \
+        cells[keep], group_starts[keep], a_sizes[keep], b_sizes[keep], pair_counts[keep]
+
+    start = 0
+    cumulative = np.cumsum(pair_counts)
+    while start < len(cells):
+        done = cumulative[start - 1] if start else 0
+        end = max(np.searchsorted(cumulative, done + chunk_size, side='right'), start + 1)
+        counts = pair_counts[start:end]
+        local = _local_indexes(counts)
+        b_size = np.repeat(b_sizes[start:end], counts)
+        group_start = np.repeat(group_starts[start:end], counts)
+        first = group_start + local // b_size
+        second = group_start + np.repeat(a_sizes[start:end], counts) + local % b_size
+        i, j = box_ids[first], box_ids[second]
+        pair_cells = cell_ids[first]
+        overlap_min = np.maximum(box_min[i], box_min[j])
+        good = np.all(overlap_min <= np.minimum(box_max[i], box_max[j]), axis=1)
+        # a pair is reported only in the cell containing minimal corner of the boxes overlap
+        ref_cell = np.floor((overlap_min - origin) / cell_size).astype(np.int64)
+        ref_cell = np.minimum(np.maximum(ref_cell, cell_min[i]), cell_max[i])
+        good &= (ref_cell[:, 0] * n_cells[1] + ref_cell[:, 1]) == pair_cells
+        yield i[good], j[good] - n_a
+        start = end
+
+
+def polygons_containing_points(points, co, flat, sizes, chunk_size=CHUNK_SIZE):
+    """
+    Crossing number test of points against polygons.
+    :param points: array of shape (k, 2)
+    :param co: array of polygon vertices, only X and Y are used
+    :param flat, sizes: polygons as flat array of indexes and array of number of sides per polygon
+    :return: two arrays (point index, polygon index) of all pairs where the point is inside the polygon
+    """
+    out_points, out_polys = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    if not len(sizes) or not len(points):
+        return out_points[0], out_polys[0]
+    starts = np.cumsum(sizes) - sizes
+    xy = np.asarray(co, dtype=np.float64)[:, :2]
+    edges = polygons_edges(flat, sizes)
+    edge_start, edge_end = xy[edges[:, 0]], xy[edges[:, 1]]
+
+    poly_ids = np.repeat(np.arange(len(sizes)), sizes)
+    poly_min = np.full((len(sizes), 2), np.inf)
+    poly_max = np.full((len(sizes), 2), -np.inf)
+    np.minimum.at(poly_min, poly_ids, edge_start)
+    np.maximum.at(poly_max, poly_ids, edge_start)
+
+    pairs_chunk = max(chunk_size // max(int(sizes.mean()), 1), 1)
+    for poly_idx, point_idx in grid_box_pairs(poly_min, poly_max, points, points, pairs_chunk):
+        n_edges = sizes[poly_idx]
+        pair_idx = np.repeat(np.arange(len(poly_idx)), n_edges)
+        edge_idx = np.repeat(starts[poly_idx], n_edges) + _local_indexes(n_edges)
+        p0, p1 = edge_start[edge_idx], edge_end[edge_idx]
+        x, y = points[point_idx[pair_idx], 0], points[point_idx[pair_idx], 1]
+        crosses = (p0[:, 1] > y) != (p1[:, 1] > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_hit = p0[:, 0] + (p1[:, 0] - p0[:, 0]) * (y - p0[:, 1]) / (p1[:, 1] - p0[:, 1])
+        crosses &= x < x_hit
+        inside = np.bincount(pair_idx, weights=crosses, minlength=len(poly_idx)) % 2 == 1
+        out_points.append(point_idx[inside])
+        out_polys.append(poly_idx[inside])
+    return np.concatenate(out_points), np.concatenate(out_polys)
+
+
+def polygons_to_flat(faces):
+    """Sverchok faces as flat array of indexes and array of number of sides per face"""
+    sizes = np.fromiter((len(f) for f in faces), dtype=np.int64, count=len(faces))
+    flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=sizes.sum())
+    return flat, sizes
+
+
+def polygons_edges(flat, sizes):
+    """Edges of loops of polygons as array"""
+    starts = np.cumsum(sizes) - sizes
+    flat_next = np.arange(len(flat)) + 1
+    flat_next[starts + sizes - 1] = starts
+    return np.column_stack((flat, flat[flat_next]))
+
+
+def merge_points(co, accuracy):
+    """
+    Merge points with equal (up to accuracy) X and Y coordinates
+    :return: indexes of kept points, index of kept point per input point
+    """
+    return unique_rows(np.round(co[:, :2] / accuracy).astype(np.int64))
+
+
+def clean_edges(edges):
+    """Remove zero length edges and duplicated edges"""
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    return np.unique(np.sort(edges, axis=1), axis=0)
+
+
+def planar_graph(co, edges, accuracy, do_intersect=True, robust=False):
+    """
+    Merge coinciding points, remove duplicated edges and optionally split edges in intersection points
+    :param robust: snap points to integer grid and use exact predicates
+    :return: ArrayDCEL, index of its vertex per input vertex
+    """
+    co = np.asarray(co, dtype=np.float64)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if not len(co):
+        return ArrayDCEL(co, edges), np.empty(0, dtype=np.int64)
+    if robust:
+        return _robust_planar_graph(co, edges, accuracy, do_intersect)
+    first, vert_map = merge_points(co, accuracy)
+    co, edges = co[first], clean_edges(vert_map[edges])
+    if do_intersect and len(edges) > 1:
+        co, edges = intersect_edges_grid_np(co, edges, accuracy, chunk_size=CHUNK_SIZE, split_overlapping=True)
+        first, new_map = merge_points(co, accuracy)
+        co, edges, vert_map = co[first], clean_edges(new_map[edges]), new_map[vert_map]
+    return ArrayDCEL(co, edges), vert_map
+
+
+def _robust_planar_graph(co, edges, accuracy, do_intersect):
+    int_co, origin, step = snap_to_grid(co, accuracy)
+    first, vert_map = unique_rows(int_co)
+    int_co = int_co[first]
+    z = co[first, 2] if co.shape[1] > 2 else np.zeros(len(first))
+    edges = clean_edges(vert_map[edges])
+    if do_intersect and len(edges) > 1:
+        int_co, z, edges = snap_round_graph(int_co, z, edges, CHUNK_SIZE)
+    new_co = np.column_stack((from_grid(int_co, origin, step), z))
+    return ArrayDCEL(new_co, edges, int_co, step), vert_map
+
+
+def build_faces(dcel, face_loops, accuracy, holes=None):
+    """
+    Convert face loops into Sverchok faces. Faces with holes are split into monotone pieces.
+    :param face_loops: array of indexes of loops with positive area
+    :param holes: dictionary {face loop: list of loops of holes}
+    :return: Sverchok faces, index of loop per output face
+    """
+    flat, sizes = dcel.loop_vertices(face_loops)
+    flat = flat.tolist()
+    ends = np.cumsum(sizes).tolist()
+    faces = [flat[end - size: end] for end, size in zip(ends, sizes.tolist())]
+    if not holes:
+        return faces, face_loops
+
+    out_faces, out_loops = [], []
+    co = dcel.co.tolist()
+    for face, loop in zip(faces, face_loops.tolist()):
+        if loop not in holes:
+            out_faces.append(face)
+            out_loops.append(loop)
+            continue
+        hole_verts, hole_faces = [], []
+        for hole in holes[loop]:
+            hole_indexes = dcel.loop_vertices([hole])[0].tolist()
+            hole_faces.append(list(range(len(hole_verts), len(hole_verts) + len(hole_indexes)))[::-1])
+            hole_verts.extend(hole_indexes)
+        index_by_co = {tuple(co[i]): i for i in chain(face, hole_verts)}
+        sv_verts, sv_faces = monotone_sv_face_with_holes([co[i] for i in face], [co[i] for i in hole_verts],
+                                                         hole_faces, accuracy)
+        piece_indexes = [index_by_co[tuple(v)] for v in sv_verts]
+        for piece in sv_faces:
+            out_faces.append([piece_indexes[i] for i in piece])
+            out_loops.append(loop)
+    return out_faces, np.array(out_loops, dtype=np.int64)
+
+
+def compact_mesh(co, faces):
+    """Remove vertices which are not used by faces"""
+    sizes = [len(f) for f in faces]
+    flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=sum(sizes))
+    used, flat = np.unique(flat, return_inverse=True)
+    flat = flat.ravel().tolist()
+    ends = np.cumsum(sizes).tolist()
+    return co[used].tolist(), [flat[end - size: end] for end, size in zip(ends, sizes)]
+
+
+def _face_loops(dcel, accuracy):
+    """Loops of faces with not degenerated area"""
+    if dcel.int_co is not None:
+        return np.flatnonzero(dcel.loop_area > 0)
+    return np.flatnonzero(dcel.loop_area > accuracy ** 2)
+
+
+def _overlay(meshes, accuracy, robust=False):
+    """
+    Build planar graph of all faces of given meshes.
+    :param meshes: list of (verts, faces)
+    :return: ArrayDCEL, face loops, list of input faces per mesh as (flat, sizes) with indexes of graph vertices
+    """
+    verts, polygons = [], []
+    shift = 0
+    for sv_verts, sv_faces in meshes:
+        verts.append(np.asarray(sv_verts, dtype=np.float64).reshape(-1, 3))
+        flat, sizes = polygons_to_flat(sv_faces)
+        polygons.append((flat + shift, sizes))
+        shift += len(verts[-1])
+    edges = np.concatenate([polygons_edges(flat, sizes) for flat, sizes in polygons])
+    dcel, vert_map = planar_graph(np.concatenate(verts), edges, accuracy, robust=robust)
+    dcel.remove_dangling_edges()
+    polygons = [(vert_map[flat], sizes) for flat, sizes in polygons]
+    return dcel, _face_loops(dcel, accuracy), polygons
+
+
+def _containing_faces(dcel, face_loops, polygons, accuracy):
+    """Indexes of output face and input face for each output face lying inside of the input face"""
+    points = dcel.interior_points(face_loops, accuracy)
+    return polygons_containing_points(points, dcel.co, *polygons)
+
+
+def _min_index(n, out_idx, in_idx):
+    result = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(result, out_idx, in_idx)
+    result[result == np.iinfo(np.int64).max] = -1
+    return result
+
+
+# #############################################################################
+# ############________drop-in versions of merge_mesh.py_________##############
+# #############################################################################
+
+
+def edges_to_faces(sv_verts, sv_edges, do_intersect=True, fill_holes=True, accuracy=1e-5, robust=False):
+    """
+    Fill faces of Sverchok mesh determined by edges, the same as merge_mesh.edges_to_faces
+    :param sv_verts: list of SV points
+    :param sv_edges: list of SV edges
+    :param do_intersect: if True self intersections will be taken in account
+    :param fill_holes: if False can produce holes in case if
+     there are such faces incise another face without intersections with one
+    :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
+    :param robust: snap points to grid with step equal to accuracy and use exact predicates
+    :return: list of SV points, list of SV faces
+    """
+    accuracy = get_accuracy(accuracy)
+    dcel, _ = planar_graph(sv_verts, sv_edges, accuracy, do_intersect, robust)
+    dcel.remove_dangling_edges()
+    face_loops = _face_loops(dcel, accuracy)
+    parents = dcel.loop_parents()
+    if not fill_holes:
+        face_loops = face_loops[dcel.nesting_depth(parents)[face_loops] % 2 == 0]
+    faces, _ = build_faces(dcel, face_loops, accuracy, dcel.face_holes(parents))
+    if not faces:
+        return [], []
+    return compact_mesh(dcel.co, faces)
+
+
+def merge_mesh_light(sv_verts, sv_faces, face_overlapping=False, is_overlap_number=False, accuracy=1e-5,
+                     robust=False):
+    """
+    Rebuild faces and vertices with taking in account intersections and holes,
+    the same as merge_mesh.merge_mesh_light
+    :param sv_verts: list of SV points
+    :param sv_faces: list of SV faces
+    :param face_overlapping: add index mask (new face : index old face) to the output of the function if True
+    :param is_overlap_number: returns information about number of overlapping face by another faces
+    :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
+    :param robust: snap points to grid with step equal to accuracy and use exact predicates
+    :return: list of SV vertices, list of SV faces, index face mask (optionally), list of overlap_number (optionally)
+    """
+    accuracy = get_accuracy(accuracy)
+    dcel, face_loops, (faces_in,) = _overlay([(sv_verts, sv_faces)], accuracy, robust)
+    out_idx, in_idx = _containing_faces(dcel, face_loops, faces_in, accuracy)
+    number = np.bincount(out_idx, minlength=len(face_loops))
+    min_index = _min_index(len(face_loops), out_idx, in_idx)
+    keep = number > 0
+    loop_index = np.full(dcel.n_loops, -1, dtype=np.int64)
+    loop_index[face_loops[keep]] = np.arange(np.count_nonzero(keep))
+    faces, loops = build_faces(dcel, face_loops[keep], accuracy, dcel.face_holes())
+    if not faces:
+        return [[], [], [], []]
+    verts, faces = compact_mesh(dcel.co, faces)
+    loops = loop_index[loops]
+    face_indexes = [min_index[keep][loops].tolist()] if face_overlapping else [[]]
+    overlap_number = [(number[keep][loops] - 1).tolist()] if is_overlap_number else [[]]
+    return [verts, faces] + face_indexes + overlap_number
+
+
+def crop_mesh(sv_verts, sv_faces, sv_verts_crop, sv_faces_crop, mode='inner', accuracy=1e-5, robust=False):
+    """
+    Crop mesh by polygons of another mesh, the same as merge_mesh.crop_mesh
+    :param sv_verts: list of SV points
+    :param sv_faces: list of SV faces
+    :param sv_verts_crop: list of SV points
+    :param sv_faces_crop: list of SV faces
+    :param mode: inner or outer, switch between holes creation and feting into mesh
+    :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
+    :param robust: snap points to grid with step equal to accuracy and use exact predicates
+    :return: list of SV vertices, list of SV faces, index face mask
+    """
+    accuracy = get_accuracy(accuracy)
+    dcel, face_loops, (faces_base, faces_crop) = _overlay([(sv_verts, sv_faces), (sv_verts_crop, sv_faces_crop)],
+                                                          accuracy, robust)
+    out_base, in_base = _containing_faces(dcel, face_loops, faces_base, accuracy)
+    out_crop, _ = _containing_faces(dcel, face_loops, faces_crop, accuracy)
+    inside_base = np.bincount(out_base, minlength=len(face_loops)) > 0
+    inside_crop = np.bincount(out_crop, minlength=len(face_loops)) > 0
+    keep = inside_base & inside_crop if mode == 'inner' else inside_base & ~inside_crop
+    min_index = _min_index(len(face_loops), out_base, in_base)[keep]
+    loop_index = np.full(dcel.n_loops, -1, dtype=np.int64)
+    loop_index[face_loops[keep]] = np.arange(np.count_nonzero(keep))
+    faces, loops = build_faces(dcel, face_loops[keep], accuracy, dcel.face_holes())
+    if not faces:
+        return [[], [], []]
+    verts, faces = compact_mesh(dcel.co, faces)
+    return [verts, faces, min_index[loop_index[loops]].tolist()]
+
+
+def merge_mesh(sv_verts_a, sv_faces_a, sv_verts_b, sv_faces_b, is_mask=True, is_index=False, accuracy=1e-6,
+               robust=False):
+    """
+    Merge two Sverchok mesh objects into one mesh with finding intersections,
+    the same as merge_mesh.merge_mesh
+    :param sv_verts_a: list of SV points
+    :param sv_faces_a: list of SV faces
+    :param sv_verts_b: list of SV points
+    :param sv_faces_b: list of SV faces
+    :param is_mask: add masks of faces which are inside of mesh A and mesh B to the output
+    :param is_index: add minimal indexes of faces of mesh A and mesh B (-1 if outside) to the output
+    :param accuracy: two floats figures are equal if their difference is lower then accuracy value, float
+    :param robust: snap points to grid with step equal to accuracy and use exact predicates
+    :return: vertices in SV format, face in SV format, optionally masks and indexes
+    """
+    accuracy = get_accuracy(accuracy)
+    dcel, face_loops, (faces_a, faces_b) = _overlay([(sv_verts_a, sv_faces_a), (sv_verts_b, sv_faces_b)], accuracy,
+                                                    robust)
+    out_a, in_a = _containing_faces(dcel, face_loops, faces_a, accuracy)
+    out_b, in_b = _containing_faces(dcel, face_loops, faces_b, accuracy)
+    inside_a = np.bincount(out_a, minlength=len(face_loops)) > 0
+    inside_b = np.bincount(out_b, minlength=len(face_loops)) > 0
+    keep = inside_a | inside_b
+    loop_index = np.full(dcel.n_loops, -1, dtype=np.int64)
+    loop_index[face_loops[keep]] = np.arange(np.count_nonzero(keep))
+    faces, loops = build_faces(dcel, face_loops[keep], accuracy, dcel.face_holes())
+    masks, indexes = [], []
+    if faces:
+        verts, faces = compact_mesh(dcel.co, faces)
+        loops = loop_index[loops]
+        masks = [inside_a[keep][loops].astype(int).tolist(), inside_b[keep][loops].astype(int).tolist()]
+        indexes = [_min_index(len(face_loops), out_a, in_a)[keep][loops].tolist(),
+                   _min_index(len(face_loops), out_b, in_b)[keep][loops].tolist()]
+    else:
+        verts = []
+        masks, indexes = [[], []], [[], []]
+    return [verts, faces] + (masks if is_mask else []) + (indexes if is_index else [])
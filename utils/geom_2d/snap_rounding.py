@@ -0,0 +1,223 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Exact predicates on integer grid for robust mode of array_dcel.py.
+
+Coordinates are snapped to integer grid with step equal to accuracy. All decisions about
+topology (orientation of three points, position of a point on a segment, crossing of two segments)
+are made exactly with int64 arithmetic, so the result does not depend on float epsilon.
+Coordinates of crossing points are rational numbers, they are calculated exactly with Python integers
+and rounded to the nearest grid node. Every edge passing through a pixel (unit square) around a vertex
+is routed through the vertex, so almost coinciding edges are merged and no slivers appear.
+Rounding can create new crossings, so splitting is repeated until nothing changes (snap rounding).
+"""
+
+from functools import cmp_to_key
+
+import numpy as np
+
+from sverchok.utils.intersect_edges import grid_candidate_pairs
+
+# maximum number of grid steps along one axis, so cross products of doubled coordinates fit into int64
+MAX_GRID_SIZE = 2 ** 28
+MAX_PASSES = 16
+
+
+def unique_rows(keys):
+    """
+    Like np.unique(keys, axis=0) but keeps order of first appearance
+    :return: indexes of first appearance of unique rows, index of unique row per input row
+    """
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    new_index = np.empty(len(first), dtype=np.int64)
+    new_index[order] = np.arange(len(first))
+    return first[order], new_index[inverse.ravel()]
+
+
+def snap_to_grid(co, accuracy):
+    """
+    :param co: float array of shape (n, 2) or (n, 3)
+    :return: integer coordinates (n, 2), grid origin in grid steps, grid step
+    If the points do not fit into the grid with step equal to accuracy the step is increased.
+    """
+    xy = co[:, :2]
+    step = accuracy
+    low, high = xy.min(axis=0), xy.max(axis=0)
+    if (high - low).max() / step > MAX_GRID_SIZE:
+        step = (high - low).max() / MAX_GRID_SIZE
+    origin = np.floor(low / step).astype(np.int64)
+    return np.round(xy / step).astype(np.int64) - origin, origin, step
+
+
+def from_grid(int_co, origin, step):
+    """Float coordinates of grid nodes, inverse of snap_to_grid"""
+    # dividing by 10 ** n gives exact decimal numbers, multiplying by 10 ** -n does not
+    scale = 1 / step
+    if abs(scale - round(scale)) < 1e-9 * scale:
+        scale = round(scale)
+    return (int_co + origin) / scale
+
+
+def orientation(a, b, c):
+    """Exact doubled signed area of triangles abc, arrays of integer points (k, 2)"""
+    return (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+
+
+def _round_div(numerator, denominator):
+    # rounding of numerator / denominator to nearest integer, object arrays of Python integers
+    negative = denominator < 0
+    numerator = np.where(negative, -numerator, numerator)
+    denominator = np.where(negative, -denominator, denominator)
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def passes_pixel(start, end, points):
+    """
+    Exact test whether segments cross interior of unit squares (pixels) with centers in given points
+    """
+    # doubled coordinates, so corners of pixels are integers
+    start, end, center = 2 * start, 2 * end, 2 * points
+    low, high = np.minimum(start, end), np.maximum(start, end)
+    result = np.all((low < center + 1) & (high > center - 1), axis=1)
+    positive = np.zeros(len(start), dtype=bool)
+    negative = np.zeros(len(start), dtype=bool)
+    for corner in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        side = orientation(start, end, center + np.array(corner))
+        positive |= side > 0
+        negative |= side < 0
+    return result & positive & negative
+
+
+def _split_pass(int_co, z, edges, chunk_size):
+    """
+    Split edges in crossing points, which are rounded to the grid,
+    and in vertices which pixels the edges pass through (hot pixels)
+    :return: integer points, z coordinates, edges, number of found splits
+    """
+    start, end = int_co[edges[:, 0]], int_co[edges[:, 1]]
+    n_edges = len(edges)
+    box_min = np.concatenate((np.minimum(start, end), int_co - 0.5)).astype(np.float64)
+    box_max = np.concatenate((np.maximum(start, end), int_co + 0.5)).astype(np.float64)
+    split_edges, split_verts = [], []
+    new_points, new_z = [], []
+    n_points = len(int_co)
+
+    for i, j in grid_candidate_pairs(box_min, box_max, chunk_size=chunk_size):
+        # edges passing through pixels of vertices
+        with_pixel = (i < n_edges) & (j >= n_edges)
+        edge, vert = i[with_pixel], j[with_pixel] - n_edges
+        own = (edges[edge, 0] == vert) | (edges[edge, 1] == vert)
+        edge, vert = edge[~own], vert[~own]
+        passes = passes_pixel(start[edge], end[edge], int_co[vert])
+        split_edges.append(edge[passes])
+        split_verts.append(vert[passes])
+
+        # proper crossings of edges
+        both_edges = j < n_edges
+        i, j = i[both_edges], j[both_edges]
+        a0, a1, b0, b1 = start[i], end[i], start[j], end[j]
+        o1 = np.sign(orientation(a0, a1, b0))
+        o2 = np.sign(orientation(a0, a1, b1))
+        o3 = np.sign(orientation(b0, b1, a0))
+        o4 = np.sign(orientation(b0, b1, a1))
+        cross = (o1 * o2 < 0) & (o3 * o4 < 0)
+        if not np.any(cross):
+            continue
+        i, j = i[cross], j[cross]
+        a0, a1, b0, b1 = a0[cross], a1[cross], b0[cross], b1[cross]
+        numerator = orientation(b0, b1, a0)
+        denominator = numerator - orientation(b0, b1, a1)
+        # p = a0 + (a1 - a0) * numerator / denominator, calculated exactly and rounded to the grid
+        num, den = numerator.astype(object), denominator.astype(object)
+        points = np.empty((len(i), 2), dtype=np.int64)
+        for axis in (0, 1):
+            value = a0[:, axis].astype(object) * den + (a1 - a0)[:, axis].astype(object) * num
+            points[:, axis] = _round_div(value, den).astype(np.int64)
+        param = numerator / denominator
+        za, zb = z[edges[i, 0]], z[edges[i, 1]]
+        ids = n_points + sum(len(p) for p in new_points) + np.arange(len(i))
+        new_points.append(points)
+        new_z.append(za + (zb - za) * param)
+        split_edges.extend([i, j])
+        split_verts.extend([ids, ids])
+
+    n_splits = sum(len(e) for e in split_edges)
+    if not n_splits:
+        return int_co, z, edges, 0
+
+    int_co = np.concatenate([int_co] + new_points)
+    z = np.concatenate([z] + new_z)
+    first, vert_map = unique_rows(int_co)
+    int_co, z = int_co[first], z[first]
+
+    # nodes of every edge sorted along the edge
+    node_edges = np.concatenate([np.arange(n_edges), np.arange(n_edges)] + split_edges)
+    node_verts = vert_map[np.concatenate([edges[:, 0], edges[:, 1]] + split_verts)]
+    direction = end[node_edges] - start[node_edges]
+    node_params = ((int_co[node_verts] - start[node_edges]) * direction).sum(axis=1)
+    order = np.lexsort((node_params, node_edges))
+    node_edges, node_verts = node_edges[order], node_verts[order]
+    same_edge = node_edges[1:] == node_edges[:-1]
+    new_edges = np.stack((node_verts[:-1][same_edge], node_verts[1:][same_edge]), axis=-1)
+    new_edges = new_edges[new_edges[:, 0] != new_edges[:, 1]]
+    new_edges = np.unique(np.sort(new_edges, axis=1), axis=0)
+    return int_co, z, new_edges, n_splits
+
+
+def snap_round_graph(int_co, z, edges, chunk_size=1000000):
+    """
+    Split edges in intersection points, which are rounded to the grid, until there are no intersections.
+    Vertices of input are kept at the beginning of output vertices with the same indexes.
+    :param int_co: integer coordinates (n, 2) without duplicates
+    :param z: Z coordinates of the points, new points get interpolated values
+    :param edges: edges without duplicates and zero length edges
+    :return: integer points, z, edges
+    """
+    for _ in range(MAX_PASSES):
+        int_co, z, edges, n_splits = _split_pass(int_co, z, edges, chunk_size)
+        if not n_splits:
+            break
+    return int_co, z, edges
+
+
+def _compare_directions(a, b):
+    # the same order as arctan2 gives: angles in (-pi, pi]
+    def half(d):
+        if d[1] < 0:
+            return 0
+        if d[1] > 0 or d[0] > 0:
+            return 1
+        return 2
+    half_a, half_b = half(a), half(b)
+    if half_a != half_b:
+        return half_a - half_b
+    cross = a[0] * b[1] - a[1] * b[0]
+    return -1 if cross > 0 else (1 if cross < 0 else 0)
+
+
+def exact_angular_order(order, origin, angle, directions):
+    """
+    Fix order of half edges sorted around vertices by float angles,
+    groups of half edges with almost equal angles are sorted exactly by integer directions
+    :param order: result of np.lexsort((angle, origin))
+    :param directions: integer direction of every half edge
+    """
+    sorted_origin = origin[order]
+    sorted_angle = angle[order]
+    close = (sorted_origin[1:] == sorted_origin[:-1]) & (np.diff(sorted_angle) < 1e-9)
+    if not np.any(close):
+        return order
+    order = order.copy()
+    for vertex in np.unique(sorted_origin[1:][close]):
+        start, stop = np.searchsorted(sorted_origin, [vertex, vertex + 1])
+        hedges = order[start:stop].tolist()
+        hedges.sort(key=cmp_to_key(lambda h1, h2: _compare_directions(directions[h1].tolist(),
+                                                                     directions[h2].tolist())))
+        order[start:stop] = hedges
+    return order
@@ -564,3 +564,229 @@ def remove_doubles_from_edgenet(verts_in, edges_in, distance):
     edges_out = [[j.index for j in i.verts] for i in bm.edges]
 
     return verts_out, edges_out
+
+
+def _group_pairs(group_starts, group_sizes):
+    '''All pairs (a, b), a < b, of positions inside each group of a sorted array'''
+    sizes = np.repeat(group_sizes, group_sizes)
+    local = np.arange(len(sizes)) - np.repeat(np.cumsum(group_sizes) - group_sizes, group_sizes)
+    positions = np.repeat(group_starts, group_sizes) + local
+    counts = sizes - local - 1
+    first = np.repeat(positions, counts)
+    second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return first, second
+
+def grid_candidate_pairs(box_min, box_max, cell_size=None, chunk_size=1000000):
+    '''
+    Uniform grid broad phase. Yields chunks (i, j) of indices of boxes
+    with overlapping bounding boxes, every pair is yielded only once.
+    Each chunk has roughly chunk_size pairs or less.
+    :param box_min, box_max: arrays of shape (n, dimensions)
+    '''
+    n, dims = box_min.shape
+    if n < 2:
+        return
+    origin = box_min.min(axis=0)
+    extent = box_max.max(axis=0) - origin
+    if cell_size is None:
+        mean_size = (box_max - box_min).max(axis=1).mean()
+        cell_size = max(mean_size, extent.max() / n ** (1 / dims))
+    if cell_size <= 0:
+        cell_size = 1.0
+    n_cells = np.floor(extent / cell_size).astype(np.int64) + 1
+    cell_min = np.floor((box_min - origin) / cell_size).astype(np.int64)
+    cell_max = np.floor((box_max - origin) / cell_size).astype(np.int64)
+    spans = cell_max - cell_min + 1
+    per_box = np.prod(spans, axis=1)
+
+    # (cell id, box id) for all cells covered by bounding box of each box
+    box_ids = np.repeat(np.arange(n), per_box)
+    local = np.arange(len(box_ids)) - np.repeat(np.cumsum(per_box) - per_box, per_box)
+    cell_ids = np.zeros(len(box_ids), dtype=np.int64)
+    for d in range(dims):
+        span = spans[box_ids, d]
+        cell_ids = cell_ids * n_cells[d] + cell_min[box_ids, d] + local % span
+        local //= span
+    order = np.argsort(cell_ids, kind='stable')
+    cell_ids = cell_ids[order]
+    box_ids = box_ids[order]
+    del order, local
+
+    cells, group_starts, group_sizes = np.unique(cell_ids, return_index=True, return_counts=True)
+    pair_counts = group_sizes * (group_sizes - 1) // 2
+    keep = pair_counts > 0
+    cells, group_starts, group_sizes, pair_counts = cells[keep], group_starts[keep], group_sizes[keep], pair_counts[keep]
+
+    strides = np.ones(dims, dtype=np.int64)
+    for d in range(dims - 2, -1, -1):
+        strides[d] = strides[d + 1] * n_cells[d + 1]
+
+    start = 0
+    cumulative = np.cumsum(pair_counts)
+    while start < len(cells):
+        done = cumulative[start - 1] if start else 0
+        end = max(np.searchsorted(cumulative, done + chunk_size, side='right'), start + 1)
+        first, second = _group_pairs(group_starts[start:end], group_sizes[start:end])
+        i = box_ids[first]
+        j = box_ids[second]
+        pair_cells = cell_ids[first]
+        # exact bounding boxes test
+        overlap_min = np.maximum(box_min[i], box_min[j])
+        good = np.all(overlap_min <= np.minimum(box_max[i], box_max[j]), axis=1)
+        # a pair is reported only in the cell containing minimal corner of the boxes overlap
+        ref_cell = np.floor((overlap_min - origin) / cell_size).astype(np.int64)
+        ref_cell = np.minimum(np.maximum(ref_cell, cell_min[i]), cell_max[i])
+        good &= (ref_cell @ strides) == pair_cells
+        i, j = i[good], j[good]
+        swap = i > j
+        i[swap], j[swap] = j[swap], i[swap]
+        yield i, j
+        start = end
+
+def _segments_closest_params(p0, a, q0, b):
+    '''Parameters of closest points of segments p0 + s*a and q0 + t*b'''
+    w = p0 - q0
+    aa = np_dot(a, a)
+    ab = np_dot(a, b)
+    bb = np_dot(b, b)
+    aw = np_dot(a, w)
+    bw = np_dot(b, w)
+    denom = aa * bb - ab * ab
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = (ab * bw - bb * aw) / denom
+        t = (aa * bw - ab * aw) / denom
+    return s, t, denom
+
+def intersect_edges_grid(verts, edges, epsilon, only_touching=True, dimensions=2, chunk_size=1000000):
+    '''
+    Intersect edges of edge net using uniform grid broad phase and vectorized
+    exact tests on batches of candidate pairs. Memory is bounded by the chunk size
+    and by the size of the output.
+    Edges are split at intersection points, intersections lying at an end of
+    an edge are snapped to existing vertex, coinciding intersection points are merged.
+    :param dimensions: 2 - intersection in XY plane, 3 - in 3D space
+    :return: verts, edges as lists
+    '''
+    np_verts, np_edges = intersect_edges_grid_np(verts, edges, epsilon, only_touching, dimensions, chunk_size)
+    return np_verts.tolist(), np_edges.tolist()
+
+def intersect_edges_grid_np(verts, edges, epsilon, only_touching=True, dimensions=2, chunk_size=1000000,
+                            split_overlapping=False):
+    '''
+    The same as intersect_edges_grid but takes and returns NumPy arrays.
+    :param split_overlapping: if True, collinear overlapping edges are split
+        at end points of each other, so the result is a proper planar graph
+    :return: verts, edges as arrays
+    '''
+    np_verts = np.asarray(verts, dtype=np.float64)
+    np_edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    n_verts = len(np_verts)
+    if len(np_edges) < 2:
+        return np_verts, np_edges
+
+    co = np_verts[:, :dimensions]
+    v1, v2 = co[np_edges[:, 0]], co[np_edges[:, 1]]
+    lengths = np.linalg.norm(v2 - v1, axis=1)
+    box_min = np.minimum(v1, v2) - epsilon
+    box_max = np.maximum(v1, v2) + epsilon
+
+    hit_edges_a, hit_edges_b, hit_s, hit_t = [], [], [], []
+    split_edges, split_params, split_verts = [], [], []
+    for i, j in grid_candidate_pairs(box_min, box_max, chunk_size=chunk_size):
+        ei, ej = np_edges[i], np_edges[j]
+        share = ((ei[:, 0] == ej[:, 0]) | (ei[:, 0] == ej[:, 1]) |
+                 (ei[:, 1] == ej[:, 0]) | (ei[:, 1] == ej[:, 1]))
+        valid = (lengths[i] > epsilon) & (lengths[j] > epsilon)
+        if split_overlapping:
+            _collinear_splits(v1, v2, lengths, np_edges, i[valid], j[valid], epsilon,
+                              split_edges, split_params, split_verts)
+        valid &= ~share
+        i, j = i[valid], j[valid]
+        a, b = v2[i] - v1[i], v2[j] - v1[j]
+        s, t, denom = _segments_closest_params(v1[i], a, v1[j], b)
+        len_a, len_b = lengths[i], lengths[j]
+        non_parallel = denom > (epsilon * len_a * len_b) ** 2
+        if only_touching:
+            tol_a, tol_b = epsilon / len_a, epsilon / len_b
+            inside = (s > -tol_a) & (s < 1 + tol_a) & (t > -tol_b) & (t < 1 + tol_b)
+        else:
+            inside = (s > 0) & (s < 1) & (t > 0) & (t < 1)
+        good = non_parallel & inside
+        s, t = np.clip(s[good], 0, 1), np.clip(t[good], 0, 1)
+        i, j = i[good], j[good]
+        pa = v1[i] + a[good] * s[:, np.newaxis]
+        pb = v1[j] + b[good] * t[:, np.newaxis]
+        close = np.linalg.norm(pa - pb, axis=1) < epsilon
+        hit_edges_a.append(i[close])
+        hit_edges_b.append(j[close])
+        hit_s.append(s[close])
+        hit_t.append(t[close])
+
+    if hit_edges_a:
+        hit_i = np.concatenate(hit_edges_a)
+        hit_j = np.concatenate(hit_edges_b)
+        hit_s = np.concatenate(hit_s)
+        hit_t = np.concatenate(hit_t)
+    else:
+        hit_i = hit_j = np.empty(0, dtype=np.int64)
+        hit_s = hit_t = np.empty(0)
+
+    # intersection points (z interpolated along the first edge in 2D mode)
+    full_v1, full_v2 = np_verts[np_edges[hit_i, 0]], np_verts[np_edges[hit_i, 1]]
+    points = full_v1 + (full_v2 - full_v1) * hit_s[:, np.newaxis]
+
+    # snapping to ends of edges
+    vert_ids = np.full(len(hit_i), -1, dtype=np.int64)
+    for edge_idx, param in ((hit_i, hit_s), (hit_j, hit_t)):
+        tol = epsilon / lengths[edge_idx]
+        at_start = (param < tol) & (vert_ids < 0)
+        vert_ids[at_start] = np_edges[edge_idx[at_start], 0]
+        at_end = (param > 1 - tol) & (vert_ids < 0)
+        vert_ids[at_end] = np_edges[edge_idx[at_end], 1]
+
+    # merging of coinciding new points
+    new = vert_ids < 0
+    keys = np.round(points[new, :dimensions] / epsilon).astype(np.int64)
+    if len(keys):
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        vert_ids[new] = n_verts + inverse.ravel()
+        new_points = points[new][first]
+    else:
+        new_points = np.empty((0, np_verts.shape[1]))
+
+    # nodes of every edge sorted along the edge
+    n_edges = len(np_edges)
+    node_edges = np.concatenate([np.arange(n_edges), np.arange(n_edges), hit_i, hit_j] + split_edges)
+    node_params = np.concatenate([np.zeros(n_edges), np.ones(n_edges), hit_s, hit_t] + split_params)
+    node_verts = np.concatenate([np_edges[:, 0], np_edges[:, 1], vert_ids, vert_ids] + split_verts)
+    order = np.lexsort((node_params, node_edges))
+    node_edges, node_verts = node_edges[order], node_verts[order]
+    same_edge = node_edges[1:] == node_edges[:-1]
+    new_edges = np.stack((node_verts[:-1][same_edge], node_verts[1:][same_edge]), axis=-1)
+    new_edges = new_edges[new_edges[:, 0] != new_edges[:, 1]]
+    _, unique_idx = np.unique(np.sort(new_edges, axis=1), axis=0, return_index=True)
+    new_edges = new_edges[np.sort(unique_idx)]
+
+    return np.concatenate([np_verts, new_points]), new_edges
+
+def _distance_to_lines(origins, directions, lengths, points):
+    w = points - origins
+    if directions.shape[1] == 2:
+        return np.abs(directions[:, 0] * w[:, 1] - directions[:, 1] * w[:, 0]) / lengths
+    return np.linalg.norm(np.cross(directions, w), axis=1) / lengths
+
+def _collinear_splits(v1, v2, lengths, np_edges, i, j, epsilon, split_edges, split_params, split_verts):
+    '''End points of collinear overlapping edges lying inside of each other, as nodes of the edges'''
+    for first, second in ((i, j), (j, i)):
+        origins = v1[first]
+        directions = v2[first] - origins
+        len_a = lengths[first]
+        collinear = ((_distance_to_lines(origins, directions, len_a, v1[second]) < epsilon) &
+                     (_distance_to_lines(origins, directions, len_a, v2[second]) < epsilon))
+        tol = epsilon / len_a
+        for end, points in ((0, v1), (1, v2)):
+            param = np_dot(points[second] - origins, directions) / len_a ** 2
+            inside = collinear & (param > tol) & (param < 1 - tol)
+            split_edges.append(first[inside])
+            split_params.append(param[inside])
+            split_verts.append(np_edges[second[inside], end])
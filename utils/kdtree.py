@@ -5,15 +5,43 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+"""
+KD-trees with interchangeable implementations (SciPy, mathutils, brute force).
+
+Building a tree is usually more expensive than querying it, and in animated
+node trees the same point cloud is often queried on each frame. get_kdtree
+caches built trees by a fingerprint of the point set, so only queries are
+repeated while points do not change:
+
+    tree = get_kdtree(points)
+    locations, idxs, distances = tree.query_array(needles, count=3)
+    idxs, distances, offsets = tree.query_range_array(needles, radius)
+
+Range queries return ragged results in CSR form: the neighbours of needle i
+are idxs[offsets[i]:offsets[i+1]], closest first.
+"""
+
+import hashlib
+from collections import OrderedDict
+from itertools import chain
+
 import numpy as np
 
 from mathutils import kdtree
 
 from sverchok.dependencies import scipy
+from sverchok.utils.ragged import counts_to_offsets
 
 if scipy is not None:
     from scipy.spatial import cKDTree
 
+# max number of cached trees
+CACHE_SIZE = 16
+# number of threads of SciPy queries, -1 means all processors
+WORKERS = -1
+
+_cache = OrderedDict()
+
 class SvKdTree(object):
     SCIPY = 'SCIPY'
     BLENDER = 'BLENDER'
@@ -47,8 +75,19 @@ class SvKdTree(object):
     def query_range(self, needle, radius, **kwargs):
         raise Exception("Not implemented")
 
+    def query_range_array(self, needles, radius):
+        """
+        Find all points within radius of each needle.
+        :param needles: np.array of shape (n, 3)
+        :param radius: a number or np.array of shape (n,)
+        :return: np.arrays (idxs, distances, offsets); neighbours of needle i
+            are idxs[offsets[i]:offsets[i+1]], sorted by distance
+        """
+        raise Exception("Not implemented")
+
 class SvBlenderKdTree(SvKdTree):
     def __init__(self, points):
+        self.points = np.asarray(points)
         self.kdtree = kdtree.KDTree(len(points))
         for i, v in enumerate(points):
             self.kdtree.insert(v, i)
@@ -83,6 +122,15 @@ class SvBlenderKdTree(SvKdTree):
         res = [tuple(r[0]) for r in res]
         return  idxs, np.array(res)
 
+    def query_range_array(self, needles, radius):
+        needles = np.asarray(needles).reshape(-1, 3)
+        radiuses = np.broadcast_to(radius, len(needles)).tolist()
+        res = [self.kdtree.find_range(needle, r) for needle, r in zip(needles.tolist(), radiuses)]
+        counts = [len(r) for r in res]
+        idxs = np.fromiter((idx for r in res for _, idx, _ in r), dtype=np.int64, count=sum(counts))
+        distances = np.fromiter((d for r in res for _, _, d in r), dtype=np.float64, count=sum(counts))
+        return idxs, distances, counts_to_offsets(counts)
+
 class SvSciPyKdTree(SvKdTree):
     def __init__(self, points, power=2):
         self.points = np.asarray(points)
@@ -95,7 +143,7 @@ class SvSciPyKdTree(SvKdTree):
         return loc, idx, distance
 
     def query_array(self, needle, count=1, **kwargs):
-        distances, idxs = self.kdtree.query(needle, k=count, p=self.power, **kwargs)
+        distances, idxs = self.kdtree.query(needle, k=count, p=self.power, workers=WORKERS, **kwargs)
         locs = self.points[idxs]
         return locs, idxs, distances
 
@@ -103,6 +151,16 @@ class SvSciPyKdTree(SvKdTree):
         idxs = self.kdtree.query_ball_point(needle, radius, p=self.power, **kwargs)
         return idxs, self.points[idxs]
 
+    def query_range_array(self, needles, radius):
+        needles = np.asarray(needles, dtype=np.float64).reshape(-1, self.points.shape[1])
+        res = self.kdtree.query_ball_point(needles, radius, p=self.power, workers=WORKERS, return_sorted=False)
+        counts = np.fromiter(map(len, res), dtype=np.int64, count=len(res))
+        idxs = np.fromiter(chain.from_iterable(res), dtype=np.int64, count=counts.sum())
+        rows = np.repeat(np.arange(len(needles)), counts)
+        distances = np.linalg.norm(self.points[idxs] - needles[rows], ord=self.power, axis=1)
+        order = np.lexsort((idxs, distances, rows))
+        return idxs[order], distances[order], counts_to_offsets(counts)
+
 class SvBruteforceKdTree(SvKdTree):
     def __init__(self, points, power=2):
         self.points = np.asarray(points)
@@ -129,3 +187,55 @@ class SvBruteforceKdTree(SvKdTree):
             qry = lambda p: self.query(p, count=count)
             return np.vectorize(qry, signature='(n,3)->(k,3),(k),(k)')(needle)
 
+    def query_range_array(self, needles, radius):
+        needles = np.asarray(needles).reshape(-1, self.points.shape[1])
+        radiuses = np.broadcast_to(radius, len(needles))
+        all_idxs, all_distances = [], []
+        for needle, r in zip(needles, radiuses):
+            distances = np.linalg.norm(self.points - needle, axis=1, ord=self.power)
+            idxs = np.flatnonzero(distances <= r)
+            idxs = idxs[np.argsort(distances[idxs], kind='stable')]
+            all_idxs.append(idxs)
+            all_distances.append(distances[idxs])
+        counts = [len(idxs) for idxs in all_idxs]
+        if not counts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0), counts_to_offsets(counts)
+        return np.concatenate(all_idxs), np.concatenate(all_distances), counts_to_offsets(counts)
+
+def split_ragged(values, offsets):
+    """Split flat array of CSR result into list of lists"""
+    values = values.tolist()
+    offsets = offsets.tolist()
+    return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+def points_key(points):
+    """Fingerprint of point set"""
+    return points.shape, hashlib.sha1(points).digest()
+
+def get_kdtree(points, implementation=None, power=2):
+    """
+    Cached KD-tree of points, the tree is rebuilt only if points are changed.
+    :param points: np.array of shape (n, 3) or list of vertices
+    :param implementation: SvKdTree.SCIPY or SvKdTree.BLENDER,
+        by default the best available one
+    :return: SvKdTree
+    """
+    if implementation is None:
+        implementation = SvKdTree.best_available_implementation()
+    # the tree keeps a copy, so changes of caller's array can not break it
+    points = np.array(points, dtype=np.float64).reshape(-1, 3)
+    points.flags.writeable = False
+    key = (implementation, power) + points_key(points)
+    tree = _cache.get(key)
+    if tree is not None:
+        _cache.move_to_end(key)
+        return tree
+    tree = SvKdTree.new(implementation, points, power=power)
+    _cache[key] = tree
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return tree
+
+def clear_cache():
+    _cache.clear()
+
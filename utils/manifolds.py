@@ -14,6 +14,7 @@ from sverchok.utils.field.vector import SvMatrixVectorField
 from sverchok.utils.sv_logging import sv_logger, get_logger
 from sverchok.utils.math import np_dot
 from sverchok.utils.geom import PlaneEquation, LineEquation, locate_linear
+from sverchok.utils.ragged import counts_to_offsets
 from sverchok.dependencies import scipy
 
 if scipy is not None:
@@ -1426,6 +1427,138 @@ def intersect_line_iso_surface(field, pt1, direction, max_distance, iso_value, s
         result_pts.append(tuple(p))
     return result_ts, result_pts
 
+def raycast_iso_surface(field, points, directions, max_distance, iso_value=0.0, sections=10, first_only=True, lipschitz=None, tolerance=1e-6, max_iterations=100):
+    """
+    Intersect many rays with iso surface of scalar field at once.
+    The field is evaluated by evaluate_grid for all rays which are not
+    finished yet, so it is much faster than intersect_line_iso_surface
+    for each ray.
+
+    If first_only is set and Lipschitz constant of the field (upper bound of
+    the gradient norm) is known, rays are sphere traced: each step goes as far
+    along the ray as the iso surface can not be nearer. Rays which are not
+    finished after max_iterations steps, or all rays if the constant is not
+    known, are sampled at `sections` points (as in intersect_line_iso_surface)
+    and the roots are found in intervals where the field crosses iso value.
+
+    Args:
+        * field: SvScalarField
+        * points, directions: np.arrays of shape (n, 3); directions are normalized
+        * max_distance, iso_value: numbers or np.arrays of shape (n,)
+        * lipschitz: Lipschitz constant of the field; by default it is taken from
+          field.get_lipschitz_constant()
+        * tolerance: precision of distances along rays
+
+    Returns:
+        Offsets of shape (n+1,), distances and points of intersections:
+        solutions of ray i are distances[offsets[i]:offsets[i+1]] sorted by distance.
+        Rays without solutions have none of them.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+    directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+    n = len(points)
+    max_distance = np.broadcast_to(np.asarray(max_distance, dtype=np.float64), (n,))
+    iso_value = np.broadcast_to(np.asarray(iso_value, dtype=np.float64), (n,))
+    if lipschitz is None and first_only:
+        lipschitz = field.get_lipschitz_constant()
+
+    def goal(rays, ts):
+        pts = points[rays] + ts[:, np.newaxis] * directions[rays]
+        return field.evaluate_grid(pts[:, 0], pts[:, 1], pts[:, 2]) - iso_value[rays]
+
+    found_rays, found_ts = [], []
+    rays = np.arange(n)
+    starts = np.zeros(n)
+    if first_only and lipschitz:
+        for _ in range(max_iterations):
+            if not len(rays):
+                break
+            steps = np.abs(goal(rays, starts)) / lipschitz
+            hit = steps < tolerance
+            found_rays.append(rays[hit])
+            found_ts.append(starts[hit])
+            starts = starts + steps
+            # rays going out of max_distance have no solutions
+            good = ~hit & (starts <= max_distance[rays])
+            rays, starts = rays[good], starts[good]
+
+    if len(rays):
+        ray_idxs, t1, t2, v1, v2 = _iso_surface_brackets(goal, rays, starts, max_distance[rays], sections, first_only)
+        found_rays.append(ray_idxs)
+        found_ts.append(_refine_iso_surface_roots(goal, ray_idxs, t1, t2, v1, v2, tolerance, max_iterations))
+
+    found_rays = np.concatenate(found_rays).astype(np.int64)
+    found_ts = np.concatenate(found_ts)
+    order = np.lexsort((found_ts, found_rays))
+    # the field can be undefined (NaN) somewhere
+    order = order[np.isfinite(found_ts[order])]
+    found_rays, found_ts = found_rays[order], found_ts[order]
+    found_points = points[found_rays] + found_ts[:, np.newaxis] * directions[found_rays]
+    offsets = counts_to_offsets(np.bincount(found_rays, minlength=n))
+    return offsets, found_ts, found_points
+
+def _iso_surface_brackets(goal, rays, starts, ends, sections, first_only):
+    """
+    Sample rays at `sections` points between starts and ends and return
+    intervals where goal changes its sign: rays, interval bounds and goal values at them.
+    With first_only, a ray is not sampled after the first interval is found.
+    """
+    result = []
+    ts = np.linspace(0.0, 1.0, num=sections)
+    lengths = ends - starts
+    indices = np.arange(len(rays))
+    prev_ts = starts
+    prev_vs = goal(rays, prev_ts)
+    for t in ts[1:]:
+        if not len(indices):
+            break
+        next_ts = starts[indices] + t * lengths[indices]
+        next_vs = goal(rays[indices], next_ts)
+        crossed = prev_vs * next_vs < 0
+        result.append((rays[indices[crossed]], prev_ts[crossed], next_ts[crossed], prev_vs[crossed], next_vs[crossed]))
+        if first_only:
+            indices, next_ts, next_vs = indices[~crossed], next_ts[~crossed], next_vs[~crossed]
+        prev_ts, prev_vs = next_ts, next_vs
+    if not result:
+        empty = np.zeros(0)
+        return np.zeros(0, dtype=np.int64), empty, empty, empty, empty
+    return tuple(np.concatenate(arrays) for arrays in zip(*result))
+
+def _refine_iso_surface_roots(goal, rays, t1, t2, v1, v2, tolerance, max_iterations):
+    """
+    Find roots of goal in intervals (t1, t2) where it changes its sign, for all
+    intervals at once, by regula falsi with Illinois modification.
+    """
+    result = np.empty(len(rays))
+    indices = np.arange(len(rays))
+    t1, t2, v1, v2 = t1.copy(), t2.copy(), v1.copy(), v2.copy()
+    prev_ts = np.full(len(rays), np.nan)
+    # which end of the interval was replaced at the previous iteration
+    sides = np.zeros(len(rays), dtype=np.int8)
+    for _ in range(max_iterations):
+        if not len(indices):
+            break
+        ts = (t1 * v2 - t2 * v1) / (v2 - v1)
+        vs = goal(rays[indices], ts)
+        done = (vs == 0) | (np.abs(ts - prev_ts) < tolerance) | (t2 - t1 < tolerance)
+        result[indices[done]] = ts[done]
+
+        left = np.sign(vs) == np.sign(v1)
+        right = ~left
+        v2[left & (sides == 1)] *= 0.5
+        v1[right & (sides == -1)] *= 0.5
+        t1[left], v1[left] = ts[left], vs[left]
+        t2[right], v2[right] = ts[right], vs[right]
+        sides = np.where(left, 1, -1).astype(np.int8)
+
+        good = ~done
+        indices, prev_ts, sides = indices[good], ts[good], sides[good]
+        t1, t2, v1, v2 = t1[good], t2[good], v1[good], v2[good]
+    if len(indices):
+        result[indices] = prev_ts
+    return result
+
 def symmetrize_curve(
     curve,
     plane,
@@ -0,0 +1,370 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Packed lists of 4x4 matrices.
+
+Usually matrix sockets transfer lists of mathutils.Matrix objects. Creating
+a Python object per matrix is expensive when there are hundreds of thousands
+of matrices (instancing of many objects, for example), so a node can output
+SvMatrixArray instead - a flat list of matrices stored in one np.array of
+shape (N, 4, 4).
+
+SvMatrixArray is packed only "inside" of the socket: matrix socket converts
+it into the list of Matrix objects when a node reads the socket, unless the
+node asks for packed data explicitly:
+
+    matrices = self.inputs['Matrix'].sv_get(deepcopy=False, packed=True)
+    # matrices can be SvMatrixArray, list of SvMatrixArray (one per object),
+    # or ordinary (nested) list of Matrix objects, if the data was produced
+    # by a node which does not know about SvMatrixArray
+
+SvMatrixArray also behaves like a read-only list of Matrix: its items are
+created on access.
+
+Functions converting rotations follow the conventions of mathutils
+(i.e. they give the same results as mathutils methods with the same names),
+all of them accept arrays of rotations.
+"""
+
+import numpy as np
+
+from mathutils import Matrix
+
+# rotation orders of Euler angles: indices of axes and parity,
+# the same as in Blender (see math_rotation.c)
+EULER_ORDERS = {
+    'XYZ': ((0, 1, 2), False),
+    'XZY': ((0, 2, 1), True),
+    'YXZ': ((1, 0, 2), True),
+    'YZX': ((1, 2, 0), False),
+    'ZXY': ((2, 0, 1), False),
+    'ZYX': ((2, 1, 0), True),
+}
+
+
+class SvMatrixArray:
+    """
+    Flat list of 4x4 matrices stored in np.array of shape (N, 4, 4).
+    """
+    def __init__(self, data):
+        data = np.asarray(data, dtype=np.float64)
+        if data.ndim == 2:
+            data = data[np.newaxis]
+        if data.ndim != 3 or data.shape[1:] != (4, 4):
+            raise ValueError(f"Array of shape (N, 4, 4) is expected, got {data.shape}")
+        self.data = data
+
+    def __repr__(self):
+        return f"<SvMatrixArray: {len(self)} matrices>"
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.to_matrices())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SvMatrixArray(self.data[index])
+        return Matrix(self.data[index].tolist())
+
+    def __matmul__(self, other):
+        """
+        Element-wise product of matrices; other can be SvMatrixArray
+        of the same length (or one matrix) or mathutils.Matrix.
+        """
+        if isinstance(other, SvMatrixArray):
+            other = other.data
+        return SvMatrixArray(np.matmul(self.data, np.asarray(other, dtype=np.float64)))
+
+    def __rmatmul__(self, other):
+        return SvMatrixArray(np.matmul(np.asarray(other, dtype=np.float64), self.data))
+
+    def copy(self):
+        return SvMatrixArray(self.data.copy())
+
+    def to_matrices(self):
+        """List of mathutils.Matrix"""
+        return [Matrix(m) for m in self.data.tolist()]
+
+    @classmethod
+    def from_matrices(cls, matrices):
+        """
+        :param matrices: list of mathutils.Matrix (or anything what as_matrix_array accepts)
+        """
+        return SvMatrixArray(as_matrix_array(matrices))
+
+    @classmethod
+    def identity(cls, count):
+        return SvMatrixArray(np.broadcast_to(np.identity(4), (count, 4, 4)).copy())
+
+    @classmethod
+    def from_translations(cls, locations):
+        """
+        Translation matrices.
+        :param locations: np.array of shape (N, 3)
+        """
+        locations = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+        result = cls.identity(len(locations))
+        result.data[:, :3, 3] = locations
+        return result
+
+    @classmethod
+    def compose(cls, locations, rotations, scales):
+        """
+        Matrices T @ R @ S, as composed by mathutils.Matrix.LocRotScale.
+        :param locations: np.array of shape (N, 3)
+        :param rotations: rotation matrices, np.array of shape (N, 3, 3)
+        :param scales: np.array of shape (N, 3)
+        """
+        locations = np.asarray(locations, dtype=np.float64)
+        rotations = np.asarray(rotations, dtype=np.float64)
+        scales = np.asarray(scales, dtype=np.float64)
+        result = cls.identity(len(locations))
+        # multiplication by diagonal matrix from the right scales columns
+        result.data[:, :3, :3] = rotations * scales[:, np.newaxis, :]
+        result.data[:, :3, 3] = locations
+        return result
+
+    def translations(self):
+        """np.array of shape (N, 3)"""
+        return self.data[:, :3, 3].copy()
+
+    def decompose(self):
+        """
+        Decomposition into translation, rotation and scale,
+        the same as done by mathutils.Matrix.decompose.
+        :return: tuple of np.arrays: locations of shape (N, 3),
+            rotations as quaternions of shape (N, 4), scales of shape (N, 3).
+        """
+        locations = self.translations()
+        basis = self.data[:, :3, :3]
+        scales = np.linalg.norm(basis, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = np.where(scales[:, np.newaxis, :] > 0, basis / scales[:, np.newaxis, :], 0.0)
+        scales[np.linalg.det(basis) < 0] *= -1
+        return locations, rotations_to_quaternions(normalized), scales
+
+    def to_quaternions(self):
+        """
+        Rotation components as quaternions (w, x, y, z),
+        the same as mathutils.Matrix.to_quaternion.
+        """
+        return self.decompose()[1]
+
+    def inverted(self):
+        """
+        Raises np.linalg.LinAlgError if any of matrices is singular.
+        """
+        return SvMatrixArray(np.linalg.inv(self.data))
+
+
+def as_matrix_array(matrices):
+    """
+    Convert any matrix socket data into np.array of shape (N, 4, 4).
+    Nested lists are flattened.
+    :param matrices: SvMatrixArray, mathutils.Matrix, np.array, or (nested) list of them.
+    """
+    if isinstance(matrices, SvMatrixArray):
+        return matrices.data
+    if isinstance(matrices, np.ndarray):
+        return matrices.astype(np.float64, copy=False).reshape(-1, 4, 4)
+    if isinstance(matrices, Matrix):
+        return np.array(matrices.to_4x4(), dtype=np.float64)[np.newaxis]
+    if len(matrices) == 0:
+        return np.empty((0, 4, 4))
+    if isinstance(matrices[0], Matrix):
+        return np.array([m.to_4x4() for m in matrices], dtype=np.float64)
+    return np.concatenate([as_matrix_array(item) for item in matrices])
+
+
+def is_packed(matrices):
+    """
+    Whether matrix socket data is SvMatrixArray or list of SvMatrixArray.
+    """
+    if isinstance(matrices, SvMatrixArray):
+        return True
+    return isinstance(matrices, (list, tuple)) and len(matrices) > 0 \
+            and all(isinstance(item, SvMatrixArray) for item in matrices)
+
+
+def unpack_matrices(data):
+    """
+    Replace all SvMatrixArray in matrix socket data with lists of mathutils.Matrix.
+    Lists which do not contain SvMatrixArray are returned as is.
+    """
+    if isinstance(data, SvMatrixArray):
+        return data.to_matrices()
+    if isinstance(data, (list, tuple)) and data and isinstance(data[0], (list, tuple, SvMatrixArray)):
+        return [unpack_matrices(item) for item in data]
+    return data
+
+
+def copy_packed_matrices(data):
+    """
+    Copy all SvMatrixArray in matrix socket data.
+    """
+    if isinstance(data, SvMatrixArray):
+        return data.copy()
+    if isinstance(data, (list, tuple)) and data and isinstance(data[0], (list, tuple, SvMatrixArray)):
+        return [copy_packed_matrices(item) for item in data]
+    return data
+
+
+def quaternions_to_rotations(quaternions):
+    """
+    Rotation matrices of shape (N, 3, 3), as given by mathutils.Quaternion.to_matrix.
+    The quaternions are not normalized.
+    :param quaternions: np.array of shape (N, 4), components in (w, x, y, z) order
+    """
+    quaternions = np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)
+    w, x, y, z = quaternions.T
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    rotations = np.empty((len(quaternions), 3, 3))
+    rotations[:, 0, 0] = 1 - 2 * (yy + zz)
+    rotations[:, 0, 1] = 2 * (xy - wz)
+    rotations[:, 0, 2] = 2 * (xz + wy)
+    rotations[:, 1, 0] = 2 * (xy + wz)
+    rotations[:, 1, 1] = 1 - 2 * (xx + zz)
+    rotations[:, 1, 2] = 2 * (yz - wx)
+    rotations[:, 2, 0] = 2 * (xz - wy)
+    rotations[:, 2, 1] = 2 * (yz + wx)
+    rotations[:, 2, 2] = 1 - 2 * (xx + yy)
+    return rotations
+
+
+def rotations_to_quaternions(rotations):
+    """
+    Quaternions (w, x, y, z) of shape (N, 4) from orthonormal matrices of shape (N, 3, 3),
+    as given by mathutils.Matrix.to_quaternion: W component is not negative.
+    """
+    rotations = np.array(rotations, dtype=np.float64).reshape(-1, 3, 3)
+    negative = np.linalg.det(rotations) < 0
+    rotations[negative] *= -1
+    m = rotations
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    quaternions = np.empty((len(m), 4))
+
+    # Method by Mike Day (the same as in Blender): choose the biggest
+    # quaternion component for numeric stability
+    case_x = (m22 < 0) & (m00 > m11)
+    case_y = (m22 < 0) & ~case_x
+    case_z = (m22 >= 0) & (m00 < -m11)
+    case_w = (m22 >= 0) & ~case_z
+
+    def fill(case, idx, trace, sign_a, sign_b, others):
+        s = 2 * np.sqrt(trace[case])
+        # ensure W is not negative
+        s = np.where(sign_a[case] < sign_b[case], -s, s)
+        quaternions[case, idx] = 0.25 * s
+        for other_idx, value in others:
+            quaternions[case, other_idx] = value[case] / s
+
+    fill(case_x, 1, 1 + m00 - m11 - m22, m[:, 2, 1], m[:, 1, 2],
+         [(0, m[:, 2, 1] - m[:, 1, 2]), (2, m[:, 1, 0] + m[:, 0, 1]), (3, m[:, 0, 2] + m[:, 2, 0])])
+    fill(case_y, 2, 1 - m00 + m11 - m22, m[:, 0, 2], m[:, 2, 0],
+         [(0, m[:, 0, 2] - m[:, 2, 0]), (1, m[:, 1, 0] + m[:, 0, 1]), (3, m[:, 2, 1] + m[:, 1, 2])])
+    fill(case_z, 3, 1 - m00 - m11 + m22, m[:, 1, 0], m[:, 0, 1],
+         [(0, m[:, 1, 0] - m[:, 0, 1]), (1, m[:, 0, 2] + m[:, 2, 0]), (2, m[:, 2, 1] + m[:, 1, 2])])
+    zero = np.zeros(len(m))
+    fill(case_w, 0, 1 + m00 + m11 + m22, zero, zero,
+         [(1, m[:, 2, 1] - m[:, 1, 2]), (2, m[:, 0, 2] - m[:, 2, 0]), (3, m[:, 1, 0] - m[:, 0, 1])])
+
+    quaternions /= np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+    return quaternions
+
+
+def axis_angle_to_quaternions(axes, angles):
+    """
+    Quaternions of shape (N, 4), as given by mathutils.Quaternion(axis, angle).
+    Zero axis gives identity rotation.
+    """
+    axes = np.asarray(axes, dtype=np.float64).reshape(-1, 3)
+    angles = np.asarray(angles, dtype=np.float64).reshape(-1)
+    norms = np.linalg.norm(axes, axis=1)
+    good = norms > 0
+    quaternions = np.zeros((len(axes), 4))
+    quaternions[:, 0] = 1
+    half = angles[good] / 2
+    quaternions[good, 0] = np.cos(half)
+    quaternions[good, 1:] = axes[good] * (np.sin(half) / norms[good])[:, np.newaxis]
+    return quaternions
+
+
+def quaternions_to_axis_angle(quaternions):
+    """
+    Axes of shape (N, 3) and angles of shape (N,),
+    as given by mathutils.Quaternion.axis and angle properties.
+    """
+    quaternions = np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)
+    quaternions = quaternions / np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+    half = np.arccos(np.clip(quaternions[:, 0], -1, 1))
+    angles = 2 * half
+    # the angle is wrapped into [-pi, pi]
+    angles = np.where(angles > np.pi, angles - 2 * np.pi, angles)
+    sines = np.sin(half)
+    sines[np.abs(sines) < 0.0005] = 1
+    axes = quaternions[:, 1:] / sines[:, np.newaxis]
+    zero = ~axes.any(axis=1)
+    axes[zero] = (0, 1, 0)
+    return axes, angles
+
+
+def euler_to_rotations(angles, order='XYZ'):
+    """
+    Rotation matrices of shape (N, 3, 3), as given by mathutils.Euler(angles, order).to_matrix.
+    :param angles: np.array of shape (N, 3), angles around X, Y and Z axes in radians
+    """
+    angles = np.asarray(angles, dtype=np.float64).reshape(-1, 3)
+    cos, sin = np.cos(angles), np.sin(angles)
+    n = len(angles)
+    rotations = np.broadcast_to(np.identity(3), (n, 3, 3))
+    # for "ABC" order rotation around A axis is applied first: R = R_C @ R_B @ R_A
+    for axis in order:
+        i = 'XYZ'.index(axis)
+        j, k = (i + 1) % 3, (i + 2) % 3
+        rotation = np.zeros((n, 3, 3))
+        rotation[:, i, i] = 1
+        rotation[:, j, j] = cos[:, i]
+        rotation[:, j, k] = -sin[:, i]
+        rotation[:, k, j] = sin[:, i]
+        rotation[:, k, k] = cos[:, i]
+        rotations = rotation @ rotations
+    return rotations
+
+
+def rotations_to_euler(rotations, order='XYZ'):
+    """
+    Euler angles of shape (N, 3) from orthonormal matrices of shape (N, 3, 3),
+    as given by mathutils.Matrix.to_euler: of two possible solutions
+    the one with smaller angles is chosen.
+    """
+    (i, j, k), parity = EULER_ORDERS[order]
+    # Blender stores matrices by columns
+    m = np.asarray(rotations, dtype=np.float64).reshape(-1, 3, 3).swapaxes(1, 2)
+    n = len(m)
+    cy = np.hypot(m[:, i, i], m[:, i, j])
+    regular = cy > 16 * np.finfo(np.float32).eps
+
+    euler1 = np.empty((n, 3))
+    euler2 = np.empty((n, 3))
+    euler1[:, i] = np.where(regular, np.arctan2(m[:, j, k], m[:, k, k]), np.arctan2(-m[:, k, j], m[:, j, j]))
+    euler1[:, j] = np.arctan2(-m[:, i, k], cy)
+    euler1[:, k] = np.where(regular, np.arctan2(m[:, i, j], m[:, i, i]), 0.0)
+    euler2[:, i] = np.arctan2(-m[:, j, k], -m[:, k, k])
+    euler2[:, j] = np.arctan2(-m[:, i, k], -cy)
+    euler2[:, k] = np.arctan2(-m[:, i, j], -m[:, i, i])
+    euler2[~regular] = euler1[~regular]
+    if parity:
+        euler1 = -euler1
+        euler2 = -euler2
+
+    second = np.abs(euler1).sum(axis=1) > np.abs(euler2).sum(axis=1)
+    return np.where(second[:, np.newaxis], euler2, euler1)
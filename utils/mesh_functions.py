@@ -23,6 +23,7 @@ import numpy as np
 
 from mathutils import Matrix, Vector
 from sverchok.utils.modules.matrix_utils import matrix_apply_np
+from sverchok.utils.matrix_array import SvMatrixArray, as_matrix_array
 
 Vertex = Tuple[float, float, float]
 Edge = Tuple[int, int]
@@ -74,6 +75,11 @@ def apply_matrices(meshes: Iterator[Mesh], matrices: Iterator[List[Matrix]], *,
     """It will generate new vertices with given matrix applied"""
     implementation = matrix_apply_np if _mesh_type == 'NP' else apply_matrix_to_vertices_py
     for (vertices, edges, polygons), _matrices in zip(meshes, matrices):
+        if isinstance(_matrices, SvMatrixArray):
+            # all copies of the mesh at once
+            sub_vertices, sub_edges, sub_polygons = transform_copies(vertices, edges, polygons, _matrices)
+            yield (sub_vertices if _mesh_type == 'NP' else sub_vertices.tolist()), sub_edges, sub_polygons
+            continue
         # several matrices can be applied to a mesh
         # in this case each matrix will populate geometry inside object
         sub_vertices = []
@@ -84,6 +90,38 @@ def apply_matrices(meshes: Iterator[Mesh], matrices: Iterator[List[Matrix]], *,
 
         yield from join_meshes(meshes_py(sub_vertices, sub_edges, sub_polygons))
 
+def transform_copies(vertices, edges, polygons, matrices):
+    """
+    Apply each of matrices to the mesh and join the resulting copies of the mesh,
+    the same as apply_matrices + join_meshes do but vectorized
+    :param matrices: SvMatrixArray, np.array of shape (N, 4, 4) or list of Matrix
+    :return: np.array of vertices and lists of edges and polygons
+    """
+    matrices = as_matrix_array(matrices)
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    new_vertices = np.einsum('mij,vj->mvi', matrices[:, :3, :3], vertices) + matrices[:, np.newaxis, :3, 3]
+    offsets = np.arange(len(matrices)) * len(vertices)
+    new_edges = repeat_topology(edges, offsets) if has_element(edges) else []
+    new_polygons = repeat_topology(polygons, offsets) if has_element(polygons) else []
+    return new_vertices.reshape(-1, 3), new_edges, new_polygons
+
+
+def repeat_topology(elements, offsets):
+    """
+    Edges or polygons of several copies of a mesh
+    :param elements: edges or polygons of the mesh
+    :param offsets: indexes of first vertices of copies, np.array
+    """
+    if isinstance(elements, np.ndarray) or len(set(map(len, elements))) == 1:
+        elements = np.asarray(elements)
+        return (elements[np.newaxis] + offsets[:, np.newaxis, np.newaxis]).reshape(-1, elements.shape[1]).tolist()
+    # elements of different length
+    flat = np.concatenate(elements)
+    flat = (flat[np.newaxis] + offsets[:, np.newaxis]).ravel().tolist()
+    ends = np.cumsum(np.tile([len(element) for element in elements], len(offsets))).tolist()
+    return [flat[start:end] for start, end in zip([0] + ends, ends)]
+
+
 def has_element(pol_edge):
     if pol_edge is None:
         return False
@@ -105,7 +143,7 @@ def join_meshes(meshes: Iterator[PyMesh], *, _mesh_type) -> Iterator[PyMesh]:
             else:
                 joined_edges.extend([(e[0] + vertexes_number, e[1] + vertexes_number) for e in edges])
         if has_element(polygons):
-            if isinstance(edges, np.ndarray):
+            if isinstance(polygons, np.ndarray):
                 joined_polygons.extend((polygons + vertexes_number).tolist())
             else:
                 joined_polygons.extend([[i + vertexes_number for i in p] for p in polygons])
@@ -33,8 +33,9 @@ Usage::
 
 import math
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import mathutils as mu
 from mathutils import Matrix
 
@@ -281,12 +282,14 @@ class InterpreterResult:
             :class:`mathutils.Matrix` (4×4) transforms.
             E.g. ``result.matrices['sphere']`` gives the list of
             placement matrices for all sphere instances.
+            In batched mode the lists are replaced with NumPy arrays
+            of shape (n, 4, 4).
     """
 
     __slots__ = ('matrices',)
 
     def __init__(self) -> None:
-        self.matrices: Dict[str, List[Matrix]] = {}
+        self.matrices: Dict[str, Union[List[Matrix], np.ndarray]] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -346,6 +349,7 @@ class Interpreter:
         seed : int = 0,
         origin_as_center: bool = True,
         input_values: Optional[Dict[str, float]] = None,
+        batched: bool = False,
     ) -> InterpreterResult:
         """Create an interpreter and run it on *program*.
 
@@ -359,6 +363,9 @@ class Interpreter:
                 their runtime values.  Missing keys fall back to the default
                 value from the #input directive (if any).  If a parameter has
                 no default and is not provided, a ValueError is raised.
+            batched: If True, matrices of the result are NumPy arrays of
+                shape (n, 4, 4) and the program is evaluated by
+                :class:`BatchInterpreter` when it supports the program.
 
         Reads ``maxdepth``, ``seed``, ``maxobjects``, ``minsize`` and
         ``maxsize`` from program settings when present.
@@ -383,7 +390,10 @@ class Interpreter:
             elif s.name == "maxsize":
                 max_size = float(s.value)
 
-        interp = Interpreter(
+        interp_class = Interpreter
+        if batched and BatchInterpreter.supports(program, max_objects):
+            interp_class = BatchInterpreter
+        interp = interp_class(
             max_depth=global_maxdepth,
             max_objects=max_objects,
             seed=seed,
@@ -391,7 +401,10 @@ class Interpreter:
             min_size=min_size,
             max_size=max_size,
         )
-        return interp._interpret(program, input_values=input_values)
+        result = interp._interpret(program, input_values=input_values)
+        if batched and interp_class is Interpreter:
+            result.matrices = {name: _stack_matrices(mats) for name, mats in result.matrices.items()}
+        return result
 
     # ------------------------------------------------------------------
     # Internal entry point
@@ -401,50 +414,11 @@ class Interpreter:
         self, program: Program, input_values: Optional[Dict[str, float]] = None
     ) -> InterpreterResult:
         """Execute *program* and return an :class:`InterpreterResult"."""
-        if self._interpret_done:
-            raise InvalidStateError("_interpret() method can only be called once on one Interpreter instance")
-        self._interpret_done = True
-
-        random.seed(self.seed)
-
-        # Resolve #input values: runtime values override defaults
-        resolved_inputs: Dict[str, float] = {}
-        for name, inp_def in program.inputs.items():
-            if name in (input_values or {}):
-                resolved_inputs[name] = input_values[name]
-            elif inp_def.default_value is not None:
-                resolved_inputs[name] = inp_def.default_value
-            else:
-                raise ValueError(
-                    f"#input parameter '{name}' has no default value "
-                    f"and was not provided in input_values."
-                )
-
-        # Build rule lookup: name -> list of Rule (for weighted selection)
-        rule_map: Dict[str, List[Rule]] = {}
-        for rule in program.rules:
-            rule_map.setdefault(rule.name, []).append(rule)
-
-        # Validate parameter count consistency across rule definitions
-        for rule_name, rules in rule_map.items():
-            if len(rules) > 1:
-                param_counts = [len(r.params) for r in rules]
-                if len(set(param_counts)) > 1:
-                    raise ValueError(
-                        f"Rule '{rule_name}' has inconsistent parameter counts "
-                        f"across definitions: {param_counts}. "
-                        f"All definitions of the same rule must have the same "
-                        f"number of parameters."
-                    )
+        rule_map = self._prepare(program, input_values)
 
         # Result collector
         result = InterpreterResult()
 
-        # Lazy define resolver with topo sort and caching
-        # Pass resolved inputs as external variables so #define expressions
-        # can reference them without participating in the topo sort.
-        self.resolver = DefineResolver(program.defines, external_vars=resolved_inputs)
-
         # Stack entries: (rule, depth, accumulated_matrix, params_scope)
         entry_rule = _pick_rule(rule_map, IMPLICIT_START_RULE)
         stack: List[Tuple[Rule, int, Matrix, Dict[str, float]]] = [
@@ -489,6 +463,54 @@ class Interpreter:
 
         return result
 
+    def _prepare(
+        self, program: Program, input_values: Optional[Dict[str, float]] = None
+    ) -> Dict[str, List[Rule]]:
+        """Resolve #input values, create the #define resolver and return
+        the rule lookup: name -> list of Rule (for weighted selection)."""
+        if self._interpret_done:
+            raise InvalidStateError("_interpret() method can only be called once on one Interpreter instance")
+        self._interpret_done = True
+
+        random.seed(self.seed)
+
+        # Resolve #input values: runtime values override defaults
+        resolved_inputs: Dict[str, float] = {}
+        for name, inp_def in program.inputs.items():
+            if name in (input_values or {}):
+                resolved_inputs[name] = input_values[name]
+            elif inp_def.default_value is not None:
+                resolved_inputs[name] = inp_def.default_value
+            else:
+                raise ValueError(
+                    f"#input parameter '{name}' has no default value "
+                    f"and was not provided in input_values."
+                )
+
+        # Build rule lookup: name -> list of Rule (for weighted selection)
+        rule_map: Dict[str, List[Rule]] = {}
+        for rule in program.rules:
+            rule_map.setdefault(rule.name, []).append(rule)
+
+        # Validate parameter count consistency across rule definitions
+        for rule_name, rules in rule_map.items():
+            if len(rules) > 1:
+                param_counts = [len(r.params) for r in rules]
+                if len(set(param_counts)) > 1:
+                    raise ValueError(
+                        f"Rule '{rule_name}' has inconsistent parameter counts "
+                        f"across definitions: {param_counts}. "
+                        f"All definitions of the same rule must have the same "
+                        f"number of parameters."
+                    )
+
+        # Lazy define resolver with topo sort and caching
+        # Pass resolved inputs as external variables so #define expressions
+        # can reference them without participating in the topo sort.
+        self.resolver = DefineResolver(program.defines, external_vars=resolved_inputs)
+
+        return rule_map
+
     # ------------------------------------------------------------------
     # Branch interpretation
     # ------------------------------------------------------------------
@@ -751,6 +773,296 @@ class Interpreter:
         return True
 
 
+# ---------------------------------------------------------------------------
+# Batched interpreter
+# ---------------------------------------------------------------------------
+
+class _NodeGroup:
+    """
+    Nodes of the rule tree which are expanded together: calls of the same
+    rule at the same depth with the same parameters.
+
+    Attributes:
+        matrices: (n, 4, 4) accumulated transforms of the nodes.
+        pending: (n,) length of the stack of :class:`Interpreter` at the
+            moment when the node would be popped from it.
+        node_ids: (n,) indexes of the nodes in the rule tree.
+    """
+
+    __slots__ = ('rule', 'depth', 'params_scope', 'matrices', 'pending', 'node_ids')
+
+    def __init__(self, rule, depth, params_scope, matrices, pending, node_ids):
+        self.rule = rule
+        self.depth = depth
+        self.params_scope = params_scope
+        self.matrices = matrices
+        self.pending = pending
+        self.node_ids = node_ids
+
+    def subset(self, mask) -> '_NodeGroup':
+        return _NodeGroup(self.rule, self.depth, self.params_scope,
+                          self.matrices[mask], self.pending[mask], self.node_ids[mask])
+
+    @staticmethod
+    def merge(groups) -> '_NodeGroup':
+        if len(groups) == 1:
+            return groups[0]
+        first = groups[0]
+        return _NodeGroup(first.rule, first.depth, first.params_scope,
+                          np.concatenate([g.matrices for g in groups]),
+                          np.concatenate([g.pending for g in groups]),
+                          np.concatenate([g.node_ids for g in groups]))
+
+
+class BatchInterpreter(Interpreter):
+    """
+    Breadth-first interpreter for EisenScript AST.
+
+    Instead of popping rule calls one by one, all calls of a rule with the
+    same depth and parameters are expanded at once: their transforms are
+    kept in one (n, 4, 4) NumPy array, repetitions are applied by batched
+    matrix products, size culling and depth limits are applied as masks.
+
+    The result has the same matrices in the same order as
+    :class:`Interpreter` gives (up to floating point rounding, mathutils
+    works in single precision). To achieve that the interpreter
+    remembers the tree of rule calls and sorts instances in the order of
+    the depth-first traversal, and it reproduces the stack depth guard of
+    :class:`Interpreter`. Programs where the result depends on the order
+    of evaluation in other ways are not supported, see :meth:`supports`.
+    """
+
+    @staticmethod
+    def supports(program: Program, max_objects: Optional[int]) -> bool:
+        """
+        Whether the program gives the same result as with :class:`Interpreter`.
+
+        Weighted rules are not supported because random choices depend on
+        the order of evaluation. ``maxobjects`` is supported only for
+        programs with one primitive type, :class:`Interpreter` counts
+        objects of different types in a way which depends on the order.
+        """
+        names = [rule.name for rule in program.rules]
+        if len(names) != len(set(names)):
+            return False
+        if max_objects is not None:
+            shapes = {_primitive_name(branch.terminal) for rule in program.rules for branch in rule.body}
+            shapes.discard(None)
+            if len(shapes) > 1:
+                return False
+        return True
+
+    def _interpret(
+        self, program: Program, input_values: Optional[Dict[str, float]] = None
+    ) -> InterpreterResult:
+        """Execute *program* and return an :class:`InterpreterResult` with arrays of matrices."""
+        self._rule_map = self._prepare(program, input_values)
+        self._wrappers = {}
+        # The rule tree: parent and push index of each node, per generation
+        self._parents = [np.array([-1])]
+        self._push_idxs = [np.zeros(1, dtype=np.int64)]
+        self._next_parents = []
+        self._next_push_idxs = []
+        self._n_nodes = 1
+        # shape name -> list of (node ids, branch index, repetition indexes, matrices)
+        self._instances: Dict[str, list] = {}
+        # shape name -> list of (node ids, branch index) of nodes which dispatched the shape
+        self._dispatches: Dict[str, list] = {}
+
+        entry_rule = _pick_rule(self._rule_map, IMPLICIT_START_RULE)
+        generation = [_NodeGroup(entry_rule, 0, {}, np.identity(4)[np.newaxis],
+                                 np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))]
+        while generation:
+            next_groups = {}
+            for group in generation:
+                self._expand(group, next_groups)
+            generation = [_NodeGroup.merge(groups) for groups in next_groups.values()]
+            if self._next_parents:
+                self._parents.append(np.concatenate(self._next_parents))
+                self._push_idxs.append(np.concatenate(self._next_push_idxs))
+                self._next_parents, self._next_push_idxs = [], []
+
+        return self._collect_result()
+
+    def _expand(self, group: _NodeGroup, next_groups: dict) -> None:
+        """The same as one iteration of the main loop of Interpreter for all nodes of the group."""
+        rule, params_scope = group.rule, group.params_scope
+
+        local_max_depth = self.max_depth
+        if rule.maxdepth is not None:
+            local_max_depth = round(self.resolver.resolve_scoped(rule.maxdepth, params_scope))
+
+        # Stack depth guard
+        in_stack = group.pending <= self.max_depth
+        if not in_stack.all():
+            group = group.subset(in_stack)
+        n_nodes = len(group.node_ids)
+        if not n_nodes:
+            return
+
+        # Retirement check
+        if group.depth > local_max_depth:
+            if rule.retirement_rule:
+                succ_rule = _pick_rule(self._rule_map, rule.retirement_rule)
+                self._add_children(next_groups, succ_rule, 0, params_scope, group.matrices,
+                                   group.node_ids, np.zeros(n_nodes, dtype=np.int64), group.pending)
+            return
+
+        n_pushed = np.zeros(n_nodes, dtype=np.int64)
+        for branch_idx, branch in enumerate(rule.body):
+            rep_info = []
+            for rep in branch.repetitions:
+                count = round(self.resolver.resolve_scoped(rep.count, params_scope))
+                tmat = self._build_transform_matrix(rep.transformations, params_scope)
+                rep_info.append((count, tmat))
+
+            terminal = branch.terminal
+            if isinstance(terminal, RuleRef):
+                target_rule, new_params_scope = self._resolve_call(terminal, params_scope)
+            else:
+                shape_name = _primitive_name(terminal)
+                if shape_name is None:
+                    continue
+                self._dispatches.setdefault(shape_name, []).append((group.node_ids, branch_idx))
+
+            matrices = self._repeat_matrices(group.matrices, rep_info)
+            mask = self._sizes_mask(matrices)
+            node_ids = np.broadcast_to(group.node_ids[:, np.newaxis], mask.shape)[mask]
+
+            if isinstance(terminal, RuleRef):
+                push_idxs = n_pushed[:, np.newaxis] + np.cumsum(mask, axis=1) - 1
+                n_pushed += mask.sum(axis=1)
+                pending = (group.pending[:, np.newaxis] + push_idxs)[mask]
+                self._add_children(next_groups, target_rule, group.depth + 1, new_params_scope,
+                                   matrices[mask], node_ids, push_idxs[mask], pending)
+            else:
+                if len(node_ids):
+                    rep_idxs = np.broadcast_to(np.arange(mask.shape[1]), mask.shape)[mask]
+                    self._instances.setdefault(shape_name, []).append(
+                        (node_ids, branch_idx, rep_idxs, matrices[mask]))
+
+    def _resolve_call(self, ref: RuleRef, params_scope: dict):
+        """Called rule (or its retirement wrapper) and its parameters, see Interpreter._dispatch_call"""
+        target_rule = _pick_rule(self._rule_map, ref.name)
+
+        new_params_scope = dict(params_scope)
+        if ref.args:
+            if not target_rule.params:
+                raise ValueError(
+                    f"Rule '{ref.name}' is called with {len(ref.args)} argument(s) "
+                    f"but has no parameters. Use '{ref.name}' without parentheses."
+                )
+            if len(ref.args) != len(target_rule.params):
+                raise ValueError(
+                    f"Rule '{ref.name}' expects {len(target_rule.params)} parameter(s) "
+                    f"but got {len(ref.args)}. "
+                    f"Expected: ({', '.join(target_rule.params)}), "
+                    f"got {len(ref.args)} argument(s)."
+                )
+            for param_name, arg_val in zip(target_rule.params, ref.args):
+                new_params_scope[param_name] = self.resolver.resolve_scoped(arg_val, params_scope)
+
+        if ref.retirement_depth is not None:
+            call_max_depth = self.resolver.resolve_scoped(ref.retirement_depth, params_scope)
+            if isinstance(call_max_depth, float) and call_max_depth == int(call_max_depth):
+                call_max_depth = int(call_max_depth)
+            # one wrapper per call, so calls of the same rule can be expanded together
+            key = (id(target_rule), call_max_depth, ref.retirement_rule)
+            if key not in self._wrappers:
+                self._wrappers[key] = _make_retirement_wrapper(target_rule, call_max_depth,
+                                                               ref.retirement_rule, self._rule_map)
+            target_rule = self._wrappers[key]
+
+        return target_rule, new_params_scope
+
+    def _add_children(self, next_groups, rule, depth, params_scope, matrices, parents, push_idxs, pending):
+        n_children = len(parents)
+        if not n_children:
+            return
+        node_ids = np.arange(self._n_nodes, self._n_nodes + n_children)
+        self._n_nodes += n_children
+        self._next_parents.append(parents)
+        self._next_push_idxs.append(push_idxs)
+        key = (id(rule), depth, _params_key(params_scope))
+        next_groups.setdefault(key, []).append(_NodeGroup(rule, depth, params_scope, matrices, pending, node_ids))
+
+    @staticmethod
+    def _repeat_matrices(matrices: np.ndarray, rep_info: list) -> np.ndarray:
+        """(n, k, 4, 4) transforms of all combinations of nested repetitions, in the order of Interpreter"""
+        result = matrices[:, np.newaxis]
+        for count, tmat in rep_info:
+            steps = []
+            cumulative = Matrix.Identity(4)
+            for _ in range(count):
+                cumulative @= tmat
+                steps.append(cumulative.copy())
+            steps = np.array(steps, dtype=np.float64).reshape(-1, 4, 4)
+            result = (result[:, :, np.newaxis] @ steps).reshape(len(matrices), -1, 4, 4)
+        return result
+
+    def _sizes_mask(self, matrices: np.ndarray) -> np.ndarray:
+        """Vectorized _size_in_bounds"""
+        if self.min_size is None and self.max_size is None:
+            return np.ones(matrices.shape[:2], dtype=bool)
+        sizes = np.linalg.norm(matrices[..., :3, :3].sum(axis=-1), axis=-1)
+        mask = np.ones(sizes.shape, dtype=bool)
+        if self.min_size is not None:
+            mask &= ~(sizes < self.min_size)
+        if self.max_size is not None:
+            mask &= ~(sizes > self.max_size)
+        return mask
+
+    def _traversal_ranks(self) -> np.ndarray:
+        """
+        Positions of nodes of the rule tree in the depth-first traversal of
+        Interpreter: a node is followed by its children in the reverse order
+        of pushing them into the stack.
+        """
+        parents = np.concatenate(self._parents)
+        push_idxs = np.concatenate(self._push_idxs)
+        bounds = np.cumsum([0] + [len(p) for p in self._parents])
+
+        subtree_sizes = np.ones(len(parents), dtype=np.int64)
+        for start, end in zip(bounds[-2:0:-1], bounds[:0:-1]):
+            np.add.at(subtree_sizes, parents[start:end], subtree_sizes[start:end])
+
+        ranks = np.zeros(len(parents), dtype=np.int64)
+        for start, end in zip(bounds[1:-1], bounds[2:]):
+            gen_parents = parents[start:end]
+            order = np.lexsort((-push_idxs[start:end], gen_parents))
+            sorted_parents = gen_parents[order]
+            sizes = subtree_sizes[start:end][order]
+            # sizes of preceding siblings
+            preceding = np.cumsum(sizes) - sizes
+            first = np.flatnonzero(np.r_[True, sorted_parents[1:] != sorted_parents[:-1]])
+            preceding -= np.repeat(preceding[first], np.diff(np.r_[first, len(order)]))
+            ranks[start + order] = ranks[sorted_parents] + 1 + preceding
+        return ranks
+
+    def _collect_result(self) -> InterpreterResult:
+        ranks = self._traversal_ranks()
+
+        def first_dispatch(shape_name):
+            return min((ranks[node_ids].min(), branch_idx)
+                       for node_ids, branch_idx in self._dispatches[shape_name])
+
+        result = InterpreterResult()
+        # keys are in the same order as Interpreter adds them
+        for shape_name in sorted(self._dispatches, key=first_dispatch):
+            instances = self._instances.get(shape_name)
+            if not instances:
+                result.matrices[shape_name] = np.empty((0, 4, 4))
+                continue
+            node_ids = np.concatenate([inst[0] for inst in instances])
+            branch_idxs = np.concatenate([np.full(len(inst[0]), inst[1]) for inst in instances])
+            rep_idxs = np.concatenate([inst[2] for inst in instances])
+            order = np.lexsort((rep_idxs, branch_idxs, ranks[node_ids]))
+            if self.max_objects is not None:
+                order = order[:max(self.max_objects, 0)]
+            result.matrices[shape_name] = np.concatenate([inst[3] for inst in instances])[order]
+        return result
+
+
 # ---------------------------------------------------------------------------
 # Module-level helpers (no interpreter state needed)
 # ---------------------------------------------------------------------------
@@ -775,6 +1087,20 @@ def _pick_rule(rule_map: Dict[str, List[Rule]], name: str) -> Rule:
     return candidates[-1]
 
 
+def _params_key(params_scope: dict):
+    """Hashable key of parameter values, calls with equal keys are expanded together"""
+    key = tuple(sorted(params_scope.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return id(params_scope)
+    return key
+
+
+def _stack_matrices(matrices: List[Matrix]) -> np.ndarray:
+    return np.array(matrices, dtype=np.float64).reshape(-1, 4, 4)
+
+
 def _make_retirement_wrapper(
     target_rule: Rule,
     max_depth: int,
@@ -0,0 +1,321 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Per node instrumentation of tree updates.
+
+Unlike utils/profile.py, which profiles Python functions, this module
+records what happens with every node during every update of a tree:
+
+- total time, time of reading input data (including implicit conversions)
+  and time of the process method,
+- time and number of deep copies of socket data made by the node,
+- number of objects and items in input and output sockets,
+- memory allocated by the node (only if memory tracing is on, it's slow).
+
+Records are kept in a ring buffer, so old records are dropped in long
+sessions. They can be exported into CSV or Chrome trace JSON file (can be
+opened in chrome://tracing or https://ui.perfetto.dev), and hot nodes can
+be found with `top_nodes`:
+
+    from sverchok.utils import node_instrumentation as ni
+    ni.enable(memory=True)
+    tree.force_update()
+    ...
+    for stat in ni.top_nodes(tree.name, count=10):
+        print(stat.node, stat.calls, stat.total_time)
+    ni.export('/tmp/trace.json')
+
+When instrumentation is disabled the update system does only one check per node.
+"""
+
+import csv
+import json
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.core import socket_data
+
+RING_SIZE = 100000
+
+# Whether per node records are gathered, it's checked by update system
+is_enabled = False
+# Whether memory allocations are traced
+is_memory_traced = False
+
+records = deque(maxlen=RING_SIZE)
+_stack = []  # records of nodes which are being processed, group nodes include nodes of their trees
+_update_id = 0
+_started_tracemalloc = False
+
+CSV_FIELDS = ['update', 'tree', 'node', 'bl_idname', 'start', 'total_time', 'prepare_time',
+              'process_time', 'deep_copy_time', 'deep_copies', 'input_objects', 'input_items',
+              'output_objects', 'output_items', 'memory_delta', 'memory_peak', 'error']
+
+
+class NodeRecord:
+    """Measurements of one node during one update"""
+    __slots__ = ('update', 'tree', 'root_tree', 'node', 'bl_idname', 'depth', 'start', 'prepared', 'end',
+                 'deep_copy_time', 'deep_copies', 'input_objects', 'input_items', 'output_objects',
+                 'output_items', 'memory_start', 'memory_delta', 'memory_peak', 'error')
+
+    def __init__(self, node, depth):
+        self.update = _update_id
+        self.tree = node.id_data.name
+        self.root_tree = _stack[0].tree if _stack else self.tree
+        self.node = node.name
+        self.bl_idname = node.bl_idname
+        self.depth = depth
+        self.start = perf_counter()
+        self.prepared = None
+        self.end = None
+        self.deep_copy_time = 0.0
+        self.deep_copies = 0
+        self.input_objects = self.input_items = 0
+        self.output_objects = self.output_items = 0
+        self.memory_start = self.memory_delta = self.memory_peak = 0
+        self.error = False
+
+    @property
+    def total_time(self):
+        return self.end - self.start
+
+    @property
+    def prepare_time(self):
+        return (self.prepared or self.end) - self.start
+
+    @property
+    def process_time(self):
+        return self.end - (self.prepared or self.end)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in CSV_FIELDS}
+
+
+@dataclass
+class NodeStatistics:
+    """Measurements of a node summed up over all its records"""
+    tree: str
+    node: str
+    bl_idname: str
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    prepare_time: float = 0.0
+    process_time: float = 0.0
+    deep_copy_time: float = 0.0
+    deep_copies: int = 0
+    input_items: int = 0
+    output_items: int = 0
+    memory_peak: int = 0  # max of all records
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+def enable(memory=False, ring_size=None):
+    """
+    Start gathering records
+    :param memory: trace memory allocations, it slows down execution of nodes significantly
+    :param ring_size: max number of records to keep
+    """
+    global is_enabled, is_memory_traced, records, _started_tracemalloc
+    if ring_size is not None and ring_size != records.maxlen:
+        records = deque(records, maxlen=ring_size)
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    is_memory_traced = memory
+    is_enabled = True
+    socket_data.deep_copy_hook = _timed_deep_copy
+
+
+def disable():
+    global is_enabled, is_memory_traced, _started_tracemalloc
+    is_enabled = False
+    is_memory_traced = False
+    socket_data.deep_copy_hook = None
+    _stack.clear()
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+
+
+def reset():
+    """Remove all gathered records"""
+    records.clear()
+
+
+def next_update():
+    """Should be called before each update of a main tree"""
+    global _update_id
+    _update_id += 1
+
+
+def data_volume(data):
+    """Number of objects and number of items (vertices, numbers etc.) of socket data"""
+    if isinstance(data, np.ndarray):
+        if data.ndim == 0:
+            return 1, 1
+        if data.ndim == 1:
+            return len(data), len(data)
+        return data.shape[0], data.shape[0] * data.shape[1]
+    if isinstance(data, (list, tuple)):
+        items = 0
+        for obj in data:
+            try:
+                items += len(obj)
+            except TypeError:
+                items += 1
+        return len(data), items
+    return 1, 1
+
+
+def _sockets_volume(sockets):
+    objects = items = 0
+    for socket in sockets:
+        data = socket_data.socket_data_cache.get(socket.socket_id)
+        if data is not None:
+            socket_objects, socket_items = data_volume(data)
+            objects += socket_objects
+            items += socket_items
+    return objects, items
+
+
+def start_node(node):
+    """Should be called before reading input data of the node"""
+    record = NodeRecord(node, len(_stack))
+    if is_memory_traced:
+        current, peak = tracemalloc.get_traced_memory()
+        # the peak is reset for each node, so the parent node should remember it
+        for parent in _stack:
+            parent.memory_peak = max(parent.memory_peak, peak)
+        tracemalloc.reset_peak()
+        record.memory_start = current
+    _stack.append(record)
+    return record
+
+
+def inputs_start():
+    """Should be called before input data of the node is read, the node can wait
+    its turn for some time after start_node if the tree is updated by timer"""
+    if _stack:
+        _stack[-1].start = perf_counter()
+
+
+def inputs_prepared(input_sockets):
+    """Should be called after input data of the node was read"""
+    if _stack:
+        record = _stack[-1]
+        record.prepared = perf_counter()
+        record.input_objects, record.input_items = _sockets_volume(input_sockets)
+
+
+def finish_node(record, node, error=False):
+    """Should be called after the node was processed or failed"""
+    record.end = perf_counter()
+    record.error = error
+    if _stack and _stack[-1] is record:
+        _stack.pop()
+    if is_memory_traced:
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(record.memory_peak, peak)
+        for parent in _stack:
+            parent.memory_peak = max(parent.memory_peak, peak)
+        record.memory_delta = current - record.memory_start
+        record.memory_peak = peak - record.memory_start
+    if not error:
+        record.output_objects, record.output_items = _sockets_volume(node.outputs)
+    records.append(record)
+
+
+def _timed_deep_copy(data):
+    if not _stack:
+        return socket_data.sv_deep_copy(data)
+    start = perf_counter()
+    data = socket_data.sv_deep_copy(data)
+    record = _stack[-1]
+    record.deep_copy_time += perf_counter() - start
+    record.deep_copies += 1
+    return data
+
+
+def top_nodes(tree_name=None, count=10, key='total_time'):
+    """
+    Nodes with the biggest sum of given measurement
+    :param tree_name: if given only nodes of this tree are taken into account
+    :param key: attribute of NodeStatistics
+    :return: list of NodeStatistics
+    """
+    statistics = dict()
+    for record in records:
+        if tree_name is not None and record.tree != tree_name:
+            continue
+        stat = statistics.get((record.tree, record.node))
+        if stat is None:
+            stat = NodeStatistics(record.tree, record.node, record.bl_idname)
+            statistics[(record.tree, record.node)] = stat
+        stat.calls += 1
+        stat.errors += record.error
+        stat.total_time += record.total_time
+        stat.prepare_time += record.prepare_time
+        stat.process_time += record.process_time
+        stat.deep_copy_time += record.deep_copy_time
+        stat.deep_copies += record.deep_copies
+        stat.input_items += record.input_items
+        stat.output_items += record.output_items
+        stat.memory_peak = max(stat.memory_peak, record.memory_peak)
+    return sorted(statistics.values(), key=lambda s: getattr(s, key), reverse=True)[:count]
+
+
+def to_chrome_trace():
+    """Records in Chrome trace event format"""
+    events = []
+    thread_ids = dict()
+    origin = records[0].start if records else 0
+    for record in records:
+        if record.root_tree not in thread_ids:
+            thread_ids[record.root_tree] = len(thread_ids) + 1
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': thread_ids[record.root_tree],
+                           'args': {'name': record.root_tree}})
+        tid = thread_ids[record.root_tree]
+        start = (record.start - origin) * 1e6
+        args = record.as_dict()
+        events.append({'name': record.node, 'cat': record.bl_idname, 'ph': 'X', 'pid': 1, 'tid': tid,
+                       'ts': start, 'dur': record.total_time * 1e6, 'args': args})
+        events.append({'name': 'prepare inputs', 'cat': 'prepare', 'ph': 'X', 'pid': 1, 'tid': tid,
+                       'ts': start, 'dur': record.prepare_time * 1e6})
+        if record.prepared is not None:
+            events.append({'name': 'process', 'cat': 'process', 'ph': 'X', 'pid': 1, 'tid': tid,
+                           'ts': (record.prepared - origin) * 1e6, 'dur': record.process_time * 1e6})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def export_chrome_trace(file_path):
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(to_chrome_trace(), file)
+
+
+def export_csv(file_path):
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record.as_dict())
+
+
+def export(file_path):
+    """Export records into CSV file if its extension is .csv, otherwise into Chrome trace JSON"""
+    if file_path.lower().endswith('.csv'):
+        export_csv(file_path)
+    else:
+        export_chrome_trace(file_path)
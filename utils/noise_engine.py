@@ -0,0 +1,267 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation of noise functions for big arrays of vectors.
+
+Two backends are available:
+
+- MATHUTILS - `mathutils.noise`, results are exactly the same as Blender ones,
+  but the noise is evaluated vector by vector in Python;
+- NUMPY - NumPy implementations of Perlin, value, cell and cellular (Voronoi)
+  noises. They look like Blender noises of the same type but values differ.
+  Arrays are split into chunks of CHUNK_SIZE vectors which are evaluated in a
+  thread pool, NumPy releases GIL while it's working on arrays.
+
+Noise types are the same as in `sv_noise_utils.noise_options`:
+
+    from sverchok.utils.noise_engine import noise_vector, NUMPY
+    vectors = noise_vector(verts, 'PERLIN_ORIGINAL', seed=1, backend=NUMPY)
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import log
+
+import numpy as np
+from mathutils import noise
+
+MATHUTILS = 'MATHUTILS'
+NUMPY = 'NUMPY'
+
+noise_backends = [
+    (MATHUTILS, 'Exact', "Noise of mathutils module, results are the same as in Blender", 0),
+    (NUMPY, 'Fast', "Multithreaded NumPy approximation of the noise, values differ from Blender ones", 1),
+]
+
+# number of vectors evaluated by one task of the thread pool
+CHUNK_SIZE = 2 ** 16
+
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='sv_noise')
+    return _pool
+
+
+def evaluate_chunked(function, vecs, chunk_size=CHUNK_SIZE):
+    """
+    Evaluate function(vecs) by chunks, the chunks are evaluated in parallel
+    if there are several CPUs. It also limits memory of intermediate arrays.
+    :param function: takes array of vectors and returns array of the same length
+    """
+    if len(vecs) <= chunk_size:
+        return function(vecs)
+    chunks = (vecs[start: start + chunk_size] for start in range(0, len(vecs), chunk_size))
+    if (os.cpu_count() or 1) == 1:
+        return np.concatenate([function(chunk) for chunk in chunks])
+    return np.concatenate(list(_get_pool().map(function, chunks)))
+
+
+#### NumPy noises, all of them return values in [0, 1] range like BLI_noise_generic_noise
+
+GRADIENTS = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+    [1, 1, 0], [-1, 1, 0], [0, -1, 1], [0, -1, -1]], dtype=np.float64)
+
+NEIGHBOUR_CELLS = np.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)])
+
+
+@lru_cache(maxsize=64)
+def _noise_state(seed):
+    """Permutation table (doubled to avoid wrapping of indexes) and
+    offsets of the three components of vector noise for given seed"""
+    rng = np.random.RandomState(int(seed) & 0xffffffff)
+    perm = rng.permutation(256)
+    perm = np.concatenate((perm, perm))
+    perm.flags.writeable = False
+    offsets = rng.uniform(0, 256, (3, 3))
+    offsets.flags.writeable = False
+    return perm, offsets
+
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _lerp(a, b, t):
+    return a + (b - a) * t
+
+
+def _lattice(vecs):
+    floor = np.floor(vecs)
+    frac = vecs - floor
+    cell = floor.astype(np.int64) & 255
+    return cell[:, 0], cell[:, 1], cell[:, 2], frac[:, 0], frac[:, 1], frac[:, 2]
+
+
+def _corner_hashes(perm, x, y, z):
+    """Hashes of 8 corners of cells, in (x, y, z) order: 000, 100, 010, 110, 001, ..."""
+    a = perm[x] + y
+    b = perm[x + 1] + y
+    aa, ab, ba, bb = perm[a] + z, perm[a + 1] + z, perm[b] + z, perm[b + 1] + z
+    return (perm[aa], perm[ba], perm[ab], perm[bb],
+            perm[aa + 1], perm[ba + 1], perm[ab + 1], perm[bb + 1])
+
+
+def _trilinear(values, u, v, w):
+    return _lerp(_lerp(_lerp(values[0], values[1], u), _lerp(values[2], values[3], u), v),
+                 _lerp(_lerp(values[4], values[5], u), _lerp(values[6], values[7], u), v),
+                 w)
+
+
+def _gradient(hashes, x, y, z):
+    g = GRADIENTS[hashes & 15]
+    return g[:, 0] * x + g[:, 1] * y + g[:, 2] * z
+
+
+def perlin_noise(vecs, perm):
+    """Improved Perlin gradient noise"""
+    x, y, z, fx, fy, fz = _lattice(vecs)
+    hashes = _corner_hashes(perm, x, y, z)
+    values = [_gradient(h, fx - dx, fy - dy, fz - dz)
+              for h, (dx, dy, dz) in zip(hashes, ((0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0),
+                                                  (0, 0, 1), (1, 0, 1), (0, 1, 1), (1, 1, 1)))]
+    return 0.5 + 0.5 * _trilinear(values, _fade(fx), _fade(fy), _fade(fz))
+
+
+def value_noise(vecs, perm):
+    """Smooth interpolation of random values in integer points"""
+    x, y, z, fx, fy, fz = _lattice(vecs)
+    values = [h / 255.0 for h in _corner_hashes(perm, x, y, z)]
+    return _trilinear(values, _fade(fx), _fade(fy), _fade(fz))
+
+
+def cell_noise(vecs, perm):
+    """Random value per integer cell"""
+    x, y, z, _, _, _ = _lattice(vecs)
+    return perm[perm[perm[x] + y] + z] / 255.0
+
+
+def cellular_distances(vecs, perm):
+    """Sorted distances to the four nearest feature points, one random point per integer cell"""
+    x, y, z, fx, fy, fz = _lattice(vecs)
+    distances = np.empty((len(vecs), len(NEIGHBOUR_CELLS)))
+    for i, (dx, dy, dz) in enumerate(NEIGHBOUR_CELLS):
+        h = perm[perm[perm[(x + dx) & 255] + ((y + dy) & 255)] + ((z + dz) & 255)]
+        px = dx + perm[h] / 255.0 - fx
+        py = dy + perm[h + 1] / 255.0 - fy
+        pz = dz + perm[h + 2] / 255.0 - fz
+        distances[:, i] = px * px + py * py + pz * pz
+    distances = np.partition(distances, 3, axis=1)[:, :4]
+    distances.sort(axis=1)
+    return np.sqrt(distances)
+
+
+def _voronoi(index):
+    def function(vecs, perm):
+        return cellular_distances(vecs, perm)[:, index]
+    return function
+
+
+def voronoi_f2f1(vecs, perm):
+    distances = cellular_distances(vecs, perm)
+    return distances[:, 1] - distances[:, 0]
+
+
+def voronoi_crackle(vecs, perm):
+    return np.minimum(10 * voronoi_f2f1(vecs, perm), 1.0)
+
+
+numpy_noises = {
+    'BLENDER': value_noise,
+    'PERLIN_ORIGINAL': perlin_noise,
+    'PERLIN_NEW': perlin_noise,
+    'VORONOI_F1': _voronoi(0),
+    'VORONOI_F2': _voronoi(1),
+    'VORONOI_F3': _voronoi(2),
+    'VORONOI_F4': _voronoi(3),
+    'VORONOI_F2F1': voronoi_f2f1,
+    'VORONOI_CRACKLE': voronoi_crackle,
+    'CELLNOISE': cell_noise,
+}
+
+
+#### Public API
+
+def _as_vectors(vecs):
+    return np.asarray(vecs, dtype=np.float64).reshape(-1, 3)
+
+
+def _as_list(vecs):
+    return vecs.tolist() if isinstance(vecs, np.ndarray) else vecs
+
+
+def noise_scalar(vecs, noise_type, seed, backend=MATHUTILS):
+    """
+    Signed noise values in vectors, the same as `mathutils.noise.noise`
+    :return: array of shape (n,)
+    """
+    if backend == NUMPY:
+        function = numpy_noises[noise_type]
+        perm, offsets = _noise_state(seed)
+        return evaluate_chunked(lambda chunk: 2 * function(chunk + offsets[0], perm) - 1, _as_vectors(vecs))
+
+    noise.seed_set(seed)
+    noise_function = noise.noise
+    return np.array([noise_function(v, noise_basis=noise_type) for v in _as_list(vecs)], dtype=np.float64)
+
+
+def noise_vector(vecs, noise_type, seed, backend=MATHUTILS):
+    """
+    Noise vectors in given vectors, the same as `mathutils.noise.noise_vector`
+    :return: array of shape (n, 3)
+    """
+    if backend == NUMPY:
+        function = numpy_noises[noise_type]
+        perm, offsets = _noise_state(seed)
+
+        def evaluate(chunk):
+            return np.stack([2 * function(chunk + offset, perm) - 1 for offset in offsets], axis=1)
+
+        return evaluate_chunked(evaluate, _as_vectors(vecs))
+
+    noise.seed_set(seed)
+    noise_function = noise.noise_vector
+    return _as_vectors([noise_function(v, noise_basis=noise_type)[:] for v in _as_list(vecs)])
+
+
+def fractal_noise(vecs, noise_type, seed, octaves=4, lacunarity=2.0, gain=0.5, backend=MATHUTILS):
+    """
+    Fractal Brownian motion - sum of octaves of signed noise, each next octave
+    has frequency multiplied by lacunarity and amplitude multiplied by gain.
+    The same as `mathutils.noise.fractal` with H = -log(gain) / log(lacunarity),
+    only integer number of octaves is supported by NUMPY backend.
+    :return: array of shape (n,)
+    """
+    if backend == NUMPY:
+        function = numpy_noises[noise_type]
+        perm, offsets = _noise_state(seed)
+
+        def evaluate(chunk):
+            chunk = chunk + offsets[0]
+            result = np.zeros(len(chunk))
+            amplitude = 1.0
+            for _ in range(int(octaves)):
+                result += (2 * function(chunk, perm) - 1) * amplitude
+                chunk *= lacunarity
+                amplitude *= gain
+            return result
+
+        return evaluate_chunked(evaluate, _as_vectors(vecs))
+
+    h_factor = -log(gain) / log(lacunarity) if lacunarity != 1 else 0.0
+    noise.seed_set(seed)
+    noise_function = noise.fractal
+    return np.array([noise_function(v, h_factor, lacunarity, octaves, noise_basis=noise_type)
+                     for v in _as_list(vecs)], dtype=np.float64)
@@ -0,0 +1,158 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Factorizations of linear systems of NURBS solvers.
+
+Equations of NURBS curve and surface solvers are the same for all coordinates
+of control points, so a system is M @ X = B, where M is a matrix of values of
+basis functions (n_equations x n_control_points), and X, B have one column per
+coordinate. M is sparse: only (degree+1) basis functions are not zero at any
+parameter value.
+
+A factorization of M depends only on degree, knotvector and parameters of
+goals, but not on target points. Factorizations are cached by a key which
+describes these things, so solving the same problem with other targets (when
+targets are animated, or when many curves with the same parametrization are
+interpolated) costs only back-substitution:
+
+    factorization = get_factorization(key, lambda: calc_matrix(...))
+    X, residue = factorization.solve(B)
+
+If SciPy is available, big systems are factorized by sparse LU decomposition
+(normal equations are used for over- and underdetermined systems), otherwise
+(pseudo)inverse matrix is calculated.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    import scipy.sparse
+    import scipy.sparse.linalg
+
+# max number of cached factorizations
+CACHE_SIZE = 32
+# systems with less unknowns are solved with dense matrices
+SPARSE_THRESHOLD = 64
+# normal equations with bigger condition number are solved with pseudo-inverse matrix,
+# they square condition number of the system
+MAX_CONDITION_NUMBER = 1e10
+
+_cache = OrderedDict()
+
+
+class SvLinearFactorization:
+    """
+    Factorization of matrix M of linear system M @ X = B.
+    The matrix is factorized on first call of `solve`.
+    """
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self._solve = None
+
+    @property
+    def shape(self):
+        return self.matrix.shape
+
+    def is_sparse(self):
+        return scipy is not None and min(self.shape) >= SPARSE_THRESHOLD
+
+    def dense_matrix(self):
+        if scipy is not None and scipy.sparse.issparse(self.matrix):
+            return self.matrix.toarray()
+        return np.asarray(self.matrix)
+
+    def _factorize(self):
+        n_equations, n_unknowns = self.shape
+        if self.is_sparse():
+            matrix = scipy.sparse.csc_matrix(self.matrix)
+            matrix.eliminate_zeros()
+            try:
+                if n_equations == n_unknowns:
+                    lu = scipy.sparse.linalg.splu(matrix)
+                    return lu.solve
+                elif n_equations > n_unknowns:
+                    # least squares solution
+                    normal = (matrix.T @ matrix).tocsc()
+                    lu = scipy.sparse.linalg.splu(normal)
+                    if _is_well_conditioned(normal, lu):
+                        return lambda b: lu.solve(matrix.T @ b)
+                else:
+                    # solution with minimal norm
+                    normal = (matrix @ matrix.T).tocsc()
+                    lu = scipy.sparse.linalg.splu(normal)
+                    if _is_well_conditioned(normal, lu):
+                        return lambda b: matrix.T @ lu.solve(b)
+            except RuntimeError:
+                # exactly singular matrix; dense inversion raises LinAlgError
+                # or gives the same result as it was before sparse solvers
+                pass
+            # (almost) rank deficient system, pseudo-inverse gives the solution with minimal norm
+
+        matrix = self.dense_matrix()
+        if n_equations == n_unknowns:
+            inverse = np.linalg.inv(matrix)
+        else:
+            inverse = np.linalg.pinv(matrix)
+        return lambda b: inverse @ b
+
+    def solve(self, b):
+        """
+        :param b: right-hand side, np.array of shape (n_equations, n_columns)
+        :return: solution of shape (n_unknowns, n_columns) and sum of squared residuals
+            (it is not zero only for overdetermined systems)
+        """
+        if self._solve is None:
+            self._solve = self._factorize()
+        b = np.asarray(b, dtype=np.float64)
+        x = self._solve(b)
+        n_equations, n_unknowns = self.shape
+        if n_equations > n_unknowns:
+            residue = float(((self.matrix @ x - b) ** 2).sum())
+        else:
+            residue = 0.0
+        return x, residue
+
+
+def _is_well_conditioned(matrix, lu):
+    # estimation of 1-norm condition number, matrix is symmetric
+    inverse = scipy.sparse.linalg.LinearOperator(matrix.shape, matvec=lu.solve, rmatvec=lu.solve)
+    condition = scipy.sparse.linalg.onenormest(inverse) * scipy.sparse.linalg.norm(matrix, 1)
+    return condition < MAX_CONDITION_NUMBER
+
+
+def array_key(array):
+    """Hashable representation of array values"""
+    return np.asarray(array, dtype=np.float64).tobytes()
+
+
+def get_factorization(key, calc_matrix):
+    """
+    Cached factorization of a matrix
+    :param key: hashable description of the matrix, if None the factorization is not cached
+    :param calc_matrix: function which returns the matrix (np.array or scipy sparse matrix)
+    :return: SvLinearFactorization
+    """
+    if key is None:
+        return SvLinearFactorization(calc_matrix())
+    factorization = _cache.get(key)
+    if factorization is not None:
+        _cache.move_to_end(key)
+        return factorization
+    factorization = SvLinearFactorization(calc_matrix())
+    _cache[key] = factorization
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return factorization
+
+
+def clear_cache():
+    _cache.clear()
@@ -0,0 +1,117 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Cache of mesh data read from scene objects.
+
+Every data block which was updated by the depsgraph gets its version
+incremented (see `tag_depsgraph_updates`, called from depsgraph update handler).
+Data read from an object is kept until the versions of the object, its data
+and its materials change, or until the frame changes. This lets scene
+dependent trees skip re-reading of objects which were not touched.
+"""
+
+from collections import defaultdict
+
+import bpy
+
+from sverchok.utils.blender_mesh import read_mesh_arrays
+
+_id_versions = defaultdict(int)
+_node_caches = defaultdict(dict)
+
+
+def tag_depsgraph_updates(depsgraph):
+    """Should be called from depsgraph_update_post handler"""
+    for update in depsgraph.updates:
+        _id_versions[update.id.original.as_pointer()] += 1
+
+
+def object_version(obj):
+    """Key which changes each time the object or data it depends on is updated"""
+    data_version = _id_versions[obj.data.as_pointer()] if obj.data is not None else 0
+    materials = tuple(_id_versions[slot.material.as_pointer()]
+                      for slot in getattr(obj, 'material_slots', []) if slot.material is not None)
+    return (_id_versions[obj.as_pointer()], data_version, materials, bpy.context.scene.frame_current)
+
+
+def get_object_mesh(obj, depsgraph=None):
+    """
+    Return (mesh, owner) of an object, mesh should be released with
+    owner.to_mesh_clear(). If depsgraph is given, evaluated mesh
+    (with modifiers) is returned.
+    """
+    if depsgraph is not None or obj.type == 'META':
+        if depsgraph is None:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+        owner = obj.evaluated_get(depsgraph)
+        return owner.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph), owner
+    return obj.to_mesh(), obj
+
+
+class ObjectsDataReader:
+    """
+    Reads mesh arrays (see `read_mesh_arrays`) of objects, reusing data cached
+    by the previous evaluation of the same node if an object was not changed.
+    `finish` should be called after all objects are read, objects which were
+    not read during the current evaluation are removed from the cache.
+
+    reader = ObjectsDataReader(node_id(self))
+    for obj in objects:
+        data = reader.read(obj, {'vertices', 'polygons'})
+    reader.finish()
+    """
+    def __init__(self, node_key, use_cache=True):
+        self.node_key = node_key
+        self.use_cache = use_cache
+        self._old = _node_caches.get(node_key, {})
+        self._new = {}
+
+    def finish(self):
+        if self.use_cache:
+            _node_caches[self.node_key] = self._new
+        else:
+            _node_caches.pop(self.node_key, None)
+        self._old = {}
+
+    def read(self, obj, names, depsgraph=None, extra=None):
+        """
+        :param names: names of arrays to read
+        :param depsgraph: if given, the mesh is read with modifiers applied
+        :param extra: optional function(mesh) -> dict, which reads additional data
+            which should be cached together with the arrays
+        """
+        names = tuple(sorted(names))
+        key = (obj.as_pointer(), obj.name, names, depsgraph is not None, extra is not None)
+        use_cache = self.use_cache and obj.mode != 'EDIT'
+        if use_cache:
+            version = object_version(obj)
+            cached = self._old.get(key)
+            if cached is not None and cached[0] == version:
+                self._new[key] = cached
+                return cached[1]
+
+        mesh, owner = get_object_mesh(obj, depsgraph)
+        try:
+            data = read_mesh_arrays(mesh, names)
+            if extra is not None:
+                data.update(extra(mesh))
+        finally:
+            owner.to_mesh_clear()
+
+        if use_cache:
+            self._new[key] = (version, data)
+        return data
+
+
+def clear_cache(node_key=None):
+    """Remove cached data of given node or of all nodes"""
+    if node_key is None:
+        _node_caches.clear()
+        _id_versions.clear()
+    else:
+        _node_caches.pop(node_key, None)
@@ -0,0 +1,283 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Processing of independent objects in a pool of worker processes.
+
+Many nodes process each of input objects (meshes, sets of points) separately,
+so objects can be processed in parallel. The node moves processing of one
+object into a kernel - a function defined at the top level of a module,
+and passes arguments of the kernel for each object to `map_objects`:
+
+    from sverchok.utils.parallel import map_objects
+    results = map_objects(pulga_system_object, [(params, gates) for params in objects])
+
+Worker processes are plain Python processes without Blender, so the kernel
+module should not import bpy, bmesh or mathutils. Packages of Sverchok are
+imported in workers without executing their `__init__` modules, so the
+kernel module should import names from modules, not from packages.
+
+The pool of workers is created once and kept until the add-on is disabled.
+NumPy arrays of arguments bigger than SHARED_MIN_SIZE bytes are passed to
+workers through `multiprocessing.shared_memory` instead of being pickled.
+Results are returned in order of objects; if the kernel fails on some
+object, SvObjectProcessingError with index of the object is raised.
+
+The number of workers is set by "Worker processes" option of preferences.
+Objects are processed in the main process if there is only one worker, or
+only one object, or if worker processes can't be started.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+from sverchok.core.sv_custom_exceptions import SvObjectProcessingError
+
+# the same logger as sv_logging.sv_logger, that module can't be imported in workers
+sv_logger = logging.getLogger('sverchok')
+
+# smaller arrays are pickled
+SHARED_MIN_SIZE = 2 ** 16
+
+# each worker gets about this number of tasks, so that workers
+# which got simple objects do not wait for others
+TASKS_PER_WORKER = 4
+
+SVERCHOK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executed in worker processes before they get any task. Modules of Sverchok
+# packages are created without executing __init__ modules, which need Blender.
+# NumPy is limited to one thread in each worker not to oversubscribe CPUs.
+WORKER_BOOTSTRAP = """
+import os, sys, types
+for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+    os.environ.setdefault(variable, '1')
+for path, dirs, files in os.walk(sverchok_dir):
+    dirs[:] = [d for d in dirs if not d.startswith(('.', '__'))]
+    if path != sverchok_dir and '__init__.py' not in files:
+        continue
+    relative = os.path.relpath(path, sverchok_dir)
+    name = 'sverchok' if relative == '.' else 'sverchok.' + relative.replace(os.sep, '.')
+    package = types.ModuleType(name)
+    package.__path__ = [path]
+    package.__package__ = name
+    sys.modules[name] = package
+"""
+
+_pool = None
+_pool_workers = 0
+_pool_broken = False
+
+
+def workers_number():
+    """Number of worker processes from preferences, 0 there means number of CPUs"""
+    from sverchok.settings import get_param
+    workers = get_param('parallel_workers', 0)
+    return workers or os.cpu_count() or 1
+
+
+def get_pool(workers):
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdown_pool()
+        _pool = ProcessPoolExecutor(max_workers=workers,
+                                    mp_context=multiprocessing.get_context('spawn'),
+                                    initializer=exec,
+                                    initargs=(WORKER_BOOTSTRAP, {'sverchok_dir': SVERCHOK_DIR}))
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+class SharedArray:
+    """Picklable reference to a copy of np.array in shared memory"""
+    def __init__(self, memory, shape, dtype):
+        self.name = memory.name
+        self.shape = shape
+        self.dtype = dtype
+
+    @classmethod
+    def create(cls, array):
+        memory = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)
+        shared[...] = array
+        return cls(memory, array.shape, array.dtype.str), memory
+
+    def attach(self):
+        """Array using the shared memory (read only) and the memory"""
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=self.name, track=False)
+        else:
+            # the memory is owned by the main process; if a worker registered it
+            # in resource tracker, the memory would be released by the worker
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                memory = shared_memory.SharedMemory(name=self.name)
+            finally:
+                resource_tracker.register = register
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf)
+        array.flags.writeable = False
+        return array, memory
+
+
+def share_arrays(data, memories):
+    """
+    Replace big np.arrays in (nested lists, tuples or dicts of) data by SharedArray.
+    :param memories: dict of arrays which are already shared, {id(array): (array, SharedArray, memory)};
+        new shared arrays are added to it, so an array passed to many objects is copied only once.
+    """
+    if isinstance(data, np.ndarray):
+        if data.nbytes >= SHARED_MIN_SIZE and data.dtype.kind in 'biufc':
+            if id(data) not in memories:
+                shared, memory = SharedArray.create(data)
+                memories[id(data)] = (data, shared, memory)
+            return memories[id(data)][1]
+        return data
+    if type(data) in (list, tuple):
+        # lists of numbers are the most common and are skipped quickly
+        if not data or not isinstance(data[0], (list, tuple, dict, np.ndarray)):
+            return data
+        items = [share_arrays(item, memories) for item in data]
+        if all(new is old for new, old in zip(items, data)):
+            return data
+        return type(data)(items)
+    if type(data) is dict:
+        items = {key: share_arrays(value, memories) for key, value in data.items()}
+        if all(items[key] is value for key, value in data.items()):
+            return data
+        return items
+    return data
+
+
+def attach_arrays(data, memories):
+    """
+    Reverse of share_arrays, used in workers.
+    :param memories: dict of attached arrays, {name of memory: (array, memory)}
+    """
+    if isinstance(data, SharedArray):
+        if data.name not in memories:
+            memories[data.name] = data.attach()
+        return memories[data.name][0]
+    if type(data) in (list, tuple):
+        if not data or not isinstance(data[0], (list, tuple, dict, np.ndarray, SharedArray)):
+            return data
+        return type(data)(attach_arrays(item, memories) for item in data)
+    if type(data) is dict:
+        return {key: attach_arrays(value, memories) for key, value in data.items()}
+    return data
+
+
+def release_memories(memories):
+    for _, memory in memories.values():
+        try:
+            memory.close()
+        except BufferError:
+            # some array still uses the memory, it is released with the array
+            pass
+    memories.clear()
+
+
+# shared memory used by the previous task of the worker; it is released at
+# the start of the next task, when results of the previous one are sent
+_attached_memories = dict()
+
+
+def run_kernel(kernel, start, objects_args):
+    """
+    Called in worker processes for a chunk of objects.
+    Returns (True, results) or (False, (index of failed object, description of error)).
+    """
+    release_memories(_attached_memories)
+    results = []
+    for index, args in enumerate(objects_args, start):
+        try:
+            results.append(kernel(*attach_arrays(args, _attached_memories)))
+        except Exception as e:
+            return False, (index, f"{type(e).__name__}: {e}", traceback.format_exc())
+    return True, results
+
+
+def map_kernel(kernel, objects_args):
+    """Process objects in the main process"""
+    results = []
+    for index, args in enumerate(objects_args):
+        try:
+            results.append(kernel(*args))
+        except Exception as e:
+            raise SvObjectProcessingError(index, f"{type(e).__name__}: {e}") from e
+    return results
+
+
+def map_objects(kernel, objects_args, workers=None):
+    """
+    Call kernel(*args) for args of each object in worker processes.
+    :param kernel: function defined at the top level of a module which does not need Blender
+    :param objects_args: list of tuples of arguments, one tuple per object
+    :param workers: number of worker processes, by default it is taken from preferences
+    :return: list of results of kernel in order of objects
+    """
+    global _pool_broken
+    objects_args = list(objects_args)
+    if workers is None:
+        workers = workers_number()
+    workers = min(workers, len(objects_args))
+    if workers < 2 or _pool_broken:
+        return map_kernel(kernel, objects_args)
+
+    memories = dict()
+    try:
+        shared_args = [share_arrays(args, memories) for args in objects_args]
+        chunk_size = math.ceil(len(objects_args) / (workers * TASKS_PER_WORKER))
+        pool = get_pool(workers)
+        futures = [pool.submit(run_kernel, kernel, start, shared_args[start: start + chunk_size])
+                   for start in range(0, len(shared_args), chunk_size)]
+        try:
+            chunks = [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            sv_logger.warning("Worker processes can't be used, objects are processed sequentially: %s", e)
+            shutdown_pool()
+            _pool_broken = True
+            return map_kernel(kernel, objects_args)
+        except Exception as e:
+            # mostly it's an error of pickling arguments or results
+            sv_logger.warning("Objects can't be processed in worker processes, they are processed sequentially: %s", e)
+            for future in futures:
+                future.cancel()
+            return map_kernel(kernel, objects_args)
+    finally:
+        for _, _, memory in memories.values():
+            memory.close()
+            memory.unlink()
+
+    results = []
+    for success, chunk in chunks:
+        if not success:
+            index, message, trace = chunk
+            sv_logger.debug("Object #%s failed in worker process:\n%s", index, trace)
+            raise SvObjectProcessingError(index, message)
+        results.extend(chunk)
+    return results
+
+
+def unregister():
+    shutdown_pool()
@@ -822,6 +822,13 @@ def pulga_system_init(params, parameters, gates, out_lists, cache):
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"]
 
 
+def pulga_system_object(params, parameters, gates, cache):
+    '''pulga_system_init for one object, kernel for worker processes'''
+    out_lists = [[], [], [], []]
+    cache_new = pulga_system_init(params, parameters, gates, out_lists, cache)
+    return out_lists, cache_new
+
+
 def iterate(iterations_max, force_map, force_parameters, out_params):
     ''' execute repeatedly the defined force map'''
     num_forces = len(force_map)
@@ -0,0 +1,389 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Columnar representation of nested lists of numbers, similar to list arrays
+of Apache Arrow. Nested list of depth D is stored as flat array of values
+plus D arrays of offsets, one per nesting level:
+
+    [[[1, 2], [3]], [[4, 5, 6]]]
+    offsets[0] = [0, 2]        # the data itself contains items 0..2 of level 1
+    offsets[1] = [0, 2, 3]     # lists of level 1 contain items 0..2, 2..3 of level 2
+    offsets[2] = [0, 2, 3, 6]  # lists of level 2 contain values 0..2, 2..3, 3..6
+    values = [1, 2, 3, 4, 5, 6]
+
+Restructuring operations (flatten, graft, wrap, matching of list lengths)
+only do arithmetic on offsets, and converting from and to nested lists is
+done one nesting level at a time instead of one item at a time.
+
+Only lists of uniform depth are supported, that is all numbers should be
+at the same level and only lists of the last level can be empty, because
+nesting level of other data is ambiguous. SvRaggedArray.from_nested
+returns None for data it can not represent, so callers can fall back to
+the generic recursive implementation.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+CONTAINER_TYPES = {list, tuple}
+NUMERIC_TYPES = {float, int, np.float64, np.int32, np.int64}
+
+
+def counts_to_offsets(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+def concatenated_ranges(starts, counts):
+    """Concatenation of ranges [start, start + count) for each pair of start and count"""
+    offsets = counts_to_offsets(counts)
+    return np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], counts)
+
+def estimated_size(data):
+    """Number of values in nested lists, estimated by lengths of the first lists of each level"""
+    size = 1
+    while type(data) in CONTAINER_TYPES:
+        size *= len(data)
+        if not data:
+            break
+        data = data[0]
+    return size
+
+def group_items(items, offsets, as_tuples=False):
+    """Split python list into lists (or tuples) of items by offsets"""
+    n = len(offsets) - 1
+    if n > 0 and len(items) and len(items) == n * (len(items) // n):
+        # lists of equal length are grouped by zip
+        size = len(items) // n
+        if (offsets[1] - offsets[0]) == size and (np.diff(offsets) == size).all():
+            groups = zip(*[iter(items)] * size)
+            return list(groups) if as_tuples else list(map(list, groups))
+    bounds = offsets.tolist()
+    if as_tuples:
+        return [tuple(items[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+    return [items[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+class SvRaggedArray:
+    """
+    Nested list of numbers as flat array of values plus array of offsets
+    per nesting level; refer to module docstring for the layout.
+
+    tuples[i] is True if lists of level i were tuples in the source data;
+    operations keep them for lists which were kept as is by the
+    corresponding operations of data_structure.
+    """
+    def __init__(self, values, offsets, tuples=None):
+        self.values = values
+        self.offsets = offsets
+        if tuples is None:
+            tuples = [False] * len(offsets)
+        self.tuples = tuples
+
+    def __repr__(self):
+        return f"<SvRaggedArray: depth {self.depth}, {len(self.values)} values>"
+
+    @property
+    def depth(self):
+        return len(self.offsets)
+
+    def level_size(self, level):
+        """Number of items at the given nesting level; the last level is values"""
+        if level == 0:
+            return 1
+        return int(self.offsets[level - 1][-1])
+
+    def counts(self, level):
+        """Lengths of lists of the given nesting level"""
+        return np.diff(self.offsets[level])
+
+    @classmethod
+    def from_nested(cls, data):
+        """
+        Convert nested lists (or tuples) of numbers.
+        Returns None if data contain objects which are not numbers,
+        or numbers at different nesting levels.
+        """
+        if type(data) not in CONTAINER_TYPES:
+            return None
+        probe = data
+        while type(probe) in CONTAINER_TYPES and len(probe):
+            probe = probe[0]
+        if type(probe) not in CONTAINER_TYPES and type(probe) not in NUMERIC_TYPES:
+            return None
+
+        items = [data]
+        offsets = []
+        tuples = []
+        while items:
+            types = set(map(type, items))
+            if not types <= CONTAINER_TYPES:
+                break
+            if len(types) > 1:
+                return None
+            if offsets and not np.diff(offsets[-1]).all():
+                # empty list above the last level
+                return None
+            tuples.append(tuple in types)
+            counts = np.fromiter(map(len, items), dtype=np.int64, count=len(items))
+            offsets.append(counts_to_offsets(counts))
+            items = list(chain.from_iterable(items))
+        else:
+            return cls(np.zeros(0), offsets, tuples)
+
+        if not types <= NUMERIC_TYPES:
+            return None
+        return cls(cls._values_array(items, types), offsets, tuples)
+
+    @staticmethod
+    def _values_array(items, types):
+        try:
+            if types == {float}:
+                return np.array(items, dtype=np.float64)
+            if types == {int}:
+                return np.array(items, dtype=np.int64)
+        except OverflowError:
+            pass
+        # mixed types are kept as python objects
+        values = np.empty(len(items), dtype=object)
+        values[:] = items
+        return values
+
+    def to_nested(self):
+        """Convert back to nested lists"""
+        items = self.values.tolist()
+        for offsets, as_tuples in zip(reversed(self.offsets), reversed(self.tuples)):
+            items = group_items(items, offsets, as_tuples)
+        return items[0]
+
+    def flatten(self, target_level=1):
+        """Same as data_structure.flatten_data"""
+        if target_level < 1 or target_level > self.depth:
+            raise TypeError(f"Can't flatten data to level {target_level}: data already have level {self.depth}")
+        if target_level == self.depth:
+            return self
+        level = self.depth - target_level + 1
+        offsets = [np.array([0, self.level_size(level)], dtype=np.int64)] + self.offsets[level:]
+        return SvRaggedArray(self.values, offsets, [False] + self.tuples[level:])
+
+    def graft(self, item_level=1, wrap_level=1):
+        """Same as data_structure.graft_data"""
+        if item_level < 0 or item_level > self.depth:
+            raise TypeError(f"Can't graft items of level {item_level}: data have level {self.depth}")
+        level = self.depth - item_level
+        wrappers = [np.arange(self.level_size(level) + 1, dtype=np.int64)] * wrap_level
+        offsets = self.offsets[:level] + wrappers + self.offsets[level:]
+        tuples = [False] * (level + wrap_level) + self.tuples[level:]
+        return SvRaggedArray(self.values, offsets, tuples)
+
+    def wrap(self, wrap_level=1):
+        """Same as data_structure.wrap_data"""
+        return self.graft(item_level=self.depth, wrap_level=wrap_level)
+
+    def unwrap(self, unwrap_level=1):
+        """Same as data_structure.unwrap_data"""
+        result = self
+        for level in range(unwrap_level):
+            if result.depth == 0:
+                raise Exception(f"Cannot unwrap data: Data at level {level} is an atomic object, not a list")
+            n = result.level_size(1)
+            if n == 0:
+                raise Exception(f"Cannot unwrap data: Data at level {level} is an empty list")
+            elif n > 1:
+                raise Exception(f"Cannot unwrap data: Data at level {level} contains {n} objects instead of one")
+            result = SvRaggedArray(result.values, result.offsets[1:], result.tuples[1:])
+        return result
+
+    def select(self, level, indices):
+        """
+        Take items of the given level (with everything nested in them) by indices.
+        Returns offsets of levels below the given one and values.
+        """
+        offsets = []
+        for lvl in range(level, self.depth):
+            level_offsets = self.offsets[lvl]
+            counts = level_offsets[indices + 1] - level_offsets[indices]
+            offsets.append(counts_to_offsets(counts))
+            indices = concatenated_ranges(level_offsets[indices], counts)
+        return offsets, self.values[indices]
+
+    def take(self, indices):
+        """New array, which contains items of the top level list by indices"""
+        indices = np.asarray(indices, dtype=np.int64)
+        offsets, values = self.select(1, indices)
+        top = np.array([0, len(indices)], dtype=np.int64)
+        return SvRaggedArray(values, [top] + offsets, [False] + self.tuples[1:])
+
+    def reduce(self, ufunc):
+        """
+        Reduce each list of the last level by numpy ufunc, for example np.add or np.minimum.
+        Returns np.array with one value per list.
+        """
+        offsets = self.offsets[-1]
+        if not len(offsets) > 1:
+            return self.values[:0]
+        if (offsets[1:] == offsets[:-1]).any():
+            raise ValueError("Can't reduce empty list")
+        return ufunc.reduceat(self.values, offsets[:-1])
+
+    def map_at_level(self, function, item_level=0):
+        """
+        Same as data_structure.map_at_level: call function for each item
+        of the given nesting level; structure of upper levels is kept.
+        """
+        level = self.depth - item_level
+        items = self.values.tolist()
+        for lvl in range(self.depth - 1, level - 1, -1):
+            items = group_items(items, self.offsets[lvl], self.tuples[lvl])
+        items = list(map(function, items))
+        for lvl in range(level - 1, -1, -1):
+            items = group_items(items, self.offsets[lvl])
+        return items[0]
+
+
+def match_indices(counts, mode):
+    """
+    Indices which match lists of several arrays, level by level.
+    counts: np.array of shape (n_arrays, n_lists), lengths of each list of each array.
+    mode: one of 'SHORT', 'CYCLE', 'REPEAT' and 'XREF', same as match_short,
+        match_long_cycle, match_long_repeat and match_cross2 of data_structure.
+    Returns offsets of matched lists (common for all arrays) and
+    np.array of shape (n_arrays, n_items) of indices of items in each list.
+    """
+    if mode == 'SHORT':
+        new_counts = counts.min(axis=0)
+    elif mode in {'CYCLE', 'REPEAT'}:
+        new_counts = counts.max(axis=0)
+    elif mode == 'XREF':
+        new_counts = counts.prod(axis=0)
+    else:
+        raise ValueError(f"Unknown matching mode: {mode}")
+    offsets = counts_to_offsets(new_counts)
+    # position of each item in its list
+    positions = np.arange(offsets[-1]) - np.repeat(offsets[:-1], new_counts)
+    item_counts = np.repeat(counts, new_counts, axis=1)
+    if mode == 'SHORT':
+        indices = np.broadcast_to(positions, item_counts.shape)
+    elif mode == 'CYCLE':
+        indices = positions % item_counts
+    elif mode == 'REPEAT':
+        indices = np.minimum(positions, item_counts - 1)
+    else:
+        # the first list changes fastest
+        strides = np.cumprod(np.concatenate((np.ones((1, item_counts.shape[1]), dtype=np.int64), item_counts[:-1])), axis=0)
+        indices = (positions // strides) % item_counts
+    return offsets, indices
+
+
+def match_ragged(arrays, level=1, mode='REPEAT', final_mode=None):
+    """
+    Match lengths of lists of several arrays, same as List Match node does:
+    lists of all levels up to the given one are matched with `mode`,
+    and lists of the given level with `final_mode`.
+    Returns list of arrays, or None if some list is empty, because
+    matching of an empty list produces an empty result instead.
+    """
+    if final_mode is None:
+        final_mode = mode
+    if any(array.depth < level for array in arrays):
+        raise TypeError(f"Can't match lists at level {level}: data have level {min(a.depth for a in arrays)}")
+    for lvl in range(level):
+        counts = np.stack([array.counts(lvl) for array in arrays])
+        if not counts.all():
+            return None
+        offsets, indices = match_indices(counts, final_mode if lvl == level - 1 else mode)
+        matched = []
+        for array, idxs in zip(arrays, indices):
+            below, values = array.select(lvl + 1, array.offsets[lvl][:-1].repeat(np.diff(offsets)) + idxs)
+            matched.append(SvRaggedArray(values, array.offsets[:lvl] + [offsets] + below,
+                                         [False] * (lvl + 1) + array.tuples[lvl + 1:]))
+        arrays = matched
+    return arrays
+
+
+# Batching of objects.
+# Nodes often process many small objects (lists of numbers or of vectors)
+# with the same numpy function. Concatenating them into one array, calling
+# the function once and splitting the result back is much faster than
+# calling the function per object.
+
+def concatenate_objects(objects, item_shape=()):
+    """
+    Concatenate objects (lists or np.arrays of numbers or of vectors) into one array.
+    item_shape: shape of one item of an object, () for numbers, (3,) for vectors.
+    Returns the array and offsets of objects in it, or None if objects are
+    empty or of different number types, so that processing of the
+    concatenated array could give different results than processing of
+    each object separately.
+    """
+    if not objects:
+        return None
+    try:
+        counts = np.fromiter(map(len, objects), dtype=np.int64, count=len(objects))
+    except TypeError:
+        return None
+    if not counts.all():
+        return None
+    if all(isinstance(obj, np.ndarray) for obj in objects):
+        if len({obj.dtype for obj in objects}) > 1 or len({obj.shape[1:] for obj in objects}) > 1:
+            return None
+        array = np.concatenate(objects)
+    else:
+        # each object would be converted to an array of ints if its first
+        # number is int and there are no floats in it
+        try:
+            firsts = [obj[0][0] for obj in objects] if item_shape else [obj[0] for obj in objects]
+        except (TypeError, IndexError):
+            return None
+        types = set(map(type, firsts))
+        if types <= {float}:
+            kind = 'f'
+        elif types <= {int}:
+            kind = 'i'
+        else:
+            return None
+        try:
+            array = np.array(list(chain.from_iterable(objects)))
+        except ValueError:
+            return None
+        if array.dtype.kind != kind:
+            return None
+    if array.shape[1:] != item_shape or array.dtype.kind not in 'iuf':
+        return None
+    return array, counts_to_offsets(counts)
+
+def match_objects(offsets, mode='REPEAT'):
+    """
+    Match lengths of objects of several concatenated arrays.
+    offsets: list of offsets of objects in each array; all arrays should
+        have the same number of objects.
+    mode: 'SHORT', 'CYCLE' or 'REPEAT', same as numpy_list_match_func of data_structure.
+    Returns offsets of matched objects and list of indices of items in each array.
+    """
+    counts = np.stack([np.diff(array_offsets) for array_offsets in offsets])
+    new_offsets, indices = match_indices(counts, mode)
+    new_counts = np.diff(new_offsets)
+    return new_offsets, [np.repeat(array_offsets[:-1], new_counts) + idxs
+                         for array_offsets, idxs in zip(offsets, indices)]
+
+def split_objects(array, offsets, out_numpy=False):
+    """Split concatenated array back to objects: list of np.arrays or of lists"""
+    if out_numpy:
+        return np.split(array, offsets[1:-1])
+    return group_items(array.tolist(), offsets)
+
+def fill_objects(structure, objects):
+    """
+    Replace indices in nested lists by objects with these indices.
+    Used to put results of batched processing back to the nesting
+    structure of the input data.
+    """
+    if isinstance(structure, int):
+        return objects[structure]
+    return [fill_objects(item, objects) for item in structure]
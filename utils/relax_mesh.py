@@ -6,17 +6,11 @@
 # License-Filename: LICENSE
 
 import numpy as np
-from collections import defaultdict
-from math import sqrt
 
-import bmesh
-import mathutils
 from mathutils.bvhtree import BVHTree
 
 from sverchok.data_structure import repeat_last_for_length
 from sverchok.utils.sv_mesh_utils import polygons_to_edges
-from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
-from sverchok.utils.geom import center, linear_approximation
 
 NONE = 'NONE'
 BVH = 'BVH'
@@ -27,117 +21,196 @@ MINIMUM = 'MIN'
 MAXIMUM = 'MAX'
 AVERAGE = 'MEAN'
 
-def mask_axes(src_vert, dst_vert, axes):
-    if axes == {0,1,2}:
-        return dst_vert
-    result = []
-    for axis in range(3):
-        if axis in axes:
-            result.append(dst_vert[axis])
-        else:
-            result.append(src_vert[axis])
+
+class _MeshTopology:
+    """
+    Vertex - face incidence of a mesh, built once. Faces are grouped by number of sides,
+    so values of face corners are arrays of shape (n_faces, n_sides, k) per group.
+    Sums over faces of a vertex are done by np.bincount over flat corners, which is
+    the same as multiplication by sparse incidence matrix.
+    """
+    def __init__(self, n_verts, faces):
+        sizes = np.array([len(face) for face in faces], dtype=np.int64)
+        self.n_verts = n_verts
+        self.n_faces = len(faces)
+        self.groups = []  # (indexes of faces, vertex indexes of shape (n_faces, n_sides))
+        for size in np.unique(sizes):
+            face_idxs = np.flatnonzero(sizes == size)
+            verts = np.array([faces[i] for i in face_idxs], dtype=np.int64).reshape(len(face_idxs), size)
+            self.groups.append((face_idxs, verts))
+        self.corner_verts = np.concatenate([verts.ravel() for _, verts in self.groups]) \
+            if self.groups else np.zeros(0, dtype=np.int64)
+        self.corner_faces = np.concatenate([np.repeat(face_idxs, verts.shape[1]) for face_idxs, verts in self.groups]) \
+            if self.groups else np.zeros(0, dtype=np.int64)
+        self.vert_face_counts = np.bincount(self.corner_verts, minlength=n_verts)
+
+    def sum_to_verts(self, values):
+        """Sum values of face corners (n_corners, k), in order of corner_verts, by vertices"""
+        return np.stack([np.bincount(self.corner_verts, weights=values[:, i], minlength=self.n_verts)
+                         for i in range(values.shape[1])], axis=-1)
+
+    def _per_face(self, function, verts):
+        result = np.empty((self.n_faces, 3))
+        for face_idxs, face_verts in self.groups:
+            result[face_idxs] = function(verts[face_verts])
+        return result
+
+    def face_centers(self, verts):
+        """The same as BMFace.calc_center_median"""
+        return self._per_face(lambda points: _sum_sides(points) / points.shape[1], verts)
+
+    def face_area_vectors(self, verts):
+        """Normals of faces with length equal to the area (Newell's method, as Blender does)"""
+        return self._per_face(lambda points: _sum_sides(_cross(points, np.roll(points, -1, axis=1))) / 2.0, verts)
+
+    def face_areas(self, verts):
+        """The same as BMFace.calc_area"""
+        return _lengths(self.face_area_vectors(verts))
+
+    def vertex_normals(self, verts):
+        """The same as BMVert.normal after BMesh.normal_update: face normals weighted by corner angles"""
+        weighted = []
+        for face_idxs, face_verts in self.groups:
+            points = verts[face_verts]
+            next_points = np.roll(points, -1, axis=1)
+            face_normals = _normalized(_sum_sides(_cross(points, next_points)))
+            # angle of a corner is the angle between its outgoing edge and reversed incoming edge
+            edges = _normalized(next_points - points)
+            cosines = -_dot(np.roll(edges, 1, axis=1), edges)
+            angles = np.arccos(np.clip(cosines, -1.0, 1.0))
+            weighted.append((face_normals[:, np.newaxis, :] * angles[..., np.newaxis]).reshape(-1, 3))
+        normals = self.sum_to_verts(np.concatenate(weighted)) if weighted else np.zeros((self.n_verts, 3))
+        # Blender uses direction from origin to the vertex for vertices without faces
+        bad = _lengths(normals) == 0
+        normals[bad] = verts[bad]
+        return _normalized(normals)
+
+    def boundary_verts_mask(self):
+        """The same as BMVert.is_boundary: vertex has an edge with exactly one face"""
+        edges = np.concatenate([np.stack((verts, np.roll(verts, -1, axis=1)), axis=-1).reshape(-1, 2)
+                                for _, verts in self.groups]) if self.groups else np.zeros((0, 2), dtype=np.int64)
+        edges, counts = np.unique(np.sort(edges, axis=1), axis=0, return_counts=True)
+        mask = np.zeros(self.n_verts, dtype=bool)
+        mask[edges[counts == 1].ravel()] = True
+        return mask
+
+
+def _cross(a, b):
+    # np.cross is noticeably slower on big arrays
+    ax, ay, az = a[..., 0], a[..., 1], a[..., 2]
+    bx, by, bz = b[..., 0], b[..., 1], b[..., 2]
+    return np.stack((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx), axis=-1)
+
+
+def _dot(a, b):
+    return np.einsum('...k,...k->...', a, b)
+
+
+def _lengths(vectors):
+    return np.sqrt(_dot(vectors, vectors))
+
+
+def _sum_sides(values):
+    """Sum of values of shape (n_faces, n_sides, 3) over sides of faces, it's faster than sum(axis=1)"""
+    result = values[:, 0].copy()
+    for i in range(1, values.shape[1]):
+        result += values[:, i]
     return result
 
-def map_mask_axes(src_verts, dst_verts, axes):
-    if axes == {0,1,2}:
-        return dst_verts
-    result = np.asarray(src_verts).copy()
-    dst = np.asarray(dst_verts)
-    for i in range(3):
-        if i in axes:
-            result[:,i] = dst[:,i]
-    return result.tolist()
+
+def _normalized(vectors):
+    lengths = _lengths(vectors)
+    lengths[lengths == 0] = 1.0
+    return vectors / lengths[..., np.newaxis]
+
+
+def _tangent_move(verts, targets, normals):
+    """Move vertices towards targets along planes orthogonal to normals (unit or zero vectors)"""
+    dv = targets - verts
+    dv -= normals * _dot(dv, normals)[:, np.newaxis]
+    return verts + dv
+
+
+def _bvh_nearest(bvh, points):
+    return np.array([bvh.find_nearest(point)[0] for point in points.tolist()], dtype=np.float64).reshape(-1, 3)
+
+
+def _axes_mask(use_axes):
+    return np.array([axis in use_axes for axis in range(3)])
+
+
+def _fixed_verts_mask(topology, mask, skip_boundary):
+    """True for vertices which should not be moved"""
+    fixed = np.zeros(topology.n_verts, dtype=bool)
+    if mask is not None:
+        fixed |= ~np.array([bool(m) for m in repeat_last_for_length(mask, topology.n_verts)])
+    if skip_boundary:
+        fixed |= topology.boundary_verts_mask()
+    return fixed
+
+
+def _linear_approximation_targets(topology, verts, face_centers, center_means, moving):
+    """
+    For each moving vertex approximate centers of its faces by a plane and return points at the same
+    distance from the plane as the vertex (see linear_approximation and PlaneEquation.distance_to_point)
+    """
+    centered = face_centers[topology.corner_faces] - center_means[topology.corner_verts]
+    products = (centered[:, :, np.newaxis] * centered[:, np.newaxis, :]).reshape(-1, 9)
+    matrices = topology.sum_to_verts(products).reshape(-1, 3, 3)[moving]
+    eigenvalues, eigenvectors = np.linalg.eig(matrices)
+    idx = np.argmin(eigenvalues.real, axis=1)
+    normals = eigenvectors.real[np.arange(len(idx)), :, idx]
+    normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+    centers = center_means[moving]
+    distances = np.abs(((verts[moving] - centers) * normals).sum(axis=1))
+    targets = verts.copy()
+    targets[moving] = centers + normals * distances[:, np.newaxis]
+    return targets
+
 
 def lloyd_relax(vertices, faces, iterations, mask=None, method=NORMAL, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, LINEAR, BVH
     """
+    if method not in {NONE, NORMAL, LINEAR, BVH}:
+        raise Exception("Unsupported volume preservation method")
 
-    def do_iteration(bvh, bm, n_verts, n_link_faces, max_link_faces, linked_face_idxs, linked_face_counts):
-        verts_out = []
-        face_centers = np.array([face.calc_center_median() for face in bm.faces])
-        face_centers_by_vert = np.zeros((n_verts, max_link_faces, 3))
-        for bm_vert in bm.verts:
-            face_idxs = linked_face_idxs[bm_vert.index]
-            n = linked_face_counts[bm_vert.index]
-            face_centers_by_vert[bm_vert.index, :n] = face_centers[face_idxs]
-        face_center_sums = face_centers_by_vert.sum(axis=1)
-        face_center_means = face_center_sums / n_link_faces
-        for bm_vert in bm.verts:
-            co = bm_vert.co
-            if (skip_boundary and bm_vert.is_boundary) or (mask is not None and not mask[bm_vert.index]):
-                new_vert = tuple(co)
-            else:    
-                if method == NONE:
-                    new_vert = face_center_means[bm_vert.index]
-                elif method == NORMAL:
-                    median = mathutils.Vector(face_center_means[bm_vert.index])
-                    dv = median - co
-                    dv = dv - dv.project(bm_vert.normal)
-                    new_vert = co + dv
-                elif method == LINEAR:
-                    cs = np.array([face_centers[face.index] for face in bm_vert.link_faces])
-                    approx = linear_approximation(cs)
-                    median = mathutils.Vector(approx.center)
-                    plane = approx.most_similar_plane()
-                    dist = plane.distance_to_point(bm_vert.co)
-                    new_vert = median + plane.normal.normalized() * dist
-                elif method == BVH:
-                    median = mathutils.Vector(face_center_means[bm_vert.index])
-                    new_vert, _normal, idx, dist = bvh.find_nearest(median)
-                else:
-                    raise Exception("Unsupported volume preservation method")
-                
-                new_vert = tuple(new_vert)
-                new_vert = mask_axes(tuple(co), new_vert, use_axes)
-                
-            verts_out.append(new_vert)
-
-        return verts_out
-
-    if mask is not None:
-        mask = repeat_last_for_length(mask, len(vertices))
-
-    if method == BVH:
-        bvh = BVHTree.FromPolygons(vertices, faces)
-    else:
-        bvh = None
-    recalc_normals = (method == NORMAL)
-    bm = bmesh_from_pydata(vertices, [], faces, normal_update=recalc_normals)
-
-    n_verts = len(bm.verts)
-    n_link_faces = np.array([len(v.link_faces) for v in bm.verts])
-    max_link_faces = n_link_faces.max()
-    n_link_faces = n_link_faces[np.newaxis].T
-
-    linked_face_idxs = dict()
-    linked_face_counts = dict()
-    for bm_vert in bm.verts:
-        face_idxs = np.array([face.index for face in bm_vert.link_faces])
-        linked_face_idxs[bm_vert.index] = face_idxs
-        linked_face_counts[bm_vert.index] = len(face_idxs)
+    verts = np.array(vertices, dtype=np.float64)
+    topology = _MeshTopology(len(verts), faces)
+    n_link_faces = topology.vert_face_counts
+    # vertices without faces can't be moved
+    moving = ~_fixed_verts_mask(topology, mask, skip_boundary) & (n_link_faces > 0)
+    moving_axes = moving[:, np.newaxis] & _axes_mask(use_axes)
+    bvh = BVHTree.FromPolygons(vertices, faces) if method == BVH else None
 
     for i in range(iterations):
-        vertices = do_iteration(bvh, bm, n_verts, n_link_faces, max_link_faces, linked_face_idxs, linked_face_counts)
-        for bm_vert, v in zip(bm.verts, vertices):
-            bm_vert.co = mathutils.Vector(v)
-        if recalc_normals:
-            bm.normal_update()
-    bm.free()
+        face_centers = topology.face_centers(verts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            center_means = topology.sum_to_verts(face_centers[topology.corner_faces]) / n_link_faces[:, np.newaxis]
+
+        if method == NONE:
+            targets = center_means
+        elif method == NORMAL:
+            targets = _tangent_move(verts, center_means, topology.vertex_normals(verts))
+        elif method == LINEAR:
+            targets = _linear_approximation_targets(topology, verts, face_centers, center_means, moving)
+        else:
+            targets = verts.copy()
+            targets[moving] = _bvh_nearest(bvh, center_means[moving])
+
+        verts = np.where(moving_axes, targets, verts)
 
-    return vertices
+    return verts.tolist()
 
 def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, BVH
     """
+    if method not in {NONE, NORMAL, BVH}:
+        raise Exception("Unsupported shape preservation method")
 
-    def do_iteration(bvh, bm, boundary_idxs, verts):
-        nonlocal mask
-        verts = np.asarray(verts)
+    def do_iteration(verts):
         n_verts = len(verts)
-        edges_fst = edges[:,0]
-        edges_snd = edges[:,1]
         v1s = verts[edges_fst]
         v2s = verts[edges_snd]
         edge_vecs = v2s - v1s
@@ -152,83 +225,59 @@ def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
         else:
             raise Exception("Unsupported target edge length type")
 
-        counts = np.zeros((n_verts,))
-        counts_fst = np.bincount(edges_fst) 
-        counts[:len(counts_fst)] += counts_fst
-        counts_snd = np.bincount(edges_snd) 
-        counts[:len(counts_snd)] += counts_snd
-
         forces = np.zeros((n_verts,3))
         d_lens = (edge_lens - target_len) / 2.0
         edge_forces = edge_vecs * d_lens[np.newaxis].T
         forces[edges_fst] += edge_forces
         forces[edges_snd] -= edge_forces
 
-        I = np.arange(n_verts)
-        if mask is not None:
-            mask = np.array([bool(m) for m in mask])
-        else:
-            mask = np.full((n_verts,), True)
-        if boundary_idxs is not None:
-            mask[list(boundary_idxs)] = False
-        #mask = np.logical_not(mask)
-        counts_masked = counts[mask][np.newaxis].T
-        forces_masked = k * forces[mask]
+        counts_masked = counts[moving][np.newaxis].T
+        forces_masked = k * forces[moving]
 
         target_verts = verts.copy()
-        target_verts[mask] += forces_masked / counts_masked
+        target_verts[moving] += forces_masked / counts_masked
 
         if method == NONE:
-            verts_out = target_verts.tolist()
+            verts_out = target_verts
         elif method == NORMAL:
-            verts_out = []
-            for bm_vert in bm.verts:
-                normal = bm_vert.normal
-                dv = mathutils.Vector(target_verts[bm_vert.index]) - bm_vert.co
-                dv = dv - dv.project(normal)
-                new_vert = tuple(bm_vert.co + dv)
-                verts_out.append(new_vert)
-        elif method == BVH:
-            verts_out = []
-            for vert in target_verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(vert)
-                verts_out.append(tuple(new_vert))
+            verts_out = _tangent_move(verts, target_verts, topology.vertex_normals(verts))
         else:
-            raise Exception("Unsupported shape preservation method")
-        
-        return map_mask_axes(verts, verts_out, use_axes)
+            verts_out = _bvh_nearest(bvh, target_verts)
+
+        return np.where(axes, verts_out, verts)
 
     if not edges or not edges[0]:
         edges = polygons_to_edges([faces], unique_edges=True)[0]
     edges = np.array(edges)
-    if mask is not None:
-        mask = repeat_last_for_length(mask, len(vertices))
-    if skip_boundary:
-        bm = bmesh_from_pydata(vertices, edges, faces)
-        boundary_idxs = set(v.index for v in bm.verts if v.is_boundary)
-        bm.free()
-    else:
-        boundary_idxs = None
-    bvh = BVHTree.FromPolygons(vertices, faces)
+    edges_fst = edges[:,0]
+    edges_snd = edges[:,1]
+    verts = np.array(vertices, dtype=np.float64)
+    n_verts = len(verts)
+    topology = _MeshTopology(n_verts, faces)
+    moving = ~_fixed_verts_mask(topology, mask, skip_boundary)
+    axes = _axes_mask(use_axes)
+
+    counts = np.zeros((n_verts,))
+    counts_fst = np.bincount(edges_fst)
+    counts[:len(counts_fst)] += counts_fst
+    counts_snd = np.bincount(edges_snd)
+    counts[:len(counts_snd)] += counts_snd
+
+    bvh = BVHTree.FromPolygons(vertices, faces) if method == BVH else None
     for i in range(iterations):
-        if method != NONE:
-            bm = bmesh_from_pydata(vertices, edges, faces, normal_update=True)
-        else:
-            bm = None
-        vertices = do_iteration(bvh, bm, boundary_idxs, vertices)
-        if bm is not None:
-            bm.free()
+        verts = do_iteration(verts)
 
-    return vertices
+    return verts.tolist()
 
 def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, target=AVERAGE, skip_boundary=True, use_axes={0,1,2}):
     """
     supported shape preservation methods: NONE, NORMAL, BVH
     """
+    if method not in {NONE, NORMAL, BVH}:
+        raise Exception("Unsupported shape preservation method")
 
-    def do_iteration(bvh, bm):
-        areas = np.array([face.calc_area() for face in bm.faces])
-        vert_cos = np.array([tuple(vert.co) for vert in bm.verts])
+    def do_iteration(verts):
+        areas = topology.face_areas(verts)
         if target == MINIMUM:
             target_area = areas.min()
         elif target == MAXIMUM:
@@ -238,66 +287,32 @@ def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
         else:
             raise Exception("Unsupported target face area type")
 
-        forces = defaultdict(lambda: np.zeros((3,)))
-        counts = defaultdict(int)
-        for bm_face in bm.faces:
-            face_vert_idxs = [vert.index for vert in bm_face.verts]
-            face_verts = vert_cos[face_vert_idxs]
-            mean = face_verts.mean(axis=0)
-            face_verts_0 = face_verts - mean
-            src_area = areas[bm_face.index]
-            scale = sqrt(target_area / src_area)
-            dvs = (scale - 1) * face_verts_0
-            for vert_idx, dv in zip(face_vert_idxs, dvs):
-                forces[vert_idx] += dv
-                counts[vert_idx] += 1
-        
-        target_verts = vert_cos.copy()
-        for bm_vert in bm.verts:
-            idx = bm_vert.index
-            if skip_boundary and bm_vert.is_boundary:
-                continue
-            if mask is not None and not mask[idx]:
-                continue
-            count = counts[idx]
-            if count:
-                forces[idx] /= count
-            force = forces[idx]
-            target_verts[idx] += k*force
+        face_centers = topology.face_centers(verts)
+        scales = np.sqrt(target_area / areas)
+        corner_faces = topology.corner_faces
+        dvs = (scales - 1)[corner_faces, np.newaxis] * (verts[topology.corner_verts] - face_centers[corner_faces])
+        forces = topology.sum_to_verts(dvs)
+
+        target_verts = verts.copy()
+        target_verts[moving] += k * forces[moving] / counts[moving, np.newaxis]
 
         if method == NONE:
-            verts_out = target_verts.tolist()
+            verts_out = target_verts
         elif method == NORMAL:
-            verts_out = []
-            for bm_vert in bm.verts:
-                idx = bm_vert.index
-                dv = mathutils.Vector(target_verts[idx]) - bm_vert.co
-                normal = bm_vert.normal
-                dv = dv - dv.project(normal)
-                new_vert = tuple(bm_vert.co + dv)
-                verts_out.append(new_vert)
-
-        elif method == BVH:
-            verts_out = []
-            for bm_vert in bm.verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(bm_vert.co)
-                verts_out.append(tuple(new_vert))
-
+            verts_out = _tangent_move(verts, target_verts, topology.vertex_normals(verts))
         else:
-            raise Exception("Unsupported shape preservation method")
+            verts_out = _bvh_nearest(bvh, verts)
 
-        return map_mask_axes(vert_cos, verts_out, use_axes)
+        return np.where(axes, verts_out, verts)
 
-    if mask is not None:
-        mask = repeat_last_for_length(mask, len(vertices))
-    if not edges or not edges[0]:
-        edges = polygons_to_edges([faces], unique_edges=True)[0]
+    verts = np.array(vertices, dtype=np.float64)
+    topology = _MeshTopology(len(verts), faces)
+    counts = topology.vert_face_counts
+    moving = ~_fixed_verts_mask(topology, mask, skip_boundary) & (counts > 0)
+    axes = _axes_mask(use_axes)
 
-    bvh = BVHTree.FromPolygons(vertices, faces)
+    bvh = BVHTree.FromPolygons(vertices, faces) if method == BVH else None
     for i in range(iterations):
-        bm = bmesh_from_pydata(vertices, edges, faces, normal_update=True)
-        vertices = do_iteration(bvh, bm)
-        bm.free()
-
-    return vertices
+        verts = do_iteration(verts)
 
+    return verts.tolist()
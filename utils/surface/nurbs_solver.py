@@ -9,9 +9,11 @@ import enum
 import numpy as np
 
 from sverchok.core.sv_custom_exceptions import AlgorithmError, ArgumentError
+from sverchok.dependencies import scipy
 from sverchok.utils.nurbs_common import (
         SvNurbsMaths, SvNurbsBasisFunctions
     )
+from sverchok.utils.nurbs_factorization import get_factorization, array_key
 from sverchok.utils.sv_logging import get_logger
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.surface.core import other_direction, SurfaceDirection
@@ -19,6 +21,29 @@ from sverchok.utils.surface.algorithms import unify_nurbs_surfaces
 from sverchok.utils.curve.nurbs_algorithms import unify_curves
 from sverchok.utils.curve.nurbs_solver_applications import adjust_curve_points, interpolate_nurbs_curve
 
+if scipy is not None:
+    import scipy.sparse
+
+def _nonzero_basis_functions(knotvector, degree, n_cpts, ts):
+    """
+    Values of basis functions which can be not zero at given parameters.
+    Basis functions are evaluated once per unique parameter value.
+
+    Returns:
+        * indexes of basis functions, array of shape (len(ts), degree + 1)
+        * values of these functions, array of the same shape
+    """
+    knotvector = np.asarray(knotvector)
+    unique_ts, inverse = np.unique(ts, return_inverse=True)
+    basis = SvNurbsBasisFunctions(knotvector)
+    values = np.array([basis.function(k, degree)(unique_ts) for k in range(n_cpts)]).T
+    spans = np.searchsorted(knotvector, unique_ts, side='right') - 1
+    spans = np.clip(spans, degree, n_cpts - 1)
+    idxs = spans[:, np.newaxis] - degree + np.arange(degree + 1)[np.newaxis, :]
+    values = np.take_along_axis(values, idxs, axis=1)
+    inverse = inverse.reshape(-1)
+    return idxs[inverse], values[inverse]
+
 class SvNurbsSurfaceSolver:
     def __init__(self):
         self.degree_u = None
@@ -72,15 +97,40 @@ class SvNurbsSurfaceSolver:
         problem_type, residue, surface = self.solve_ex(logger = logger)
         return surface
 
+    def _calc_matrix(self, us, vs, n_cpts_u, n_cpts_v, weights):
+        """
+        Matrix of the system, row per goal and column per control point
+        (index of control point is n_cpts_v * u_idx + v_idx). Only
+        (degree_u + 1) * (degree_v + 1) basis functions are not zero at
+        any point, so the matrix is sparse if SciPy is available.
+        """
+        p_u, p_v = self.degree_u, self.degree_v
+        idxs_u, alphas_u = _nonzero_basis_functions(self.knotvector_u, p_u, n_cpts_u, us)
+        idxs_v, alphas_v = _nonzero_basis_functions(self.knotvector_v, p_v, n_cpts_v, vs)
+        n_points = len(us)
+
+        # (n_points, p_u + 1, p_v + 1)
+        cpt_idxs = n_cpts_v * idxs_u[:, :, np.newaxis] + idxs_v[:, np.newaxis, :]
+        alphas = weights.reshape(-1)[cpt_idxs] * alphas_u[:, :, np.newaxis] * alphas_v[:, np.newaxis, :]
+        alphas = alphas.reshape(n_points, -1)
+        alphas /= alphas.sum(axis=1)[:, np.newaxis]
+        cpt_idxs = cpt_idxs.reshape(n_points, -1)
+
+        if scipy is not None:
+            rows = np.repeat(np.arange(n_points), cpt_idxs.shape[1])
+            return scipy.sparse.csr_matrix((alphas.ravel(), (rows, cpt_idxs.ravel())),
+                                           shape=(n_points, n_cpts_u * n_cpts_v))
+        matrix = np.zeros((n_points, n_cpts_u * n_cpts_v))
+        np.add.at(matrix, (np.arange(n_points)[:, np.newaxis], cpt_idxs), alphas)
+        return matrix
+
     def solve_ex(self, problem_types = PROBLEM_ANY, implementation = SvNurbsMaths.NATIVE, logger = None):
         if logger is None:
             logger = get_logger()
         targets = self.goals
         us = np.array([t[0] for t in targets])
         vs = np.array([t[1] for t in targets])
-        pts = np.array([t[2] for t in targets])
-        basis_u = SvNurbsBasisFunctions(self.knotvector_u)
-        basis_v = SvNurbsBasisFunctions(self.knotvector_v)
+        pts = np.array([t[2] for t in targets], dtype=np.float64)
         if self.src_control_points is None:
             n_cpts_u, n_cpts_v = self.n_cpts_u, self.n_cpts_v
             ndim = 3
@@ -92,60 +142,37 @@ class SvNurbsSurfaceSolver:
         n_points = len(targets)
         n_equations = ndim * n_points
         n_unknowns = ndim * n_cpts
-        p_u = self.degree_u
-        p_v = self.degree_v
-
-        alphas_u = np.array([basis_u.function(k, p_u)(us) for k in range(n_cpts_u)])
-        alphas_v = np.array([basis_v.function(k, p_v)(vs) for k in range(n_cpts_v)])
-
-        A = np.zeros((n_equations, n_unknowns))
-        for pt_idx in range(n_points):
-            for cpt_u_idx in range(n_cpts_u):
-                for cpt_v_idx in range(n_cpts_v):
-                    cpt_idx = n_cpts_v * cpt_u_idx + cpt_v_idx
-                    alpha_u = alphas_u[cpt_u_idx][pt_idx]
-                    alpha_v = alphas_v[cpt_v_idx][pt_idx]
-                    weight = weights[cpt_u_idx,cpt_v_idx]
-                    alpha = weight * alpha_u * alpha_v
-                    for dim_idx in range(ndim):
-                        A[ndim*pt_idx + dim_idx, ndim*cpt_idx + dim_idx] = alpha
-
-            denominator = A[ndim*pt_idx, :].sum()
-            for dim_idx in range(ndim):
-                A[ndim*pt_idx + dim_idx, :] /= denominator
+
+        # equations are the same for all coordinates, so only the matrix
+        # of (n_points x n_cpts) is factorized, with one column of B per coordinate
+        key = ('surface', self.degree_u, self.degree_v, n_cpts_u, n_cpts_v,
+               array_key(self.knotvector_u), array_key(self.knotvector_v),
+               array_key(weights), array_key(us), array_key(vs))
+        factorization = get_factorization(key, lambda: self._calc_matrix(us, vs, n_cpts_u, n_cpts_v, weights))
 
         if self.src_surface is not None:
-            src_points = self.src_surface.evaluate_array(us, vs)
+            B = pts - self.src_surface.evaluate_array(us, vs)
         else:
-            src_points = None
+            B = pts
 
-        B = np.zeros((n_equations, 1))
-        for pt_idx, point in enumerate(pts):
-            if src_points is not None:
-                point = point - src_points[pt_idx]
-            B[pt_idx*ndim:pt_idx*ndim+ndim, 0] = point[np.newaxis]
-
-        residue = None
         if n_equations == n_unknowns:
             problem_type = SvNurbsSurfaceSolver.PROBLEM_WELLDETERMINED
             if problem_type not in problem_types:
                 raise AlgorithmError("The problem is well-determined")
-            try:
-                A1 = np.linalg.inv(A)
-                X = (A1 @ B).T
-            except np.linalg.LinAlgError as e:
-                logger.error(f"Matrix: {self.A}")
-                raise AlgorithmError(f"Can not solve: #equations = {n_equations}, #unknowns = {n_unknowns}: {e}") from e
         elif n_equations < n_unknowns:
             problem_type = SvNurbsSurfaceSolver.PROBLEM_UNDERDETERMINED
-            A1 = np.linalg.pinv(A)
-            X = (A1 @ B).T
         else: # n_equations > n_unknowns
             problem_type = SvNurbsSurfaceSolver.PROBLEM_OVERDETERMINED
             if problem_type not in problem_types:
                 raise AlgorithmError("The system is overdetermined")
-            X, residues, rank, singval = np.linalg.lstsq(self.A, self.B)
-            residue = residues.sum()
+
+        try:
+            X, residue = factorization.solve(B)
+        except np.linalg.LinAlgError as e:
+            logger.error(f"Matrix: {factorization.matrix}")
+            raise AlgorithmError(f"Can not solve: #equations = {n_equations}, #unknowns = {n_unknowns}: {e}") from e
+        if problem_type != SvNurbsSurfaceSolver.PROBLEM_OVERDETERMINED:
+            residue = None
 
         d_cpts = X.reshape((n_cpts_u, n_cpts_v, ndim))
         if self.src_control_points is None:
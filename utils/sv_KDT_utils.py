@@ -7,9 +7,9 @@
 
 from mathutils import kdtree
 import numpy as np
-from sverchok.dependencies import scipy
 
 from sverchok.data_structure import match_long_repeat as mlr
+from sverchok.utils.kdtree import SvKdTree, get_kdtree, counts_to_offsets, WORKERS
 
 # documentation/blender_python_api_2_70_release/mathutils.kdtree.html
 def create_kdt(verts):
@@ -23,32 +23,51 @@ def create_kdt(verts):
     return kd
 
 
-def kdt_closest_verts_range(verts, v_find, dists, out):
-    '''Find vertices in desired distance'''
-    kd = create_kdt(verts)
-    out.extend([kd.find_range(vert, dist) for vert, dist in zip(*mlr([v_find, dists]))])
-
-
-def kdt_closest_verts_find_n(verts, v_find, nums, out):
-    '''Find  the N closest vertices ordered by distance'''
-    kd = create_kdt(verts)
-    out.extend([kd.find_n(vert, num) for vert, num in zip(*mlr([v_find, nums]))])
+def kdt_closest_verts_range(verts, v_find, dists):
+    '''
+    Find vertices in desired distance
+    returns (locations, indices, distances, offsets), results for i-th vertex
+    are locations[offsets[i]:offsets[i+1]] etc., ordered by distance
+    '''
+    v_find, dists = mlr([v_find, dists])
+    tree = get_kdtree(verts)
+    idxs, distances, offsets = tree.query_range_array(np.asarray(v_find, dtype=np.float64), np.asarray(dists))
+    return tree.points[idxs], idxs, distances, offsets
+
+
+def kdt_closest_verts_find_n(verts, v_find, nums):
+    '''
+    Find the N closest vertices ordered by distance
+    returns (locations, indices, distances, offsets) like kdt_closest_verts_range
+    '''
+    v_find, nums = mlr([v_find, nums])
+    tree = get_kdtree(verts)
+    counts = np.clip(np.asarray(nums, dtype=np.int64), 0, len(tree.points))
+    count = counts.max(initial=0)
+    if count == 0:
+        idxs, distances = np.zeros(0, dtype=np.int64), np.zeros(0)
+    else:
+        _, idxs, distances = tree.query_array(np.asarray(v_find, dtype=np.float64), count=count)
+        mask = np.arange(count) < counts[:, np.newaxis]
+        idxs = np.asarray(idxs).reshape(len(counts), count)[mask]
+        distances = np.asarray(distances).reshape(len(counts), count)[mask]
+    return tree.points[idxs], idxs, distances, counts_to_offsets(counts)
 
 def kdt_closest_path(verts, radius, start_index, result, cycle):
     '''Creates path joining each vertice with the closest free neighbor'''
-    kd = create_kdt(verts)
+    # neighbours of a vertex do not depend on the path, so they are found at once
+    tree = get_kdtree(verts)
+    idxs, _, offsets = tree.query_range_array(tree.points, np.asarray(radius[:len(verts)]))
+    idxs, offsets = idxs.tolist(), offsets.tolist()
     edge_set = set()
     free_ids = set(range(len(verts)))
-    r = radius
 
     idx = start_index
     free_ids.remove(idx)
     for id in range(len(verts)):
 
-        n_list = kd.find_range(verts[idx], r[idx])
-
         found = False
-        for _, index, _ in n_list:
+        for index in idxs[offsets[idx]:offsets[idx + 1]]:
             if (index == idx) or (index not in free_ids):
                 continue
             free_ids.remove(index)
@@ -71,8 +90,8 @@ def kdt_closest_edges(verts, socket_inputs):
     '''Join verts pairs by defining distance range and number of connections'''
     mindist, maxdist, maxNum, skip = socket_inputs
 
-    # make kdtree
-    kd = create_kdt(verts)
+    # make kdtree and find neighbours of all vertices at once
+    tree = get_kdtree(verts)
 
     # set minimum values
     maxNum = max(maxNum, 1)
@@ -83,12 +102,14 @@ def kdt_closest_edges(verts, socket_inputs):
     edges_add = edges.add
     max_dist = abs(maxdist)
     min_dist = abs(mindist)
-    for i, vtx in enumerate(verts):
+    idxs, distances, offsets = tree.query_range_array(tree.points, max_dist)
+    idxs, distances, offsets = idxs.tolist(), distances.tolist(), offsets.tolist()
+    for i in range(len(verts)):
         num_edges = 0
+        start, end = offsets[i], offsets[i + 1]
 
-        # this always returns closest first followed by next closest, etc.
-        #              co  index  dist
-        for edge_idx, (_, index, dist) in enumerate(kd.find_range(vtx, max_dist)):
+        # closest first followed by next closest, etc.
+        for edge_idx, (index, dist) in enumerate(zip(idxs[start:end], distances[start:end])):
 
             if skip > 0:
                 if edge_idx < skip:
@@ -109,17 +130,15 @@ def kdt_closest_edges(verts, socket_inputs):
 
 
 def scipy_kdt_closest_edges_fast(vs, min_dist, max_dist):
-    new_tree = scipy.spatial.cKDTree
-    kd_tree = new_tree(np.array(vs))
+    kd_tree = get_kdtree(vs, SvKdTree.SCIPY).kdtree
     indexes_max = kd_tree.query_pairs(r=max_dist)
     indexes_min = kd_tree.query_pairs(r=min_dist)
     return list(indexes_max ^ indexes_min)
 
 def scipy_kdt_closest_max_queried(vs, min_dist, max_dist, maxNum, skip):
-    new_tree = scipy.spatial.cKDTree
-    kd_tree = new_tree(np.array(vs))
+    tree = get_kdtree(vs, SvKdTree.SCIPY)
     skip_f = max(skip-1,0)
-    dist, idx = kd_tree.query(np.array(vs), distance_upper_bound=max_dist, k=maxNum+1+skip_f )
+    dist, idx = tree.kdtree.query(tree.points, distance_upper_bound=max_dist, k=maxNum+1+skip_f, workers=WORKERS)
     all_edges = np.zeros([maxNum * len(vs), 2], dtype=np.int32)
     start = 0
     for i in range(1+skip_f, maxNum+1+skip_f):
@@ -135,16 +154,15 @@ def scipy_kdt_closest_max_queried(vs, min_dist, max_dist, maxNum, skip):
     return []
 
 def scipy_kdt_closest_edges_no_skip(vs, min_dist, max_dist, maxNum, skip):
-    new_tree = scipy.spatial.cKDTree
-    np_vs = np.array(vs)
-    kd_tree = new_tree(np_vs)
+    tree = get_kdtree(vs, SvKdTree.SCIPY)
+    np_vs = tree.points
     # set minimum values
     maxNum = max(maxNum, 1)
     skip = max(skip, 0)
 
     # makes edges
     e = set()
-    query = kd_tree.query_ball_point(np_vs, max_dist)
+    query = tree.kdtree.query_ball_point(np_vs, max_dist, workers=WORKERS)
     for i, (rel, vtx) in enumerate(zip(query, np_vs)):
         if len(rel) < 2:
             continue
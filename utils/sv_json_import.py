@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Union, Generator, ContextManager
 
 import bpy
 from sverchok import old_nodes
+from sverchok.core import lazy_nodes
 from sverchok.utils.sv_IO_panel_tools import get_file_obj_from_zip
 from sverchok.utils.sv_logging import sv_logger, get_logger, logging
 from sverchok.utils.handle_blender_data import BPYProperty, BlNode
@@ -262,7 +263,9 @@ class TreeGenerator:
         Also it can register dummy and old nodes and register fails
         """
         with self._fails_log.add_fail("Creating node", f'Tree: {self._tree_name}, Node: {node_name}'):
-            if old_nodes.is_old(bl_type):  # old node classes are registered only by request
+            if lazy_nodes.is_lazy(bl_type):  # lazy and old node classes are registered only by request
+                lazy_nodes.register_lazy(bl_type)
+            if old_nodes.is_old(bl_type):
                 old_nodes.register_old(bl_type)
             # import only here to do not create a cyclic import
             node = self._tree.nodes.new(bl_type)
@@ -16,6 +16,7 @@ from typing import Type, Generator, TYPE_CHECKING, Dict, Tuple, Optional, List,
 
 import bpy
 from sverchok import old_nodes
+from sverchok.core import lazy_nodes
 from sverchok.utils.handle_blender_data import BPYPointers, BPYProperty
 from sverchok.utils.sv_node_utils import recursive_framed_location_finder
 
@@ -375,6 +376,8 @@ class FileStruct(Struct):
                     node_struct = factories.node(node_name, self.logger, raw_structure)
 
                     # register optional node classes
+                    if lazy_nodes.is_lazy(node_struct.read_bl_type()):
+                        lazy_nodes.register_lazy(node_struct.read_bl_type())
                     if old_nodes.is_old(node_struct.read_bl_type()):
                         old_nodes.register_old(node_struct.read_bl_type())
 
@@ -472,6 +475,8 @@ class NodePresetFileStruct(Struct):
             node_struct = factories.node(node_name, self.logger, raw_struct)
             location = node.location[:]  # without copying it looks like gives straight references to memory
             tree.nodes.remove(node)
+            if lazy_nodes.is_lazy(node_struct.read_bl_type()):
+                lazy_nodes.register_lazy(node_struct.read_bl_type())
             node = tree.nodes.new(node_struct.read_bl_type())
             node.name = node_name
             node.select = True
@@ -570,6 +575,8 @@ class TreeStruct(Struct):
                     node_struct = factories.node(node_name, self.logger, raw_structure)
 
                     # register optional node classes
+                    if lazy_nodes.is_lazy(node_struct.read_bl_type()):
+                        lazy_nodes.register_lazy(node_struct.read_bl_type())
                     if old_nodes.is_old(node_struct.read_bl_type()):
                         old_nodes.register_old(node_struct.read_bl_type())
 
@@ -0,0 +1,148 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Manifest of node modules for lazy loading of nodes (see core/lazy_nodes.py).
+
+The manifest keeps everything which is needed to show a node in menus and
+search without importing its module: bl_idname, label, icons, category,
+dependencies and docstring. It is built by parsing source files of nodes,
+so the module can be used without Blender. After adding or changing nodes
+the manifest should be regenerated:
+
+    python utils/sv_nodes_manifest.py
+
+Modules which can't be described statically (node classes are generated,
+labels are calculated etc.) are saved with `"nodes": null`, such modules
+are always imported during Sverchok initialization. A module which was
+changed after the manifest was generated (check sum differs) is imported
+during initialization as well, so an outdated manifest never hides a node.
+"""
+
+import ast
+import json
+import os
+import zlib
+
+MANIFEST_FILE_NAME = 'nodes_manifest.json'
+MANIFEST_VERSION = 1
+
+# class attributes which are saved into the manifest
+NODE_ATTRIBUTES = ('bl_idname', 'bl_label', 'bl_icon', 'sv_icon', 'sv_category')
+
+
+def nodes_path():
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'nodes')
+
+
+def file_checksum(file_path):
+    with open(file_path, 'rb') as file:
+        # line endings can be changed by git on checkout
+        return zlib.crc32(file.read().replace(b'\r\n', b'\n'))
+
+
+def iter_node_files(path):
+    """Yields (category, module name, file path) in the same way nodes.automatic_collection does"""
+    for sub_dir, dirs, files in os.walk(path):
+        dirs.sort()
+        category = os.path.basename(sub_dir)
+        if category == '__pycache__':
+            continue
+        for file_name in sorted(files):
+            if file_name == '__init__.py' or not file_name.endswith('.py'):
+                continue
+            yield category, file_name[:-3], os.path.join(sub_dir, file_name)
+
+
+def _is_node_class(class_def):
+    for base in class_def.bases:
+        if isinstance(base, ast.Name) and base.id == 'SverchCustomTreeNode':
+            return True
+        if isinstance(base, ast.Attribute) and base.attr == 'Node':
+            return True
+    return False
+
+
+def _class_attributes(class_def):
+    attributes = dict()
+    for statement in class_def.body:
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+            target, value = statement.targets[0], statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            target, value = statement.target, statement.value
+        else:
+            continue
+        if not isinstance(target, ast.Name):
+            continue
+        if target.id in NODE_ATTRIBUTES or target.id == 'sv_dependencies':
+            try:
+                attributes[target.id] = ast.literal_eval(value)
+            except ValueError:
+                attributes[target.id] = NotImplemented
+    return attributes
+
+
+def parse_node_module(file_path):
+    """
+    Returns list of dictionaries with attributes of node classes of given file
+    or None if the classes can't be described without importing the module
+    """
+    with open(file_path, encoding='utf-8', errors='replace') as file:
+        tree = ast.parse(file.read())
+
+    nodes = []
+    node_class_names = set()
+    for class_def in (n for n in tree.body if isinstance(n, ast.ClassDef)):
+        if any(isinstance(base, ast.Name) and base.id in node_class_names for base in class_def.bases):
+            return None  # attributes of the node are inherited from another node class
+        if not _is_node_class(class_def):
+            continue
+        node_class_names.add(class_def.name)
+        attributes = _class_attributes(class_def)
+        if NotImplemented in attributes.values():
+            return None
+        if not isinstance(attributes.get('bl_idname'), str) or not isinstance(attributes.get('bl_label'), str):
+            return None
+        node = {name: attributes[name] for name in NODE_ATTRIBUTES if name in attributes}
+        if 'sv_dependencies' in attributes:
+            node['sv_dependencies'] = sorted(attributes['sv_dependencies'])
+        node['doc'] = ast.get_docstring(class_def, clean=False) or ''
+        nodes.append(node)
+    return nodes or None
+
+
+def generate_manifest(path=None):
+    path = path or nodes_path()
+    modules = dict()
+    for category, module_name, file_path in iter_node_files(path):
+        modules[f'{category}.{module_name}'] = {
+            'checksum': file_checksum(file_path),
+            'nodes': parse_node_module(file_path)}
+    return {'version': MANIFEST_VERSION, 'modules': modules}
+
+
+def read_manifest(path=None):
+    """Returns None if the manifest file does not exist or has another version"""
+    file_path = os.path.join(path or nodes_path(), MANIFEST_FILE_NAME)
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, encoding='utf-8') as file:
+        manifest = json.load(file)
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_manifest(manifest, path=None):
+    file_path = os.path.join(path or nodes_path(), MANIFEST_FILE_NAME)
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+        file.write('\n')
+
+
+if __name__ == '__main__':
+    write_manifest(generate_manifest())
@@ -0,0 +1,360 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+File-backed readers and writers for the Text In+ / Text Out+ nodes.
+
+Unlike the text datablock path, these functions never build the whole file
+as a Python string or as nested lists. CSV data is parsed in chunks of lines
+directly into a preallocated (optionally memory-mapped) NumPy array, so peak
+memory is bounded by the size of the resulting array plus one chunk.
+"""
+
+import os
+import csv
+import json
+import hashlib
+import tempfile
+import itertools
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 100000
+
+csv_dialect_delimiters = {
+    'excel': ',',
+    'excel-tab': '\t',
+    'unix': ',',
+    'semicolon': ';',
+}
+
+
+def count_lines(path, block_size=1 << 20):
+    """
+    Count lines of a file without decoding it.
+    A last line without trailing newline is counted as well.
+    """
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            count += block.count(b'\n')
+            last = block[-1:]
+    if last != b'\n':
+        count += 1
+    return count
+
+
+def parse_columns(text):
+    """
+    Parse column selection string like "0, 2, 5-7" into a sorted
+    tuple of column indices. Empty string means all columns (None).
+    """
+    text = text.strip()
+    if not text:
+        return None
+    columns = set()
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        if '-' in item:
+            start, end = item.split('-', 1)
+            columns.update(range(int(start), int(end) + 1))
+        else:
+            columns.add(int(item))
+    return tuple(sorted(columns))
+
+
+def _split_row(line, delimiter):
+    return next(csv.reader([line], delimiter=delimiter))
+
+
+def _convert_lines(lines, delimiter, decimalmark):
+    if decimalmark != '.':
+        if decimalmark == delimiter:
+            raise ValueError("Decimal mark can not be the same as delimiter")
+        lines = [line.replace(decimalmark, '.') for line in lines]
+    return lines
+
+
+def infer_dtype(rows):
+    """
+    Guess the narrowest numeric dtype (int64 or float64) able to hold
+    given sample of rows, which are lists of strings.
+    """
+    is_int = True
+    for row in rows:
+        for value in row:
+            value = value.strip()
+            if not value:
+                continue
+            if is_int:
+                try:
+                    int(value)
+                    continue
+                except ValueError:
+                    is_int = False
+            float(value)  # raises ValueError on non numeric data
+    return np.int64 if is_int else np.float64
+
+
+def _memmap_path(path, columns, dtype, **options):
+    """
+    Path of cached .npy file for the source file; the name depends on
+    everything which affects parsing, so that changed options do not
+    return stale data.
+    """
+    stat = os.stat(path)
+    options = ":".join(f"{name}={options[name]!r}" for name in sorted(options))
+    key = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}:{columns}:{np.dtype(dtype).str}:{options}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f"sverchok_csv_{digest}.npy")
+
+
+def read_csv_array(path, delimiter=',', decimalmark='.', skip_lines=0, header=False,
+                   columns=None, dtype=None, memmap=False,
+                   chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8', progress=None):
+    """
+    Read numeric CSV file into 2D NumPy array, chunk by chunk.
+
+    :param path: path to the file
+    :param delimiter: field delimiter
+    :param decimalmark: decimal separator used in the file
+    :param skip_lines: number of lines to skip before header / data
+    :param header: if True, first (not skipped) line contains column names
+    :param columns: iterable of column indices to keep; None - keep all
+    :param dtype: dtype of the resulting array; None - infer from the first chunk
+    :param memmap: if True, the array is stored in a temporary .npy file and
+        returned as read-only memory map; the file is reused on next read
+        until the source file changes
+    :param chunk_size: number of lines parsed at once
+    :param progress: optional callable(rows_done, rows_total)
+    :return: tuple (names, array) where names is a list of column names and
+        array has shape (n_rows, n_columns)
+    """
+    total = count_lines(path) - skip_lines - (1 if header else 0)
+    total = max(total, 0)
+
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        for _ in range(skip_lines):
+            f.readline()
+
+        names = None
+        if header:
+            names = _split_row(f.readline(), delimiter)
+
+        first_chunk = list(itertools.islice(f, chunk_size))
+        first_chunk = [line for line in first_chunk if line.strip()]
+        if not first_chunk:
+            return (names or []), np.empty((0, 0))
+
+        n_total_columns = len(_split_row(first_chunk[0], delimiter))
+        if columns is None:
+            columns = tuple(range(n_total_columns))
+        else:
+            columns = tuple(c for c in columns if c < n_total_columns)
+        if names is None:
+            names = [f"Col {c}" for c in columns]
+        else:
+            names = [names[c] if c < len(names) else f"Col {c}" for c in columns]
+
+        first_chunk = _convert_lines(first_chunk, delimiter, decimalmark)
+        dtype_inferred = dtype is None
+        if dtype is None:
+            sample = [[_split_row(line, delimiter)[c] for c in columns] for line in first_chunk[:100]]
+            dtype = infer_dtype(sample)
+
+        shape = (total, len(columns))
+        if memmap:
+            cache_path = _memmap_path(path, columns, dtype,
+                                      delimiter=delimiter, decimalmark=decimalmark, skip_lines=skip_lines,
+                                      header=header, encoding=encoding)
+            if os.path.exists(cache_path):
+                result = np.load(cache_path, mmap_mode='r')
+                if progress is not None:
+                    progress(len(result), len(result))
+                return names, result
+            # the file is filled under temporary name, so that a failed read
+            # does not leave incomplete data in the cache
+            partial_path = f"{cache_path[:-4]}.{os.getpid()}.partial.npy"
+            result = np.lib.format.open_memmap(partial_path, mode='w+', dtype=dtype, shape=shape)
+        else:
+            result = np.empty(shape, dtype=dtype)
+
+        try:
+            done = _read_csv_chunks(f, first_chunk, result, delimiter, decimalmark, columns, dtype,
+                                    dtype_inferred, chunk_size, total, progress)
+            if memmap and done is not None:
+                result.flush()
+                del result
+                if done < total:
+                    _shrink_npy_rows(partial_path, done)
+                os.replace(partial_path, cache_path)
+        finally:
+            if memmap and os.path.exists(partial_path):
+                result = None
+                os.remove(partial_path)
+
+    if done is None:
+        # integers in the first chunk only, start again with floats
+        return read_csv_array(path, delimiter, decimalmark, skip_lines, header,
+                              columns, np.float64, memmap, chunk_size, encoding, progress)
+    if memmap:
+        result = np.load(cache_path, mmap_mode='r')
+    elif done < len(result):
+        # empty lines were skipped
+        result = result[:done]
+    return names, result
+
+
+def _read_csv_chunks(f, chunk, result, delimiter, decimalmark, columns, dtype, dtype_inferred,
+                     chunk_size, total, progress):
+    """
+    Parse lines of the file into rows of result, starting with already read chunk.
+    Return number of rows read, or None if integer dtype was inferred
+    from the first chunk and it turned out to be wrong.
+    """
+    done = 0
+    while chunk:
+        try:
+            values = np.loadtxt(chunk, delimiter=delimiter, usecols=columns, dtype=dtype, ndmin=2)
+        except ValueError:
+            if dtype_inferred and dtype == np.int64:
+                return None
+            raise
+        result[done: done + len(values)] = values
+        done += len(values)
+        if progress is not None:
+            progress(done, total)
+        chunk = [line for line in itertools.islice(f, chunk_size) if line.strip()]
+        chunk = _convert_lines(chunk, delimiter, decimalmark)
+    return done
+
+
+def _shrink_npy_rows(path, n_rows):
+    """
+    Truncate 2D C-ordered .npy file to first n_rows rows in place.
+    The header is rewritten with the same length, so the data offset is kept.
+    """
+    with open(path, 'r+b') as f:
+        version = np.lib.format.read_magic(f)
+        header_start = f.tell()
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            len_size = 2
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            len_size = 4
+        data_offset = f.tell()
+        header_size = data_offset - header_start - len_size
+        header = repr({'descr': np.lib.format.dtype_to_descr(dtype),
+                       'fortran_order': fortran_order,
+                       'shape': (n_rows,) + tuple(shape[1:])})
+        header = header.ljust(header_size - 1) + '\n'
+        f.seek(header_start + len_size)
+        f.write(header.encode('latin1'))
+        row_size = dtype.itemsize * int(np.prod(shape[1:]))
+        f.truncate(data_offset + n_rows * row_size)
+
+
+def read_json_file(path, encoding='utf-8'):
+    """
+    Read Sverchok JSON file ({socket_name: [socket_type, data]}) directly from
+    disk. Data of every socket which is a list of regular numeric arrays is
+    converted into a list of NumPy arrays, other data is kept as is.
+    """
+    with open(path, 'r', encoding=encoding) as f:
+        json_data = json.load(f)
+
+    for name, value in json_data.items():
+        if name == 'socket_order':
+            continue
+        if isinstance(value, list) and len(value) == 2:
+            socket_type, data = value
+            json_data[name] = [socket_type, _to_arrays(data)]
+    return json_data
+
+
+def _to_arrays(data):
+    if not isinstance(data, list):
+        return data
+    result = []
+    for item in data:
+        try:
+            array = np.asarray(item)
+        except ValueError:  # ragged data
+            return data
+        if array.dtype.kind not in 'iuf':
+            return data
+        result.append(array)
+    return result
+
+
+def write_csv_arrays(f, columns, delimiter=',', chunk_size=DEFAULT_CHUNK_SIZE, fmt='%.17g'):
+    """
+    Write columns (1D arrays or lists of equal length) into file-like object
+    in chunks of rows, without building the whole text in memory.
+    Columns of different lengths are truncated to the shortest one,
+    the same way `zip` does. Items of 2D columns (vectors) are written
+    as one cell each, like "(1.0, 2.0, 3.0)".
+    """
+    columns = [_csv_column(c) for c in columns]
+    if not columns:
+        return
+    n_rows = min(len(c) for c in columns)
+    if all(isinstance(c, np.ndarray) and c.ndim == 1 for c in columns):
+        formats = ['%d' if c.dtype.kind in 'iub' else fmt for c in columns]
+        for start in range(0, n_rows, chunk_size):
+            block = np.column_stack([c[start: start + chunk_size] for c in columns])
+            np.savetxt(f, block, delimiter=delimiter, fmt=formats)
+        return
+    writer = csv.writer(f, delimiter=delimiter)
+    for start in range(0, n_rows, chunk_size):
+        cells = [_csv_cells(c[start: start + chunk_size]) for c in columns]
+        writer.writerows(zip(*cells))
+
+
+def _csv_column(column):
+    if isinstance(column, np.ndarray):
+        return column
+    try:
+        array = np.asarray(column)
+    except ValueError:  # ragged data
+        return column
+    if array.dtype.kind not in 'iufb' or array.ndim > 2:
+        return column
+    return array
+
+
+def _csv_cells(column):
+    if isinstance(column, np.ndarray):
+        if column.ndim > 1:
+            return [tuple(item) for item in column.tolist()]
+        return column.tolist()
+    return column
+
+
+def write_json_arrays(f, data_out, indent=None):
+    """
+    Dump Sverchok JSON data into file-like object. NumPy arrays are
+    serialized element by element by the JSON encoder, without converting
+    them into intermediate string of the whole document.
+    """
+    separators = None if indent else (',', ':')
+    json.dump(data_out, f, indent=indent, separators=separators, default=_json_default)
+
+
+def _json_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -33,10 +33,13 @@ from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges, point
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh, bmesh_clip
 from sverchok.utils.geom import calc_bounds, bounding_sphere, PlaneEquation, bounding_box_aligned
 from sverchok.utils.math import project_to_sphere, weighted_center
+from sverchok.utils.parallel import map_objects
+from sverchok.utils.ragged import counts_to_offsets
+from sverchok.utils.voronoi_cells import simplex_ridges, neighbour_planes, prune_planes, cell_faces, clip_cell
 from sverchok.dependencies import scipy, FreeCAD
 
 if scipy is not None:
-    from scipy.spatial import Voronoi, SphericalVoronoi, Delaunay
+    from scipy.spatial import Voronoi, SphericalVoronoi, Delaunay, cKDTree
 
 if FreeCAD is not None:
     from FreeCAD import Base
@@ -238,157 +241,56 @@ def calc_bvh_projections(bvh, sites):
     return np.array(projections)
 
 # see additional info https://github.com/nortikin/sverchok/pull/4948
-def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='VOLUME', normal_update = False, precision=1e-8, mask=[]):
-
-    def get_sites_delaunay_params(delaunay, n_orig_sites):
-        result = defaultdict(list)
-        ridges = []
-        sites_pair = dict()
-        for simplex in delaunay.simplices:
-            ridges += itertools.combinations(tuple( sorted( simplex ) ), 2)
-
-        ridges = list(set( ridges )) # remove duplicates of ridges
-        ridges.sort() # for nice view in debugger
-
-        for ridge_idx in range(len(ridges)):
-            site1_idx, site2_idx = tuple(ridges[ridge_idx])
-            # Remove 4D simplex ridges:
-            if n_orig_sites<=site1_idx or n_orig_sites<=site2_idx:
-                continue
-            # Convert source sites to the 3D
-            site1 = delaunay.points[site1_idx]
-            site1 = Vector([site1[0], site1[1], site1[2], ])
-            site2 = delaunay.points[site2_idx]
-            site2 = Vector([site2[0], site2[1], site2[2], ])
-            middle = (site1 + site2) * 0.5
-            normal =  Vector(site1 - site2).normalized() # normal to site1
-            plane1 = PlaneEquation.from_normal_and_point( normal, middle)
-            plane2 = PlaneEquation.from_normal_and_point(-normal, middle)
-            result[site1_idx].append( (site2_idx, site1, site2, middle,  normal, plane1) )
-            result[site2_idx].append( (site1_idx, site2, site1, middle, -normal, plane2) )
-
-        return result
-
-    # some statistics:
-    num_bisect = 0 # general count of bisect for full cutting process
-    num_unpredicted_erased = 0 # if optimisation can not find a skip bisect case (with using bounding box) then counter incremented
-
-    def cut_cell(start_mesh, sites_delaunay_params, site_idx, spacing, center_of_mass, bbox_aligned):
-        nonlocal num_bisect, num_unpredicted_erased
-        src_mesh = None
-        # Check ridges for sites before bisect. If no ridges then no bisect and no mesh in result
-        if site_idx in sites_delaunay_params:
-            site_params = sites_delaunay_params[site_idx]
-
-            if len(start_mesh.verts) > 0:
-                lst_ridges_to_bisect = []
-                #arr_dist_site_middle = np.empty(0)
-
-                out_of_bbox = False
-
-                # Sorting for optiomal bisections and search what can be skipped:
-                for i, (site_pair_idx, site_vert, site_pair_vert, middle, plane_no, plane) in enumerate(site_params):
-                    # Move bisect plane on size of half of spacing (normal point to the site_idx from site_pair_idx)
-                    plane_co = middle + 0.5 * spacing * plane_no
-                    # [1]. Test if bbox_aligned outside a site_pair plane?
-                    signs_verts_bbox_aligned = PlaneEquation.from_normal_and_point( plane_no, plane_co ).side_of_points(bbox_aligned)
-                    # if all vertexes of bbox_aligned out of plane with negation normal then object will be erased anyway.
-                    # So one can skip bisect operation
-                    if (signs_verts_bbox_aligned <= 0).all():
-                        out_of_bbox = True
-                        break
-                    # if all vertexes of bbox_aligned is on a positive side of a plane then bisect cannot produce any sections.
-                    # So one can skip operation of bisection and stay object unchanged (do not add ringe to bisection list)
-                    if (signs_verts_bbox_aligned > 0).all():
-                        pass
-                    else:
-                        # [2]. calc middle planes for optimal bisects sequence (sort later)
-                        plane_spacing = PlaneEquation.from_normal_and_point(plane_no, plane_co)
-                        sign = plane_spacing.side_of_points(center_of_mass)
-                        dist = plane_spacing.distance_to_point(center_of_mass)
-                
-                        lst_ridges_to_bisect.append( [dist*sign, site_pair_idx, site_vert, site_pair_vert, middle, plane_co, plane_no, plane, ] )
-                    
-                    # [3]. for test if all (site, middle) dist are less 0.5 spacing?
-                    #    if spacing to big and eat all area [all (site-middle).length <= spacing/2]
-                    # arr_dist_site_middle = np.append(arr_dist_site_middle, np.linalg.norm(site_vert-middle) )
-
-                    # here is the place to extend optimization variants to exclude bisect from process.
-                    # To the future: one cannot optimize process of bisection. Only count of bisects can be optimized.
-                    pass
-
-                # (3).
-                # out_of_bbox may realized before all site pairs observed so arr_dist_site_middle may contain not all dists
-                # if out_of_bbox==False and (arr_dist_site_middle<=0.5 * spacing).all():
-                #     #out_of_bbox = True # If site has open side then its bisect cannot be skipped. So this rule are disabled.
-                #     pass
-
-                if out_of_bbox==False:
-                    # (2)
-                    lst_ridges_to_bisect.sort()  # less dist gets more points to cut off (with negative dists to. Negative dist is a negative side of bisect plane)
-
-                    src_mesh = start_mesh.copy() # do not need create src_mesh until here.
-
-                    # A main bisection process of site_idx
-                    for i in range(len(lst_ridges_to_bisect)):
-                        dist_center_of_mass_to_plane, site_pair_idx, site_vert, site_pair_vert, middle, plane_co, plane_no, plane = lst_ridges_to_bisect[i]
-                        geom_in = src_mesh.verts[:] + src_mesh.edges[:] + src_mesh.faces[:]
-                        res_bisect = bmesh.ops.bisect_plane(
-                                src_mesh, geom=geom_in, dist=precision,
-                                plane_co = plane_co,
-                                plane_no = plane_no,
-                                use_snap_center = False,
-                                clear_outer = False,
-                                clear_inner = True
-                            )
-                        num_bisect+=1 # for statistics
-
-                        if len(res_bisect['geom_cut'])>0:
-                            if mode=='VOLUME': # fill faces after bisect
-                                surround = [e for e in res_bisect['geom_cut'] if isinstance(e, bmesh.types.BMEdge)]
-                                if surround:
-                                    fres = bmesh.ops.edgenet_prepare(src_mesh, edges=surround)
-                                    if fres['edges']:
-                                        #bmesh.ops.edgeloop_fill(src_mesh, edges=fres['edges']) # has glitches
-                                        mfilled = bmesh.ops.triangle_fill(src_mesh, use_beauty=True, use_dissolve=True, edges=fres['edges'])
-                                    else:
-                                        pass
-                                else:
-                                    pass
-                        else:
-                            # if no geometry after bisect then break
-                            # Geometry get clear in two cases:
-                            # 1. Optimisation fail and not realized that this process has no result
-                            # 2. Big spacing eat geometry inside mesh
-                            if len( res_bisect['geom'] )==0:
-                                num_unpredicted_erased+=1 # for statistics
-                                break
-                            pass
-                else:
-                    # func come here if out_of_bbox==True
-                    pass
-            else:
-                pass
-        else:
-            pass
-
-
-        # if out_of_bbox==True then bisect process jump here
-        # if no verts then return noting
-        if src_mesh is None or len( src_mesh.verts ) == 0:
-            if src_mesh is not None:
-                src_mesh.clear() #remember to clear empty geometry
-                src_mesh.free()
-            return None
-
-        # if src_mesh has vertices then return mesh data
-        if mode=='VOLUME' and normal_update==True:
-            src_mesh.normal_update()
-        pydata = pydata_from_bmesh(src_mesh)
-        src_mesh.clear() #remember to clear geometry before return
+def bisect_cell(start_mesh, planes, mode='VOLUME', normal_update=False, precision=1e-8):
+    """
+    Cut the cell out of the mesh by bisections with bmesh. It is used for
+    cells which can't be cut by voronoi_cells.clip_cell.
+    :param planes: np.array of shape (n, 4) of planes of the cell, see voronoi_cells
+    :return: vertices, edges and faces, or None if the cell is empty
+    """
+    src_mesh = start_mesh.copy()
+    for normal, offset in zip(planes[:, :3], planes[:, 3]):
+        geom_in = src_mesh.verts[:] + src_mesh.edges[:] + src_mesh.faces[:]
+        res_bisect = bmesh.ops.bisect_plane(
+                src_mesh, geom=geom_in, dist=precision,
+                plane_co = Vector(normal * offset),
+                plane_no = Vector(normal),
+                use_snap_center = False,
+                clear_outer = False,
+                clear_inner = True
+            )
+
+        if len(res_bisect['geom_cut'])>0:
+            if mode=='VOLUME': # fill faces after bisect
+                surround = [e for e in res_bisect['geom_cut'] if isinstance(e, bmesh.types.BMEdge)]
+                if surround:
+                    fres = bmesh.ops.edgenet_prepare(src_mesh, edges=surround)
+                    if fres['edges']:
+                        #bmesh.ops.edgeloop_fill(src_mesh, edges=fres['edges']) # has glitches
+                        bmesh.ops.triangle_fill(src_mesh, use_beauty=True, use_dissolve=True, edges=fres['edges'])
+        elif len( res_bisect['geom'] )==0:
+            # if no geometry after bisect then break
+            break
+
+    if len( src_mesh.verts ) == 0:
         src_mesh.free()
-        return pydata
+        return None
 
+    if mode=='VOLUME' and normal_update==True:
+        src_mesh.normal_update()
+    pydata = pydata_from_bmesh(src_mesh)
+    src_mesh.free()
+    return pydata
+
+def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='VOLUME', normal_update = False, precision=1e-8, mask=[]):
+    """
+    Cut the mesh into Voronoi cells of sites.
+    Planes between neighbour sites are calculated for all cells at once, planes
+    which do not cut the mesh are dropped, then cells are cut out of the mesh
+    by voronoi_cells.clip_cell in worker processes (see utils.parallel). Cells
+    which clip_cell can't make (when a section of the mesh by a plane has holes)
+    are cut by bmesh bisections.
+    """
     verts_out = []
     edges_out = []
     faces_out = []
@@ -433,17 +335,27 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
             np_sites = np.array([(s[0], s[1], s[2]) for s in sites], dtype=np.float32)
 
         delaunay = Delaunay(np.array(np_sites, dtype=np.float32))
-        sites_delaunay_params = get_sites_delaunay_params(delaunay, n_orig_sites)
+        n_sites = len(sites)
+        points = delaunay.points[:, :3]
+        # ridges to added 4D points are skipped
+        ridges = simplex_ridges(delaunay.simplices, n_sites)
 
         if isinstance(spacing, list):
-            spacing = repeat_last_for_length(spacing, len(sites))
+            spacing = repeat_last_for_length(spacing, n_sites)
         else:
-            spacing = [spacing for i in range(len(sites))]
+            spacing = [spacing for i in range(n_sites)]
+        plane_sites, plane_neighbours, planes = neighbour_planes(points, ridges, np.array(spacing, dtype=np.float64))
+        # sites without ridges have no cells
+        has_planes = np.bincount(plane_sites, minlength=n_sites) > 0
 
+        np_verts = np.array(verts, dtype=np.float64)
         # calc center of mass. Using for sort of bisect planes for sites.
-        center_of_mass = np.average( verts, axis=0 )
+        center_of_mass = np.average( np_verts, axis=0 )
+        radius = np.linalg.norm(np_verts - center_of_mass, axis=1).max()
         # using for precalc unneeded bisects
         bbox_aligned, *_ = bounding_box_aligned(verts)
+        cell_offsets, cell_planes, empty = prune_planes(plane_sites, plane_neighbours, planes, n_sites,
+                                                        np.real(bbox_aligned), center_of_mass, radius)
 
         # Extend mask if it is less len of sites
         if len(mask)==0:
@@ -453,20 +365,38 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
             # else extend mask by false and do not use sites that are not in the mask
             mask = mask[:]+[False]*(len(sites)-len(mask) if len(mask)<=len(sites) else 0)
 
-        start_mesh = bmesh_from_pydata(verts, [], faces, normal_update=True)
-        for site_idx in range(len(sites)):
-            if(mask[site_idx]):
-                cell = cut_cell(start_mesh, sites_delaunay_params, site_idx, spacing[site_idx], center_of_mass, bbox_aligned)
-                if cell is not None:
-                    new_verts, new_edges, new_faces = cell
-                    if new_verts:
-                        verts_out.append(new_verts)
-                        edges_out.append(new_edges)
-                        faces_out.append(new_faces)
-                        used_sites_idx.append( site_idx )
-                        used_sites_verts.append( sites[site_idx] )
-        start_mesh.clear() # remember to clear empty geometry
-        start_mesh.free()
+        cells = [site_idx for site_idx in range(n_sites) if mask[site_idx] and has_planes[site_idx] and not empty[site_idx]]
+        face_offsets = counts_to_offsets([len(face) for face in faces])
+        face_indices = np.fromiter(itertools.chain.from_iterable(faces), dtype=np.int64, count=face_offsets[-1])
+        fill = mode == 'VOLUME'
+        if fill or are_sites_plane or len(faces) == 0:
+            cells_face_ids = [None] * len(cells)
+        else:
+            # surface is cut without filling, so each cell can be cut out of the faces near it
+            faces_offsets, faces_ids = cell_faces(cKDTree(points[:n_sites]), np_verts, face_offsets, face_indices, n_sites, precision)
+            cells_face_ids = [faces_ids[faces_offsets[site_idx]:faces_offsets[site_idx + 1]] for site_idx in cells]
+
+        cells_planes = [cell_planes[cell_offsets[site_idx]:cell_offsets[site_idx + 1]] for site_idx in cells]
+        results = map_objects(clip_cell, [(np_verts, face_offsets, face_indices, face_ids, planes, fill, precision)
+                                          for face_ids, planes in zip(cells_face_ids, cells_planes)])
+
+        start_mesh = None
+        for site_idx, planes, cell in zip(cells, cells_planes, results):
+            if cell is False:
+                if start_mesh is None:
+                    start_mesh = bmesh_from_pydata(verts, [], faces, normal_update=True)
+                cell = bisect_cell(start_mesh, planes, mode, normal_update, precision)
+            if cell is not None:
+                new_verts, new_edges, new_faces = cell
+                if new_verts:
+                    verts_out.append(new_verts)
+                    edges_out.append(new_edges)
+                    faces_out.append(new_faces)
+                    used_sites_idx.append( site_idx )
+                    used_sites_verts.append( sites[site_idx] )
+        if start_mesh is not None:
+            start_mesh.clear() # remember to clear empty geometry
+            start_mesh.free()
     else:
         start_mesh = bmesh_from_pydata(verts, [], faces, normal_update=False)
         new_verts, new_edges, new_faces = pydata_from_bmesh(start_mesh)  # No edges as function params. So one can get edges from bmesh.
@@ -475,14 +405,7 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
         faces_out.append(new_faces)
         start_mesh.clear() # remember to clear empty geometry
         start_mesh.free()
-    
-
-    # show statistics:
-    # bisects - count of bisects in cut_cell
-    # unb - unpredicted erased mesh (bbox_aligned cannot make predicted results)
-    # sites - count of sites in process
-    # mask - mask of sites that uset to the result. Empty list all sites uset to result.
-    # print( f"bisects: {num_bisect: 4d}, unb={num_unpredicted_erased: 4d}, sites={len(sites)}")
+
     return verts_out, edges_out, faces_out, used_sites_idx, used_sites_verts
 
 def voronoi_on_mesh(verts, faces, sites, thickness,
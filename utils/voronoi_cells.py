@@ -0,0 +1,282 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Cutting of a mesh into Voronoi cells with NumPy.
+
+The cell of a site is the part of the mesh at positive sides of planes
+between the site and its neighbours (sites connected with it by edges of
+Delaunay triangulation). Planes of all cells are calculated at once and
+planes which do not cut the mesh are dropped. Then each cell is cut out of
+the mesh by `clip_cell`; it does not need Blender, so cells can be cut in
+worker processes of `sverchok.utils.parallel`.
+
+Meshes are passed as vertices (np.array of shape (n, 3)) and faces in CSR
+form: face_offsets (n_faces + 1,) and face_indices - concatenated indices of
+vertices of all faces. Planes are np.arrays of shape (n, 4): unit normal and
+offset; points p with p·normal >= offset are kept.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+from sverchok.utils.delaunay3d import unique_rows
+from sverchok.utils.ragged import concatenated_ranges, counts_to_offsets
+
+
+def simplex_ridges(simplices, n_sites):
+    """Unique pairs of sites which are connected by edges of simplices, np.array of shape (n, 2)"""
+    k = simplices.shape[1]
+    pairs = [(i, j) for i in range(k) for j in range(i + 1, k)]
+    ridges = unique_rows(simplices[:, pairs].reshape(-1, 2), simplices.max() + 1)
+    return ridges[(ridges < n_sites).all(axis=1)]
+
+
+def neighbour_planes(points, ridges, spacing):
+    """
+    Planes between neighbour sites, one plane for each site of each ridge.
+    :param points: np.array of shape (n_sites, 3)
+    :param ridges: np.array of shape (n, 2) of pairs of sites
+    :param spacing: np.array of shape (n_sites,); plane of a site is moved
+        to the site by half of its spacing
+    :return: indices of sites, indices of neighbours and np.array of planes
+    """
+    sites = np.concatenate((ridges[:, 0], ridges[:, 1]))
+    neighbours = np.concatenate((ridges[:, 1], ridges[:, 0]))
+    vectors = points[sites] - points[neighbours]
+    lengths = np.linalg.norm(vectors, axis=1)
+    good = lengths > 0
+    sites, neighbours = sites[good], neighbours[good]
+    normals = vectors[good] / lengths[good][:, np.newaxis]
+    middles = 0.5 * (points[sites] + points[neighbours]) + 0.5 * spacing[sites][:, np.newaxis] * normals
+    offsets = np.einsum('ij,ij->i', normals, middles)
+    return sites, neighbours, np.column_stack((normals, offsets))
+
+
+def prune_planes(sites, neighbours, planes, n_sites, bbox, center, radius):
+    """
+    Drop planes which do not cut the mesh. The mesh is approximated by its
+    bounding box (np.array of 8 corners) and by the sphere with given center
+    and radius, which contain all vertices of the mesh.
+    Remaining planes of each cell are sorted by distance to the center,
+    planes which cut off more of the mesh go first.
+    :return: offsets and planes of cells in CSR form (planes of site i are
+        planes[offsets[i]:offsets[i+1]]), mask of cells which are empty
+        because the whole mesh is at negative side of some their plane.
+    """
+    normals, plane_offsets = planes[:, :3], planes[:, 3]
+    center_dist = normals @ center - plane_offsets
+    corner_dist = bbox @ normals.T - plane_offsets
+    outside = (center_dist <= -radius) | (corner_dist <= 0).all(axis=0)
+    inside = (center_dist >= radius) | (corner_dist > 0).all(axis=0)
+    empty = np.zeros(n_sites, dtype=bool)
+    empty[sites[outside]] = True
+
+    good = ~inside & ~empty[sites]
+    sites, neighbours, planes, center_dist = sites[good], neighbours[good], planes[good], center_dist[good]
+    order = np.lexsort((neighbours, center_dist, sites))
+    counts = np.bincount(sites, minlength=n_sites)
+    return counts_to_offsets(counts), planes[order], empty
+
+
+def polygon_area_vectors(verts, loops):
+    """Normal vectors of polygons with lengths equal to their doubled areas (Newell's method)"""
+    result = []
+    for loop in loops:
+        corners = verts[loop]
+        result.append(np.cross(corners, np.roll(corners, -1, axis=0)).sum(axis=0))
+    return np.array(result).reshape(-1, 3)
+
+
+def cap_loops(boundary_edges):
+    """
+    Chain directed edges into closed loops.
+    Returns None if edges do not form simple loops.
+    """
+    next_vert = dict()
+    for v1, v2 in boundary_edges:
+        if v1 in next_vert:
+            return None
+        next_vert[v1] = v2
+    if len(set(next_vert.values())) != len(next_vert):
+        return None
+    loops = []
+    while next_vert:
+        start, vert = next_vert.popitem()
+        loop = [start]
+        while vert != start:
+            loop.append(vert)
+            vert = next_vert.pop(vert, None)
+            if vert is None:
+                return None
+        if len(loop) >= 3:
+            loops.append(loop)
+    return loops
+
+
+def clip_mesh(verts, face_offsets, face_indices, planes, fill=True, precision=1e-8):
+    """
+    Cut off parts of the mesh at negative sides of planes, one plane after another.
+    :param fill: close holes made by each plane by new faces; it is used for
+        closed meshes, holes are filled before the mesh is cut by the next plane.
+    :param precision: vertices closer to a plane are considered to be on the plane
+    :return: vertices, face_offsets and face_indices of the result, unused
+        vertices are removed; or None if holes can not be filled with
+        simple polygons (for example, the section has holes itself), or if
+        a non-convex face crosses some plane more than twice.
+    """
+    verts = np.asarray(verts, dtype=np.float64)
+    face_offsets = np.asarray(face_offsets, dtype=np.int64)
+    face_indices = np.asarray(face_indices, dtype=np.int64)
+
+    for normal, offset in zip(planes[:, :3], planes[:, 3]):
+        if len(face_offsets) < 2:
+            break
+        dist = verts @ normal - offset
+        dist[np.abs(dist) <= precision] = 0
+        corner_dist = dist[face_indices]
+        starts = face_offsets[:-1]
+        counts = np.diff(face_offsets)
+        dist_min = np.minimum.reduceat(corner_dist, starts)
+        dist_max = np.maximum.reduceat(corner_dist, starts)
+        kept = dist_min >= 0
+        cut = (dist_min < 0) & (dist_max > 0)
+        if kept.all():
+            continue
+
+        # faces which are kept as is
+        new_counts = [counts[kept]]
+        new_indices = [face_indices[concatenated_ranges(starts[kept], counts[kept])]]
+
+        # faces crossing the plane
+        new_verts = dict()
+        cut_faces = []
+        corners = concatenated_ranges(starts[cut], counts[cut])
+        cut_indices = face_indices[corners].tolist()
+        cut_dist = corner_dist[corners].tolist()
+        bounds = counts_to_offsets(counts[cut]).tolist()
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            face, face_dist = cut_indices[start:end], cut_dist[start:end]
+            # the part of the face which is kept must be one run of corners,
+            # otherwise it is several polygons
+            kept_corners = [d >= 0 for d in face_dist]
+            if sum(k1 != k2 for k1, k2 in zip(kept_corners, kept_corners[1:] + kept_corners[:1])) > 2:
+                return None
+            polygon = []
+            for i in range(len(face)):
+                v1, d1 = face[i - 1], face_dist[i - 1]
+                v2, d2 = face[i], face_dist[i]
+                if (d1 < 0 < d2) or (d2 < 0 < d1):
+                    key = (v1, v2) if v1 < v2 else (v2, v1)
+                    if key not in new_verts:
+                        new_verts[key] = len(verts) + len(new_verts)
+                    polygon.append(new_verts[key])
+                if d2 >= 0:
+                    polygon.append(v2)
+            polygon = [v for i, v in enumerate(polygon) if v != polygon[i - 1]]
+            if len(set(polygon)) >= 3:
+                cut_faces.append(polygon)
+
+        if new_verts:
+            pairs = np.array(list(new_verts.keys()))
+            d1, d2 = dist[pairs[:, 0]], dist[pairs[:, 1]]
+            t = (d1 / (d1 - d2))[:, np.newaxis]
+            verts = np.concatenate((verts, verts[pairs[:, 0]] + t * (verts[pairs[:, 1]] - verts[pairs[:, 0]])))
+            dist = np.concatenate((dist, np.zeros(len(pairs))))
+        if cut_faces:
+            new_counts.append(np.array([len(face) for face in cut_faces]))
+            new_indices.append(np.array([v for face in cut_faces for v in face]))
+
+        face_offsets = counts_to_offsets(np.concatenate(new_counts))
+        face_indices = np.concatenate(new_indices).astype(np.int64)
+
+        if fill and len(face_indices):
+            # edges of the section are boundary edges of the mesh which lie on the plane
+            edges = directed_edges(face_offsets, face_indices)
+            edges = edges[(dist[edges] == 0).all(axis=1)]
+            if len(edges):
+                keys, inverse, key_counts = np.unique(np.sort(edges, axis=1), axis=0,
+                                                      return_inverse=True, return_counts=True)
+                boundary = edges[key_counts[inverse.ravel()] == 1]
+                loops = cap_loops(boundary[:, ::-1].tolist())
+                if loops is None:
+                    return None
+                if loops:
+                    # caps are directed out of the cell; otherwise it is either
+                    # a hole in the section or the mesh has inverted normals
+                    signs = np.sign(polygon_area_vectors(verts, loops) @ -normal)
+                    if len(loops) > 1 and not (signs == signs[0]).all():
+                        return None
+                    face_offsets = counts_to_offsets(np.concatenate((np.diff(face_offsets), [len(loop) for loop in loops])))
+                    face_indices = np.concatenate((face_indices, [v for loop in loops for v in loop])).astype(np.int64)
+
+    used = np.unique(face_indices)
+    new_index = np.zeros(len(verts), dtype=np.int64)
+    new_index[used] = np.arange(len(used))
+    return verts[used], face_offsets, new_index[face_indices]
+
+
+def face_edges(face_offsets, face_indices, n_verts):
+    """Unique edges of faces, np.array of shape (n, 2)"""
+    return unique_rows(directed_edges(face_offsets, face_indices), n_verts)
+
+
+def directed_edges(face_offsets, face_indices):
+    """Edges of all faces in direction of faces, np.array of shape (len(face_indices), 2)"""
+    ends = np.arange(1, len(face_indices) + 1)
+    ends[face_offsets[1:] - 1] = face_offsets[:-1]
+    return np.column_stack((face_indices, face_indices[ends]))
+
+
+def cell_faces(tree, verts, face_offsets, face_indices, n_sites, precision=1e-8):
+    """
+    Faces which can intersect Voronoi cells of sites. If a point of a face is
+    in the cell of a site, the site is not farther from the face center than
+    the nearest site plus two radii of the face.
+    Not usable when faces are cut with filling of holes: the section of
+    incomplete mesh is not closed.
+    :param tree: KD-tree of sites (scipy.spatial.cKDTree)
+    :return: offsets and indices of faces of cells in CSR form
+    """
+    starts = face_offsets[:-1]
+    counts = np.diff(face_offsets)
+    corners = verts[face_indices]
+    centers = np.add.reduceat(corners, starts) / counts[:, np.newaxis]
+    radii = np.sqrt(np.maximum.reduceat(((corners - np.repeat(centers, counts, axis=0)) ** 2).sum(axis=1), starts))
+    nearest, _ = tree.query(centers)
+    candidates = tree.query_ball_point(centers, nearest + 2 * radii + precision, return_sorted=False)
+    n_candidates = np.array([len(sites) for sites in candidates], dtype=np.int64)
+    sites = np.fromiter(chain.from_iterable(candidates), dtype=np.int64, count=n_candidates.sum())
+    faces = np.repeat(np.arange(len(counts)), n_candidates)
+    order = np.argsort(sites, kind='stable')
+    return counts_to_offsets(np.bincount(sites, minlength=n_sites)), faces[order]
+
+
+def clip_cell(verts, face_offsets, face_indices, face_ids, planes, fill=True, precision=1e-8):
+    """
+    Cut the cell out of the mesh. Kernel for worker processes.
+    :param face_ids: indices of faces which can intersect the cell, or None for all faces
+    :return: None if the cell is empty; False if it can't be done by clip_mesh;
+        otherwise vertices, edges and faces as lists
+    """
+    if face_ids is not None:
+        starts = face_offsets[:-1][face_ids]
+        counts = np.diff(face_offsets)[face_ids]
+        face_indices = face_indices[concatenated_ranges(starts, counts)]
+        face_offsets = counts_to_offsets(counts)
+    result = clip_mesh(verts, face_offsets, face_indices, planes, fill, precision)
+    if result is None:
+        return False
+    verts, face_offsets, face_indices = result
+    if len(verts) == 0:
+        return None
+    edges = face_edges(face_offsets, face_indices, len(verts))
+    faces = face_indices.tolist()
+    bounds = face_offsets.tolist()
+    faces = [faces[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    return list(map(tuple, verts.tolist())), edges.tolist(), faces
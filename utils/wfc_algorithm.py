@@ -322,3 +322,244 @@ class WaveFunctionCollapse:
 #                 return False
 #
 #     return True
+
+
+# number of set bits in each byte value
+POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def to_bitsets(bools):
+    """Pack last axis of boolean array into bitsets of uint64 words, bit i is item i"""
+    packed = np.packbits(bools, axis=-1, bitorder='little')
+    n_bytes = -(-bools.shape[-1] // 64) * 8
+    if packed.shape[-1] < n_bytes:
+        padding = [(0, 0)] * (packed.ndim - 1) + [(0, n_bytes - packed.shape[-1])]
+        packed = np.pad(packed, padding)
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def from_bitsets(bitsets, count):
+    """Unpack bitsets of uint64 words into boolean array of given length"""
+    return np.unpackbits(bitsets.view(np.uint8), axis=-1, count=count, bitorder='little').view(bool)
+
+
+def popcount(bitsets):
+    """Number of set bits in each bitset"""
+    return POPCOUNT_TABLE[bitsets.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+class BitsetWaveFunctionCollapse(WaveFunctionCollapse):
+    """
+    The same algorithm as WaveFunctionCollapse but possible patterns of all
+    cells are stored as bitsets in one array, and adjacency rules are
+    precomputed as bitset masks per pattern and direction. Constraints are
+    propagated for whole frontier of changed cells at once.
+
+    When a contradiction is met the solver returns to the last snapshot of
+    the grid, snapshots are taken regularly during the solve. Only when
+    rolling back does not help the solve is started from scratch, this is
+    what `max_number_contradiction_tries` limits.
+
+    Results are different from WaveFunctionCollapse with the same seed.
+    """
+    # max number of snapshots which are kept during the solve
+    snapshots_number = 4
+    # how many times the solver returns to the same snapshot before dropping it
+    snapshot_attempts = 3
+    # max number of rollbacks during one try
+    max_rollbacks = 100
+
+    def create_patterns_from_input(self):
+        # The same patterns in the same order as WaveFunctionCollapse creates
+        size = self.pattern_size
+        size_x, size_y = self.input_grid_size[0], self.input_grid_size[1]
+        # adding zero makes -0.0 equal to 0.0 as in Python comparison
+        grid = np.array(self.input_sample_image, dtype=np.float64).reshape(size_y, size_x, 4) + 0.0
+
+        offset = 0 if self.periodic_input else size - 1
+        rows = (np.arange(size_y - offset)[:, np.newaxis] + np.arange(size)) % size_y
+        cols = (np.arange(size_x - offset)[:, np.newaxis] + np.arange(size)) % size_x
+        patterns = grid[rows[:, np.newaxis, :, np.newaxis], cols[np.newaxis, :, np.newaxis, :]]
+        patterns = patterns.reshape(-1, size, size, 4)
+
+        if not self.add_rotations:
+            transforms = [[0, 1, 1]] * len(patterns)
+        else:
+            rotations = [np.rot90(patterns, k=-(i + 1), axes=(1, 2)) for i in range(4)]
+            patterns = np.stack(rotations, axis=1).reshape(-1, size, size, 4)
+            transforms = [[(i + 1) * 90, 1, 1] for _ in range(len(patterns) // 4) for i in range(4)]
+
+        _, first_idxs, counts = np.unique(patterns.reshape(len(patterns), -1), axis=0,
+                                          return_index=True, return_counts=True)
+        order = np.argsort(first_idxs)
+        first_idxs = first_idxs[order]
+
+        self.pattern_array = patterns[first_idxs]
+        self.patterns = [tuple(p) for p in self.pattern_array.reshape(len(first_idxs), -1, 4).tolist()]
+        self.pattern_frequencies = counts[order].tolist()
+        self.patterns_transforms = [transforms[i] for i in first_idxs]
+        self.number_of_unique_patterns = len(self.pattern_frequencies)
+
+    def calculate_adjacency_masks(self):
+        # adjacency_masks[pattern][direction] - bitset of patterns which can be neighbours
+        # of the pattern in given direction, directions and rules are the same as in calculate_adjacencies
+        patterns = self.pattern_array
+        n_patterns = len(patterns)
+        columns = self._equal_parts(patterns[:, :, :-1].reshape(n_patterns, -1),
+                                    patterns[:, :, 1:].reshape(n_patterns, -1))
+        rows = self._equal_parts(patterns[:, :-1].reshape(n_patterns, -1),
+                                 patterns[:, 1:].reshape(n_patterns, -1))
+        self.adjacency_masks = to_bitsets(np.stack([columns, columns.T, rows, rows.T], axis=1))
+
+    @staticmethod
+    def _equal_parts(parts1, parts2):
+        """Matrix of equality of each row of parts1 to each row of parts2"""
+        if not parts1.shape[1]:
+            return np.ones((len(parts1), len(parts2)), dtype=bool)
+        labels = np.unique(np.concatenate([parts1, parts2]), axis=0, return_inverse=True)[1].ravel()
+        labels1, labels2 = labels[:len(parts1)], labels[len(parts1):]
+        return labels1[:, np.newaxis] == labels2[np.newaxis, :]
+
+    def calculate_neighbours(self):
+        # neighbours[cell][direction], -1 if there is no neighbour (output is not tiled)
+        size_x, size_y = self.output_grid_size
+        cells = np.arange(size_x * size_y)
+        xs, ys = cells % size_x, cells // size_x
+        self.neighbours = np.empty((len(cells), len(self.nbr_directions)), dtype=np.int64)
+        for direction, (dx, dy) in enumerate(self.nbr_directions):
+            nxs, nys = xs + dx, ys + dy
+            neighbours = nxs % size_x + (nys % size_y) * size_x
+            if not self.tile_around_bounds:
+                inside = (nxs >= 0) & (nxs < size_x) & (nys >= 0) & (nys < size_y)
+                neighbours[~inside] = -1
+            self.neighbours[:, direction] = neighbours
+
+    def initialize_bitsets(self):
+        n_cells = self.output_grid_size[0] * self.output_grid_size[1]
+        n_patterns = self.number_of_unique_patterns
+        self.domains = np.repeat(to_bitsets(np.ones((1, n_patterns), dtype=bool)), n_cells, axis=0)
+        self.pattern_counts = np.full(n_cells, n_patterns, dtype=np.int64)
+        # one more item for missing neighbours, see calculate_neighbours
+        self.collapsed = np.zeros(n_cells + 1, dtype=bool)
+        self.collapsed[-1] = True
+
+    def solve(self,
+              output_size=(10, 10),
+              seed=0,
+              tiling_output=False,
+              max_number_contradiction_tries=1):
+
+        self.output_grid_size = output_size
+        self.tile_around_bounds = tiling_output
+        random_state = np.random.RandomState(seed)
+
+        self.calculate_adjacency_masks()
+        self.calculate_neighbours()
+        for _ in range(max_number_contradiction_tries):
+            self.initialize_bitsets()
+            if self.run_bitset_solve(random_state):
+                return self.assign_bitsets_to_output()
+
+        raise RuntimeError("Looks like solution for current input parameters can't be found. "
+                           "Try to change seed or number of contradiction tries")
+
+    def run_bitset_solve(self, random_state):
+        # returns False if the solve should be started from scratch
+        n_cells = len(self.pattern_counts)
+        snapshot_interval = max(1, n_cells // (self.snapshots_number * 8))
+        snapshots = []  # [[domains, counts, collapsed], failures]
+        n_rollbacks = 0
+        n_choices = 0
+        cell = random_state.randint(n_cells)
+
+        while True:
+            if cell is None:
+                cell = self.get_lowest_entropy_cell_bitset()
+                if cell is None:
+                    return True
+            self.collapse_cell(cell, random_state)
+
+            if self.propagate_bitsets(np.array([cell])):
+                cell = None
+                n_choices += 1
+                if n_choices % snapshot_interval == 0:
+                    snapshots.append([(self.domains.copy(), self.pattern_counts.copy(), self.collapsed.copy()), 0])
+                    del snapshots[:-self.snapshots_number]
+                continue
+
+            # contradiction
+            cell = None
+            n_rollbacks += 1
+            if n_rollbacks > self.max_rollbacks:
+                return False
+            while snapshots and snapshots[-1][1] >= self.snapshot_attempts:
+                snapshots.pop()
+            if not snapshots:
+                return False
+            state, _ = snapshots[-1]
+            snapshots[-1][1] += 1
+            self.domains[:], self.pattern_counts[:], self.collapsed[:] = state
+
+    def get_lowest_entropy_cell_bitset(self):
+        # Cells with one possible pattern left were propagated already, they just become collapsed
+        collapsed = self.collapsed[:-1]
+        if self.number_of_unique_patterns > 1:
+            collapsed |= self.pattern_counts == 1
+        entropy = np.where(collapsed, np.iinfo(np.int64).max, self.pattern_counts)
+        cell = int(np.argmin(entropy))
+        return None if self.collapsed[cell] else cell
+
+    def collapse_cell(self, cell, random_state):
+        n_patterns = self.number_of_unique_patterns
+        allowed = np.flatnonzero(from_bitsets(self.domains[cell], n_patterns))
+        if self.use_input_pattern_frequency == 1:
+            weights = np.cumsum(np.array(self.pattern_frequencies)[allowed])
+            pattern_index = allowed[np.searchsorted(weights, random_state.random_sample() * weights[-1], side='right')]
+        else:
+            pattern_index = allowed[random_state.randint(len(allowed))]
+        chosen = np.zeros(n_patterns, dtype=bool)
+        chosen[pattern_index] = True
+        self.domains[cell] = to_bitsets(chosen)
+        self.pattern_counts[cell] = 1
+        self.collapsed[cell] = True
+
+    def propagate_bitsets(self, frontier):
+        # Propagates constraints from changed cells, returns False if a contradiction was found
+        n_patterns = self.number_of_unique_patterns
+        while len(frontier):
+            # all patterns of frontier cells, patterns of each cell are contiguous
+            frontier_counts = self.pattern_counts[frontier]
+            starts = np.cumsum(frontier_counts) - frontier_counts
+            _, pattern_idxs = np.nonzero(from_bitsets(self.domains[frontier], n_patterns))
+            # union of allowed neighbours of all patterns of each cell, (cells, directions, words)
+            allowed = np.bitwise_or.reduceat(self.adjacency_masks[pattern_idxs], starts, axis=0)
+
+            # missing neighbours are -1, last item of collapsed array is always True
+            neighbours = self.neighbours[frontier]
+            valid = ~self.collapsed[neighbours]
+            if not valid.any():
+                break
+            neighbours, allowed = neighbours[valid], allowed[valid]
+            # a cell can be a neighbour of several frontier cells
+            order = np.argsort(neighbours, kind='stable')
+            neighbours = neighbours[order]
+            firsts = np.ones(len(neighbours), dtype=bool)
+            firsts[1:] = neighbours[1:] != neighbours[:-1]
+            firsts = np.flatnonzero(firsts)
+            updated = neighbours[firsts]
+            self.domains[updated] &= np.bitwise_and.reduceat(allowed[order], firsts, axis=0)
+
+            counts = popcount(self.domains[updated])
+            if not counts.all():
+                return False
+            changed = counts != self.pattern_counts[updated]
+            self.pattern_counts[updated] = counts
+            frontier = updated[changed]
+        return True
+
+    def assign_bitsets_to_output(self):
+        # The same output as assign_wave_to_output gives
+        pattern_idxs = from_bitsets(self.domains, self.number_of_unique_patterns).argmax(axis=1)
+        first_pixels = self.pattern_array.reshape(self.number_of_unique_patterns, -1, 4)[:, 0]
+        size_x, size_y = self.output_grid_size
+        return first_pixels[pattern_idxs].reshape(size_y, size_x, 4).tolist()